@@ -0,0 +1,125 @@
+"""Decision phase benchmark: propose/commit engine across worker counts.
+
+Usage (from repository root):
+    python benchmarks/decision_phase.py
+    python benchmarks/decision_phase.py --agents 5000 --workers 1,2,4,8 --ticks 5 --json decisions.json
+
+Builds a procedural world, then times ``run_decision_phase`` on an identical
+copy for each worker count (``1`` runs the propose step in-process). Speedup is
+reported relative to one worker, next to the machine's core count and the
+worker count the engine actually used: it stays in-process below
+``--min-parallel-agents`` awake agents and never forks more workers than there
+are cores. Every run's actions are checked against the one-worker run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from dosadi.runtime.decision_engine import (  # noqa: E402
+    MIN_PARALLEL_AGENTS,
+    effective_workers,
+    fork_available,
+    run_decision_phase,
+)
+from dosadi.world.procedural import ProceduralWorldConfig, generate_procedural_world  # noqa: E402
+
+
+def _world(nodes: int, agents: int, seed: int):
+    return generate_procedural_world(
+        ProceduralWorldConfig(seed=seed, nodes=nodes, wards=max(1, nodes // 50), factions=4, facilities=nodes // 10, agents=agents)
+    )
+
+
+def _rows(actions) -> List[tuple]:
+    return [(agent_id, action.verb, action.target_location_id) for agent_id, action in actions.items()]
+
+
+def run(
+    nodes: int,
+    agents: int,
+    ticks: int,
+    workers: List[int],
+    *,
+    min_parallel_agents: int = MIN_PARALLEL_AGENTS,
+    seed: int = 7,
+) -> Dict[str, object]:
+    timings: Dict[int, float] = {}
+    reference: List[List[tuple]] | None = None
+    for count in workers:
+        world = _world(nodes, agents, seed)
+        runs: List[List[tuple]] = []
+        start = time.perf_counter()
+        for tick in range(ticks):
+            runs.append(_rows(run_decision_phase(world, tick, workers=count, min_parallel_agents=min_parallel_agents)))
+        timings[count] = time.perf_counter() - start
+        if reference is None:
+            reference = runs
+        elif runs != reference:
+            raise SystemExit(f"workers={count} produced different actions than workers={workers[0]}")
+
+    base = timings[workers[0]]
+    return {
+        "cpu_count": os.cpu_count(),
+        "fork_available": fork_available(),
+        "results": {
+            str(count): {
+                "effective_workers": effective_workers(count, agents, min_parallel_agents=min_parallel_agents),
+                "seconds": round(seconds, 6),
+                "decisions_per_s": round(agents * ticks / seconds, 3) if seconds > 0 else 0.0,
+                "speedup": round(base / seconds, 3) if seconds > 0 else 0.0,
+            }
+            for count, seconds in timings.items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the parallel agent decision phase")
+    parser.add_argument("--nodes", type=int, default=1_000)
+    parser.add_argument("--agents", type=int, default=2_000)
+    parser.add_argument("--ticks", type=int, default=3)
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts; the first is the baseline")
+    parser.add_argument(
+        "--min-parallel-agents",
+        type=int,
+        default=MIN_PARALLEL_AGENTS,
+        help="Awake agents needed before a tick forks the pool (0 always forks when cores allow)",
+    )
+    parser.add_argument("--json", type=Path, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    workers = [int(value) for value in args.workers.split(",") if value.strip()]
+    if not workers or min(workers) < 1:
+        parser.error("--workers needs positive integers")
+    results = run(args.nodes, args.agents, max(1, args.ticks), workers, min_parallel_agents=args.min_parallel_agents)
+
+    print(f"cpu_count={results['cpu_count']} fork_available={results['fork_available']}")
+    for count, row in results["results"].items():
+        print(
+            f"  workers={count:<3} used={row['effective_workers']:<3} {row['seconds'] * 1000:10.2f} ms"
+            f"  {row['decisions_per_s']:12.1f}/s  x{row['speedup']:.2f}"
+        )
+
+    if args.json:
+        payload = {
+            "nodes": args.nodes,
+            "agents": args.agents,
+            "ticks": args.ticks,
+            "min_parallel_agents": args.min_parallel_agents,
+            **results,
+        }
+        args.json.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
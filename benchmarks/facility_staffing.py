@@ -0,0 +1,123 @@
+"""Facility staffing benchmark: 1,000 facilities staffed by 20,000 agents.
+
+Usage (from repository root):
+    python benchmarks/facility_staffing.py
+    python benchmarks/facility_staffing.py --facilities 2000 --agents 40000 --days 5 --json staffing.json
+
+Every agent holds a FACILITY_STAFF assignment spread evenly across workshop
+facilities. The script times the daily facility update and materials
+production passes, and compares the roster lookup against the assignment scan
+it replaced (counting staff for every facility).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from dosadi.runtime.facility_updates import update_facilities_for_day  # noqa: E402
+from dosadi.runtime.materials_economy import MaterialsEconomyConfig, run_materials_production_for_day  # noqa: E402
+from dosadi.state import WorldState  # noqa: E402
+from dosadi.world.facilities import Facility, FacilityKind, ensure_facility_ledger  # noqa: E402
+from dosadi.world.workforce import Assignment, AssignmentKind, ensure_workforce  # noqa: E402
+
+
+def build_world(facilities: int, agents: int, *, seed: int = 1) -> WorldState:
+    world = WorldState(seed=seed)
+    world.mat_cfg = MaterialsEconomyConfig(enabled=True)
+    ledger = ensure_facility_ledger(world)
+    for idx in range(facilities):
+        ledger.add(
+            Facility(
+                facility_id=f"fac:{idx:05d}",
+                kind=FacilityKind.WORKSHOP,
+                site_node_id=f"loc:{idx % 97}",
+                min_staff=1,
+            )
+        )
+    workforce = ensure_workforce(world)
+    for idx in range(agents):
+        workforce.assign(
+            Assignment(
+                agent_id=f"agent:{idx:06d}",
+                kind=AssignmentKind.FACILITY_STAFF,
+                target_id=f"fac:{idx % facilities:05d}",
+                start_day=0,
+                notes={"role": "operator" if idx % 4 else "foreman"},
+            )
+        )
+    return world
+
+
+def _scan_counts(world: WorldState) -> Dict[str, int]:
+    workforce = ensure_workforce(world)
+    return {
+        facility_id: sum(
+            1
+            for assignment in workforce.assignments.values()
+            if assignment.kind is AssignmentKind.FACILITY_STAFF and assignment.target_id == facility_id
+        )
+        for facility_id in ensure_facility_ledger(world).facilities
+    }
+
+
+def _roster_counts(world: WorldState) -> Dict[str, int]:
+    workforce = ensure_workforce(world)
+    return {
+        facility_id: workforce.facility_staff_count(facility_id)
+        for facility_id in ensure_facility_ledger(world).facilities
+    }
+
+
+def _timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run(facilities: int, agents: int, days: int, *, scan: bool = True) -> Dict[str, float]:
+    start = time.perf_counter()
+    world = build_world(facilities, agents)
+    results: Dict[str, float] = {"build_seconds": time.perf_counter() - start}
+
+    results["facility_updates_seconds_per_day"] = (
+        sum(_timed(update_facilities_for_day, world, day=day) for day in range(days)) / days
+    )
+    results["materials_production_seconds_per_day"] = (
+        sum(_timed(run_materials_production_for_day, world, day=day) for day in range(days)) / days
+    )
+    results["roster_count_seconds"] = _timed(_roster_counts, world)
+    if scan:
+        results["assignment_scan_seconds"] = _timed(_scan_counts, world)
+        assert _scan_counts(world) == _roster_counts(world)
+    return {key: round(value, 6) for key, value in results.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark facility staffing lookups")
+    parser.add_argument("--facilities", type=int, default=1_000)
+    parser.add_argument("--agents", type=int, default=20_000)
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--no-scan", action="store_true", help="Skip the legacy assignment-scan comparison")
+    parser.add_argument("--json", type=Path, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.facilities, args.agents, max(1, args.days), scan=not args.no_scan)
+    width = max(len(name) for name in results)
+    for name, seconds in results.items():
+        print(f"{name:<{width}}  {seconds * 1000:10.2f} ms")
+
+    if args.json:
+        payload = {"facilities": args.facilities, "agents": args.agents, "days": args.days, "results": results}
+        args.json.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
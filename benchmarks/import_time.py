@@ -0,0 +1,105 @@
+"""Import/startup time benchmark.
+
+Usage (from repository root):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 5 --json import_time.json
+
+Each probe runs in a fresh interpreter so module caches never leak between
+measurements. Reported values are the best wall time over ``--repeat`` runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_PATH = REPO_ROOT / "src"
+
+PROBES: Dict[str, List[str]] = {
+    "import dosadi": ["-c", "import dosadi"],
+    "import dosadi.state": ["-c", "import dosadi.state"],
+    "import dosadi.runtime.timewarp": ["-c", "import dosadi.runtime.timewarp"],
+    "import dosadi.vault.seed_vault": ["-c", "import dosadi.vault.seed_vault"],
+    "evolve_cli --help": ["-m", "dosadi.runtime.evolve_cli", "--help"],
+    "pytest --collect-only (one file)": [
+        "-m",
+        "pytest",
+        "--collect-only",
+        "-q",
+        "-p",
+        "no:cacheprovider",
+        "tests/test_run_outputs.py",
+    ],
+    "pytest --collect-only": ["-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"],
+}
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_PATH), env.get("PYTHONPATH", "")]))
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+
+def _time_probe(args: Sequence[str], *, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=REPO_ROOT,
+            env=_env(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _dosadi_module_count(statement: str) -> int:
+    code = f"{statement}\nimport sys\nprint(sum(1 for m in sys.modules if m.startswith('dosadi')))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, env=_env(), capture_output=True, text=True, check=True
+    )
+    return int(out.stdout.strip() or 0)
+
+
+def run(repeat: int) -> Dict[str, Dict[str, float]]:
+    baseline = _time_probe(["-c", "pass"], repeat=repeat)
+    results: Dict[str, Dict[str, float]] = {"interpreter": {"seconds": round(baseline, 4)}}
+    for name, args in PROBES.items():
+        seconds = _time_probe(args, repeat=repeat)
+        entry = {"seconds": round(seconds, 4), "over_interpreter": round(seconds - baseline, 4)}
+        if args[0] == "-c":
+            entry["dosadi_modules"] = _dosadi_module_count(args[1])
+        results[name] = entry
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure dosadi import and startup time")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per probe (best is reported)")
+    parser.add_argument("--json", type=Path, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    width = max(len(name) for name in results)
+    for name, entry in results.items():
+        modules = entry.get("dosadi_modules")
+        suffix = f"  ({int(modules)} dosadi modules)" if modules is not None else ""
+        print(f"{name:<{width}}  {entry['seconds'] * 1000:8.1f} ms{suffix}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
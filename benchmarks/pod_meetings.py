@@ -0,0 +1,149 @@
+"""Pod meeting benchmark: pods of hundreds of members voting for representatives.
+
+Usage (from repository root):
+    python benchmarks/pod_meetings.py
+    python benchmarks/pod_meetings.py --pods 8 --members 800 --ticks 2000 --json pods.json
+
+Every member attends its pod meeting. The script times one meeting pass with
+the per-meeting candidate scores against the legacy per-voter rescoring of
+every candidate, then times the group/council checks over a run of ticks with
+next-due scheduling against polling every pod and pod role table each tick.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from dosadi.agents.core import AgentState  # noqa: E402
+from dosadi.agents.groups import (  # noqa: E402
+    Group,
+    create_pod_group,
+    ensure_group_schedule,
+    maybe_form_proto_council,
+    maybe_run_pod_meeting,
+    run_due_pod_meetings,
+)
+from dosadi.state import WorldState  # noqa: E402
+
+HUB = "loc:well-core"
+
+
+def build_world(pods: int, members: int, *, seed: int = 1) -> WorldState:
+    rng = random.Random(seed)
+    world = WorldState(seed=seed)
+    for pod_idx in range(pods):
+        pod_location = f"loc:pod-{pod_idx}"
+        member_ids: List[str] = []
+        for idx in range(members):
+            agent_id = f"agent:{pod_idx}:{idx:05d}"
+            agent = AgentState(agent_id=agent_id, name=agent_id, location_id=pod_location)
+            agent.personality.leadership_weight = rng.random()
+            world.agents[agent_id] = agent
+            member_ids.append(agent_id)
+        world.groups.append(create_pod_group(pod_location, member_ids, tick=0))
+    return world
+
+
+def _legacy_votes(pod: Group, agents_by_id: Dict[str, AgentState], rng: random.Random) -> Dict[str, int]:
+    attendees = [
+        aid
+        for aid in pod.member_ids
+        if aid in agents_by_id and agents_by_id[aid].location_id == pod.parent_location_id
+    ]
+    votes: Dict[str, int] = {}
+    for _voter in attendees:
+        candidates = [aid for aid in pod.member_ids if aid in agents_by_id]
+        best_id = None
+        best_score = float("-inf")
+        for cid in candidates:
+            score = agents_by_id[cid].personality.leadership_weight + rng.uniform(-0.05, 0.05)
+            if score > best_score:
+                best_score = score
+                best_id = cid
+        if best_id is not None:
+            votes[best_id] = votes.get(best_id, 0) + 1
+    return votes
+
+
+def _meeting_pass(world: WorldState, rng: random.Random, tick: int) -> None:
+    for pod in world.groups:
+        maybe_run_pod_meeting(pod, world.agents, tick, rng, meeting_interval_ticks=1)
+
+
+def _polled_ticks(world: WorldState, rng: random.Random, ticks: int, interval: int) -> None:
+    for tick in range(1, ticks + 1):
+        for pod in world.groups:
+            maybe_run_pod_meeting(pod, world.agents, tick, rng, meeting_interval_ticks=interval)
+        maybe_form_proto_council(world.groups, world.agents, tick, hub_location_id=HUB)
+
+
+def _scheduled_ticks(world: WorldState, rng: random.Random, ticks: int, interval: int) -> None:
+    for tick in range(1, ticks + 1):
+        run_due_pod_meetings(world, world.groups, world.agents, tick, rng, meeting_interval_ticks=interval)
+        maybe_form_proto_council(
+            world.groups,
+            world.agents,
+            tick,
+            hub_location_id=HUB,
+            pod_rep_ids=ensure_group_schedule(world).rep_ids(world.groups),
+        )
+
+
+def _timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def run(pods: int, members: int, ticks: int, interval: int, *, legacy: bool = True) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    world = build_world(pods, members)
+    results["meeting_pass_seconds"] = _timed(_meeting_pass, world, random.Random(0), 1)
+    if legacy:
+        results["legacy_voting_seconds"] = _timed(
+            lambda: [_legacy_votes(pod, world.agents, random.Random(0)) for pod in world.groups]
+        )
+
+    results["scheduled_ticks_seconds"] = _timed(_scheduled_ticks, build_world(pods, members), random.Random(0), ticks, interval)
+    if legacy:
+        results["polled_ticks_seconds"] = _timed(_polled_ticks, build_world(pods, members), random.Random(0), ticks, interval)
+    return {key: round(value, 6) for key, value in results.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pod meetings and council checks")
+    parser.add_argument("--pods", type=int, default=4)
+    parser.add_argument("--members", type=int, default=400)
+    parser.add_argument("--ticks", type=int, default=1_000)
+    parser.add_argument("--interval", type=int, default=120, help="Pod meeting interval in ticks")
+    parser.add_argument("--no-legacy", action="store_true", help="Skip the legacy voting/polling comparison")
+    parser.add_argument("--json", type=Path, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.pods, args.members, max(1, args.ticks), args.interval, legacy=not args.no_legacy)
+    width = max(len(name) for name in results)
+    for name, seconds in results.items():
+        print(f"{name:<{width}}  {seconds * 1000:10.2f} ms")
+
+    if args.json:
+        payload = {
+            "pods": args.pods,
+            "members": args.members,
+            "ticks": args.ticks,
+            "interval": args.interval,
+            "results": results,
+        }
+        args.json.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
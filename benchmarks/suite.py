@@ -0,0 +1,265 @@
+"""Throughput benchmark suite with stored baselines.
+
+Usage (from repository root):
+    python benchmarks/suite.py
+    python benchmarks/suite.py --scales small,medium,large --json results.json
+    python benchmarks/suite.py --save-baseline benchmarks/baselines/suite.json
+    python benchmarks/suite.py --baseline benchmarks/baselines/suite.json --tolerance 0.3
+
+Each scale is a fixed-seed world: ``small`` is the Founding Wakeup MVP, while
+``medium`` and ``large`` come from the procedural generator. Every scale
+measures ``step_world_once`` ticks/second, ``timewarp.step_day`` days/second
+(with per-subsystem timings from the subsystem registry), snapshot save/load
+MB/second and route queries/second. With ``--baseline`` the rates are compared
+against a stored run and the script exits non-zero when any of them falls more
+than ``--tolerance`` below the baseline, or any subsystem above ``--min-seconds``
+becomes that much slower.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import datetime as dt
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from dosadi.runtime.founding_wakeup import step_world_once  # noqa: E402
+from dosadi.runtime.snapshot import load_snapshot, restore_world, save_snapshot, snapshot_world  # noqa: E402
+from dosadi.runtime.subsystems import timed_subsystems  # noqa: E402
+from dosadi.runtime.timewarp import TimewarpConfig, step_day  # noqa: E402
+from dosadi.state import WorldState  # noqa: E402
+from dosadi.world.procedural import ProceduralWorldConfig, generate_procedural_world  # noqa: E402
+from dosadi.world.routing import compute_route  # noqa: E402
+from dosadi.world.scenarios.founding_wakeup import generate_founding_wakeup_mvp  # noqa: E402
+
+DEFAULT_BASELINE = REPO_ROOT / "benchmarks" / "baselines" / "suite.json"
+SEED = 7
+
+
+@dataclass(slots=True)
+class Scale:
+    name: str
+    build: Callable[[], WorldState]
+    ticks: int
+    days: int
+    route_queries: int
+    # Survey map to query when the scale's own world is too small to route on.
+    route_world: Optional[Callable[[], WorldState]] = None
+
+
+def _procedural(**kwargs: int) -> Callable[[], WorldState]:
+    return lambda: generate_procedural_world(ProceduralWorldConfig(seed=SEED, **kwargs))
+
+
+SCALES: Dict[str, Scale] = {
+    "small": Scale(
+        name="small",
+        build=lambda: generate_founding_wakeup_mvp(num_agents=24, seed=SEED),
+        ticks=200,
+        days=5,
+        route_queries=500,
+        route_world=_procedural(nodes=100, wards=4, factions=1, facilities=0, agents=0),
+    ),
+    "medium": Scale(
+        name="medium",
+        build=_procedural(nodes=1_000, wards=40, factions=8, facilities=100, agents=500),
+        ticks=20,
+        days=3,
+        route_queries=300,
+    ),
+    "large": Scale(
+        name="large",
+        build=_procedural(nodes=10_000, wards=200, factions=20, facilities=1_000, agents=5_000),
+        ticks=3,
+        days=2,
+        route_queries=100,
+    ),
+}
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _rate(count: float, seconds: float) -> float:
+    return round(count / seconds, 3) if seconds > 0 else 0.0
+
+
+def _bench_ticks(world: WorldState, ticks: int) -> float:
+    def run() -> None:
+        for _ in range(ticks):
+            step_world_once(world)
+
+    return _rate(ticks, _timed(run))
+
+
+def _bench_days(world: WorldState, days: int) -> tuple[float, Dict[str, Dict[str, float]]]:
+    cfg = TimewarpConfig(max_awake_agents=200)
+    with timed_subsystems() as timings:
+        seconds = _timed(lambda: step_day(world, days=days, cfg=cfg))
+    return _rate(days, seconds), timings.as_dict()
+
+
+def _bench_snapshot(world: WorldState, scale: str) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"{scale}.json.gz"
+        save_seconds = _timed(lambda: save_snapshot(snapshot_world(world, scenario_id=scale), path))
+        size_mb = path.stat().st_size / 1_000_000
+        load_seconds = _timed(lambda: restore_world(load_snapshot(path)))
+    return {
+        "snapshot_mb": round(size_mb, 3),
+        "snapshot_save_mb_per_s": _rate(size_mb, save_seconds),
+        "snapshot_load_mb_per_s": _rate(size_mb, load_seconds),
+    }
+
+
+def _bench_routes(world: WorldState, queries: int) -> float:
+    node_ids = sorted(world.survey_map.nodes)
+    if len(node_ids) < 2:
+        return 0.0
+    rng = random.Random(SEED)
+    pairs = [tuple(rng.sample(node_ids, 2)) for _ in range(queries)]
+
+    def run() -> None:
+        # A fresh day per query keeps every lookup a cache miss.
+        for offset, (origin, dest) in enumerate(pairs):
+            world.day = 1_000_000 + offset
+            compute_route(world, from_node=origin, to_node=dest)
+
+    return _rate(queries, _timed(run))
+
+
+def run_scale(scale: Scale) -> Dict[str, object]:
+    started = time.perf_counter()
+    world = scale.build()
+    build_seconds = time.perf_counter() - started
+    rates: Dict[str, float] = {"ticks_per_s": _bench_ticks(world, scale.ticks)}
+    rates["days_per_s"], subsystems = _bench_days(world, scale.days)
+    rates.update(_bench_snapshot(world, scale.name))
+    route_world = scale.route_world() if scale.route_world is not None else world
+    rates["route_queries_per_s"] = _bench_routes(route_world, scale.route_queries)
+    return {
+        "build_seconds": round(build_seconds, 6),
+        "agents": len(world.agents),
+        "survey_nodes": len(world.survey_map.nodes),
+        "rates": rates,
+        "subsystems": subsystems,
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def machine_metadata() -> Dict[str, object]:
+    return {
+        "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "git_revision": _git_revision(),
+    }
+
+
+# Rates where larger is better; snapshot size is informational.
+_GATED_RATES = ("ticks_per_s", "days_per_s", "snapshot_save_mb_per_s", "snapshot_load_mb_per_s", "route_queries_per_s")
+
+
+def compare_to_baseline(
+    results: Dict[str, object], baseline: Dict[str, object], *, tolerance: float, min_seconds: float
+) -> List[str]:
+    """Return one message per metric that regressed beyond ``tolerance``."""
+
+    regressions: List[str] = []
+    for scale, current in results["scales"].items():
+        base = baseline.get("scales", {}).get(scale)
+        if base is None:
+            continue
+        for metric in _GATED_RATES:
+            now, then = current["rates"].get(metric), base["rates"].get(metric)
+            if now is None or not then:
+                continue
+            if now < then * (1.0 - tolerance):
+                regressions.append(f"{scale}.{metric}: {now:.3f} vs baseline {then:.3f}")
+        for name, timing in current["subsystems"].items():
+            then = base.get("subsystems", {}).get(name, {}).get("seconds")
+            if then is None or then < min_seconds:
+                continue
+            if timing["seconds"] > then * (1.0 + tolerance):
+                regressions.append(f"{scale}.subsystem.{name}: {timing['seconds']:.4f}s vs baseline {then:.4f}s")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the fixed-seed throughput benchmark suite")
+    parser.add_argument("--scales", default="small,medium", help=f"Comma-separated subset of {sorted(SCALES)}")
+    parser.add_argument("--json", type=Path, help="Optional path to write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare against a stored baseline run")
+    parser.add_argument("--save-baseline", type=Path, nargs="?", const=DEFAULT_BASELINE, help="Store this run as a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed fractional slowdown before failing")
+    parser.add_argument("--min-seconds", type=float, default=0.01, help="Ignore subsystems faster than this in the baseline")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scales.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCALES]
+    if unknown:
+        parser.error(f"unknown scales: {', '.join(unknown)}")
+
+    results: Dict[str, object] = {"machine": machine_metadata(), "seed": SEED, "scales": {}}
+    for name in names:
+        scale_result = run_scale(SCALES[name])
+        results["scales"][name] = scale_result
+        print(f"[{name}] agents={scale_result['agents']} survey_nodes={scale_result['survey_nodes']}")
+        slowest = list(scale_result["subsystems"].items())[:5]
+        width = max(len(label) for label in [*scale_result["rates"], *(name for name, _ in slowest)])
+        for metric, value in scale_result["rates"].items():
+            print(f"  {metric:<{width}}  {value:12.3f}")
+        for subsystem, timing in slowest:
+            print(f"  {subsystem:<{width}}  {timing['seconds'] * 1000:9.2f} ms")
+
+    payload = json.dumps(results, indent=2, sort_keys=True)
+    if args.json:
+        args.json.write_text(payload, encoding="utf-8")
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(payload, encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline, tolerance=args.tolerance, min_seconds=args.min_seconds)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.tolerance:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
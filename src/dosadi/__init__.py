@@ -1,22 +1,36 @@
-"""Dosadi simulation package public façade (Founding Wakeup MVP focused)."""
+"""Dosadi simulation package public façade (Founding Wakeup MVP focused).
 
-from .admin_log import AdminEventLog
-from .documents import (
-    DocBlock,
-    DocCatalog,
-    load_industry_catalog,
-    load_info_security_catalog,
-    load_military_catalog,
-)
-from .event import Event, EventBus, EventPriority
-from .playbook.scenario_runner import ScenarioEntry, available_scenarios, run_scenario
-from .playbook.scenario_validation import (
-    ScenarioValidationIssue,
-    ScenarioValidationResult,
-    verify_scenario,
-)
-from .registry import SharedVariableRegistry, default_registry
-from .state import WorldConfig, WorldState, day_tick, minute_tick
+Names are resolved lazily on first access so that importing a submodule such
+as ``dosadi.runtime.evolve_cli`` does not import the whole simulation.
+"""
+
+from .runtime.subsystems import lazy_module_getattr
+
+_EXPORTS = {
+    "AdminEventLog": "dosadi.admin_log:AdminEventLog",
+    "DocBlock": "dosadi.documents:DocBlock",
+    "DocCatalog": "dosadi.documents:DocCatalog",
+    "load_industry_catalog": "dosadi.documents:load_industry_catalog",
+    "load_info_security_catalog": "dosadi.documents:load_info_security_catalog",
+    "load_military_catalog": "dosadi.documents:load_military_catalog",
+    "Event": "dosadi.event:Event",
+    "EventBus": "dosadi.event:EventBus",
+    "EventPriority": "dosadi.event:EventPriority",
+    "ScenarioEntry": "dosadi.playbook.scenario_runner:ScenarioEntry",
+    "available_scenarios": "dosadi.playbook.scenario_runner:available_scenarios",
+    "run_scenario": "dosadi.playbook.scenario_runner:run_scenario",
+    "ScenarioValidationIssue": "dosadi.playbook.scenario_validation:ScenarioValidationIssue",
+    "ScenarioValidationResult": "dosadi.playbook.scenario_validation:ScenarioValidationResult",
+    "verify_scenario": "dosadi.playbook.scenario_validation:verify_scenario",
+    "SharedVariableRegistry": "dosadi.registry:SharedVariableRegistry",
+    "default_registry": "dosadi.registry:default_registry",
+    "WorldConfig": "dosadi.state:WorldConfig",
+    "WorldState": "dosadi.state:WorldState",
+    "day_tick": "dosadi.state:day_tick",
+    "minute_tick": "dosadi.state:minute_tick",
+}
+
+__getattr__ = lazy_module_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "AdminEventLog",
@@ -1,36 +1,44 @@
-"""Agent package for MVP agent core implementations."""
+"""Agent package for MVP agent core implementations.
 
-from .core import (
-    AgentState,
-    Attributes,
-    Episode,
-    EpisodeGoalDelta,
-    EpisodeSourceType,
-    Goal,
-    GoalHorizon,
-    GoalOrigin,
-    GoalStatus,
-    GoalType,
-    PlaceBelief,
-    create_agent,
-    initialize_agents_for_founding_wakeup,
-    make_episode_id,
-    make_goal_id,
-)
-from .groups import (
-    Group,
-    GroupRole,
-    GroupType,
-    create_pod_group,
-    create_proto_council,
-    ensure_council_gather_information_goal,
-    make_group_id,
-    maybe_form_proto_council,
-    maybe_run_council_meeting,
-    maybe_run_pod_meeting,
-    project_author_protocol_to_scribe,
-    project_gather_information_to_scouts,
-)
+Names are resolved lazily so that importing ``dosadi.agents.physiology`` (or any
+other submodule) does not import the agent core and world state.
+"""
+
+from dosadi.runtime.subsystems import lazy_module_getattr
+
+_EXPORTS = {
+    "AgentState": "dosadi.agents.core:AgentState",
+    "Attributes": "dosadi.agents.core:Attributes",
+    "Episode": "dosadi.agents.core:Episode",
+    "EpisodeGoalDelta": "dosadi.agents.core:EpisodeGoalDelta",
+    "EpisodeSourceType": "dosadi.agents.core:EpisodeSourceType",
+    "Goal": "dosadi.agents.core:Goal",
+    "GoalHorizon": "dosadi.agents.core:GoalHorizon",
+    "GoalOrigin": "dosadi.agents.core:GoalOrigin",
+    "GoalStatus": "dosadi.agents.core:GoalStatus",
+    "GoalType": "dosadi.agents.core:GoalType",
+    "PlaceBelief": "dosadi.agents.core:PlaceBelief",
+    "create_agent": "dosadi.agents.core:create_agent",
+    "initialize_agents_for_founding_wakeup": "dosadi.agents.core:initialize_agents_for_founding_wakeup",
+    "make_episode_id": "dosadi.agents.core:make_episode_id",
+    "make_goal_id": "dosadi.agents.core:make_goal_id",
+    "Group": "dosadi.agents.groups:Group",
+    "GroupRole": "dosadi.agents.groups:GroupRole",
+    "GroupType": "dosadi.agents.groups:GroupType",
+    "create_pod_group": "dosadi.agents.groups:create_pod_group",
+    "create_proto_council": "dosadi.agents.groups:create_proto_council",
+    "ensure_council_gather_information_goal": "dosadi.agents.groups:ensure_council_gather_information_goal",
+    "make_group_id": "dosadi.agents.groups:make_group_id",
+    "maybe_form_proto_council": "dosadi.agents.groups:maybe_form_proto_council",
+    "maybe_run_council_meeting": "dosadi.agents.groups:maybe_run_council_meeting",
+    "maybe_run_pod_meeting": "dosadi.agents.groups:maybe_run_pod_meeting",
+    "pod_representative_ids": "dosadi.agents.groups:pod_representative_ids",
+    "project_author_protocol_to_scribe": "dosadi.agents.groups:project_author_protocol_to_scribe",
+    "project_gather_information_to_scouts": "dosadi.agents.groups:project_gather_information_to_scouts",
+    "run_due_pod_meetings": "dosadi.agents.groups:run_due_pod_meetings",
+}
+
+__getattr__ = lazy_module_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "AgentState",
@@ -58,6 +66,8 @@ __all__ = [
     "maybe_form_proto_council",
     "maybe_run_council_meeting",
     "maybe_run_pod_meeting",
+    "pod_representative_ids",
     "project_author_protocol_to_scribe",
     "project_gather_information_to_scouts",
+    "run_due_pod_meetings",
 ]
@@ -79,7 +79,7 @@ class GoalHorizon(str, Enum):
     LONG = "LONG"
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     """MVP Goal representation for Dosadi agents."""
 
@@ -89,6 +89,9 @@ class Goal:
     goal_type: GoalType
     description: str = ""
 
+    # Optional service hint used by queue routing (e.g. "get_suit").
+    kind: Optional[str] = None
+
     parent_goal_id: Optional[str] = None
 
     target: Dict[str, Any] = field(default_factory=dict)
@@ -144,7 +147,7 @@ class EpisodeSourceType(str, Enum):
     WATCHED_THEATER = "WATCHED_THEATER"
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeGoalDelta:
     goal_id: str
     pre_status: GoalStatus
@@ -152,7 +155,7 @@ class EpisodeGoalDelta:
     delta_progress: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     """Subjective record of an event from one agent's perspective."""
 
@@ -194,7 +197,7 @@ def make_episode_id(owner_id: str) -> str:
     return f"ep:{owner_id}:{uuid.uuid4().hex}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceBelief:
     """Subjective belief about a single place/location."""
 
@@ -350,7 +353,7 @@ class PlaceBelief:
         self.last_updated_tick = max(self.last_updated_tick, tick_end)
 
 
-@dataclass
+@dataclass(slots=True)
 class Attributes:
     """Physical and mental attributes, roughly centered on 10."""
 
@@ -362,7 +365,7 @@ class Attributes:
     CHA: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class Personality:
     """MVP personality traits relevant to early decision-making."""
 
@@ -375,7 +378,7 @@ class Personality:
     leadership_weight: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicalState:
     """Physical and psychological state variables."""
 
@@ -397,7 +400,7 @@ class PhysicalState:
     last_physical_update_tick: int = -10
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """MVP agent representation used in the Founding Wakeup scenario."""
 
@@ -446,6 +449,10 @@ class AgentState:
     # Sleep and memory scheduling
     is_asleep: bool = False
 
+    # Focus-mode simulation flags (see runtime.focus_mode)
+    is_awake: bool = False
+    sim_mode: str = "AMBIENT"
+
     next_sleep_tick: int = 0
     next_wake_tick: int = 0
 
@@ -471,6 +478,9 @@ class AgentState:
 
     place_beliefs: Dict[str, PlaceBelief] = field(default_factory=dict)
 
+    # Facility last chosen per service type (see runtime.facility_choice)
+    last_facility_by_service: Dict[str, str] = field(default_factory=dict)
+
     known_protocols: List[str] = field(default_factory=list)
 
     last_decision_tick: int = 0
@@ -2325,7 +2335,7 @@ def apply_action(agent: AgentState, action: Action, world: "WorldState", tick: i
                 tick=tick,
                 registry=registry,
             )
-            activate_protocol(protocol, tick=tick)
+            activate_protocol(protocol, tick=tick, registry=registry)
             log_episode(
                 event_type="AUTHOR_PROTOCOL",
                 summary="Drafted and activated a movement protocol.",
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
 import random
 import uuid
 
@@ -143,6 +143,9 @@ def create_proto_council(member_ids: List[str], tick: int) -> Group:
     return group
 
 
+_POD_VOTE_NOISE = 0.05
+
+
 def maybe_run_pod_meeting(
     pod_group: Group,
     agents_by_id: Dict[str, AgentState],
@@ -185,28 +188,28 @@ def maybe_run_pod_meeting(
         pod_group.last_meeting_tick = tick
         return
 
-    # Voting: each attendee picks a candidate based on leadership_weight
+    # Voting: each attendee picks a candidate based on leadership_weight plus
+    # personal noise. Candidate pool: all pod members (including self for
+    # simplicity). The pool and its leadership scores are computed once per
+    # meeting; a candidate more than twice the noise amplitude below the top
+    # leadership score can never win a vote, so voters only draw noise for
+    # the remaining contenders (kept in member order so ties resolve the same).
+    candidates = [aid for aid in pod_group.member_ids if aid in agents_by_id]
     votes: Dict[str, int] = {}
-    for voter_id in attendees:
-        # Candidate pool: all pod members (including self for simplicity)
-        candidates = [
-            aid for aid in pod_group.member_ids
-            if aid in agents_by_id
-        ]
-        if not candidates:
-            continue
-        # Score each candidate
-        best_id = None
-        best_score = float("-inf")
-        for cid in candidates:
-            leadership = agents_by_id[cid].personality.leadership_weight
-            noise = rng.uniform(-0.05, 0.05)
-            score = leadership + noise
-            if score > best_score:
-                best_score = score
-                best_id = cid
-        if best_id is not None:
-            votes[best_id] = votes.get(best_id, 0) + 1
+    if candidates:
+        leadership = [agents_by_id[cid].personality.leadership_weight for cid in candidates]
+        cutoff = max(leadership) - 2.0 * _POD_VOTE_NOISE
+        contenders = [(cid, lw) for cid, lw in zip(candidates, leadership) if lw >= cutoff]
+        for _voter_id in attendees:
+            best_id = None
+            best_score = float("-inf")
+            for cid, lw in contenders:
+                score = lw + rng.uniform(-_POD_VOTE_NOISE, _POD_VOTE_NOISE)
+                if score > best_score:
+                    best_score = score
+                    best_id = cid
+            if best_id is not None:
+                votes[best_id] = votes.get(best_id, 0) + 1
 
     if not votes:
         pod_group.last_meeting_tick = tick
@@ -282,6 +285,7 @@ def maybe_form_proto_council(
     tick: int,
     hub_location_id: str = "loc:well-core",
     max_council_size: int = 10,
+    pod_rep_ids: Optional[Sequence[str]] = None,
 ) -> Optional[Group]:
     """
     Create or extend the proto-council if conditions are met.
@@ -290,21 +294,22 @@ def maybe_form_proto_council(
     - If no COUNCIL exists:
       - Find pod representatives at hub_location_id.
       - If >= 2 present, create a new council group.
+
+    ``pod_rep_ids`` may carry a precomputed ``pod_representative_ids(groups)``
+    so the pod role tables are not rescanned on every call.
     """
     council = next((g for g in groups if g.group_type == GroupType.COUNCIL), None)
+    if council is not None and len(council.member_ids) >= max_council_size:
+        return council
 
     # Identify all pod reps currently at hub
+    if pod_rep_ids is None:
+        pod_rep_ids = pod_representative_ids(groups)
     rep_ids_at_hub: List[str] = []
-    for g in groups:
-        if g.group_type != GroupType.POD:
-            continue
-        for aid, roles in g.roles_by_agent.items():
-            if GroupRole.POD_REPRESENTATIVE in roles:
-                agent = agents_by_id.get(aid)
-                if agent and agent.location_id == hub_location_id:
-                    rep_ids_at_hub.append(aid)
-
-    rep_ids_at_hub = list(set(rep_ids_at_hub))
+    for aid in pod_rep_ids:
+        agent = agents_by_id.get(aid)
+        if agent and agent.location_id == hub_location_id:
+            rep_ids_at_hub.append(aid)
 
     if council is None:
         if len(rep_ids_at_hub) < 2:
@@ -324,6 +329,97 @@ def maybe_form_proto_council(
     return council
 
 
+def pod_representative_ids(groups: List[Group]) -> List[str]:
+    """Distinct POD_REPRESENTATIVE agent ids across pods, in first-seen order."""
+
+    rep_ids: Dict[str, None] = {}
+    for g in groups:
+        if g.group_type != GroupType.POD:
+            continue
+        for aid, roles in g.roles_by_agent.items():
+            if GroupRole.POD_REPRESENTATIVE in roles:
+                rep_ids.setdefault(aid, None)
+    return list(rep_ids)
+
+
+@dataclass
+class GroupSchedule:
+    """Next-due tick for pod meetings plus the cached pod representative list.
+
+    Derived runtime state (not part of snapshots): it is reset whenever the
+    number of groups or the meeting interval changes, and the representative
+    cache is dropped after any pod meeting pass.
+    """
+
+    group_count: int = -1
+    pod_interval: int = 0
+    next_pod_meeting_tick: int = 0
+    pod_rep_ids: Optional[List[str]] = None
+
+    def _sync(self, groups: List[Group], interval: int) -> None:
+        if self.group_count != len(groups) or self.pod_interval != interval:
+            self.group_count = len(groups)
+            self.pod_interval = interval
+            self.next_pod_meeting_tick = 0
+            self.pod_rep_ids = None
+
+    def rep_ids(self, groups: List[Group]) -> List[str]:
+        if self.group_count != len(groups):
+            self._sync(groups, self.pod_interval)
+        if self.pod_rep_ids is None:
+            self.pod_rep_ids = pod_representative_ids(groups)
+        return self.pod_rep_ids
+
+
+def ensure_group_schedule(world: object) -> GroupSchedule:
+    schedule = getattr(world, "group_schedule", None)
+    if not isinstance(schedule, GroupSchedule):
+        schedule = GroupSchedule()
+        world.group_schedule = schedule
+    return schedule
+
+
+def run_due_pod_meetings(
+    world: object,
+    groups: List[Group],
+    agents_by_id: Dict[str, AgentState],
+    tick: int,
+    rng: random.Random,
+    meeting_interval_ticks: int,
+    rep_vote_fraction_threshold: float = 0.4,
+    min_leadership_threshold: float = 0.6,
+    max_representatives: int = 2,
+) -> bool:
+    """Run ``maybe_run_pod_meeting`` for every pod once the earliest pod is due.
+
+    Returns True when a pass over the pods was made.
+    """
+
+    schedule = ensure_group_schedule(world)
+    schedule._sync(groups, meeting_interval_ticks)
+    if tick < schedule.next_pod_meeting_tick:
+        return False
+
+    pods = [g for g in groups if g.group_type == GroupType.POD]
+    for g in pods:
+        maybe_run_pod_meeting(
+            pod_group=g,
+            agents_by_id=agents_by_id,
+            tick=tick,
+            rng=rng,
+            meeting_interval_ticks=meeting_interval_ticks,
+            rep_vote_fraction_threshold=rep_vote_fraction_threshold,
+            min_leadership_threshold=min_leadership_threshold,
+            max_representatives=max_representatives,
+        )
+    schedule.pod_rep_ids = None
+    if meeting_interval_ticks > 0 and pods:
+        schedule.next_pod_meeting_tick = min(g.last_meeting_tick + meeting_interval_ticks for g in pods)
+    else:
+        schedule.next_pod_meeting_tick = tick + 1
+    return True
+
+
 def maybe_run_council_meeting(
     world: Optional[object],
     council_group: Group,
@@ -11,7 +11,7 @@ if TYPE_CHECKING:  # pragma: no cover - for type checking only
     from dosadi.agents.core import AgentState
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkPreference:
     # Preference in [-1.0, 1.0]
     # -1.0 = strongly dislikes / avoids
@@ -26,7 +26,7 @@ class WorkPreference:
     samples: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkPreferences:
     per_type: Dict[WorkDetailType, WorkPreference] = field(default_factory=dict)
 
@@ -36,7 +36,7 @@ class WorkPreferences:
         return self.per_type[work_type]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkDetailHistory:
     # Total "effective ticks" spent on this work type (already perf-weighted)
     ticks: float = 0.0
@@ -46,7 +46,7 @@ class WorkDetailHistory:
     proficiency: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkHistory:
     per_type: Dict[WorkDetailType, WorkDetailHistory] = field(default_factory=dict)
 
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import itertools
-import uuid
-from dataclasses import dataclass
-from typing import Dict, Optional, Set, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Mapping, Optional, Set, TYPE_CHECKING
 
 from dosadi.runtime.admin_log import AdminLogEntry
 from dosadi.memory.episodes import (
@@ -14,6 +13,8 @@ from dosadi.memory.episodes import (
     EpisodeOutcome,
     EpisodeTargetType,
     EpisodeVerb,
+    SharedEpisode,
+    SharedEpisodeEvent,
 )
 from dosadi.runtime.work_details import WorkDetailType
 
@@ -257,21 +258,92 @@ def _channel_defaults(channel: EpisodeChannel) -> tuple[float, float]:
     return 0.5, 0.0
 
 
-def _compute_goal_relevance(
-    owner: AgentState,
-    summary_tag: str,
+# GoalStatus values a cached focus goal may still hold (GoalStatus is a str enum).
+_LIVE_GOAL_STATUSES = ("ACTIVE", "PENDING")
+_NEED_GOAL_KINDS = frozenset(("eat", "get_food", "get_water", "drink"))
+_REST_GOAL_KINDS = frozenset(("rest", "sleep"))
+
+_DEFAULT_TAG_CONFIG = TagConfig(
+    base_importance=0.3,
+    default_outcome=EpisodeOutcome.NEUTRAL,
+    valence=0.0,
+    arousal=0.0,
+    threat=0.0,
+)
+
+
+class _TagTables:
+    """
+    SUMMARY_TAG_CONFIG compiled into integer-indexed columns.
+
+    Each summary tag is assigned a small integer once; the per-episode hot path
+    then reads tuples/lists by index instead of re-deriving the config and
+    running ``startswith`` checks. Unknown tags get the default config and are
+    appended on first sight. Tables are rebuilt if SUMMARY_TAG_CONFIG changes.
+    """
+
+    __slots__ = ("source_len", "index", "configs", "verbs", "need_tag", "fatigue_tag", "tag_sets")
+
+    def __init__(self) -> None:
+        self.source_len = len(SUMMARY_TAG_CONFIG)
+        self.index: Dict[str, int] = {}
+        self.configs: list[TagConfig] = []
+        self.verbs: list[str] = []
+        self.need_tag: list[bool] = []
+        self.fatigue_tag: list[bool] = []
+        self.tag_sets: list[frozenset[str]] = []
+        for tag, cfg in SUMMARY_TAG_CONFIG.items():
+            self._add(tag, cfg)
+
+    def _add(self, tag: str, cfg: TagConfig) -> int:
+        idx = len(self.configs)
+        self.index[tag] = idx
+        self.configs.append(cfg)
+        self.verbs.append(tag.upper())
+        self.need_tag.append(tag.startswith(("queue_", "body_hunger", "body_thirst")))
+        self.fatigue_tag.append(tag.startswith("body_fatigue"))
+        self.tag_sets.append(frozenset((tag,)))
+        return idx
+
+    def lookup(self, tag: str) -> int:
+        idx = self.index.get(tag)
+        if idx is None:
+            idx = self._add(tag, SUMMARY_TAG_CONFIG.get(tag, _DEFAULT_TAG_CONFIG))
+        return idx
+
+
+_tag_tables: Optional[_TagTables] = None
+
+
+def _compiled_tags() -> _TagTables:
+    global _tag_tables
+    if _tag_tables is None or _tag_tables.source_len != len(SUMMARY_TAG_CONFIG):
+        _tag_tables = _TagTables()
+    return _tag_tables
+
+
+def _goal_kind_value(focus: Goal) -> Optional[str]:
+    goal_kind = getattr(focus, "kind", None) or getattr(focus, "tag", None)
+    if goal_kind is None:
+        goal_kind = getattr(focus, "goal_type", None)
+    if isinstance(goal_kind, str):
+        return goal_kind
+    if hasattr(goal_kind, "value"):
+        return str(getattr(goal_kind, "value"))
+    return None
+
+
+def _goal_relevance_for_focus(
+    focus: Optional[Goal],
+    tag_idx: int,
     location_id: Optional[str],
     target_id: Optional[str],
 ) -> tuple[Optional[str], float, EpisodeGoalRelation]:
-    """
-    Compute (goal_id, goal_relevance, goal_relation) for the owner's current
-    focus goal, using simple v0 heuristics from D-MEMORY-0203.
-    """
-    focus: Optional[Goal] = owner.choose_focus_goal()
     if focus is None:
         return None, 0.0, EpisodeGoalRelation.UNKNOWN
 
     goal_id: Optional[str] = getattr(focus, "id", None) or getattr(focus, "goal_id", None)
+    tables = _compiled_tags()
 
     relevance = 0.0
 
@@ -283,24 +355,11 @@ def _compute_goal_relevance(
         relevance += 0.6
 
     # Resource / domain overlap: basic needs
-    goal_kind = getattr(focus, "kind", None) or getattr(focus, "tag", None)
-    if goal_kind is None:
-        goal_kind = getattr(focus, "goal_type", None)
-    if isinstance(goal_kind, str):
-        if goal_kind in ("eat", "get_food", "get_water", "drink"):
-            if summary_tag.startswith("queue_") or summary_tag.startswith("body_hunger") or summary_tag.startswith("body_thirst"):
-                relevance += 0.6
-        if goal_kind in ("rest", "sleep"):
-            if summary_tag.startswith("body_fatigue"):
-                relevance += 0.6
-    elif hasattr(goal_kind, "value"):
-        kind_value = str(getattr(goal_kind, "value"))
-        if kind_value in ("eat", "get_food", "get_water", "drink"):
-            if summary_tag.startswith("queue_") or summary_tag.startswith("body_hunger") or summary_tag.startswith("body_thirst"):
-                relevance += 0.6
-        if kind_value in ("rest", "sleep"):
-            if summary_tag.startswith("body_fatigue"):
-                relevance += 0.6
+    kind_value = _goal_kind_value(focus)
+    if kind_value in _NEED_GOAL_KINDS and tables.need_tag[tag_idx]:
+        relevance += 0.6
+    if kind_value in _REST_GOAL_KINDS and tables.fatigue_tag[tag_idx]:
+        relevance += 0.6
 
     # Target overlap (for future use; placeholder)
     goal_target_id = getattr(focus, "target_agent_id", None)
@@ -313,11 +372,28 @@ def _compute_goal_relevance(
     relevance = max(0.0, min(1.0, relevance))
 
     # v0: we don't distinguish SUPPORTS vs THWARTS; keep UNKNOWN.
-    relation = EpisodeGoalRelation.UNKNOWN
+    return goal_id, relevance, EpisodeGoalRelation.UNKNOWN
+
 
-    return goal_id, relevance, relation
+def _compute_goal_relevance(
+    owner: AgentState,
+    summary_tag: str,
+    location_id: Optional[str],
+    target_id: Optional[str],
+) -> tuple[Optional[str], float, EpisodeGoalRelation]:
+    """
+    Compute (goal_id, goal_relevance, goal_relation) for the owner's current
+    focus goal, using simple v0 heuristics from D-MEMORY-0203.
+    """
+    return _goal_relevance_for_focus(
+        owner.choose_focus_goal(),
+        _compiled_tags().lookup(summary_tag),
+        location_id,
+        target_id,
+    )
 
 
+# Fallback id source for factories that are not bound to a world.
 _episode_id_counter = itertools.count()
 
 
@@ -332,10 +408,103 @@ class EpisodeFactory:
     """
 
     world: Optional[WorldState] = None
+    # owner_id -> (tick, goal count, focus goal); see _focus_goal.
+    _focus_cache: Dict[str, tuple] = field(default_factory=dict, repr=False, compare=False)
 
     def _next_episode_id(self) -> str:
+        """Return the next episode id from the world's monotonic counter."""
+
+        next_id = getattr(self.world, "next_episode_id", None)
+        if next_id is not None:
+            return next_id()
         return f"ep:{next(_episode_id_counter)}"
 
+    def _focus_goal(self, owner: AgentState, tick: int) -> Optional[Goal]:
+        """
+        Return ``owner.choose_focus_goal()``, evaluated at most once per tick.
+
+        choose_focus_goal filters the goal list and may promote a PENDING goal
+        to ACTIVE; bulk emitters would otherwise repeat that for every episode.
+        The cached goal is refreshed when the tick or the goal count changes,
+        or when it has since reached a terminal status.
+        """
+
+        goals = owner.goals
+        cached = self._focus_cache.get(owner.agent_id)
+        if cached is not None and cached[0] == tick and cached[1] == len(goals):
+            focus = cached[2]
+            if focus is None or focus.status in _LIVE_GOAL_STATUSES:
+                return focus
+        focus = owner.choose_focus_goal()
+        self._focus_cache[owner.agent_id] = (tick, len(goals), focus)
+        return focus
+
+    def build_many(
+        self,
+        owners: Iterable[AgentState],
+        tick: int,
+        *,
+        summary_tag: str,
+        channel: EpisodeChannel,
+        location_id: Optional[str] = None,
+        target_type: EpisodeTargetType = EpisodeTargetType.OTHER,
+        target_id: Optional[str] = None,
+        event_id: Optional[str] = None,
+        source_agent_id: Optional[str] = None,
+        details: Optional[Mapping[str, Mapping[str, float | int | str]]] = None,
+    ) -> list[Episode]:
+        """
+        Build one Episode per owner for the same occurrence.
+
+        Tag, channel and emotion lookups happen once for the batch; only goal
+        linkage is computed per owner. Episodes carry ``summary_tag`` in their
+        tag set, and ``details`` optionally maps owner id to that owner's
+        detail payload.
+        """
+
+        tables = _compiled_tags()
+        tag_idx = tables.lookup(summary_tag)
+        tag_cfg = tables.configs[tag_idx]
+        verb = tables.verbs[tag_idx]
+        reliability, importance_bonus = _channel_defaults(channel)
+        importance = max(0.0, min(1.0, tag_cfg.base_importance + importance_bonus))
+
+        episodes: list[Episode] = []
+        for owner in owners:
+            goal_id, goal_relevance, goal_relation = _goal_relevance_for_focus(
+                self._focus_goal(owner, tick), tag_idx, location_id, target_id
+            )
+            owner_details = details.get(owner.agent_id) if details else None
+            episodes.append(
+                Episode(
+                    episode_id=self._next_episode_id(),
+                    owner_agent_id=owner.agent_id,
+                    tick=tick,
+                    location_id=location_id,
+                    channel=channel,
+                    source_agent_id=source_agent_id,
+                    event_id=event_id,
+                    target_type=target_type,
+                    target_id=target_id,
+                    verb=verb,
+                    summary_tag=summary_tag,
+                    goal_id=goal_id,
+                    goal_relation=goal_relation,
+                    goal_relevance=goal_relevance,
+                    outcome=tag_cfg.default_outcome,
+                    emotion=EmotionSnapshot(
+                        valence=tag_cfg.valence,
+                        arousal=tag_cfg.arousal,
+                        threat=tag_cfg.threat,
+                    ),
+                    importance=importance,
+                    reliability=reliability,
+                    tags={summary_tag},
+                    details=dict(owner_details) if owner_details else {},
+                )
+            )
+        return episodes
+
     def build_episode(
         self,
         owner: AgentState,
@@ -350,16 +519,9 @@ class EpisodeFactory:
         source_agent_id: Optional[str] = None,
     ) -> Episode:
         # Tag defaults
-        tag_cfg = SUMMARY_TAG_CONFIG.get(
-            summary_tag,
-            TagConfig(
-                base_importance=0.3,
-                default_outcome=EpisodeOutcome.NEUTRAL,
-                valence=0.0,
-                arousal=0.0,
-                threat=0.0,
-            ),
-        )
+        tables = _compiled_tags()
+        tag_idx = tables.lookup(summary_tag)
+        tag_cfg = tables.configs[tag_idx]
 
         # Channel defaults
         reliability, importance_bonus = _channel_defaults(channel)
@@ -375,15 +537,11 @@ class EpisodeFactory:
         importance = max(0.0, min(1.0, tag_cfg.base_importance + importance_bonus))
 
         # Goal linkage
-        goal_id, goal_relevance, goal_relation = _compute_goal_relevance(
-            owner=owner,
-            summary_tag=summary_tag,
-            location_id=location_id,
-            target_id=target_id,
+        goal_id, goal_relevance, goal_relation = _goal_relevance_for_focus(
+            self._focus_goal(owner, tick), tag_idx, location_id, target_id
         )
 
-        # Simple episode_id: uuid4
-        episode_id = f"ep:{uuid.uuid4().hex}"
+        episode_id = self._next_episode_id()
 
         episode = Episode(
             episode_id=episode_id,
@@ -395,7 +553,7 @@ class EpisodeFactory:
             event_id=event_id,
             target_type=target_type,
             target_id=target_id,
-            verb=summary_tag.upper(),  # simple mapping for now
+            verb=tables.verbs[tag_idx],  # simple mapping for now
             summary_tag=summary_tag,
             goal_id=goal_id,
             goal_relation=goal_relation,
@@ -408,6 +566,63 @@ class EpisodeFactory:
 
         return episode
 
+    def build_shared_event(
+        self,
+        tick: int,
+        *,
+        summary_tag: str,
+        channel: EpisodeChannel,
+        location_id: Optional[str] = None,
+        target_type: EpisodeTargetType = EpisodeTargetType.OTHER,
+        target_id: Optional[str] = None,
+        event_id: Optional[str] = None,
+        source_agent_id: Optional[str] = None,
+    ) -> SharedEpisodeEvent:
+        """Build the owner-independent record shared by every witness of an event."""
+
+        tables = _compiled_tags()
+        tag_idx = tables.lookup(summary_tag)
+        tag_cfg = tables.configs[tag_idx]
+        return SharedEpisodeEvent(
+            tick=tick,
+            location_id=location_id,
+            channel=channel,
+            source_agent_id=source_agent_id,
+            event_id=event_id,
+            target_type=target_type,
+            target_id=target_id,
+            verb=tables.verbs[tag_idx],
+            summary_tag=summary_tag,
+            outcome=tag_cfg.default_outcome,
+            emotion=EmotionSnapshot(
+                valence=tag_cfg.valence,
+                arousal=tag_cfg.arousal,
+                threat=tag_cfg.threat,
+            ),
+            tags=tables.tag_sets[tag_idx],
+        )
+
+    def build_shared_episode(self, owner: AgentState, shared: SharedEpisodeEvent) -> SharedEpisode:
+        """Attach a per-owner overlay (goal linkage, salience) to ``shared``."""
+
+        tables = _compiled_tags()
+        tag_idx = tables.lookup(shared.summary_tag)
+        tag_cfg = tables.configs[tag_idx]
+        reliability, importance_bonus = _channel_defaults(shared.channel)
+        goal_id, goal_relevance, goal_relation = _goal_relevance_for_focus(
+            self._focus_goal(owner, shared.tick), tag_idx, shared.location_id, shared.target_id
+        )
+        return SharedEpisode(
+            episode_id=self._next_episode_id(),
+            owner_agent_id=owner.agent_id,
+            shared=shared,
+            goal_id=goal_id,
+            goal_relation=goal_relation,
+            goal_relevance=goal_relevance,
+            importance=max(0.0, min(1.0, tag_cfg.base_importance + importance_bonus)),
+            reliability=reliability,
+        )
+
     def create_body_signal_episode(
         self,
         *,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Deque, Dict, List, Optional, Set
+from typing import Deque, Dict, FrozenSet, List, Mapping, Optional, Set
 
 
 class EpisodeChannel(Enum):
@@ -96,7 +96,7 @@ class EpisodeVerb:
     ASSIGNMENT_DISPUTE = "ASSIGNMENT_DISPUTE"
 
 
-@dataclass
+@dataclass(slots=True)
 class EmotionSnapshot:
     """
     Minimal emotional state associated with an episode.
@@ -111,7 +111,7 @@ class EmotionSnapshot:
     threat: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     """
     A single, owner-relative record of something the agent experienced or learned.
@@ -164,7 +164,137 @@ class Episode:
     details: Dict[str, float | int | str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class SharedEpisodeEvent:
+    """
+    Owner-independent part of an episode that many agents experienced at once.
+
+    A single record is built per world occurrence (e.g. a queue serving step)
+    and referenced by every observer's SharedEpisode overlay, instead of
+    copying the same fields into one Episode per observer.
+    """
+
+    tick: int
+    location_id: Optional[str] = None
+    channel: EpisodeChannel = EpisodeChannel.OBSERVED
+    source_agent_id: Optional[str] = None
+    event_id: Optional[str] = None
+    target_type: EpisodeTargetType = EpisodeTargetType.OTHER
+    target_id: Optional[str] = None
+    verb: str = ""
+    summary_tag: str = ""
+    outcome: EpisodeOutcome = EpisodeOutcome.NEUTRAL
+    emotion: EmotionSnapshot = field(default_factory=EmotionSnapshot)
+    tags: FrozenSet[str] = frozenset()
+    details: Mapping[str, float | int | str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class SharedEpisode:
+    """
+    Per-owner overlay on a SharedEpisodeEvent.
+
+    Only the owner-relative fields (goal linkage, salience, reliability) are
+    stored here; everything else reads through to the shared record, so a
+    SharedEpisode can be used wherever an Episode is read.
+    """
+
+    episode_id: str
+    owner_agent_id: str
+    shared: SharedEpisodeEvent
+
+    goal_id: Optional[str] = None
+    goal_relation: EpisodeGoalRelation = EpisodeGoalRelation.UNKNOWN
+    goal_relevance: float = 0.0
+
+    importance: float = 0.0
+    reliability: float = 0.5
+
+    @property
+    def tick(self) -> int:
+        return self.shared.tick
+
+    @property
+    def location_id(self) -> Optional[str]:
+        return self.shared.location_id
+
+    @property
+    def channel(self) -> EpisodeChannel:
+        return self.shared.channel
+
+    @property
+    def source_agent_id(self) -> Optional[str]:
+        return self.shared.source_agent_id
+
+    @property
+    def event_id(self) -> Optional[str]:
+        return self.shared.event_id
+
+    @property
+    def target_type(self) -> EpisodeTargetType:
+        return self.shared.target_type
+
+    @property
+    def target_id(self) -> Optional[str]:
+        return self.shared.target_id
+
+    @property
+    def verb(self) -> str:
+        return self.shared.verb
+
+    @property
+    def summary_tag(self) -> str:
+        return self.shared.summary_tag
+
+    @property
+    def outcome(self) -> EpisodeOutcome:
+        return self.shared.outcome
+
+    @property
+    def emotion(self) -> EmotionSnapshot:
+        return self.shared.emotion
+
+    @property
+    def tags(self) -> FrozenSet[str]:
+        return self.shared.tags
+
+    @property
+    def details(self) -> Mapping[str, float | int | str]:
+        return self.shared.details
+
+    def materialize(self) -> Episode:
+        """Return a standalone Episode copy (e.g. before mutating it)."""
+
+        shared = self.shared
+        return Episode(
+            episode_id=self.episode_id,
+            owner_agent_id=self.owner_agent_id,
+            tick=shared.tick,
+            location_id=shared.location_id,
+            channel=shared.channel,
+            source_agent_id=shared.source_agent_id,
+            event_id=shared.event_id,
+            target_type=shared.target_type,
+            target_id=shared.target_id,
+            verb=shared.verb,
+            summary_tag=shared.summary_tag,
+            goal_id=self.goal_id,
+            goal_relation=self.goal_relation,
+            goal_relevance=self.goal_relevance,
+            outcome=shared.outcome,
+            emotion=EmotionSnapshot(
+                valence=shared.emotion.valence,
+                arousal=shared.emotion.arousal,
+                threat=shared.emotion.threat,
+            ),
+            importance=self.importance,
+            reliability=self.reliability,
+            tags=set(shared.tags),
+            details=dict(shared.details),
+        )
+
+
+@dataclass(slots=True)
 class EpisodeBuffers:
     """
     Container for an agent's episodic memory layers.
@@ -176,8 +306,8 @@ class EpisodeBuffers:
       (for scribes, auditors, etc.).
     """
 
-    short_term: Deque[Episode] = field(default_factory=deque)
-    daily: List[Episode] = field(default_factory=list)
+    short_term: Deque[Episode | SharedEpisode] = field(default_factory=deque)
+    daily: List[Episode | SharedEpisode] = field(default_factory=list)
 
     # For agents whose job includes record-keeping, they may keep references
     # to long-lived external records instead of internal full episodes.
@@ -187,7 +317,7 @@ class EpisodeBuffers:
     short_term_capacity: int = 50
     daily_capacity: int = 100
 
-    def push_short_term(self, episode: Episode) -> None:
+    def push_short_term(self, episode: Episode | SharedEpisode) -> None:
         """
         Add an episode to short-term buffer, evicting a low-importance episode
         if over capacity.
@@ -209,7 +339,7 @@ class EpisodeBuffers:
                 self.short_term.popleft()
                 self.short_term.rotate(lowest_idx)
 
-    def promote_to_daily(self, episode: Episode) -> None:
+    def promote_to_daily(self, episode: Episode | SharedEpisode) -> None:
         """
         Move or copy an episode into the daily buffer, respecting capacity.
         Lower-importance daily episodes are dropped on overflow.
@@ -2,19 +2,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from dosadi.memory.episodes import Episode, EpisodeVerb
+from dosadi.memory.episodes import Episode, EpisodeVerb, SharedEpisode
 
 if TYPE_CHECKING:  # pragma: no cover
     from dosadi.agents.core import PlaceBelief
 
 
-def apply_episode_to_place_belief(pb: PlaceBelief, ep: Episode) -> None:
+def apply_episode_to_place_belief(pb: PlaceBelief, ep: Episode | SharedEpisode) -> None:
     """
     Extend PlaceBelief updates with verb-aware consolidation hooks.
 
     Base tag-driven updates are still handled via PlaceBelief.update_from_episode;
     this function adds lightweight adjustments for new standardized verbs used by
-    work details (D-MEMORY-0210).
+    work details (D-MEMORY-0210). SharedEpisode overlays read their verb, tags,
+    details and emotion from the shared record and are handled identically.
     """
 
     pb.update_from_episode(ep)
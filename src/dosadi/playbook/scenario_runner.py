@@ -9,6 +9,7 @@ simple overrides, and invoke the deterministic runners.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Callable, Dict, Mapping, Optional, Sequence
 
 
@@ -60,13 +61,27 @@ def run_scenario(
     *,
     config: Optional[Any] = None,
     overrides: Optional[Mapping[str, object]] = None,
+    profile: Optional[Path] = None,
+    profile_interval_ms: float = 5.0,
 ) -> Any:
+    """Run scenario ``name``; with ``profile`` set, sample the run into that directory."""
+
     entry = get_scenario_entry(name)
     if config is not None and overrides:
         raise ValueError("Pass either 'config' or 'overrides', not both")
     if config is None:
         config = entry.build_config(overrides)
-    return entry.runner(config)
+    if profile is None:
+        return entry.runner(config)
+
+    from ..runtime.sampling_profiler import SamplingProfiler
+
+    profiler = SamplingProfiler(Path(profile), interval_ms=profile_interval_ms)
+    profiler.start()
+    try:
+        return entry.runner(config)
+    finally:
+        profiler.stop(label=name)
 
 @dataclass(slots=True)
 class FoundingWakeupScenarioConfig:
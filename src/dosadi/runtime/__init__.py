@@ -1,17 +1,31 @@
-"""Runtime helpers for the Wakeup Prime scenario (and legacy MVP alias)."""
+"""Runtime helpers for the Wakeup Prime scenario (and legacy MVP alias).
 
-from .founding_wakeup import (
-    FoundingWakeupConfig,
-    FoundingWakeupReport,
-    RuntimeConfig,
-    build_founding_wakeup_report,
-    run_founding_wakeup_from_config,
-    run_founding_wakeup_mvp,
-    step_world_once,
-)
-from .protocol_authoring import handle_protocol_authoring, maybe_author_movement_protocols
-from .timewarp import TimewarpConfig, select_awake_set, step_day, step_to_day
-from .wakeup_prime import WakeupPrimeRuntimeConfig, run_wakeup_prime, step_wakeup_prime_once
+Public names are resolved lazily so that importing a single runtime module
+(``dosadi.runtime.snapshot``, a CLI, ...) does not import the whole runtime.
+"""
+
+from .subsystems import lazy_module_getattr
+
+_EXPORTS = {
+    "FoundingWakeupConfig": "dosadi.runtime.founding_wakeup:FoundingWakeupConfig",
+    "FoundingWakeupReport": "dosadi.runtime.founding_wakeup:FoundingWakeupReport",
+    "RuntimeConfig": "dosadi.runtime.founding_wakeup:RuntimeConfig",
+    "build_founding_wakeup_report": "dosadi.runtime.founding_wakeup:build_founding_wakeup_report",
+    "run_founding_wakeup_from_config": "dosadi.runtime.founding_wakeup:run_founding_wakeup_from_config",
+    "run_founding_wakeup_mvp": "dosadi.runtime.founding_wakeup:run_founding_wakeup_mvp",
+    "step_world_once": "dosadi.runtime.founding_wakeup:step_world_once",
+    "handle_protocol_authoring": "dosadi.runtime.protocol_authoring:handle_protocol_authoring",
+    "maybe_author_movement_protocols": "dosadi.runtime.protocol_authoring:maybe_author_movement_protocols",
+    "TimewarpConfig": "dosadi.runtime.timewarp:TimewarpConfig",
+    "select_awake_set": "dosadi.runtime.timewarp:select_awake_set",
+    "step_day": "dosadi.runtime.timewarp:step_day",
+    "step_to_day": "dosadi.runtime.timewarp:step_to_day",
+    "WakeupPrimeRuntimeConfig": "dosadi.runtime.wakeup_prime:WakeupPrimeRuntimeConfig",
+    "run_wakeup_prime": "dosadi.runtime.wakeup_prime:run_wakeup_prime",
+    "step_wakeup_prime_once": "dosadi.runtime.wakeup_prime:step_wakeup_prime_once",
+}
+
+__getattr__ = lazy_module_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "FoundingWakeupConfig",
@@ -4,7 +4,7 @@ import random
 from typing import Optional, Tuple
 
 from dosadi.agents.core import AgentState, Goal
-from dosadi.runtime.queues import QueueLifecycleState, QueueState
+from dosadi.runtime.queues import QueueLifecycleState, QueueState, enqueue_agent
 from dosadi.state import WorldState
 from dosadi.runtime.facility_choice import choose_facility_for_service
 
@@ -97,8 +97,7 @@ def attempt_join_queue(
     if queue.state is not QueueLifecycleState.ACTIVE:
         return False
 
-    if agent.id not in queue.agents_waiting:
-        queue.agents_waiting.append(agent.id)
+    enqueue_agent(world, queue, agent.id)
 
     agent.current_queue_id = queue_id
     agent.queue_join_tick = tick
@@ -0,0 +1,108 @@
+"""Bounded background writer for milestone I/O.
+
+Jobs are executed on one worker thread in submission order, so writes that
+depend on each other (snapshot file, then manifest, then timeline row) stay
+ordered. ``submit`` blocks once ``max_pending`` jobs are queued, which keeps
+memory bounded when the simulation outpaces the disk.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+_STOP = object()
+
+
+@dataclass(slots=True)
+class WriterStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    blocked_seconds: float = 0.0
+    busy_seconds: float = 0.0
+
+
+class BackgroundWriter:
+    """Single worker thread with a bounded job queue and back-pressure."""
+
+    def __init__(self, max_pending: int = 2, *, name: str = "dosadi-writer") -> None:
+        self.max_pending = max(1, int(max_pending))
+        self.stats = WriterStats()
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                future, fn, args, kwargs = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                started = time.perf_counter()
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:  # surfaced on the caller thread
+                    self.stats.failed += 1
+                    if self._error is None:
+                        self._error = exc
+                    future.set_exception(exc)
+                else:
+                    self.stats.completed += 1
+                    future.set_result(result)
+                finally:
+                    self.stats.busy_seconds += time.perf_counter() - started
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("background write failed") from error
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue ``fn(*args, **kwargs)``; blocks while the queue is full."""
+
+        if self._closed:
+            raise RuntimeError("writer is closed")
+        self._raise_pending_error()
+        future: Future = Future()
+        started = time.perf_counter()
+        self._queue.put((future, fn, args, kwargs))
+        self.stats.blocked_seconds += time.perf_counter() - started
+        self.stats.submitted += 1
+        return future
+
+    def flush(self) -> None:
+        """Block until every submitted job has finished; re-raise the first failure."""
+
+        self._queue.join()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Flush outstanding jobs and stop the worker thread."""
+
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._raise_pending_error()
+
+
+__all__ = ["BackgroundWriter", "WriterStats"]
@@ -16,3 +16,8 @@ MIN_TICKS_AS_SUPERVISOR_BEFORE_REPORT: int = 40_000
 PREFERENCE_REVIEW_INTERVAL_TICKS: int = 120_000  # ~once per "day"
 NEGATIVE_PREFERENCE_THRESHOLD: float = -0.3
 POSITIVE_PREFERENCE_THRESHOLD: float = 0.3
+
+# Needs decay rates shared by the tick loop (eating) and timewarp integration
+HUNGER_RATE_PER_TICK: float = 1.0 / 50_000.0
+HUNGER_MAX: float = 2.0
+HYDRATION_DECAY_PER_TICK: float = 1.0 / 80_000.0
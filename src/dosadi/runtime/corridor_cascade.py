@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Mapping, MutableMapping
+from dataclasses import dataclass, field, replace
+import heapq
+import math
+from typing import Any, Iterable, Mapping, MutableMapping
 
 from dosadi.runtime.events import EventKind, ensure_event_bus
 from dosadi.runtime.rng_service import RNGService, ensure_rng_service
@@ -29,6 +31,9 @@ class CorridorCascadeConfig:
     enforcement_effect: float = 0.15
     maintenance_effect: float = 0.25
     rng_stream_prefix: str = "corridor:"
+    # Only evaluate corridors that were touched or may cross a threshold;
+    # quiet corridors are caught up lazily with identical arithmetic.
+    incremental: bool = True
 
 
 @dataclass(slots=True)
@@ -45,6 +50,8 @@ class CorridorCascadeState:
     recent_failures_7d: float = 0.0
     recent_success_7d: float = 0.0
     last_event_day: int = -1
+    # Number of cascade updates applied to this corridor (-1: not swept).
+    synced_seq: int = -1
 
     def signature(self) -> tuple:
         return (
@@ -65,8 +72,34 @@ class CorridorCascadeState:
 @dataclass(slots=True)
 class CorridorCascadeLedger:
     corridors: dict[str, CorridorCascadeState] = field(default_factory=dict)
+    # Incremental bookkeeping: update_seq counts update_corridor_cascades calls;
+    # hot/dirty corridors are evaluated on the next update; quiet corridors sit
+    # in the wake heap until a threshold crossing becomes possible.
+    update_seq: int = 0
+    tracked_count: int = -1
+    hot: set[str] = field(default_factory=set)
+    dirty: set[str] = field(default_factory=set)
+    wake_heap: list[list] = field(default_factory=list)
+    wake_at: dict[str, int] = field(default_factory=dict)
+    replay_cfg: CorridorCascadeConfig | None = None
+
+    def catch_up(self, state: CorridorCascadeState, upto_seq: int | None = None) -> None:
+        """Apply the quiet-corridor steps a lagging state has not seen yet."""
+
+        target = self.update_seq if upto_seq is None else upto_seq
+        if state.synced_seq < 0 or state.synced_seq >= target or self.replay_cfg is None:
+            return
+        cfg = self.replay_cfg
+        for _ in range(target - state.synced_seq):
+            _advance_state(cfg, state, pressure=0.0, maintenance=0.0, escort=0.0)
+        state.synced_seq = target
+
+    def sync(self) -> None:
+        for state in self.corridors.values():
+            self.catch_up(state)
 
     def signature(self) -> tuple:
+        self.sync()
         return tuple(
             (cid, state.signature()) for cid, state in sorted(self.corridors.items())
         )
@@ -90,16 +123,27 @@ def ensure_cascade_ledger(world: Any) -> CorridorCascadeLedger:
 
 def corridor_state(world: Any, corridor_id: str) -> CorridorCascadeState:
     ledger = ensure_cascade_ledger(world)
-    if corridor_id not in ledger.corridors:
-        ledger.corridors[corridor_id] = CorridorCascadeState()
-    return ledger.corridors[corridor_id]
+    state = ledger.corridors.get(corridor_id)
+    if state is None:
+        state = ledger.corridors[corridor_id] = CorridorCascadeState()
+    else:
+        ledger.catch_up(state)
+    return state
 
 
 def corridor_status(world: Any, corridor_id: str) -> str:
+    # A lagging quiet corridor cannot change status before its wake-up, so no
+    # catch-up is needed here.
     state = ensure_cascade_ledger(world).corridors.get(corridor_id)
     return state.collapse_status if state else "ACTIVE"
 
 
+def mark_corridor_dirty(world: Any, corridor_id: str) -> None:
+    """Have the next incremental update re-evaluate ``corridor_id``."""
+
+    ensure_cascade_ledger(world).dirty.add(corridor_id)
+
+
 def _maintenance_investment(world: Any, corridor_id: str) -> float:
     mapping = getattr(world, "corridor_maintenance_investment", {}) or {}
     return _clamp01(float(mapping.get(corridor_id, 0.0)))
@@ -134,6 +178,7 @@ def record_delivery_outcome(
     else:
         state.recent_failures_7d = min(cfg.risk_window_days, state.recent_failures_7d + 1.0)
     state.last_event_day = day
+    mark_corridor_dirty(world, corridor_id)
 
 
 def _emit_status_event(
@@ -180,101 +225,257 @@ def _effective_pressure(world: Any, corridor_id: str) -> float:
     return _clamp01(base_pressure * (1.0 - cfg.enforcement_effect * enforcement))
 
 
-def update_corridor_cascades(world: Any, day: int) -> None:
-    cfg = ensure_cascade_config(world)
-    if not getattr(cfg, "enabled", False):
-        return
+def _advance_state(
+    cfg: CorridorCascadeConfig,
+    state: CorridorCascadeState,
+    *,
+    pressure: float,
+    maintenance: float,
+    escort: float,
+) -> None:
+    """One day of corridor dynamics; shared by full evaluation and catch-up."""
 
-    ledger = ensure_cascade_ledger(world)
+    state.recent_failures_7d = _decay_window(state.recent_failures_7d, cfg.risk_window_days)
+    state.recent_success_7d = _decay_window(state.recent_success_7d, cfg.risk_window_days)
+
+    state.pressure = pressure
+    state.maintenance_debt = _clamp01(
+        state.maintenance_debt + 0.1 * state.pressure - cfg.maintenance_effect * maintenance
+    )
+    state.risk = _clamp01(0.6 * state.pressure + 0.4 * state.maintenance_debt)
+    state.health = _clamp01(
+        state.health
+        - cfg.health_decay_base * (1.0 + state.pressure + state.maintenance_debt)
+        + cfg.health_repair_base * maintenance
+    )
+
+    escort_mitigation = cfg.escort_effect * escort
+    if escort_mitigation > 0:
+        state.risk = _clamp01(state.risk * (1.0 - escort_mitigation))
+
+    if state.health < cfg.degraded_threshold:
+        state.days_degraded += 1
+    else:
+        state.days_degraded = 0
+
+    if state.health < cfg.closed_threshold:
+        state.days_closed += 1
+    else:
+        state.days_closed = 0
+
+    if state.health < cfg.collapse_threshold:
+        state.consecutive_collapse_days += 1
+    else:
+        state.consecutive_collapse_days = 0
+
+    abandonment = state.recent_success_7d <= 0.1 and state.risk >= 0.5
+    state.abandonment_days = state.abandonment_days + 1 if abandonment else 0
+
+    status = "ACTIVE"
+    if state.health < cfg.degraded_threshold or state.days_degraded > 0:
+        status = "DEGRADED"
+    if state.health < cfg.closed_threshold or state.days_closed > 0:
+        status = "CLOSED"
+    if state.consecutive_collapse_days >= cfg.collapse_days or state.abandonment_days >= cfg.abandonment_days:
+        status = "COLLAPSED"
+    state.collapse_status = status
+
+
+def _evaluate_corridor(
+    world: Any,
+    cfg: CorridorCascadeConfig,
+    ledger: CorridorCascadeLedger,
+    rng_service: RNGService,
+    corridor_id: str,
+    *,
+    day: int,
+    seq: int,
+) -> bool:
+    """Full daily update for one corridor; returns True when it is quiet."""
+
+    state = ledger.corridors.get(corridor_id)
+    if state is None:
+        state = ledger.corridors[corridor_id] = CorridorCascadeState()
+    ledger.catch_up(state, seq - 1)
+    prev_status = state.collapse_status
+
+    maintenance = _maintenance_investment(world, corridor_id)
+    escort = _escort_level(world, corridor_id)
+    _advance_state(
+        cfg,
+        state,
+        pressure=_effective_pressure(world, corridor_id),
+        maintenance=maintenance,
+        escort=escort,
+    )
+    state.synced_seq = seq
+    status = state.collapse_status
+
+    collapsed_set: set[str] = getattr(world, "collapsed_corridors", set())
+    if status == "COLLAPSED":
+        collapsed_set.add(corridor_id)
+    else:
+        collapsed_set.discard(corridor_id)
+    world.collapsed_corridors = collapsed_set
+
+    if status != prev_status:
+        reason = "PRESSURE" if state.pressure >= state.maintenance_debt else "MAINT_DEBT"
+        if state.abandonment_days >= cfg.abandonment_days:
+            reason = "ABANDONMENT"
+        payload = {
+            "corridor_id": corridor_id,
+            "health": round(state.health, 4),
+            "risk": round(state.risk, 4),
+            "pressure": round(state.pressure, 4),
+            "failures": round(state.recent_failures_7d, 4),
+            "success": round(state.recent_success_7d, 4),
+            "reason": reason,
+        }
+        event_kind = {
+            "DEGRADED": EventKind.CORRIDOR_DEGRADED,
+            "CLOSED": EventKind.CORRIDOR_CLOSED,
+            "COLLAPSED": EventKind.CORRIDOR_COLLAPSED,
+        }.get(status)
+        if event_kind:
+            _emit_status_event(world, corridor_id=corridor_id, day=day, status=event_kind, payload=payload)
+            severity = max(0.1, 1.0 - state.health)
+            if event_kind in {EventKind.CORRIDOR_CLOSED, EventKind.CORRIDOR_COLLAPSED}:
+                _record_incident(world, day=day, corridor_id=corridor_id, status=event_kind, severity=severity)
+
+    rng_service.rand(
+        f"{cfg.rng_stream_prefix}update",
+        scope={"corridor_id": corridor_id, "day": day, "status": state.collapse_status},
+    )
+    return (
+        state.pressure == 0.0
+        and maintenance == 0.0
+        and escort == 0.0
+        and state.abandonment_days == 0
+        and cfg.health_decay_base >= 0.0
+    )
+
+
+def _next_wake_seq(cfg: CorridorCascadeConfig, state: CorridorCascadeState, seq: int) -> int | None:
+    """
+    Earliest update at which a quiet corridor could change status.
+
+    With no pressure, maintenance or escort, health falls by a fixed amount
+    per update and nothing else moves, so status only changes when health
+    crosses a threshold or the collapse counter fills. Waking early is always
+    safe (evaluation is exact), so estimates round down by a step.
+    """
+
+    step = cfg.health_decay_base * (1.0 + state.maintenance_debt)
+    candidates: list[int] = []
+    if step > 0:
+        for threshold in (cfg.degraded_threshold, cfg.closed_threshold, cfg.collapse_threshold):
+            if threshold > 0 and state.health >= threshold:
+                candidates.append(int(math.floor((state.health - threshold) / step)) - 1)
+    if state.health < cfg.collapse_threshold and state.consecutive_collapse_days < cfg.collapse_days:
+        candidates.append(cfg.collapse_days - state.consecutive_collapse_days)
+    if not candidates:
+        return None
+    return seq + max(1, min(candidates))
+
+
+def _input_corridors(world: Any) -> Iterable[str]:
+    for name in ("corridor_stress", "corridor_maintenance_investment", "corridor_escort_level"):
+        mapping = getattr(world, name, None) or {}
+        yield from mapping.keys()
+    risk_ledger = getattr(world, "risk_ledger", None)
+    if risk_ledger is not None:
+        yield from (getattr(risk_ledger, "edges", None) or {}).keys()
+
+
+def _track_universe(ledger: CorridorCascadeLedger, universe: Mapping[str, Any], seq: int) -> None:
+    for corridor_id, state in ledger.corridors.items():
+        if state.synced_seq >= 0 and corridor_id not in universe:
+            ledger.catch_up(state, seq - 1)
+            state.synced_seq = -1
+            ledger.wake_at.pop(corridor_id, None)
+    for corridor_id in universe:
+        state = ledger.corridors.get(corridor_id)
+        if state is None:
+            state = ledger.corridors[corridor_id] = CorridorCascadeState()
+        if state.synced_seq < 0:
+            state.synced_seq = seq - 1
+            ledger.hot.add(corridor_id)
+    ledger.tracked_count = len(universe)
+
+
+def _full_sweep(world: Any, cfg: CorridorCascadeConfig, ledger: CorridorCascadeLedger, day: int) -> None:
+    ledger.sync()
     survey_map = getattr(world, "survey_map", None)
     corridor_ids = list(getattr(survey_map, "edges", {}).keys()) if survey_map else list(ledger.corridors.keys())
     rng_service: RNGService = ensure_rng_service(world)
-
+    seq = ledger.update_seq + 1
     for corridor_id in sorted(set(corridor_ids)):
-        state = corridor_state(world, corridor_id)
-        prev_status = state.collapse_status
-        state.recent_failures_7d = _decay_window(state.recent_failures_7d, cfg.risk_window_days)
-        state.recent_success_7d = _decay_window(state.recent_success_7d, cfg.risk_window_days)
-
-        maintenance = _maintenance_investment(world, corridor_id)
-        escort = _escort_level(world, corridor_id)
-        state.pressure = _effective_pressure(world, corridor_id)
-        state.maintenance_debt = _clamp01(
-            state.maintenance_debt + 0.1 * state.pressure - cfg.maintenance_effect * maintenance
-        )
-        state.risk = _clamp01(0.6 * state.pressure + 0.4 * state.maintenance_debt)
-        state.health = _clamp01(
-            state.health
-            - cfg.health_decay_base * (1.0 + state.pressure + state.maintenance_debt)
-            + cfg.health_repair_base * maintenance
-        )
+        state = ledger.corridors.get(corridor_id)
+        if state is not None and state.synced_seq < 0:
+            state.synced_seq = seq - 1
+        _evaluate_corridor(world, cfg, ledger, rng_service, corridor_id, day=day, seq=seq)
+    ledger.update_seq = seq
+    # Everything is current; let a later incremental update start afresh.
+    ledger.tracked_count = -1
+    ledger.hot.clear()
+    ledger.dirty.clear()
+    ledger.wake_heap.clear()
+    ledger.wake_at.clear()
+    ledger.replay_cfg = replace(cfg)
+
+
+def _incremental_update(world: Any, cfg: CorridorCascadeConfig, ledger: CorridorCascadeLedger, day: int) -> None:
+    seq = ledger.update_seq + 1
+    if ledger.replay_cfg != cfg:
+        # Lagging corridors must finish their quiet days under the old config.
+        ledger.sync()
+        ledger.replay_cfg = replace(cfg)
+        ledger.hot.update(ledger.wake_at)
+        ledger.wake_at.clear()
+        ledger.wake_heap.clear()
 
-        escort_mitigation = cfg.escort_effect * escort
-        if escort_mitigation > 0:
-            state.risk = _clamp01(state.risk * (1.0 - escort_mitigation))
-
-        if state.health < cfg.degraded_threshold:
-            state.days_degraded += 1
-        else:
-            state.days_degraded = 0
-
-        if state.health < cfg.closed_threshold:
-            state.days_closed += 1
-        else:
-            state.days_closed = 0
-
-        if state.health < cfg.collapse_threshold:
-            state.consecutive_collapse_days += 1
-        else:
-            state.consecutive_collapse_days = 0
-
-        abandonment = state.recent_success_7d <= 0.1 and state.risk >= 0.5
-        state.abandonment_days = state.abandonment_days + 1 if abandonment else 0
-
-        status = "ACTIVE"
-        if state.health < cfg.degraded_threshold or state.days_degraded > 0:
-            status = "DEGRADED"
-        if state.health < cfg.closed_threshold or state.days_closed > 0:
-            status = "CLOSED"
-        if state.consecutive_collapse_days >= cfg.collapse_days or state.abandonment_days >= cfg.abandonment_days:
-            status = "COLLAPSED"
-
-        state.collapse_status = status
-        collapsed_set: set[str] = getattr(world, "collapsed_corridors", set())
-        if status == "COLLAPSED":
-            collapsed_set.add(corridor_id)
-        else:
-            collapsed_set.discard(corridor_id)
-        world.collapsed_corridors = collapsed_set
-
-        if status != prev_status:
-            reason = "PRESSURE" if state.pressure >= state.maintenance_debt else "MAINT_DEBT"
-            if state.abandonment_days >= cfg.abandonment_days:
-                reason = "ABANDONMENT"
-            payload = {
-                "corridor_id": corridor_id,
-                "health": round(state.health, 4),
-                "risk": round(state.risk, 4),
-                "pressure": round(state.pressure, 4),
-                "failures": round(state.recent_failures_7d, 4),
-                "success": round(state.recent_success_7d, 4),
-                "reason": reason,
-            }
-            event_kind = {
-                "DEGRADED": EventKind.CORRIDOR_DEGRADED,
-                "CLOSED": EventKind.CORRIDOR_CLOSED,
-                "COLLAPSED": EventKind.CORRIDOR_COLLAPSED,
-            }.get(status)
-            if event_kind:
-                _emit_status_event(world, corridor_id=corridor_id, day=day, status=event_kind, payload=payload)
-                severity = max(0.1, 1.0 - state.health)
-                if event_kind in {EventKind.CORRIDOR_CLOSED, EventKind.CORRIDOR_COLLAPSED}:
-                    _record_incident(world, day=day, corridor_id=corridor_id, status=event_kind, severity=severity)
-
-        rng_service.rand(
-            f"{cfg.rng_stream_prefix}update",
-            scope={"corridor_id": corridor_id, "day": day, "status": state.collapse_status},
-        )
+    survey_map = getattr(world, "survey_map", None)
+    universe: Mapping[str, Any] = getattr(survey_map, "edges", {}) if survey_map else ledger.corridors
+    if len(universe) != ledger.tracked_count:
+        _track_universe(ledger, universe, seq)
+
+    candidates = set(ledger.hot)
+    candidates.update(ledger.dirty)
+    candidates.update(_input_corridors(world))
+    heap = ledger.wake_heap
+    while heap and heap[0][0] <= seq:
+        wake_seq, corridor_id = heapq.heappop(heap)
+        if ledger.wake_at.get(corridor_id) == wake_seq:
+            candidates.add(corridor_id)
+    ledger.hot.clear()
+    ledger.dirty.clear()
+
+    rng_service: RNGService = ensure_rng_service(world)
+    for corridor_id in sorted(candidates):
+        if corridor_id not in universe:
+            continue
+        ledger.wake_at.pop(corridor_id, None)
+        quiet = _evaluate_corridor(world, cfg, ledger, rng_service, corridor_id, day=day, seq=seq)
+        if not quiet:
+            ledger.hot.add(corridor_id)
+            continue
+        wake_seq = _next_wake_seq(cfg, ledger.corridors[corridor_id], seq)
+        if wake_seq is not None:
+            ledger.wake_at[corridor_id] = wake_seq
+            heapq.heappush(heap, [wake_seq, corridor_id])
+    ledger.update_seq = seq
+
+
+def update_corridor_cascades(world: Any, day: int) -> None:
+    cfg = ensure_cascade_config(world)
+    if not getattr(cfg, "enabled", False):
+        return
+
+    ledger = ensure_cascade_ledger(world)
+    if getattr(cfg, "incremental", False):
+        _incremental_update(world, cfg, ledger, day)
+    else:
+        _full_sweep(world, cfg, ledger, day)
 
 
 __all__ = [
@@ -285,6 +486,7 @@ __all__ = [
     "corridor_status",
     "ensure_cascade_config",
     "ensure_cascade_ledger",
+    "mark_corridor_dirty",
     "record_delivery_outcome",
     "update_corridor_cascades",
 ]
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field, asdict
 from hashlib import sha256
 from typing import Any, Iterable, Mapping
 
-from dosadi.runtime.institutions import ensure_policy, ensure_state
+from dosadi.runtime.institutions import customs_policy_revision, ensure_policy, ensure_state
 from dosadi.runtime.crackdown import border_modifiers
 from dosadi.runtime.ledger import BLACK_MARKET, STATE_TREASURY, ensure_accounts, transfer
 from dosadi.runtime.telemetry import ensure_metrics, record_event
@@ -70,6 +70,41 @@ class BorderCrossing:
     border_at: str
     from_control: str
     to_control: str
+    policy_boundary: bool = False
+
+
+@dataclass(slots=True)
+class BorderEdge:
+    """Control on both ends of one survey edge, oriented as ``edge.a -> edge.b``."""
+
+    a: str
+    b: str
+    control_a: str
+    control_b: str
+    policy_boundary: bool = False
+
+    @property
+    def crossing(self) -> bool:
+        return self.control_a != self.control_b
+
+    def oriented(self, from_node: str) -> tuple[str, str]:
+        if from_node == self.b:
+            return self.control_b, self.control_a
+        return self.control_a, self.control_b
+
+
+@dataclass(slots=True)
+class BorderTable:
+    """Per-edge border lookups derived from node wards and customs policies."""
+
+    key: tuple[int, ...] = ()
+    node_control: dict[str, str] = field(default_factory=dict)
+    edges: dict[str, BorderEdge] = field(default_factory=dict)
+
+    def control(self, node_id: str | None) -> str:
+        if not node_id:
+            return "unknown"
+        return self.node_control.get(node_id, "unknown")
 
 
 def ensure_customs_config(world: Any) -> CustomsConfig:
@@ -96,39 +131,96 @@ def ensure_customs_counters(world: Any) -> dict[str, int]:
     return counters
 
 
-def _ward_for_node(world: Any, node_id: str | None) -> str:
+def _customs_biases(policies: Mapping[str, Any], ward_id: str) -> tuple[float, float, float]:
+    policy = policies.get(ward_id)
+    return (
+        getattr(policy, "customs_inspection_bias", 0.0),
+        getattr(policy, "customs_tariff_bias", 0.0),
+        getattr(policy, "customs_contraband_bias", 0.0),
+    )
+
+
+def _border_table_key(world: Any) -> tuple[int, ...]:
+    survey_map = getattr(world, "survey_map", None)
+    policies = getattr(world, "inst_policy_by_ward", None) or {}
+    return (
+        int(getattr(survey_map, "ward_revision", 0)),
+        customs_policy_revision(world),
+        id(survey_map),
+        len(getattr(survey_map, "nodes", {}) or {}),
+        len(getattr(survey_map, "edges", {}) or {}),
+        id(policies),
+        len(policies),
+    )
+
+
+def border_table(world: Any) -> BorderTable:
+    """Return the world's border table, rebuilding it when wards or policies changed."""
+
+    key = _border_table_key(world)
+    table = getattr(world, "border_table", None)
+    if isinstance(table, BorderTable) and table.key == key:
+        return table
+
     survey_map = getattr(world, "survey_map", None)
-    if survey_map is None or not node_id:
-        return "unknown"
-    node = getattr(survey_map, "nodes", {}).get(node_id)
-    ward_id = getattr(node, "ward_id", None)
-    return str(ward_id) if ward_id is not None else "unknown"
+    policies = getattr(world, "inst_policy_by_ward", None) or {}
+    node_control: dict[str, str] = {}
+    for node_id, node in (getattr(survey_map, "nodes", {}) or {}).items():
+        ward_id = getattr(node, "ward_id", None)
+        node_control[node_id] = str(ward_id) if ward_id is not None else "unknown"
+    edges: dict[str, BorderEdge] = {}
+    for ekey, edge in (getattr(survey_map, "edges", {}) or {}).items():
+        a, b = getattr(edge, "a", ""), getattr(edge, "b", "")
+        control_a = node_control.get(a, "unknown")
+        control_b = node_control.get(b, "unknown")
+        policy_boundary = control_a != control_b and _customs_biases(policies, control_a) != _customs_biases(
+            policies, control_b
+        )
+        edges[ekey] = BorderEdge(a=a, b=b, control_a=control_a, control_b=control_b, policy_boundary=policy_boundary)
+    table = BorderTable(key=key, node_control=node_control, edges=edges)
+    world.border_table = table
+    return table
+
+
+def _border_crossing(
+    table: BorderTable, edge_key: str, from_node: str | None, to_node: str | None
+) -> BorderCrossing | None:
+    entry = table.edges.get(edge_key)
+    if entry is not None and from_node in (entry.a, entry.b) and to_node in (entry.a, entry.b):
+        if not entry.crossing:
+            return None
+        from_control, to_control = entry.oriented(from_node)
+        return BorderCrossing(
+            border_at=edge_key,
+            from_control=from_control,
+            to_control=to_control,
+            policy_boundary=entry.policy_boundary,
+        )
+    from_control = table.control(from_node)
+    to_control = table.control(to_node)
+    if from_control == to_control:
+        return None
+    return BorderCrossing(border_at=edge_key, from_control=from_control, to_control=to_control)
 
 
 def iter_border_crossings(world: Any, route_nodes: Iterable[str], route_edge_keys: Iterable[str]) -> list[BorderCrossing]:
-    crossings: list[BorderCrossing] = []
+    table = border_table(world)
     nodes = list(route_nodes)
-    edges = list(route_edge_keys)
-    for idx, edge_key in enumerate(edges):
+    crossings: list[BorderCrossing] = []
+    policies = getattr(world, "inst_policy_by_ward", None)
+    for idx, edge_key in enumerate(route_edge_keys):
         if idx >= len(nodes) - 1:
             break
-        from_node = nodes[idx]
-        to_node = nodes[idx + 1]
-        from_control = _ward_for_node(world, from_node)
-        to_control = _ward_for_node(world, to_node)
-        if from_control != to_control:
-            crossings.append(BorderCrossing(border_at=edge_key, from_control=from_control, to_control=to_control))
+        crossing = _border_crossing(table, edge_key, nodes[idx], nodes[idx + 1])
+        if crossing is not None:
+            crossings.append(crossing)
             continue
-        # Detect policy boundary even within same ward
-        policy_from = ensure_policy(world, from_control)
-        policy_to = ensure_policy(world, to_control)
-        if (
-            getattr(policy_from, "customs_inspection_bias", 0.0) != getattr(policy_to, "customs_inspection_bias", 0.0)
-            or getattr(policy_from, "customs_tariff_bias", 0.0) != getattr(policy_to, "customs_tariff_bias", 0.0)
-            or getattr(policy_from, "customs_contraband_bias", 0.0)
-            != getattr(policy_to, "customs_contraband_bias", 0.0)
-        ):
-            crossings.append(BorderCrossing(border_at=edge_key, from_control=from_control, to_control=to_control))
+        # Same-control hops have always materialized a default policy for
+        # their ward; keep doing so, since policies are part of the snapshot.
+        control = table.control(nodes[idx])
+        if not isinstance(policies, dict) or control not in policies:
+            ensure_policy(world, control)
+            policies = world.inst_policy_by_ward
     return crossings
 
 
@@ -429,11 +521,7 @@ def process_delivery_edge(
         return
     if from_node is None or to_node is None:
         return
-    crossing = None
-    from_control = _ward_for_node(world, from_node)
-    to_control = _ward_for_node(world, to_node)
-    if from_control != to_control:
-        crossing = BorderCrossing(border_at=edge_key, from_control=from_control, to_control=to_control)
+    crossing = _border_crossing(border_table(world), edge_key, from_node, to_node)
     if crossing is None:
         return
     process_customs_crossing(world, day=day, shipment=delivery, crossing=crossing)
@@ -0,0 +1,273 @@
+"""Two-phase agent decisions: parallel *propose*, serial *commit*.
+
+The legacy decision phase walks ``world.agents`` and lets every agent draw from
+the shared ``world.rng``, so the outcome depends on iteration order and cannot
+be split across processes.  This engine separates the work:
+
+propose
+    For each awake agent, in shards, compute the focus goal, the queue choice
+    and the next :class:`~dosadi.agents.core.Action` against a read-only view
+    of the world.  Every agent gets its own ``random.Random`` split from the
+    tick's ``agent.decision`` stream of :class:`~dosadi.runtime.rng_service.RNGService`,
+    so a proposal does not depend on which shard or process computed it.
+    With more than one worker the shards run in a fork-based process pool; the
+    children inherit the world as it stood at the start of the phase.
+
+commit
+    In sorted agent order, apply each proposal: navigation target, queue
+    membership, the agent's facility memory and ``last_decision_tick``.
+
+Goals whose handlers write to shared world state (meals, water, rest, reports,
+work details and scouting) are not proposed in parallel; those agents are
+*deferred* and decided in full during the commit, in the same sorted order and
+with the same per-agent stream.  Proposals are always computed before any
+commit, so a run with ``workers=1`` (in-process) and ``workers=N`` produce the
+same world bit for bit.
+
+The pool is forked afresh every tick -- a persistent pool would hold a stale
+copy of the world -- and each child pickles its proposals back.  That costs
+tens of milliseconds per tick regardless of agent count, which only pays off
+once a tick has thousands of agents to decide and there are cores to spread
+them over.  Below ``min_parallel_agents`` awake agents, or on a single-core
+machine, the propose step runs in-process whatever ``workers`` says.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+import os
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+from dosadi.agents.core import Action, GoalStatus, GoalType, decide_next_action, prepare_navigation_context
+from dosadi.runtime.agent_navigation import attempt_join_queue, choose_queue_for_goal
+from dosadi.runtime.rng_service import ensure_rng_service
+from dosadi.runtime.work_details import ensure_scout_detail_for_gather_goal
+
+DECISION_STREAM = "agent.decision"
+# Below this many awake agents the per-tick fork costs more than it saves.
+MIN_PARALLEL_AGENTS = 4_000
+
+# Goal types whose decide_next_action handlers mutate world state.
+WORLD_WRITING_GOAL_TYPES = frozenset(
+    {
+        GoalType.GET_MEAL_TODAY,
+        GoalType.GET_WATER_TODAY,
+        GoalType.REST_TONIGHT,
+        GoalType.WRITE_SUPERVISOR_REPORT,
+        GoalType.WORK_DETAIL,
+        GoalType.GATHER_INFORMATION,
+    }
+)
+
+
+@dataclass(slots=True)
+class DecisionProposal:
+    agent_id: str
+    deferred: bool = False
+    queue_id: Optional[str] = None
+    queue_location_id: Optional[str] = None
+    last_facility_by_service: Optional[Dict[str, str]] = None
+    action: Optional[Action] = None
+
+
+@dataclass(slots=True)
+class _DecisionContext:
+    world: Any
+    tick: int
+    topology: Dict[str, Any]
+    neighbors: Dict[str, List[str]]
+    well_core_id: str
+
+
+# Set in the parent just before the pool forks; workers read it, never write it back.
+_FORK_CONTEXT: Optional[_DecisionContext] = None
+
+
+def fork_available() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _active_gather_goal(agent: Any) -> Any:
+    return next(
+        (
+            g
+            for g in agent.goals
+            if g.goal_type == GoalType.GATHER_INFORMATION and g.status == GoalStatus.ACTIVE
+        ),
+        None,
+    )
+
+
+def awake_agent_ids(world: Any) -> List[str]:
+    return [
+        agent_id
+        for agent_id in sorted(world.agents)
+        if not (getattr(world.agents[agent_id], "is_asleep", False) and not world.agents[agent_id].physical.is_sleeping)
+    ]
+
+
+def decision_seeds(world: Any, tick: int, agent_ids: Sequence[str]) -> Dict[str, int]:
+    """One seed per agent for ``tick``, independent of order and sharding.
+
+    A single draw from the tick's ``agent.decision`` stream is split per agent
+    by hashing in the agent id, so the service's counters and audit grow by one
+    stream per tick rather than one per agent.
+    """
+
+    service = ensure_rng_service(world)
+    base = service.stream(DECISION_STREAM, scope={"tick": int(tick)}).getrandbits(64)
+    return {agent_id: random.Random(f"{base}:{agent_id}").getrandbits(64) for agent_id in agent_ids}
+
+
+def propose_decision(ctx: _DecisionContext, agent_id: str, seed: int) -> DecisionProposal:
+    """Decide for one agent without writing to shared world state."""
+
+    agent = ctx.world.agents[agent_id]
+    if _active_gather_goal(agent) is not None:
+        return DecisionProposal(agent_id=agent_id, deferred=True)
+    # Promoting a pending goal only touches the agent; the commit repeats it.
+    focus_goal = agent.choose_focus_goal()
+    if focus_goal is not None and focus_goal.goal_type in WORLD_WRITING_GOAL_TYPES:
+        return DecisionProposal(agent_id=agent_id, deferred=True)
+
+    rng = random.Random(seed)
+    queue_id, queue_location_id = choose_queue_for_goal(agent, ctx.world, focus_goal, rng=rng)
+    action = decide_next_action(
+        agent,
+        ctx.world,
+        topology=ctx.topology,
+        neighbors=ctx.neighbors,
+        well_core_id=ctx.well_core_id,
+        rng=rng,
+    )
+    return DecisionProposal(
+        agent_id=agent_id,
+        queue_id=queue_id,
+        queue_location_id=queue_location_id,
+        last_facility_by_service=agent.last_facility_by_service,
+        action=action,
+    )
+
+
+def _propose_shard(shard: Sequence[tuple[str, int]]) -> List[DecisionProposal]:
+    ctx = _FORK_CONTEXT
+    if ctx is None:
+        raise RuntimeError("decision context was not inherited by the worker")
+    return [propose_decision(ctx, agent_id, seed) for agent_id, seed in shard]
+
+
+def _shards(items: Sequence[tuple[str, int]], count: int) -> List[Sequence[tuple[str, int]]]:
+    size = -(-len(items) // max(1, count))
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def effective_workers(workers: int, agents: int, *, min_parallel_agents: int = MIN_PARALLEL_AGENTS) -> int:
+    """Worker processes actually worth forking for ``agents`` awake agents."""
+
+    if workers <= 1 or agents < max(2, min_parallel_agents) or not fork_available():
+        return 1
+    return max(1, min(workers, os.cpu_count() or 1, agents))
+
+
+def propose_all(
+    ctx: _DecisionContext,
+    seeds: Dict[str, int],
+    *,
+    workers: int,
+    min_parallel_agents: int = MIN_PARALLEL_AGENTS,
+) -> List[DecisionProposal]:
+    """Proposals for every agent in ``seeds``, in the same order."""
+
+    items = list(seeds.items())
+    workers = effective_workers(workers, len(items), min_parallel_agents=min_parallel_agents)
+    if workers <= 1:
+        return [propose_decision(ctx, agent_id, seed) for agent_id, seed in items]
+
+    global _FORK_CONTEXT
+    _FORK_CONTEXT = ctx
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            results = pool.map(_propose_shard, _shards(items, workers))
+            return [proposal for shard in results for proposal in shard]
+    finally:
+        _FORK_CONTEXT = None
+
+
+def _decide_in_full(ctx: _DecisionContext, agent: Any, rng: random.Random) -> Action:
+    gather_goal = _active_gather_goal(agent)
+    if gather_goal is not None:
+        ensure_scout_detail_for_gather_goal(ctx.world, agent, gather_goal, ctx.tick)
+    focus_goal = agent.choose_focus_goal()
+    queue_id, queue_location_id = choose_queue_for_goal(agent, ctx.world, focus_goal, rng=rng)
+    _commit_queue(ctx, agent, queue_id, queue_location_id)
+    return decide_next_action(
+        agent,
+        ctx.world,
+        topology=ctx.topology,
+        neighbors=ctx.neighbors,
+        well_core_id=ctx.well_core_id,
+        rng=rng,
+    )
+
+
+def _commit_queue(ctx: _DecisionContext, agent: Any, queue_id: Optional[str], queue_location_id: Optional[str]) -> None:
+    if queue_location_id is None:
+        return
+    agent.navigation_target_id = queue_location_id
+    if agent.location_id == queue_location_id and agent.current_queue_id is None and queue_id is not None:
+        attempt_join_queue(agent, ctx.world, queue_id, ctx.tick)
+
+
+def commit_decisions(
+    ctx: _DecisionContext, proposals: Sequence[DecisionProposal], seeds: Dict[str, int]
+) -> Dict[str, Action]:
+    actions_by_agent: Dict[str, Action] = {}
+    for proposal in sorted(proposals, key=lambda p: p.agent_id):
+        agent = ctx.world.agents[proposal.agent_id]
+        if proposal.deferred:
+            action = _decide_in_full(ctx, agent, random.Random(seeds[proposal.agent_id]))
+        else:
+            agent.choose_focus_goal()
+            agent.last_facility_by_service = proposal.last_facility_by_service
+            _commit_queue(ctx, agent, proposal.queue_id, proposal.queue_location_id)
+            action = proposal.action
+        actions_by_agent[proposal.agent_id] = action
+        agent.last_decision_tick = ctx.tick
+    return actions_by_agent
+
+
+def run_decision_phase(
+    world: Any, tick: int, *, workers: int = 1, min_parallel_agents: int = MIN_PARALLEL_AGENTS
+) -> Dict[str, Action]:
+    """Decide every awake agent's next action with the propose/commit engine."""
+
+    topology, neighbors, well_core_id, _ = prepare_navigation_context(world)
+    ctx = _DecisionContext(
+        world=world,
+        tick=tick,
+        topology=topology,
+        neighbors=neighbors,
+        well_core_id=well_core_id,
+    )
+    seeds = decision_seeds(world, tick, awake_agent_ids(world))
+    proposals = propose_all(ctx, seeds, workers=workers, min_parallel_agents=min_parallel_agents)
+    return commit_decisions(ctx, proposals, seeds)
+
+
+__all__ = [
+    "DECISION_STREAM",
+    "DecisionProposal",
+    "MIN_PARALLEL_AGENTS",
+    "WORLD_WRITING_GOAL_TYPES",
+    "awake_agent_ids",
+    "commit_decisions",
+    "decision_seeds",
+    "effective_workers",
+    "fork_available",
+    "propose_all",
+    "propose_decision",
+    "run_decision_phase",
+]
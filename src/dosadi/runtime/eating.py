@@ -15,20 +15,19 @@ from dosadi.memory.episodes import EpisodeChannel, EpisodeVerb
 from dosadi.memory.episode_factory import EpisodeFactory
 from dosadi.world.environment import get_or_create_place_env
 from dosadi.runtime.config import (
+    HUNGER_MAX,
+    HUNGER_RATE_PER_TICK,
+    HYDRATION_DECAY_PER_TICK,
     MIN_TICKS_AS_SUPERVISOR_BEFORE_REPORT,
     SUPERVISOR_REPORT_INTERVAL_TICKS,
 )
 from dosadi.runtime.suit_wear import ensure_suit_config, suit_decay_multiplier
 
-# Hunger and meal tuning constants (MVP defaults)
-HUNGER_RATE_PER_TICK: float = 1.0 / 50_000.0
-HUNGER_MAX: float = 2.0
-
+# Hunger and meal tuning constants (MVP defaults); decay rates live in runtime.config
 HUNGER_GOAL_THRESHOLD: float = 0.4
 MEAL_SATIATION_AMOUNT: float = 0.7
 GET_MEAL_GOAL_TIMEOUT_TICKS: int = 100_000
 
-HYDRATION_DECAY_PER_TICK: float = 1.0 / 80_000.0
 HYDRATION_GOAL_THRESHOLD: float = 0.6
 GET_WATER_GOAL_TIMEOUT_TICKS: int = 80_000
 
@@ -95,11 +95,7 @@ def _resolve_project_stakeholders(
 def _resolve_facility_stakeholders(
     *, workforce: WorkforceLedger, facility_id: str, max_count: int
 ) -> List[str]:
-    stakeholders: Set[str] = set()
-    for assignment in workforce.assignments.values():
-        if assignment.kind is AssignmentKind.FACILITY_STAFF and assignment.target_id == facility_id:
-            stakeholders.add(assignment.agent_id)
-    return _bounded(stakeholders, max_count)
+    return _bounded(workforce.facility_staff_ids(facility_id), max_count)
 
 
 def _resolve_phase_stakeholders(*, world: Any, max_count: int) -> List[str]:
@@ -331,7 +327,7 @@ def run_router_for_day(world: Any, *, day: int) -> None:
     if state.cursor_seq < event_log.base_seq:
         state.cursor_seq = event_log.base_seq
 
-    events = event_log.since(state.cursor_seq)
+    events = event_log.since(state.cursor_seq, limit=cfg.max_events_per_day)
     if not events:
         state.last_run_day = day
         world.router_state = state
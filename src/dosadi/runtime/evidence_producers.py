@@ -192,7 +192,7 @@ def _queue_unfairness(world, polity_id: str, day: int) -> list[EvidenceItem]:
         processed = getattr(getattr(queue, "stats", None), "total_processed", 0)
         denied = getattr(getattr(queue, "stats", None), "total_denied", 0)
         unfairness = denied / max(1.0, float(processed + denied))
-        waiting_bias = len(getattr(queue, "agents_waiting", [])) / max(
+        waiting_bias = len(queue.waiting) / max(
             1.0, float(getattr(queue, "processing_rate", 1))
         )
         score = _clamp01(0.6 * unfairness + 0.4 * _clamp01(waiting_bias / 10.0))
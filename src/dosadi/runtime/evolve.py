@@ -6,18 +6,15 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Sequence
 
-from dosadi.playbook.scenario_runner import FoundingWakeupScenarioConfig
-
-from dosadi.runtime.founding_wakeup import step_world_once
-from dosadi.runtime.run_outputs import append_timeline_row, generate_run_id, prepare_run_directory
-from dosadi.runtime.scorecards import compute_scorecard
-from dosadi.runtime.kpis import flatten_kpis_for_report
-from dosadi.runtime.snapshot import load_snapshot, restore_world, world_signature
-from dosadi.runtime.timewarp import DEFAULT_TICKS_PER_DAY, TimewarpConfig, step_day
-from dosadi.runtime.wakeup_prime import step_wakeup_prime_once
-from dosadi.vault.seed_vault import save_seed
-from dosadi.world.scenarios.founding_wakeup import generate_founding_wakeup_mvp
-from dosadi.scenarios.wakeup_prime import WakeupPrimeScenarioConfig, generate_wakeup_scenario_prime
+from dosadi.runtime.background_writer import BackgroundWriter
+from dosadi.runtime.run_outputs import (
+    build_timeline_row,
+    generate_run_id,
+    prepare_run_directory,
+    write_timeline_row,
+)
+from dosadi.runtime.subsystems import subsystem
+from dosadi.runtime.timewarp import DEFAULT_TICKS_PER_DAY, TimewarpConfig
 
 
 @dataclass(slots=True)
@@ -35,29 +32,40 @@ class EvolveConfig:
     kpi_enabled: bool = True
     signature_enabled: bool = True
     save_initial_snapshot: bool = True
+    analytics_db: Path | None = None
+    analytics_events_per_milestone: int = 200
+    # Queue depth for off-thread snapshot/manifest/timeline writes (0 = synchronous).
+    writer_queue_depth: int = 2
+    # Sampling interval for the stack profiler; None disables profiling.
+    profile_interval_ms: float | None = None
 
 
 _ScenarioInitializer = Callable[[int], Any]
 _StepFn = Callable[[Any], None]
 
 
+def _generate_founding_wakeup(seed: int) -> Any:
+    default_agents = subsystem("scenario.founding_wakeup.config")().num_agents
+    return subsystem("scenario.founding_wakeup.generate")(num_agents=default_agents, seed=seed)
+
+
+def _generate_wakeup_prime(seed: int) -> Any:
+    scenario_cfg = subsystem("scenario.wakeup_prime.config")(seed=seed)
+    return subsystem("scenario.wakeup_prime.generate")(scenario_cfg).world
+
+
+def _step_founding_wakeup(world: Any) -> None:
+    subsystem("step.founding_wakeup")(world)
+
+
+def _step_wakeup_prime(world: Any) -> None:
+    subsystem("step.wakeup_prime")(world)
+
+
 _SCENARIO_REGISTRY: Mapping[str, tuple[_ScenarioInitializer, _StepFn]] = {
-    "founding_wakeup": (
-        lambda seed: generate_founding_wakeup_mvp(
-            num_agents=FoundingWakeupScenarioConfig().num_agents, seed=seed
-        ),
-        step_world_once,
-    ),
-    "founding_wakeup_mvp": (
-        lambda seed: generate_founding_wakeup_mvp(
-            num_agents=FoundingWakeupScenarioConfig().num_agents, seed=seed
-        ),
-        step_world_once,
-    ),
-    "wakeup_prime": (
-        lambda seed: generate_wakeup_scenario_prime(WakeupPrimeScenarioConfig(seed=seed)).world,
-        step_wakeup_prime_once,
-    ),
+    "founding_wakeup": (_generate_founding_wakeup, _step_founding_wakeup),
+    "founding_wakeup_mvp": (_generate_founding_wakeup, _step_founding_wakeup),
+    "wakeup_prime": (_generate_wakeup_prime, _step_wakeup_prime),
 }
 
 
@@ -112,23 +120,27 @@ def _record_milestone(
     day: int,
     cfg: EvolveConfig,
     milestone_idx: int,
+    analytics: Any = None,
+    writer: BackgroundWriter | None = None,
+    profiler: Any = None,
 ) -> Dict[str, Any]:
     seed_id = f"{cfg.seed_prefix}-{seed:05d}-{milestone_idx:04d}"
-    snapshot_entry = save_seed(
+    snapshot_entry = subsystem("vault.save_seed")(
         cfg.vault_dir,
         world,
         seed_id=seed_id,
         scenario_id=scenario_id,
         meta={"run_id": run_id, "milestone_type": milestone_type, "day": day},
+        writer=writer,
     )
 
-    signature = world_signature(world) if cfg.signature_enabled else None
-    scorecard = compute_scorecard(world) if cfg.kpi_enabled else None
-    kpis = flatten_kpis_for_report(getattr(world, "kpis", None)) if cfg.kpi_enabled else {}
+    signature = subsystem("snapshot.world_signature")(world) if cfg.signature_enabled else None
+    scorecard = subsystem("seed.scorecard")(world) if cfg.kpi_enabled else None
+    kpis = subsystem("kpis.flatten_for_report")(getattr(world, "kpis", None)) if cfg.kpi_enabled else {}
     scorecard_payload = asdict(scorecard) if scorecard is not None else None
     snapshot_path = Path(cfg.vault_dir, snapshot_entry.get("snapshot_path", ""))
 
-    row = append_timeline_row(
+    row = build_timeline_row(
         run_dir,
         run_id=run_id,
         scenario_id=scenario_id,
@@ -144,11 +156,46 @@ def _record_milestone(
         scorecard=scorecard_payload,
     )
     row["seed_id"] = seed_id
-    if scorecard_payload is not None:
-        row["scorecard"] = scorecard_payload
+    if writer is None:
+        _write_milestone_row(run_dir, row, snapshot_entry)
+    else:
+        writer.submit(_write_milestone_row, run_dir, row, snapshot_entry)
+    if analytics is not None:
+        analytics.record_event_log(
+            run_id, getattr(world, "event_log", None), max_events=cfg.analytics_events_per_milestone
+        )
+    if profiler is not None:
+        profiler.mark(f"{milestone_type}-day{day}")
     return row
 
 
+def _write_milestone_row(run_dir: Path, row: Dict[str, Any], snapshot_entry: Mapping[str, Any]) -> None:
+    # The snapshot hash is only known once the vault write has completed.
+    row["snapshot_sha256"] = snapshot_entry.get("snapshot_sha256") or ""
+    write_timeline_row(run_dir, {k: v for k, v in row.items() if k != "seed_id"})
+
+
+def _open_analytics(cfg: EvolveConfig, *, run_id: str, scenario_id: str, seed: int) -> Any:
+    if cfg.analytics_db is None:
+        return None
+    from dosadi.runtime.run_analytics import RunAnalyticsStore
+    from dosadi.runtime.run_outputs import _to_jsonable_config
+
+    store = RunAnalyticsStore(cfg.analytics_db)
+    store.record_run(run_id, scenario_id=scenario_id, seed=seed, config=_to_jsonable_config(cfg))
+    return store
+
+
+def _start_profiler(cfg: EvolveConfig, run_dir: Path) -> Any:
+    if cfg.profile_interval_ms is None:
+        return None
+    from dosadi.runtime.sampling_profiler import SamplingProfiler
+
+    profiler = SamplingProfiler(run_dir, interval_ms=cfg.profile_interval_ms)
+    profiler.start()
+    return profiler
+
+
 def _should_run_microsim(day_cursor: int, cfg: EvolveConfig) -> bool:
     if cfg.microsim_days <= 0:
         return False
@@ -171,6 +218,53 @@ def _evolve_world(
     run_id: str,
     run_dir: Path,
     step_fn: _StepFn,
+) -> Dict[str, Any]:
+    analytics = _open_analytics(cfg, run_id=run_id, scenario_id=scenario_id, seed=seed)
+    writer = BackgroundWriter(cfg.writer_queue_depth) if cfg.writer_queue_depth > 0 else None
+    profiler = _start_profiler(cfg, run_dir)
+    try:
+        try:
+            summary = _evolve_loop(
+                world=world,
+                scenario_id=scenario_id,
+                seed=seed,
+                cfg=cfg,
+                run_id=run_id,
+                run_dir=run_dir,
+                step_fn=step_fn,
+                analytics=analytics,
+                writer=writer,
+                profiler=profiler,
+            )
+        finally:
+            if profiler is not None:
+                profiler.stop()
+            # Drain pending writes so the manifest and timeline are complete.
+            if writer is not None:
+                writer.close()
+        if profiler is not None:
+            summary["profile_summary"] = run_dir / "profile_summary.json"
+        if analytics is not None:
+            for idx, row in enumerate(summary["milestones"]):
+                analytics.record_milestone(row, milestone_idx=idx)
+        return summary
+    finally:
+        if analytics is not None:
+            analytics.close()
+
+
+def _evolve_loop(
+    *,
+    world: Any,
+    scenario_id: str,
+    seed: int,
+    cfg: EvolveConfig,
+    run_id: str,
+    run_dir: Path,
+    step_fn: _StepFn,
+    analytics: Any,
+    writer: BackgroundWriter | None,
+    profiler: Any = None,
 ) -> Dict[str, Any]:
     ticks_per_day = _ticks_per_day(world)
     target_days = max(0, int(cfg.target_years)) * 365
@@ -190,6 +284,9 @@ def _evolve_world(
                 day=day_cursor,
                 cfg=cfg,
                 milestone_idx=milestone_idx,
+                analytics=analytics,
+                writer=writer,
+                profiler=profiler,
             )
         )
         milestone_idx += 1
@@ -202,7 +299,7 @@ def _evolve_world(
 
         remaining_days = target_days - day_cursor
         cruise_days = min(cfg.cruise_days, remaining_days)
-        step_day(world, days=cruise_days, cfg=cfg.timewarp_cfg)
+        subsystem("timewarp.step_day")(world, days=cruise_days, cfg=cfg.timewarp_cfg)
         day_cursor = _current_day(world, ticks_per_day)
 
         if _should_run_microsim(day_cursor, cfg):
@@ -221,6 +318,9 @@ def _evolve_world(
                     day=day_cursor,
                     cfg=cfg,
                     milestone_idx=milestone_idx,
+                    analytics=analytics,
+                    writer=writer,
+                    profiler=profiler,
                 )
             )
             milestone_idx += 1
@@ -237,6 +337,9 @@ def _evolve_world(
                     day=day_cursor,
                     cfg=cfg,
                     milestone_idx=milestone_idx,
+                    analytics=analytics,
+                    writer=writer,
+                    profiler=profiler,
                 )
             )
             milestone_idx += 1
@@ -253,6 +356,9 @@ def _evolve_world(
                 day=day_cursor,
                 cfg=cfg,
                 milestone_idx=milestone_idx,
+                analytics=analytics,
+                writer=writer,
+                profiler=profiler,
             )
         )
 
@@ -306,8 +412,8 @@ def evolve_from_snapshot(
     notes: str | None = None,
     timestamp: datetime | None = None,
 ) -> Dict[str, Any]:
-    snapshot = load_snapshot(snapshot_path)
-    world = restore_world(snapshot)
+    snapshot = subsystem("snapshot.load")(snapshot_path)
+    world = subsystem("snapshot.restore_world")(snapshot)
     scenario_id = snapshot.scenario_id
     seed = snapshot.seed
 
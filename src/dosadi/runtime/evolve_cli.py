@@ -9,27 +9,33 @@ from dosadi.runtime.evolve import EvolveConfig, evolve_from_snapshot, evolve_see
 from dosadi.runtime.timewarp import TimewarpConfig
 
 
+# Slotted dataclasses expose member descriptors as class attributes, so the
+# argument defaults are read from default instances.
+_DEFAULTS = EvolveConfig()
+_TIMEWARP_DEFAULTS = TimewarpConfig()
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the evolution harness")
     parser.add_argument("--scenario", default="founding_wakeup_mvp", help="Scenario id")
     parser.add_argument("--seed", type=int, default=1, help="Seed to use when generating a scenario")
     parser.add_argument("--snapshot", type=Path, help="Resume from an existing snapshot path")
-    parser.add_argument("--target-years", type=int, default=EvolveConfig.target_years)
-    parser.add_argument("--cruise-days", type=int, default=EvolveConfig.cruise_days)
-    parser.add_argument("--microsim-days", type=int, default=EvolveConfig.microsim_days)
+    parser.add_argument("--target-years", type=int, default=_DEFAULTS.target_years)
+    parser.add_argument("--cruise-days", type=int, default=_DEFAULTS.cruise_days)
+    parser.add_argument("--microsim-days", type=int, default=_DEFAULTS.microsim_days)
     parser.add_argument(
-        "--microsim-every-days", type=int, default=EvolveConfig.microsim_every_days
+        "--microsim-every-days", type=int, default=_DEFAULTS.microsim_every_days
     )
-    parser.add_argument("--save-every-days", type=int, default=EvolveConfig.save_every_days)
+    parser.add_argument("--save-every-days", type=int, default=_DEFAULTS.save_every_days)
     parser.add_argument("--max-steps", type=int, help="Optional guard to stop early")
-    parser.add_argument("--vault-dir", type=Path, default=EvolveConfig.vault_dir)
-    parser.add_argument("--runs-dir", type=Path, default=EvolveConfig.runs_dir)
-    parser.add_argument("--seed-prefix", default=EvolveConfig.seed_prefix)
+    parser.add_argument("--vault-dir", type=Path, default=_DEFAULTS.vault_dir)
+    parser.add_argument("--runs-dir", type=Path, default=_DEFAULTS.runs_dir)
+    parser.add_argument("--seed-prefix", default=_DEFAULTS.seed_prefix)
     parser.add_argument("--notes", help="Optional notes to emit alongside config")
     parser.add_argument(
         "--max-awake-agents",
         type=int,
-        default=TimewarpConfig.max_awake_agents,
+        default=_TIMEWARP_DEFAULTS.max_awake_agents,
         help="Timewarp max awake agents",
     )
     parser.add_argument("--disable-kpis", action="store_true", help="Skip KPI collection")
@@ -43,6 +49,28 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Do not save the initial snapshot/milestone",
     )
+    parser.add_argument(
+        "--analytics-db",
+        type=Path,
+        help="Optional SQLite database to mirror milestones, KPIs and sampled events into",
+    )
+    parser.add_argument(
+        "--writer-queue-depth",
+        type=int,
+        default=_DEFAULTS.writer_queue_depth,
+        help="Pending milestone writes before the simulation waits (0 writes synchronously)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Sample the run's stacks into per-milestone collapsed files and profile_summary.json",
+    )
+    parser.add_argument(
+        "--profile-interval-ms",
+        type=float,
+        default=5.0,
+        help="Sampling interval for --profile in milliseconds",
+    )
     return parser.parse_args()
 
 
@@ -62,6 +90,9 @@ def _build_config(args: argparse.Namespace) -> EvolveConfig:
         kpi_enabled=not args.disable_kpis,
         signature_enabled=not args.disable_signature,
         save_initial_snapshot=not args.no_initial_snapshot,
+        analytics_db=args.analytics_db,
+        writer_queue_depth=args.writer_queue_depth,
+        profile_interval_ms=args.profile_interval_ms if args.profile else None,
     )
 
 
@@ -70,6 +101,8 @@ def _print_summary(summary: dict[str, Any]) -> None:
     print(f"scenario: {summary.get('scenario_id')} seed: {summary.get('seed')}")
     print(f"run_dir: {summary.get('run_dir')}")
     print(f"milestones: {len(summary.get('milestones', []))}")
+    if summary.get("profile_summary"):
+        print(f"profile: {summary['profile_summary']}")
     if summary.get("milestones"):
         first = summary["milestones"][0]
         last = summary["milestones"][-1]
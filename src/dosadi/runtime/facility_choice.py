@@ -67,10 +67,7 @@ def choose_facility_for_service(
     epsilon = epsilon_base * (1.0 + 0.5 * curiosity)
     epsilon = max(0.01, min(0.3, epsilon))
 
-    last_by_service = getattr(agent, "last_facility_by_service", None)
-    if last_by_service is None:
-        agent.last_facility_by_service = {}
-        last_by_service = agent.last_facility_by_service
+    last_by_service = agent.last_facility_by_service
     last_used_for_service = last_by_service.get(service_type)
 
     scored: List[Tuple[str, float]] = []
@@ -6,7 +6,7 @@ from typing import MutableMapping
 
 from dosadi.world.facilities import Facility, FacilityLedger, ensure_facility_ledger, get_facility_behavior
 from dosadi.world import stocks
-from dosadi.world.workforce import AssignmentKind, ensure_workforce
+from dosadi.world.workforce import ensure_workforce
 
 
 def _effective_days(facility: Facility, *, day: int, days: int) -> int:
@@ -50,12 +50,7 @@ def _staffing_ratio(world, facility: Facility, behavior) -> float:
 
     target = max(1, getattr(behavior, "labor_agents", 1))
     ledger = ensure_workforce(world)
-    assigned = sum(
-        1
-        for assignment in ledger.assignments.values()
-        if assignment.kind is AssignmentKind.FACILITY_STAFF
-        and assignment.target_id == facility.facility_id
-    )
+    assigned = ledger.facility_staff_count(facility.facility_id)
     if assigned <= 0:
         return 0.0
     return min(1.0, assigned / target)
@@ -20,7 +20,7 @@ from dosadi.world.phases import WorldPhase
 from dosadi.world.routing import edge_key
 from dosadi.world.survey_map import SurveyMap
 from dosadi.world.events import EventKind, WorldEvent, WorldEventLog
-from dosadi.world.logistics import DeliveryRequest, DeliveryStatus, LogisticsLedger
+from dosadi.world.logistics import OPEN_DELIVERY_STATUSES, DeliveryRequest, LogisticsLedger
 from dosadi.runtime.law_enforcement import (
     apply_interdiction,
     escort_synergy_multiplier,
@@ -118,17 +118,7 @@ def _delivery_targets(world: Any) -> list[Target]:
     if not isinstance(ledger, LogisticsLedger):
         return []
     targets: list[Target] = []
-    for delivery_id in ledger.active_ids:
-        delivery = ledger.deliveries.get(delivery_id)
-        if delivery is None:
-            continue
-        if delivery.status not in {
-            DeliveryStatus.REQUESTED,
-            DeliveryStatus.ASSIGNED,
-            DeliveryStatus.PICKED_UP,
-            DeliveryStatus.IN_TRANSIT,
-        }:
-            continue
+    for delivery in ledger.with_status(*OPEN_DELIVERY_STATUSES):
         urgency = 0.0
         for mat_key, qty in delivery.items.items():
             if qty <= 0:
@@ -137,7 +127,7 @@ def _delivery_targets(world: Any) -> list[Target]:
         _add_target(
             targets,
             kind="delivery",
-            target_id=delivery_id,
+            target_id=delivery.delivery_id,
             value=_clamp01(urgency),
             payload={"delivery": delivery},
         )
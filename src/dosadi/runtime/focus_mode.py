@@ -13,6 +13,7 @@ from dosadi.world.logistics import (
     ensure_logistics,
     process_logistics_until,
     release_courier,
+    set_delivery_status,
 )
 from dosadi.world.workforce import AssignmentKind, WorkforceLedger, ensure_workforce
 
@@ -205,7 +206,7 @@ def _run_daily_pipeline(world: Any, *, day: int) -> None:
 
 
 def _deliver(world: Any, delivery: DeliveryRequest, tick: int) -> None:
-    delivery.status = DeliveryStatus.DELIVERED
+    set_delivery_status(world, delivery, DeliveryStatus.DELIVERED)
     delivery.deliver_tick = tick
     release_courier(world, delivery.assigned_carrier_id)
 
@@ -14,7 +14,8 @@ from dosadi.agents.groups import (
     maybe_form_proto_council,
     _find_dangerous_corridors_from_metrics,
     maybe_run_council_meeting,
-    maybe_run_pod_meeting,
+    ensure_group_schedule,
+    run_due_pod_meetings,
 )
 from dosadi.runtime.agent_navigation import (
     attempt_join_queue,
@@ -27,6 +28,7 @@ from dosadi.runtime.eating import (
     chronic_update_agent_physical_state,
 )
 from dosadi.runtime.council_metrics import update_council_metrics_and_staffing
+from dosadi.runtime.decision_engine import MIN_PARALLEL_AGENTS, run_decision_phase
 from dosadi.memory.config import MemoryConfig
 from dosadi.runtime.memory_runtime import (
     step_agent_memory_maintenance,
@@ -36,6 +38,7 @@ from dosadi.runtime.proto_council import run_proto_council_tuning
 from dosadi.runtime.agent_preferences import maybe_update_desired_work_type
 from dosadi.runtime.protocol_authoring import maybe_author_movement_protocols
 from dosadi.runtime.protocols import update_protocol_adoption_metrics
+from dosadi.memory.episode_factory import EpisodeFactory
 from dosadi.runtime.queue_episodes import QueueEpisodeEmitter
 from dosadi.runtime.queues import process_all_queues
 from dosadi.runtime.events import drain_event_bus, publish_tick_events
@@ -47,7 +50,7 @@ from dosadi.runtime.success_contracts import (
 from dosadi.world.construction import process_projects
 from dosadi.runtime.work_details import ensure_scout_detail_for_gather_goal
 from dosadi.state import WorldState
-from dosadi.world.scenarios.founding_wakeup import generate_founding_wakeup_mvp
+from dosadi.world.scenarios.founding_wakeup import founding_wakeup_template, generate_founding_wakeup_mvp
 from dosadi.systems.protocols import ProtocolStatus, ProtocolType
 from dosadi.scenarios.founding_wakeup.contracts import build_founding_wakeup_contract
 
@@ -79,6 +82,11 @@ class RuntimeConfig:
     min_edges_for_hazard_check: int = 1
     min_baseline_hazard_rate: float = 0.05
     min_hazard_reduction_fraction: float = 0.30
+    # 0 keeps the legacy shared-rng decision loop; >= 1 uses the propose/commit
+    # engine in dosadi.runtime.decision_engine with up to that many worker
+    # processes, forked only when at least decision_min_parallel_agents are awake.
+    decision_workers: int = 0
+    decision_min_parallel_agents: int = MIN_PARALLEL_AGENTS
 
 
 # Alias used in docs/specs
@@ -132,7 +140,9 @@ def step_world_once(world: WorldState) -> None:
     world.rng = rng
     cfg: RuntimeConfig = getattr(world, "runtime_config", None) or RuntimeConfig()
     world.runtime_config = cfg
-    queue_emitter = getattr(world, "queue_episode_emitter", None) or QueueEpisodeEmitter()
+    queue_emitter = getattr(world, "queue_episode_emitter", None) or QueueEpisodeEmitter(
+        EpisodeFactory(world=world)
+    )
     world.queue_episode_emitter = queue_emitter
     memory_config = getattr(world, "memory_config", None) or MemoryConfig()
     world.memory_config = memory_config
@@ -171,18 +181,17 @@ def step_world_once(world: WorldState) -> None:
 def _phase_A_groups_and_council(world: WorldState, tick: int, rng: random.Random, cfg: RuntimeConfig) -> None:
     metrics = getattr(world, "metrics", None)
 
-    for g in world.groups:
-        if g.group_type == GroupType.POD:
-            maybe_run_pod_meeting(
-                pod_group=g,
-                agents_by_id=world.agents,
-                tick=tick,
-                rng=rng,
-                meeting_interval_ticks=cfg.pod_meeting_interval_ticks,
-                rep_vote_fraction_threshold=cfg.rep_vote_fraction_threshold,
-                min_leadership_threshold=cfg.min_leadership_threshold,
-                max_representatives=cfg.max_pod_representatives,
-            )
+    run_due_pod_meetings(
+        world,
+        world.groups,
+        world.agents,
+        tick,
+        rng,
+        meeting_interval_ticks=cfg.pod_meeting_interval_ticks,
+        rep_vote_fraction_threshold=cfg.rep_vote_fraction_threshold,
+        min_leadership_threshold=cfg.min_leadership_threshold,
+        max_representatives=cfg.max_pod_representatives,
+    )
 
     council = maybe_form_proto_council(
         groups=world.groups,
@@ -190,6 +199,7 @@ def _phase_A_groups_and_council(world: WorldState, tick: int, rng: random.Random
         tick=tick,
         hub_location_id="loc:well-core",
         max_council_size=cfg.max_council_size,
+        pod_rep_ids=ensure_group_schedule(world).rep_ids(world.groups),
     )
 
     dangerous_edge_ids: List[str] = []
@@ -227,6 +237,16 @@ def _phase_A_groups_and_council(world: WorldState, tick: int, rng: random.Random
 
 
 def _phase_B_agent_decisions(world: WorldState, tick: int) -> Dict[str, Action]:
+    cfg = getattr(world, "runtime_config", None)
+    workers = int(getattr(cfg, "decision_workers", 0) or 0)
+    if workers > 0:
+        return run_decision_phase(
+            world,
+            tick,
+            workers=workers,
+            min_parallel_agents=int(getattr(cfg, "decision_min_parallel_agents", MIN_PARALLEL_AGENTS)),
+        )
+
     actions_by_agent: Dict[str, Action] = {}
 
     topology, neighbors, well_core_id, rng = prepare_navigation_context(world)
@@ -486,7 +506,7 @@ def run_founding_wakeup_mvp(num_agents: int, max_ticks: int, seed: int) -> Found
     """Run the documented Founding Wakeup MVP loop and evaluate milestones."""
 
     random.seed(seed)
-    world = generate_founding_wakeup_mvp(num_agents=num_agents, seed=seed)
+    world = generate_founding_wakeup_mvp(num_agents=num_agents, seed=seed, template=founding_wakeup_template())
     runtime_cfg = RuntimeConfig(max_ticks=max_ticks)
     world.runtime_config = runtime_cfg
     world.rng.seed(seed)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import random
+from array import array
 from dataclasses import dataclass, field
 from hashlib import sha256
 from typing import Any, Iterable, Mapping
 
 from dosadi.runtime.class_system import class_hardship
 from dosadi.runtime.telemetry import ensure_metrics
+from dosadi.runtime.ward_engine import WardColumns, ward_graph
 from dosadi.state import WardState, WorldState
 
 HEALTH_EVENT_KINDS = {"OUTBREAK_STARTED", "OUTBREAK_PEAK", "OUTBREAK_ENDED"}
@@ -256,47 +258,64 @@ def _evolve_outbreaks(
     _bounded_append(events, new_events, limit=cfg.event_history_limit)
 
 
-def _corridor_pairs(world: WorldState) -> list[tuple[str, str]]:
-    pairs: set[tuple[str, str]] = set()
-    for edge in getattr(world, "edges", {}).values():
-        origin = getattr(edge, "origin", None) or getattr(edge, "a", None)
-        destination = getattr(edge, "destination", None) or getattr(edge, "b", None)
-        if origin and destination:
-            pairs.add((str(origin), str(destination)))
-            pairs.add((str(destination), str(origin)))
-    if not pairs:
-        ward_ids = sorted(world.wards)
-        for idx, ward_id in enumerate(ward_ids):
-            for other in ward_ids[idx + 1 :]:
-                pairs.add((ward_id, other))
-                pairs.add((other, ward_id))
-    return sorted(pairs)
+def _spread_rows(world: WorldState, by_ward: Mapping[str, WardHealthState]) -> tuple[tuple[str, ...], list[list[int]] | None]:
+    """Return the ward ids taking part in spread and their neighbour rows.
+
+    Rows are column slots in ascending ward id order; ``None`` means every
+    ward neighbours every other ward (no corridor edges are known).
+    """
+
+    graph = ward_graph(world)
+    if not graph.has_edges:
+        return tuple(ward_id for ward_id in sorted(world.wards) if ward_id in by_ward), None
+    ward_ids = tuple(node_id for node_id in graph.node_ids if node_id in by_ward)
+    slots = {ward_id: idx for idx, ward_id in enumerate(ward_ids)}
+    rows = [[slots[other] for other in graph.neighbors(ward_id) if other in slots] for ward_id in ward_ids]
+    return ward_ids, rows
 
 
 def _spread_outbreaks(world: WorldState, cfg: HealthConfig, by_ward: dict[str, WardHealthState]) -> None:
-    deltas: dict[tuple[str, str], dict[str, float]] = {}
-    for a, b in _corridor_pairs(world):
-        ward_a = by_ward.get(a)
-        ward_b = by_ward.get(b)
-        if ward_a is None or ward_b is None:
+    ward_ids, rows = _spread_rows(world, by_ward)
+    if len(ward_ids) < 2:
+        return
+    states = [by_ward[ward_id] for ward_id in ward_ids]
+    columns = WardColumns(ward_ids)
+    live = [
+        columns.gather(disease, states, lambda state, disease=disease: state.outbreaks.get(disease, 0.0))
+        for disease in DISEASES
+    ]
+    before = [array("d", column) for column in live]
+    floors = [min(column) for column in before]
+    strength = cfg.spread_strength
+    count = len(ward_ids)
+
+    # Transfers are computed from the pre-spread intensities and then applied
+    # in (from, to, disease) order with clamping at every step.
+    transfers: list[tuple[int, int, int, float]] = []
+    for src in range(count):
+        spreading = [k for k, column in enumerate(before) if column[src] > floors[k]]
+        if not spreading:
             continue
-        for disease in DISEASES:
-            ia = ward_a.outbreaks.get(disease, 0.0)
-            ib = ward_b.outbreaks.get(disease, 0.0)
-            if ia <= ib:
-                continue
-            spill = (ia - ib) * cfg.spread_strength
-            if spill <= 0:
-                continue
-            deltas.setdefault((a, b), {})[disease] = spill
-    for (a, b), transfers in deltas.items():
-        for disease, spill in transfers.items():
-            from_state = by_ward.get(a)
-            to_state = by_ward.get(b)
-            if from_state is None or to_state is None:
-                continue
-            from_state.outbreaks[disease] = _clamp(from_state.outbreaks.get(disease, 0.0) - spill)
-            to_state.outbreaks[disease] = _clamp(to_state.outbreaks.get(disease, 0.0) + spill)
+        row = rows[src] if rows is not None else (dst for dst in range(count) if dst != src)
+        for dst in row:
+            for k in spreading:
+                ia = before[k][src]
+                ib = before[k][dst]
+                if ia <= ib:
+                    continue
+                spill = (ia - ib) * strength
+                if spill <= 0:
+                    continue
+                transfers.append((src, dst, k, spill))
+
+    for src, dst, k, spill in transfers:
+        column = live[k]
+        column[src] = _clamp(column[src] - spill)
+        column[dst] = _clamp(column[dst] + spill)
+    for src, dst, k, _ in transfers:
+        disease = DISEASES[k]
+        states[src].outbreaks[disease] = live[k][src]
+        states[dst].outbreaks[disease] = live[k][dst]
 
 
 def _apply_consequences(world: WorldState, by_ward: dict[str, WardHealthState]) -> None:
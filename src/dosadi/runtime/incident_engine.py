@@ -6,7 +6,7 @@ from typing import Any, Dict, Iterable, List, MutableMapping
 
 from dosadi.world.facilities import FacilityLedger, ensure_facility_ledger
 from dosadi.world.incidents import Incident, IncidentKind, IncidentLedger
-from dosadi.world.logistics import DeliveryStatus, LogisticsLedger, release_courier
+from dosadi.world.logistics import OPEN_DELIVERY_STATUSES, DeliveryStatus, LogisticsLedger, release_courier
 from dosadi.world.phases import WorldPhase
 from dosadi.world.events import EventKind as WorldEventKind, WorldEvent, WorldEventLog
 from dosadi.runtime.events import EventKind, ensure_event_bus
@@ -187,18 +187,7 @@ def _schedule_delivery_incidents(
     if logistics is None:
         return 0
 
-    active_status = {
-        DeliveryStatus.REQUESTED,
-        DeliveryStatus.ASSIGNED,
-        DeliveryStatus.PICKED_UP,
-        DeliveryStatus.IN_TRANSIT,
-    }
-    candidates = [
-        delivery_id
-        for delivery_id in logistics.active_ids
-        if logistics.deliveries.get(delivery_id, None)
-        and logistics.deliveries[delivery_id].status in active_status
-    ]
+    candidates = logistics.ids_with_status(*OPEN_DELIVERY_STATUSES)
     rng_service = ensure_rng_service(world)
     bound = max(1, cfg.max_incidents_per_day * 10)
     sampled = _bounded_candidates(
@@ -347,7 +336,7 @@ def _resolve_delivery_loss(world: Any, *, incident: Incident, day: int) -> None:
     if delivery.status in {DeliveryStatus.ASSIGNED, DeliveryStatus.PICKED_UP, DeliveryStatus.IN_TRANSIT}:
         if delivery.assigned_carrier_id:
             release_courier(world, delivery.assigned_carrier_id)
-        delivery.status = DeliveryStatus.FAILED
+        logistics.set_status(delivery, DeliveryStatus.FAILED)
         delivery.deliver_tick = None
         fraction = max(0.0, min(1.0, incident.severity))
         incident.payload["lost_items"] = {
@@ -135,6 +135,35 @@ def ensure_policy(world: Any, ward_id: str) -> WardInstitutionPolicy:
     return policy
 
 
+def customs_policy_revision(world: Any) -> int:
+    """Counter bumped by :func:`set_customs_biases` when a bias actually changes."""
+
+    return int(getattr(world, "inst_customs_revision", 0) or 0)
+
+
+def set_customs_biases(
+    world: Any,
+    ward_id: str,
+    *,
+    inspection_bias: float | None = None,
+    tariff_bias: float | None = None,
+    contraband_bias: float | None = None,
+) -> WardInstitutionPolicy:
+    policy = ensure_policy(world, ward_id)
+    changed = False
+    for name, value in (
+        ("customs_inspection_bias", inspection_bias),
+        ("customs_tariff_bias", tariff_bias),
+        ("customs_contraband_bias", contraband_bias),
+    ):
+        if value is not None and float(value) != getattr(policy, name):
+            setattr(policy, name, float(value))
+            changed = True
+    if changed:
+        world.inst_customs_revision = customs_policy_revision(world) + 1
+    return policy
+
+
 def ensure_state(world: Any, ward_id: str, *, cfg: InstitutionConfig | None = None) -> WardInstitutionState:
     cfg = cfg or ensure_inst_config(world)
     states: dict[str, WardInstitutionState] = getattr(world, "inst_state_by_ward", {}) or {}
@@ -565,9 +594,11 @@ __all__ = [
     "InstitutionConfig",
     "WardInstitutionPolicy",
     "WardInstitutionState",
+    "customs_policy_revision",
     "ensure_inst_config",
     "ensure_policy",
     "ensure_state",
+    "set_customs_biases",
     "institution_seed_payload",
     "institutions_signature",
     "run_institutions_for_day",
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from hashlib import sha256
-from typing import Any, Mapping
+from pathlib import Path
+from typing import Any, Iterator, Mapping
 
 from dosadi.runtime.institutions import ensure_inst_config, ensure_policy, ensure_state
 from dosadi.runtime.telemetry import ensure_metrics
@@ -19,6 +21,11 @@ class LedgerConfig:
     max_tx_per_day: int = 2000
     max_tx_retained: int = 20000
     deterministic_salt: str = "ledger-v1"
+    rollup_days_retained: int = 3650
+    # Optional JSONL file receiving every transaction evicted from the
+    # journal ring, so ring + spill file form a complete audit trail.
+    spill_path: str | None = None
+    spill_batch_size: int = 512
 
 
 @dataclass(slots=True)
@@ -40,16 +47,229 @@ class LedgerTx:
     meta: dict[str, object] = field(default_factory=dict)
 
 
+def _tx_row_payload(row: list[Any]) -> list[Any]:
+    day, seq, from_acct, to_acct, amount, reason, meta = row
+    return [day, f"{day}:{seq:06d}", from_acct, to_acct, round(amount, 6), reason, {k: meta[k] for k in sorted(meta or {})}]
+
+
+@dataclass(slots=True)
+class LedgerJournal:
+    """Fixed-capacity columnar ring of posted transactions.
+
+    Each column holds one value per retained transaction: day, per-day
+    sequence number, interned from/to account ids, amount, interned reason
+    code, and the (usually absent) meta dict. Once the ring is full the
+    oldest row is overwritten in place. Rows leaving the ring can be spilled
+    to disk, and ``digest`` chains every posted row so signatures never need
+    to re-serialize the history. ``rollups`` keeps per-day, per-account
+    ``[inflow, outflow, tx_count]`` totals keyed by ``str(day)``.
+    """
+
+    capacity: int = 20000
+    head: int = 0
+    days: list[int] = field(default_factory=list)
+    seqs: list[int] = field(default_factory=list)
+    from_ids: list[int] = field(default_factory=list)
+    to_ids: list[int] = field(default_factory=list)
+    amounts: list[float] = field(default_factory=list)
+    reason_ids: list[int] = field(default_factory=list)
+    metas: list[dict[str, object] | None] = field(default_factory=list)
+    account_names: list[str] = field(default_factory=list)
+    account_index: dict[str, int] = field(default_factory=dict)
+    reason_names: list[str] = field(default_factory=list)
+    reason_index: dict[str, int] = field(default_factory=dict)
+    rollups: dict[str, dict[str, list[float]]] = field(default_factory=dict)
+    total: int = 0
+    digest: str = ""
+    spill_pending: list[list[Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def _intern(self, names: list[str], index: dict[str, int], name: str) -> int:
+        if len(index) != len(names):
+            index.clear()
+            index.update((value, idx) for idx, value in enumerate(names))
+        code = index.get(name)
+        if code is None:
+            code = len(names)
+            names.append(name)
+            index[name] = code
+        return code
+
+    def _slot(self, position: int) -> int:
+        size = len(self.days)
+        if position < 0:
+            position += size
+        if position < 0 or position >= size:
+            raise IndexError("ledger journal index out of range")
+        return (self.head + position) % size
+
+    def row(self, position: int) -> list[Any]:
+        slot = self._slot(position)
+        return [
+            self.days[slot],
+            self.seqs[slot],
+            self.account_names[self.from_ids[slot]],
+            self.account_names[self.to_ids[slot]],
+            self.amounts[slot],
+            self.reason_names[self.reason_ids[slot]],
+            self.metas[slot],
+        ]
+
+    def append(
+        self,
+        *,
+        day: int,
+        seq: int,
+        from_acct: str,
+        to_acct: str,
+        amount: float,
+        reason: str,
+        meta: dict[str, object] | None,
+    ) -> list[Any] | None:
+        """Record a row; return the evicted oldest row when the ring was full."""
+
+        row = [
+            day,
+            seq,
+            self._intern(self.account_names, self.account_index, from_acct),
+            self._intern(self.account_names, self.account_index, to_acct),
+            amount,
+            self._intern(self.reason_names, self.reason_index, reason),
+            meta or None,
+        ]
+        self.total += 1
+        self.digest = sha256(
+            (self.digest + json.dumps(_tx_row_payload([day, seq, from_acct, to_acct, amount, reason, meta]), sort_keys=True, separators=(",", ":"))).encode("utf-8")
+        ).hexdigest()
+        self._roll_up(day, from_acct, to_acct, amount)
+
+        columns = (self.days, self.seqs, self.from_ids, self.to_ids, self.amounts, self.reason_ids, self.metas)
+        if len(self.days) < self.capacity:
+            for column, value in zip(columns, row):
+                column.append(value)
+            return None
+        evicted = self.row(0)
+        slot = self.head
+        for column, value in zip(columns, row):
+            column[slot] = value
+        self.head = (slot + 1) % len(self.days)
+        return evicted
+
+    def resize(self, capacity: int) -> list[list[Any]]:
+        """Change the ring capacity, keeping the newest rows; return evicted rows."""
+
+        capacity = max(1, int(capacity))
+        if capacity == self.capacity:
+            return []
+        rows = [self.row(idx) for idx in range(len(self))]
+        keep = rows[-capacity:]
+        self.capacity = capacity
+        self.head = 0
+        self.days = [r[0] for r in keep]
+        self.seqs = [r[1] for r in keep]
+        self.from_ids = [self._intern(self.account_names, self.account_index, r[2]) for r in keep]
+        self.to_ids = [self._intern(self.account_names, self.account_index, r[3]) for r in keep]
+        self.amounts = [r[4] for r in keep]
+        self.reason_ids = [self._intern(self.reason_names, self.reason_index, r[5]) for r in keep]
+        self.metas = [r[6] for r in keep]
+        return rows[: len(rows) - len(keep)]
+
+    def _roll_up(self, day: int, from_acct: str, to_acct: str, amount: float) -> None:
+        by_account = self.rollups.get(str(day))
+        if by_account is None:
+            by_account = {}
+            self.rollups[str(day)] = by_account
+        outgoing = by_account.setdefault(from_acct, [0.0, 0.0, 0])
+        outgoing[1] += amount
+        outgoing[2] += 1
+        incoming = by_account.setdefault(to_acct, [0.0, 0.0, 0])
+        incoming[0] += amount
+        incoming[2] += 1
+
+    def prune_rollups(self, retained_days: int) -> None:
+        while len(self.rollups) > max(1, int(retained_days)):
+            del self.rollups[next(iter(self.rollups))]
+
+    def spill(self, rows: list[list[Any]], path: str | None, *, batch_size: int) -> None:
+        if not path or not rows:
+            return
+        self.spill_pending.extend(rows)
+        if len(self.spill_pending) >= max(1, int(batch_size)):
+            self.flush_spill(path)
+
+    def flush_spill(self, path: str | None) -> int:
+        if not path or not self.spill_pending:
+            return 0
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "a", encoding="utf-8") as fp:
+            for row in self.spill_pending:
+                fp.write(json.dumps(_tx_row_payload(row), sort_keys=True, separators=(",", ":")) + "\n")
+        written = len(self.spill_pending)
+        self.spill_pending = []
+        return written
+
+
+class LedgerTxView(Sequence):
+    """Read-only sequence of retained transactions, oldest first."""
+
+    __slots__ = ("_journal",)
+
+    def __init__(self, journal: LedgerJournal) -> None:
+        self._journal = journal
+
+    def __len__(self) -> int:
+        return len(self._journal)
+
+    def _materialize(self, position: int) -> LedgerTx:
+        day, seq, from_acct, to_acct, amount, reason, meta = self._journal.row(position)
+        return LedgerTx(
+            day=day,
+            tx_id=f"{day}:{seq:06d}",
+            from_acct=from_acct,
+            to_acct=to_acct,
+            amount=amount,
+            reason=reason,
+            meta=dict(meta or {}),
+        )
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self._materialize(idx) for idx in range(*index.indices(len(self)))]
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[LedgerTx]:
+        for idx in range(len(self)):
+            yield self._materialize(idx)
+
+
 @dataclass(slots=True)
 class LedgerState:
     accounts: dict[str, LedgerAccount] = field(default_factory=dict)
-    txs: list[LedgerTx] = field(default_factory=list)
+    journal: LedgerJournal = field(default_factory=LedgerJournal)
     last_run_day: int = -1
     tx_counter_day: int = -1
     tx_counter: int = 0
     paid_enforcement: dict[str, float] = field(default_factory=dict)
     paid_audit: dict[str, float] = field(default_factory=dict)
 
+    @property
+    def txs(self) -> LedgerTxView:
+        return LedgerTxView(self.journal)
+
+    @property
+    def tx_total(self) -> int:
+        """Number of transactions ever posted (retained or not)."""
+
+        return self.journal.total
+
+    def account_day_rollup(self, day: int) -> dict[str, list[float]]:
+        """``{acct_id: [inflow, outflow, tx_count]}`` for ``day``."""
+
+        return self.journal.rollups.get(str(day), {})
+
     def signature(self) -> str:
         canonical = {
             "accounts": {
@@ -60,18 +280,7 @@ class LedgerState:
                 }
                 for acct_id, acct in sorted(self.accounts.items())
             },
-            "txs": [
-                {
-                    "day": tx.day,
-                    "tx_id": tx.tx_id,
-                    "from": tx.from_acct,
-                    "to": tx.to_acct,
-                    "amount": round(tx.amount, 6),
-                    "reason": tx.reason,
-                    "meta": {k: tx.meta[k] for k in sorted(tx.meta)},
-                }
-                for tx in self.txs
-            ],
+            "journal": {"digest": self.journal.digest, "total": self.journal.total},
             "tx_counter_day": self.tx_counter_day,
             "tx_counter": self.tx_counter,
         }
@@ -146,26 +355,32 @@ def post_tx(
     payer.balance = max(0.0, payer.balance - effective_amount)
     payee.balance = payee.balance + effective_amount
 
-    tx_id = f"{day}:{state.tx_counter:06d}"
-    state.tx_counter += 1
-    tx = LedgerTx(
+    journal = state.journal
+    evicted = journal.resize(cfg.max_tx_retained)
+    row = journal.append(
         day=day,
-        tx_id=tx_id,
+        seq=state.tx_counter,
         from_acct=from_acct,
         to_acct=to_acct,
         amount=effective_amount,
         reason=reason,
-        meta=dict(meta or {}),
+        meta=dict(meta) if meta else None,
     )
-    state.txs.append(tx)
-    max_txs = max(1, int(cfg.max_tx_retained))
-    if len(state.txs) > max_txs:
-        overflow = len(state.txs) - max_txs
-        if overflow > 0:
-            state.txs = state.txs[overflow:]
+    state.tx_counter += 1
+    if row is not None:
+        evicted.append(row)
+    if evicted:
+        journal.spill(evicted, cfg.spill_path, batch_size=cfg.spill_batch_size)
     return True
 
 
+def flush_ledger_spill(world: Any) -> int:
+    """Write pending spilled transactions to ``LedgerConfig.spill_path``."""
+
+    cfg = ensure_ledger_config(world)
+    return ensure_ledger_state(world).journal.flush_spill(cfg.spill_path)
+
+
 def transfer(
     world: Any,
     day: int,
@@ -234,7 +449,7 @@ def _apply_throughput_levies(world: Any, *, day: int, state: LedgerState) -> dic
         levy = max(0.0, float(policy.levy_rate)) * throughput
         if levy <= 0.0:
             continue
-        prev_len = len(state.txs)
+        prev_total = state.tx_total
         posted = post_tx(
             world,
             day=day,
@@ -244,7 +459,7 @@ def _apply_throughput_levies(world: Any, *, day: int, state: LedgerState) -> dic
             reason="LEVY_THROUGHPUT",
             meta={"throughput": throughput},
         )
-        if posted and len(state.txs) > prev_len:
+        if posted and state.tx_total > prev_total:
             levies[ward_id] = state.txs[-1].amount
     return levies
 
@@ -260,7 +475,7 @@ def _apply_corruption_leaks(world: Any, *, day: int, levies: Mapping[str, float]
         if leak <= 0:
             continue
         get_or_create_account(world, BLACK_MARKET, tags={"sink"})
-        prev_len = len(state.txs)
+        prev_total = state.tx_total
         posted = post_tx(
             world,
             day=day,
@@ -270,7 +485,7 @@ def _apply_corruption_leaks(world: Any, *, day: int, levies: Mapping[str, float]
             reason="CORRUPTION_LEAK",
             meta={"corruption": corruption},
         )
-        if posted and len(state.txs) > prev_len:
+        if posted and state.tx_total > prev_total:
             state.paid_enforcement.setdefault(ward_id, 0.0)
 
 
@@ -281,7 +496,7 @@ def _apply_planned_spend(world: Any, *, day: int, state: LedgerState) -> None:
     for ward_id in sorted(wards):
         policy = ensure_policy(world, ward_id)
         if getattr(policy, "enforcement_budget_points", 0.0) > 0:
-            prev_len = len(state.txs)
+            prev_total = state.tx_total
             posted = post_tx(
                 world,
                 day=day,
@@ -290,10 +505,10 @@ def _apply_planned_spend(world: Any, *, day: int, state: LedgerState) -> None:
                 amount=policy.enforcement_budget_points,
                 reason="PAY_ENFORCEMENT",
             )
-            if posted and len(state.txs) > prev_len:
+            if posted and state.tx_total > prev_total:
                 state.paid_enforcement[ward_id] = state.txs[-1].amount
         if getattr(policy, "audit_budget_points", 0.0) > 0:
-            prev_len = len(state.txs)
+            prev_total = state.tx_total
             posted = post_tx(
                 world,
                 day=day,
@@ -302,7 +517,7 @@ def _apply_planned_spend(world: Any, *, day: int, state: LedgerState) -> None:
                 amount=policy.audit_budget_points,
                 reason="PAY_AUDIT",
             )
-            if posted and len(state.txs) > prev_len:
+            if posted and state.tx_total > prev_total:
                 state.paid_audit[ward_id] = state.txs[-1].amount
 
 
@@ -320,7 +535,8 @@ def _emit_metrics(world: Any, state: LedgerState) -> None:
             "avg_ward": sum(ward_balances) / len(ward_balances) if ward_balances else 0.0,
             "avg_faction": sum(faction_balances) / len(faction_balances) if faction_balances else 0.0,
         }
-        ledger_metrics["tx_count"] = len(state.txs)
+        ledger_metrics["tx_count"] = len(state.journal)
+        ledger_metrics["tx_total"] = state.tx_total
     for acct_id, acct in sorted(state.accounts.items()):
         metrics.topk_add("ledger.richest_accounts", acct_id, acct.balance)
         metrics.topk_add("ledger.lowest_accounts", acct_id, -acct.balance)
@@ -347,6 +563,8 @@ def run_ledger_for_day(world: Any, *, day: int) -> None:
     levies = _apply_throughput_levies(world, day=day, state=state)
     _apply_corruption_leaks(world, day=day, levies=levies, state=state)
     _apply_planned_spend(world, day=day, state=state)
+    state.journal.prune_rollups(cfg.rollup_days_retained)
+    state.journal.flush_spill(cfg.spill_path)
     _emit_metrics(world, state)
 
 
@@ -381,11 +599,14 @@ def save_ledger_seed(world: Any, path) -> None:
 __all__ = [
     "LedgerAccount",
     "LedgerConfig",
+    "LedgerJournal",
     "LedgerState",
     "LedgerTx",
+    "LedgerTxView",
     "ensure_accounts",
     "ensure_ledger_config",
     "ensure_ledger_state",
+    "flush_ledger_spill",
     "get_or_create_account",
     "ledger_seed_payload",
     "post_tx",
@@ -273,7 +273,7 @@ def _fail_delivery(world: Any, delivery_id: str, *, tick: int, reason: str) -> N
     if delivery is None:
         return
 
-    delivery.status = DeliveryStatus.FAILED
+    logistics.set_status(delivery, DeliveryStatus.FAILED)
     delivery.deliver_tick = tick
     delivery.notes["failure"] = reason
     delivery.next_edge_complete_tick = None
@@ -73,12 +73,7 @@ def _facility_metrics(world) -> Dict[str, float]:
 
 
 def _facility_staff_count(world, facility_id: str) -> int:
-    ledger = ensure_workforce(world)
-    return sum(
-        1
-        for assignment in ledger.assignments.values()
-        if assignment.kind is AssignmentKind.FACILITY_STAFF and assignment.target_id == facility_id
-    )
+    return ensure_workforce(world).facility_staff_count(facility_id)
 
 
 def _emit_facility_event(world, event: Mapping[str, object]) -> None:
@@ -0,0 +1,247 @@
+"""Memory accounting and budget enforcement for append-only world collections.
+
+Many subsystems append to history lists on the world (``events``, ``trades``,
+``finance_events``, ``migration_flows`` ...).  A few cap themselves with ad-hoc
+``_bounded_append`` helpers, the rest grow for the whole run.  This service
+measures every tracked collection on a cadence, publishes item counts and
+retained bytes as ``memory.*`` gauges in :class:`~dosadi.runtime.telemetry.Metrics`,
+and, when the total exceeds ``budget_bytes``, trims the largest collections
+oldest-first according to their retention policy:
+
+``drop_oldest``
+    discard the trimmed entries.
+``summarize``
+    fold them into a per-collection rollup (count, day range, counts by kind).
+``spill``
+    append them as JSON lines under ``spill_dir`` before discarding them; without
+    a ``spill_dir`` this falls back to ``summarize``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import math
+from pathlib import Path
+from typing import Any, Iterable, Mapping, MutableMapping
+
+from dosadi.runtime.memory_report import deep_sizeof
+from dosadi.runtime.telemetry import ensure_metrics
+
+DROP_OLDEST = "drop_oldest"
+SUMMARIZE = "summarize"
+SPILL = "spill"
+RETENTION_POLICIES = (DROP_OLDEST, SUMMARIZE, SPILL)
+
+DEFAULT_COLLECTION_POLICIES: dict[str, str] = {
+    "events": SUMMARIZE,
+    "trades": SPILL,
+    "career_events": SUMMARIZE,
+    "finance_events": SUMMARIZE,
+    "insurance_events": SUMMARIZE,
+    "health_events": SUMMARIZE,
+    "demographic_events": SUMMARIZE,
+    "clinic_records": SPILL,
+    "law_cases": SPILL,
+    "admin_logs": SPILL,
+    "migration_flows": SUMMARIZE,
+    "market_quotes": DROP_OLDEST,
+}
+
+_MAX_TRIM_PASSES = 8
+
+
+@dataclass(slots=True)
+class MemoryBudgetConfig:
+    enabled: bool = False
+    budget_bytes: int = 64 * 1024 * 1024
+    cadence_days: int = 30
+    # Entries each collection keeps even when the budget is exceeded.
+    min_keep: int = 50
+    spill_dir: str | None = None
+    policies: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_COLLECTION_POLICIES))
+
+
+@dataclass(slots=True)
+class CollectionUsage:
+    name: str
+    items: int
+    bytes: int
+
+
+@dataclass(slots=True)
+class MemoryBudgetState:
+    last_run_day: int = -1
+    usage: dict[str, CollectionUsage] = field(default_factory=dict)
+    total_bytes: int = 0
+    trimmed: dict[str, int] = field(default_factory=dict)
+    summaries: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def ensure_memory_budget_config(world: Any) -> MemoryBudgetConfig:
+    cfg = getattr(world, "memory_budget_cfg", None)
+    if not isinstance(cfg, MemoryBudgetConfig):
+        cfg = MemoryBudgetConfig()
+        world.memory_budget_cfg = cfg
+    return cfg
+
+
+def ensure_memory_budget_state(world: Any) -> MemoryBudgetState:
+    state = getattr(world, "memory_budget_state", None)
+    if not isinstance(state, MemoryBudgetState):
+        state = MemoryBudgetState()
+        world.memory_budget_state = state
+    return state
+
+
+def measure_collections(world: Any, names: Iterable[str]) -> dict[str, CollectionUsage]:
+    """Item counts and retained bytes for each named collection present on ``world``."""
+
+    usage: dict[str, CollectionUsage] = {}
+    seen: set[int] = set()
+    for name in names:
+        collection = getattr(world, name, None)
+        if not isinstance(collection, (list, MutableMapping)):
+            continue
+        usage[name] = CollectionUsage(name=name, items=len(collection), bytes=deep_sizeof(collection, seen))
+    return usage
+
+
+def _entry_field(entry: Any, *names: str) -> Any:
+    for name in names:
+        value = entry.get(name) if isinstance(entry, Mapping) else getattr(entry, name, None)
+        if value is not None:
+            return value
+    return None
+
+
+def _summarize(summary: dict[str, Any], entries: Iterable[Any]) -> None:
+    by_kind: dict[str, int] = summary.setdefault("by_kind", {})
+    for entry in entries:
+        summary["count"] = summary.get("count", 0) + 1
+        day = _entry_field(entry, "day")
+        if isinstance(day, (int, float)):
+            day = int(day)
+            summary["first_day"] = min(summary.get("first_day", day), day)
+            summary["last_day"] = max(summary.get("last_day", day), day)
+        kind = _entry_field(entry, "kind", "event", "type", "event_type")
+        key = str(kind) if kind is not None else type(entry).__name__
+        by_kind[key] = by_kind.get(key, 0) + 1
+
+
+def _spill(spill_dir: Path, name: str, entries: Iterable[Any]) -> None:
+    from dosadi.runtime.snapshot import to_snapshot_dict
+
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    with open(spill_dir / f"{name}.jsonl", "a", encoding="utf-8") as fp:
+        for entry in entries:
+            fp.write(json.dumps(to_snapshot_dict(entry), sort_keys=True, default=str) + "\n")
+
+
+def _remove_oldest(collection: Any, count: int) -> list[Any]:
+    if isinstance(collection, MutableMapping):
+        keys = list(collection.keys())[:count]
+        return [collection.pop(key) for key in keys]
+    removed = collection[:count]
+    del collection[:count]
+    return removed
+
+
+def trim_collection(world: Any, name: str, count: int, *, policy: str, cfg: MemoryBudgetConfig, state: MemoryBudgetState) -> int:
+    """Remove the ``count`` oldest entries of ``name`` under ``policy``; return how many went."""
+
+    collection = getattr(world, name, None)
+    if count <= 0 or not isinstance(collection, (list, MutableMapping)):
+        return 0
+    removed = _remove_oldest(collection, min(count, len(collection)))
+    if policy == SPILL and cfg.spill_dir:
+        _spill(Path(cfg.spill_dir), name, removed)
+    elif policy in (SPILL, SUMMARIZE):
+        _summarize(state.summaries.setdefault(name, {}), removed)
+    state.trimmed[name] = state.trimmed.get(name, 0) + len(removed)
+    return len(removed)
+
+
+def _publish(world: Any, state: MemoryBudgetState, cfg: MemoryBudgetConfig) -> None:
+    metrics = ensure_metrics(world)
+    for name, usage in state.usage.items():
+        metrics.set_gauge(f"memory.{name}.items", usage.items)
+        metrics.set_gauge(f"memory.{name}.bytes", usage.bytes)
+    metrics.set_gauge("memory.total_bytes", state.total_bytes)
+    metrics.set_gauge("memory.budget_bytes", int(cfg.budget_bytes))
+
+
+def _trim_pass(world: Any, usage: Mapping[str, CollectionUsage], *, cfg: MemoryBudgetConfig, state: MemoryBudgetState) -> int:
+    excess = sum(item.bytes for item in usage.values()) - int(cfg.budget_bytes)
+    trimmed = 0
+    metrics = ensure_metrics(world)
+    for item in sorted(usage.values(), key=lambda u: (-u.bytes, u.name)):
+        if excess <= 0:
+            break
+        spare = item.items - max(0, int(cfg.min_keep))
+        if spare <= 0 or item.bytes <= 0:
+            continue
+        per_entry = item.bytes / item.items
+        count = min(spare, math.ceil(excess / per_entry))
+        policy = cfg.policies.get(item.name, DROP_OLDEST)
+        removed = trim_collection(world, item.name, count, policy=policy, cfg=cfg, state=state)
+        metrics.inc(f"memory.trimmed.{policy}", removed)
+        trimmed += removed
+        excess -= removed * per_entry
+    return trimmed
+
+
+def enforce_memory_budget(world: Any, *, cfg: MemoryBudgetConfig, state: MemoryBudgetState) -> int:
+    """Measure, trim the largest collections until under budget, and re-measure.
+
+    Returns the number of entries trimmed.  Each pass trims collections by the
+    estimated number of entries (at their average entry size) needed to cover
+    the excess, never below ``min_keep`` entries; the estimate ignores container
+    overhead, so passes repeat until the budget holds or nothing is left to trim.
+    """
+
+    names = list(cfg.policies)
+    usage = measure_collections(world, names)
+    trimmed = 0
+    for _ in range(_MAX_TRIM_PASSES):
+        if sum(item.bytes for item in usage.values()) <= int(cfg.budget_bytes):
+            break
+        removed = _trim_pass(world, usage, cfg=cfg, state=state)
+        if not removed:
+            break
+        trimmed += removed
+        usage = measure_collections(world, names)
+
+    state.usage = usage
+    state.total_bytes = sum(item.bytes for item in usage.values())
+    _publish(world, state, cfg)
+    return trimmed
+
+
+def run_memory_budget_for_day(world: Any, *, day: int) -> None:
+    cfg = ensure_memory_budget_config(world)
+    if not cfg.enabled:
+        return
+    state = ensure_memory_budget_state(world)
+    if state.last_run_day >= 0 and day - state.last_run_day < max(1, int(cfg.cadence_days)):
+        return
+    state.last_run_day = day
+    enforce_memory_budget(world, cfg=cfg, state=state)
+
+
+__all__ = [
+    "CollectionUsage",
+    "DEFAULT_COLLECTION_POLICIES",
+    "DROP_OLDEST",
+    "MemoryBudgetConfig",
+    "MemoryBudgetState",
+    "RETENTION_POLICIES",
+    "SPILL",
+    "SUMMARIZE",
+    "enforce_memory_budget",
+    "ensure_memory_budget_config",
+    "ensure_memory_budget_state",
+    "measure_collections",
+    "run_memory_budget_for_day",
+    "trim_collection",
+]
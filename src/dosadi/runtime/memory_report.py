@@ -0,0 +1,215 @@
+"""Retained-memory accounting for worlds and agents.
+
+``memory_report`` walks the object graph reachable from a world and attributes
+retained bytes to coarse buckets (agents, episodes, beliefs, event logs,
+ledgers, other). Objects reachable from several places are only counted once,
+in the first bucket that reaches them, so the buckets sum to the total.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+import sys
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Iterable, Mapping
+
+MEMORY_CATEGORIES = ("agents", "episodes", "beliefs", "event_logs", "ledgers", "other")
+
+AGENT_EPISODE_FIELDS = ("episodes", "episodes_daily", "stm", "crumbs")
+AGENT_BELIEF_FIELDS = ("place_beliefs", "beliefs")
+
+EVENT_LOG_FIELDS = frozenset(
+    {
+        "events",
+        "events_outbox",
+        "event_log",
+        "event_bus",
+        "event_ring",
+        "admin_event_log",
+        "admin_logs",
+        "raid_history",
+        "intel_ops_history",
+        "cell_ops_history",
+        "migration_flows",
+        "clinic_records",
+        "law_cases",
+        "security_reports",
+        "trades",
+        "market_quotes",
+    }
+)
+
+_SKIP_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, Enum)
+
+
+@dataclass(slots=True)
+class MemoryReport:
+    agent_count: int = 0
+    bytes_by_category: dict[str, int] = field(default_factory=dict)
+    bytes_by_field: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.bytes_by_category.values())
+
+    @property
+    def bytes_per_agent(self) -> float:
+        if self.agent_count <= 0:
+            return 0.0
+        per_agent = sum(self.bytes_by_category.get(name, 0) for name in ("agents", "episodes", "beliefs"))
+        return per_agent / self.agent_count
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "agent_count": self.agent_count,
+            "total_bytes": self.total_bytes,
+            "bytes_per_agent": round(self.bytes_per_agent, 1),
+            "bytes_by_category": dict(self.bytes_by_category),
+            "bytes_by_field": {k: v for k, v in sorted(self.bytes_by_field.items(), key=lambda itm: (-itm[1], itm[0]))},
+        }
+
+
+def _slot_names(cls: type) -> Iterable[str]:
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__"):
+                yield name
+
+
+def _children(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, Mapping):
+        for key, value in obj.items():
+            yield key
+            yield value
+        if not isinstance(obj, dict):
+            yield from _attribute_values(obj)
+        return
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        yield from obj
+        return
+    yield from _attribute_values(obj)
+
+
+def _attribute_values(obj: Any) -> Iterable[Any]:
+    instance_dict = getattr(obj, "__dict__", None)
+    if isinstance(instance_dict, dict):
+        yield instance_dict
+    for name in _slot_names(type(obj)):
+        try:
+            yield getattr(obj, name)
+        except AttributeError:
+            continue
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Return the retained size of ``obj`` excluding objects already in ``seen``.
+
+    Classes, modules, functions and enum members are treated as shared
+    interpreter state and never counted.
+    """
+
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if current is None or isinstance(current, (bool, *_SKIP_TYPES)):
+            continue
+        marker = id(current)
+        if marker in seen:
+            continue
+        seen.add(marker)
+        total += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, bytearray, int, float, complex)):
+            continue
+        stack.extend(_children(current))
+    return total
+
+
+def _world_field_category(name: str, value: Any) -> str:
+    if name in EVENT_LOG_FIELDS or name.endswith("_events"):
+        return "event_logs"
+    type_name = type(value).__name__
+    if "ledger" in name or type_name.endswith("Ledger") or type_name.endswith("LedgerState"):
+        return "ledgers"
+    return "other"
+
+
+def _agent_field_category(name: str) -> str:
+    if name in AGENT_EPISODE_FIELDS:
+        return "episodes"
+    if name in AGENT_BELIEF_FIELDS:
+        return "beliefs"
+    return "agents"
+
+
+def _field_items(obj: Any) -> list[tuple[str, Any]]:
+    if is_dataclass(obj):
+        return [(f.name, getattr(obj, f.name, None)) for f in fields(obj)]
+    return sorted(vars(obj).items())
+
+
+def memory_report(world: Any) -> MemoryReport:
+    """Attribute the bytes retained by ``world`` to coarse categories.
+
+    Agent state is measured first so shared objects (goals also registered in
+    ``world.goals``, episodes referenced from logs) count towards the agents
+    that own them.
+    """
+
+    report = MemoryReport(bytes_by_category={name: 0 for name in MEMORY_CATEGORIES})
+    seen: set[int] = {id(world)}
+    base = sys.getsizeof(world)
+    instance_dict = getattr(world, "__dict__", None)
+    if isinstance(instance_dict, dict):
+        seen.add(id(instance_dict))
+        base += sys.getsizeof(instance_dict)
+    report.bytes_by_category["other"] += base
+
+    def charge(category: str, label: str, size: int) -> None:
+        report.bytes_by_category[category] = report.bytes_by_category.get(category, 0) + size
+        report.bytes_by_field[label] = report.bytes_by_field.get(label, 0) + size
+
+    agents = getattr(world, "agents", None) or {}
+    report.agent_count = len(agents)
+    if isinstance(agents, Mapping):
+        seen.add(id(agents))
+        charge("agents", "agents", sys.getsizeof(agents))
+        for agent_id, agent in agents.items():
+            charge("agents", "agents", deep_sizeof(agent_id, seen))
+            if id(agent) in seen:
+                continue
+            seen.add(id(agent))
+            charge("agents", "agents", sys.getsizeof(agent))
+            agent_dict = getattr(agent, "__dict__", None)
+            if isinstance(agent_dict, dict):
+                seen.add(id(agent_dict))
+                charge("agents", "agents", sys.getsizeof(agent_dict))
+            for name, value in _field_items(agent):
+                category = _agent_field_category(name)
+                label = "agents" if category == "agents" else f"agent.{name}"
+                charge(category, label, deep_sizeof(value, seen))
+
+    for name, value in _field_items(world):
+        if name == "agents":
+            continue
+        charge(_world_field_category(name, value), name, deep_sizeof(value, seen))
+
+    return report
+
+
+__all__ = [
+    "AGENT_BELIEF_FIELDS",
+    "AGENT_EPISODE_FIELDS",
+    "EVENT_LOG_FIELDS",
+    "MEMORY_CATEGORIES",
+    "MemoryReport",
+    "deep_sizeof",
+    "memory_report",
+]
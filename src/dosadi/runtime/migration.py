@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Iterable, Mapping
 
 from dosadi.runtime.class_system import class_hardship
 from dosadi.runtime.telemetry import Metrics, TopK
+from dosadi.runtime.ward_engine import WardGraph, ward_graph
 
 if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
     from dosadi.state import WorldState
@@ -69,18 +70,12 @@ def _stable_rng(seed: int, day: int, salt: str) -> random.Random:
     return random.Random(int(digest, 16) % (2**32))
 
 
-def _neighbor_ids(world: WorldState, ward_id: str) -> list[str]:
-    neighbors: set[str] = set()
-    for edge in getattr(world, "edges", {}).values():
-        origin = getattr(edge, "origin", None) or getattr(edge, "a", None)
-        destination = getattr(edge, "destination", None) or getattr(edge, "b", None)
-        if origin == ward_id and destination:
-            neighbors.add(str(destination))
-        if destination == ward_id and origin:
-            neighbors.add(str(origin))
+def _neighbor_ids(world: WorldState, ward_id: str, graph: WardGraph | None = None) -> list[str]:
+    graph = graph if graph is not None else ward_graph(world)
+    neighbors = graph.neighbors(ward_id)
     if not neighbors:
-        neighbors.update(k for k in getattr(world, "wards", {}).keys() if k != ward_id)
-    return sorted(neighbors)
+        neighbors = sorted(k for k in getattr(world, "wards", {}).keys() if k != ward_id)
+    return neighbors
 
 
 def _edge_allows_flow(edge: object) -> bool:
@@ -173,6 +168,7 @@ def run_migration_for_day(world: WorldState, *, day: int | None = None) -> None:
     total_allowed = max(0, int(cfg.max_total_movers_per_update))
     global_remaining = total_allowed
     new_flows: list[MigrationFlow] = []
+    graph = ward_graph(world)
 
     for origin_id in sorted(migration_by_ward):
         origin_state = migration_by_ward[origin_id]
@@ -180,42 +176,14 @@ def run_migration_for_day(world: WorldState, *, day: int | None = None) -> None:
             origin_state.last_update_day = current_day
             continue
 
-        neighbors = _neighbor_ids(world, origin_id)[: max(1, int(cfg.neighbor_topk))]
+        neighbors = _neighbor_ids(world, origin_id, graph)[: max(1, int(cfg.neighbor_topk))]
         scored: list[tuple[float, str]] = []
 
         for neighbor_id in neighbors:
             dest_state = migration_by_ward.get(neighbor_id)
             if dest_state is None:
                 continue
-            edge = None
-            for e in getattr(world, "edges", {}).values():
-                if (
-                    getattr(e, "origin", None) == origin_id
-                    or (isinstance(e, Mapping) and e.get("origin") == origin_id)
-                ) and (
-                    getattr(e, "destination", None) == neighbor_id
-                    or (isinstance(e, Mapping) and e.get("destination") == neighbor_id)
-                ):
-                    edge = e
-                    break
-                if (
-                    getattr(e, "a", None) == origin_id
-                    or (isinstance(e, Mapping) and e.get("a") == origin_id)
-                ) and (
-                    getattr(e, "b", None) == neighbor_id
-                    or (isinstance(e, Mapping) and e.get("b") == neighbor_id)
-                ):
-                    edge = e
-                    break
-                if (
-                    getattr(e, "a", None) == neighbor_id
-                    or (isinstance(e, Mapping) and e.get("a") == neighbor_id)
-                ) and (
-                    getattr(e, "b", None) == origin_id
-                    or (isinstance(e, Mapping) and e.get("b") == origin_id)
-                ):
-                    edge = e
-                    break
+            edge = graph.edge_between(origin_id, neighbor_id)
             if not _edge_allows_flow(edge):
                 continue
             capacity_remaining = max(0, dest_state.intake_capacity - dest_state.displaced)
@@ -5,7 +5,7 @@ from dataclasses import asdict
 from dosadi.world.construction import ProjectLedger, ProjectStatus
 from dosadi.world.events import EventKind, WorldEvent, WorldEventLog
 from dosadi.world.facilities import FacilityLedger, get_facility_behavior
-from dosadi.world.logistics import DeliveryStatus, LogisticsLedger
+from dosadi.world.logistics import OPEN_DELIVERY_STATUSES, LogisticsLedger
 from dosadi.world.phases import KPISnapshot, PhaseConfig, PhaseState, WorldPhase
 from dosadi.world.workforce import AssignmentKind, WorkforceLedger
 
@@ -19,18 +19,7 @@ def compute_kpis(world, *, day: int) -> KPISnapshot:
     logistics = getattr(world, "logistics", None)
     logistics_backlog = 0
     if isinstance(logistics, LogisticsLedger):
-        backlog_status = {
-            DeliveryStatus.REQUESTED.value,
-            DeliveryStatus.ASSIGNED.value,
-            DeliveryStatus.PICKED_UP.value,
-            DeliveryStatus.IN_TRANSIT.value,
-        }
-        logistics_backlog = 0
-        for delivery in logistics.deliveries.values():
-            status = getattr(delivery, "status", None)
-            status_label = status.value if isinstance(status, DeliveryStatus) else str(status)
-            if status_label in backlog_status:
-                logistics_backlog += 1
+        logistics_backlog = len(logistics.ids_with_status(*OPEN_DELIVERY_STATUSES))
 
     projects = getattr(world, "projects", None)
     workforce = getattr(world, "workforce", None)
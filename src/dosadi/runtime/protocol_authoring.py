@@ -27,7 +27,7 @@ def handle_protocol_authoring(
         tick=world.tick,
         registry=registry,
     )
-    activate_protocol(protocol, tick=world.tick)
+    activate_protocol(protocol, tick=world.tick, registry=registry)
 
 
 def maybe_author_movement_protocols(
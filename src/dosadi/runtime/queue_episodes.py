@@ -13,11 +13,59 @@ class QueueEpisodeEmitter:
 
     This is intended to be called by queue/ration systems when queue outcomes
     are resolved. It does not implement queue logic itself.
+
+    Agents without per-agent details (observers, denied/canceled/fight
+    participants) receive SharedEpisode overlays that reference one
+    SharedEpisodeEvent per outcome and channel, rather than a full Episode copy.
     """
 
     def __init__(self, factory: Optional[EpisodeFactory] = None) -> None:
         self.factory = factory or EpisodeFactory()
 
+    def _emit_shared(
+        self,
+        agents: Iterable[AgentState],
+        *,
+        tick: int,
+        summary_tag: str,
+        channel: EpisodeChannel,
+        queue_location_id: str,
+        event_id: Optional[str],
+    ) -> None:
+        shared = None
+        for agent in agents:
+            if shared is None:
+                shared = self.factory.build_shared_event(
+                    tick,
+                    summary_tag=summary_tag,
+                    channel=channel,
+                    location_id=queue_location_id,
+                    target_type=EpisodeTargetType.PLACE,
+                    target_id=queue_location_id,
+                    event_id=event_id,
+                )
+            agent.record_episode(self.factory.build_shared_episode(agent, shared))
+
+    def _emit_outcome(
+        self,
+        *,
+        tick: int,
+        summary_tag: str,
+        queue_location_id: str,
+        agents: Iterable[AgentState],
+        observers: Iterable[AgentState],
+        event_id: Optional[str],
+    ) -> None:
+        for channel, group in ((EpisodeChannel.DIRECT, agents), (EpisodeChannel.OBSERVED, observers)):
+            self._emit_shared(
+                group,
+                tick=tick,
+                summary_tag=summary_tag,
+                channel=channel,
+                queue_location_id=queue_location_id,
+                event_id=event_id,
+            )
+
     def queue_served(
         self,
         *,
@@ -28,37 +76,30 @@ class QueueEpisodeEmitter:
         observers: Iterable[AgentState] = (),
         event_id: Optional[str] = None,
     ) -> None:
-        for agent in served_agents:
-            wait = 0
-            if wait_ticks:
-                wait = wait_ticks.get(agent.agent_id, 0)
-            episode = self.factory.build_episode(
-                owner=agent,
-                tick=tick,
-                summary_tag="queue_served",
-                channel=EpisodeChannel.DIRECT,
-                location_id=queue_location_id,
-                target_type=EpisodeTargetType.PLACE,
-                target_id=queue_location_id,
-                event_id=event_id,
-            )
-            episode.tags.add("queue_served")
-            episode.details["wait_ticks"] = wait
+        served = list(served_agents)
+        wait_ticks = wait_ticks or {}
+        episodes = self.factory.build_many(
+            served,
+            tick,
+            summary_tag="queue_served",
+            channel=EpisodeChannel.DIRECT,
+            location_id=queue_location_id,
+            target_type=EpisodeTargetType.PLACE,
+            target_id=queue_location_id,
+            event_id=event_id,
+            details={agent.agent_id: {"wait_ticks": wait_ticks.get(agent.agent_id, 0)} for agent in served},
+        )
+        for agent, episode in zip(served, episodes):
             agent.record_episode(episode)
 
-        for agent in observers:
-            episode = self.factory.build_episode(
-                owner=agent,
-                tick=tick,
-                summary_tag="queue_served",
-                channel=EpisodeChannel.OBSERVED,
-                location_id=queue_location_id,
-                target_type=EpisodeTargetType.PLACE,
-                target_id=queue_location_id,
-                event_id=event_id,
-            )
-            episode.tags.add("queue_served")
-            agent.record_episode(episode)
+        self._emit_shared(
+            observers,
+            tick=tick,
+            summary_tag="queue_served",
+            channel=EpisodeChannel.OBSERVED,
+            queue_location_id=queue_location_id,
+            event_id=event_id,
+        )
 
     def queue_denied(
         self,
@@ -69,33 +110,14 @@ class QueueEpisodeEmitter:
         observers: Iterable[AgentState] = (),
         event_id: Optional[str] = None,
     ) -> None:
-        for agent in denied_agents:
-            episode = self.factory.build_episode(
-                owner=agent,
-                tick=tick,
-                summary_tag="queue_denied",
-                channel=EpisodeChannel.DIRECT,
-                location_id=queue_location_id,
-                target_type=EpisodeTargetType.PLACE,
-                target_id=queue_location_id,
-                event_id=event_id,
-            )
-            episode.tags.add("queue_denied")
-            agent.record_episode(episode)
-
-        for agent in observers:
-            episode = self.factory.build_episode(
-                owner=agent,
-                tick=tick,
-                summary_tag="queue_denied",
-                channel=EpisodeChannel.OBSERVED,
-                location_id=queue_location_id,
-                target_type=EpisodeTargetType.PLACE,
-                target_id=queue_location_id,
-                event_id=event_id,
-            )
-            episode.tags.add("queue_denied")
-            agent.record_episode(episode)
+        self._emit_outcome(
+            tick=tick,
+            summary_tag="queue_denied",
+            queue_location_id=queue_location_id,
+            agents=denied_agents,
+            observers=observers,
+            event_id=event_id,
+        )
 
     def queue_canceled(
         self,
@@ -106,33 +128,14 @@ class QueueEpisodeEmitter:
         observers: Iterable[AgentState] = (),
         event_id: Optional[str] = None,
     ) -> None:
-        for agent in affected_agents:
-            episode = self.factory.build_episode(
-                owner=agent,
-                tick=tick,
-                summary_tag="queue_canceled",
-                channel=EpisodeChannel.DIRECT,
-                location_id=queue_location_id,
-                target_type=EpisodeTargetType.PLACE,
-                target_id=queue_location_id,
-                event_id=event_id,
-            )
-            episode.tags.add("queue_canceled")
-            agent.record_episode(episode)
-
-        for agent in observers:
-            episode = self.factory.build_episode(
-                owner=agent,
-                tick=tick,
-                summary_tag="queue_canceled",
-                channel=EpisodeChannel.OBSERVED,
-                location_id=queue_location_id,
-                target_type=EpisodeTargetType.PLACE,
-                target_id=queue_location_id,
-                event_id=event_id,
-            )
-            episode.tags.add("queue_canceled")
-            agent.record_episode(episode)
+        self._emit_outcome(
+            tick=tick,
+            summary_tag="queue_canceled",
+            queue_location_id=queue_location_id,
+            agents=affected_agents,
+            observers=observers,
+            event_id=event_id,
+        )
 
     def queue_fight(
         self,
@@ -146,30 +149,11 @@ class QueueEpisodeEmitter:
         """
         Called when a fight or severe altercation breaks out in/near a queue.
         """
-        for agent in involved_agents:
-            episode = self.factory.build_episode(
-                owner=agent,
-                tick=tick,
-                summary_tag="queue_fight",
-                channel=EpisodeChannel.DIRECT,
-                location_id=queue_location_id,
-                target_type=EpisodeTargetType.PLACE,
-                target_id=queue_location_id,
-                event_id=event_id,
-            )
-            episode.tags.add("queue_fight")
-            agent.record_episode(episode)
-
-        for agent in observers:
-            episode = self.factory.build_episode(
-                owner=agent,
-                tick=tick,
-                summary_tag="queue_fight",
-                channel=EpisodeChannel.OBSERVED,
-                location_id=queue_location_id,
-                target_type=EpisodeTargetType.PLACE,
-                target_id=queue_location_id,
-                event_id=event_id,
-            )
-            episode.tags.add("queue_fight")
-            agent.record_episode(episode)
+        self._emit_outcome(
+            tick=tick,
+            summary_tag="queue_fight",
+            queue_location_id=queue_location_id,
+            agents=involved_agents,
+            observers=observers,
+            event_id=event_id,
+        )
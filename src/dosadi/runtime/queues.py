@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Deque, List, Optional, Sequence, TYPE_CHECKING
+from math import ceil
+from typing import Deque, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 from dosadi.agents.core import AgentState, create_work_detail_goal
 from dosadi.runtime.agent_goals import complete_goals_by_kind
+from dosadi.memory.episode_factory import EpisodeFactory
 from dosadi.runtime.queue_episodes import QueueEpisodeEmitter
 from dosadi.runtime.work_details import choose_work_detail_for_agent
 
@@ -38,7 +41,10 @@ def leave_facility_queue(world: "WorldState", facility_id: str, agent_id: str) -
     q = world.facility_queues.get(facility_id)
     if not q:
         return
-    q.queue = deque(aid for aid in q.queue if aid != agent_id)
+    try:
+        q.queue.remove(agent_id)
+    except ValueError:
+        return
 
 
 class QueuePriorityRule(Enum):
@@ -53,12 +59,159 @@ class QueueLifecycleState(Enum):
     CANCELED = auto()
 
 
+WAIT_HISTOGRAM_BOUNDS: tuple[int, ...] = (0, 10, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000)
+
+
+@dataclass
+class WaitHistogram:
+    """Wait-time counts bucketed by upper bound; the last bucket is open-ended."""
+
+    bounds: List[int] = field(default_factory=lambda: list(WAIT_HISTOGRAM_BOUNDS))
+    counts: List[int] = field(default_factory=list)
+
+    def record(self, wait_ticks: int) -> None:
+        if len(self.counts) != len(self.bounds) + 1:
+            self.counts = [0] * (len(self.bounds) + 1)
+        self.counts[bisect_left(self.bounds, max(0, int(wait_ticks)))] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, fraction: float) -> Optional[int]:
+        """Upper bound of the bucket holding the ``fraction`` quantile.
+
+        Returns ``None`` when nothing was recorded or the quantile falls in the
+        open-ended bucket.
+        """
+
+        total = self.total
+        if total <= 0:
+            return None
+        target = max(1, ceil(total * min(1.0, max(0.0, fraction))))
+        running = 0
+        for idx, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return self.bounds[idx] if idx < len(self.bounds) else None
+        return None
+
+
 @dataclass
 class QueueStats:
     total_processed: int = 0
     total_denied: int = 0
     max_wait_ticks: int = 0
     avg_wait_ticks: float = 0.0
+    wait_histogram: WaitHistogram = field(default_factory=WaitHistogram)
+
+
+@dataclass
+class WaitingHeap:
+    """
+    Indexed binary min-heap of waiting agents.
+
+    Entries are ``[priority, seq, agent_id]``; lower priority is served first
+    and ``seq`` (join order) breaks ties, so equal priorities stay FIFO.
+    ``positions`` maps agent ids to heap slots, giving O(log n) join, leave
+    and serve. Both fields are plain lists/dicts so queues snapshot as-is.
+    """
+
+    entries: List[list] = field(default_factory=list)
+    positions: Dict[AgentID, int] = field(default_factory=dict)
+    next_seq: int = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, agent_id: object) -> bool:
+        self._ensure_positions()
+        return agent_id in self.positions
+
+    def push(self, agent_id: AgentID, priority: float = 0.0) -> bool:
+        if agent_id in self:
+            return False
+        self.entries.append([float(priority), self.next_seq, agent_id])
+        self.next_seq += 1
+        self.positions[agent_id] = len(self.entries) - 1
+        self._sift_up(len(self.entries) - 1)
+        return True
+
+    def remove(self, agent_id: AgentID) -> bool:
+        self._ensure_positions()
+        slot = self.positions.pop(agent_id, None)
+        if slot is None:
+            return False
+        last = self.entries.pop()
+        if slot < len(self.entries):
+            self.entries[slot] = last
+            self.positions[last[2]] = slot
+            self._sift_up(slot)
+            self._sift_down(self.positions[last[2]])
+        return True
+
+    def pop(self) -> Optional[AgentID]:
+        if not self.entries:
+            return None
+        agent_id = self.entries[0][2]
+        self.remove(agent_id)
+        return agent_id
+
+    def pop_many(self, count: int) -> List[AgentID]:
+        served: List[AgentID] = []
+        while self.entries and len(served) < count:
+            served.append(self.pop())
+        return served
+
+    def reprioritize(self, agent_id: AgentID, priority: float) -> bool:
+        self._ensure_positions()
+        slot = self.positions.get(agent_id)
+        if slot is None:
+            return False
+        self.entries[slot][0] = float(priority)
+        self._sift_up(slot)
+        self._sift_down(self.positions[agent_id])
+        return True
+
+    def ordered_ids(self) -> List[AgentID]:
+        """Waiting agents in service order (O(n log n); for reporting)."""
+
+        return [entry[2] for entry in sorted(self.entries)]
+
+    def _ensure_positions(self) -> None:
+        if len(self.positions) != len(self.entries):
+            self.positions = {entry[2]: idx for idx, entry in enumerate(self.entries)}
+
+    def _swap(self, i: int, j: int) -> None:
+        entries = self.entries
+        entries[i], entries[j] = entries[j], entries[i]
+        self.positions[entries[i][2]] = i
+        self.positions[entries[j][2]] = j
+
+    def _sift_up(self, slot: int) -> None:
+        entries = self.entries
+        while slot > 0:
+            parent = (slot - 1) >> 1
+            if entries[slot] < entries[parent]:
+                self._swap(slot, parent)
+                slot = parent
+            else:
+                break
+
+    def _sift_down(self, slot: int) -> None:
+        entries = self.entries
+        size = len(entries)
+        while True:
+            child = 2 * slot + 1
+            if child >= size:
+                break
+            if child + 1 < size and entries[child + 1] < entries[child]:
+                child += 1
+            if entries[child] < entries[slot]:
+                self._swap(slot, child)
+                slot = child
+            else:
+                break
 
 
 @dataclass
@@ -79,11 +232,67 @@ class QueueState:
 
     state: QueueLifecycleState = QueueLifecycleState.ACTIVE
 
-    agents_waiting: List[AgentID] = field(default_factory=list)
+    waiting: WaitingHeap = field(default_factory=WaitingHeap)
+    # ROLE_BIASED: extra priority per agent role (matched against ``roles``,
+    # ``assignment_role`` and ``tier:<n>``); higher is served sooner.
+    role_weights: Dict[str, float] = field(default_factory=dict)
 
     last_processed_tick: int = 0
     stats: QueueStats = field(default_factory=QueueStats)
 
+    @property
+    def agents_waiting(self) -> List[AgentID]:
+        """Waiting agent ids in service order."""
+
+        return self.waiting.ordered_ids()
+
+
+def agent_severity(agent: AgentState) -> float:
+    """Need severity in [0, 1] used by SEVERITY queues (worst physical need)."""
+
+    physical = agent.physical
+    return max(
+        0.0,
+        min(
+            1.0,
+            max(
+                1.0 - physical.health,
+                physical.hunger_level,
+                1.0 - physical.hydration_level,
+                physical.thirst,
+            ),
+        ),
+    )
+
+
+def agent_role_bias(agent: AgentState, role_weights: Mapping[str, float]) -> float:
+    keys = [str(role) for role in agent.roles]
+    if agent.assignment_role:
+        keys.append(agent.assignment_role)
+    keys.append(f"tier:{agent.tier}")
+    bias = max((float(role_weights.get(key, 0.0)) for key in keys), default=0.0)
+    return bias + 0.1 * max(0, agent.tier - 1)
+
+
+def queue_priority(queue: QueueState, agent: Optional[AgentState]) -> float:
+    """Heap priority for ``agent`` in ``queue`` (lower is served first)."""
+
+    if agent is None or queue.priority_rule is QueuePriorityRule.FIFO:
+        return 0.0
+    if queue.priority_rule is QueuePriorityRule.SEVERITY:
+        return -agent_severity(agent)
+    return -agent_role_bias(agent, queue.role_weights)
+
+
+def enqueue_agent(world: "WorldState", queue: QueueState, agent_id: AgentID) -> bool:
+    """Add ``agent_id`` to ``queue`` keyed by its current priority."""
+
+    return queue.waiting.push(agent_id, queue_priority(queue, world.agents.get(agent_id)))
+
+
+def dequeue_agent(queue: QueueState, agent_id: AgentID) -> bool:
+    return queue.waiting.remove(agent_id)
+
 
 def process_all_queues(
     world: "WorldState",
@@ -97,7 +306,7 @@ def process_all_queues(
     Queue-specific policies (suits, assignments, etc.) will be added later.
     """
     if episode_emitter is None:
-        episode_emitter = QueueEpisodeEmitter()
+        episode_emitter = QueueEpisodeEmitter(EpisodeFactory(world=world))
 
     for queue in world.queues.values():
         if queue.state is not QueueLifecycleState.ACTIVE:
@@ -120,17 +329,11 @@ def process_queue(
     - Apply queue-specific service/denial logic.
     - Emit queue_served and queue_denied episodes accordingly.
     """
-    waiting_ids: List[AgentID] = list(queue.agents_waiting)
-    if not waiting_ids:
+    if not len(queue.waiting):
         queue.last_processed_tick = tick
         return
 
-    ranked_ids = _rank_waiting_agents(world, queue, waiting_ids)
-
-    served_ids = ranked_ids[: queue.processing_rate]
-    remaining_ids = ranked_ids[queue.processing_rate :]
-
-    queue.agents_waiting = remaining_ids
+    served_ids = queue.waiting.pop_many(max(0, int(queue.processing_rate)))
 
     served_agents: List[AgentState] = []
     wait_ticks: dict[str, int] = {}
@@ -163,15 +366,16 @@ def process_queue(
             served_agents.append(agent)
             wait_ticks[agent.agent_id] = wait
 
+    # Served and denied agents have left the heap, so one pass covers both.
+    observers = _collect_queue_observers(world, queue) if served_agents or denied_agents else []
+
     if served_agents:
         episode_emitter.queue_served(
             tick=tick,
             queue_location_id=queue.location_id,
             served_agents=served_agents,
             wait_ticks=wait_ticks,
-            observers=_collect_queue_observers(
-                world, queue, exclude=[a.id for a in served_agents]
-            ),
+            observers=observers,
             event_id=None,
         )
 
@@ -180,30 +384,13 @@ def process_queue(
             tick=tick,
             queue_location_id=queue.location_id,
             denied_agents=denied_agents,
-            observers=_collect_queue_observers(
-                world, queue, exclude=[a.id for a in denied_agents]
-            ),
+            observers=observers,
             event_id=None,
         )
 
     queue.last_processed_tick = tick
 
 
-def _rank_waiting_agents(
-    world: "WorldState",
-    queue: QueueState,
-    waiting_ids: Sequence[AgentID],
-) -> List[AgentID]:
-    """
-    Return waiting agent ids sorted according to the queue's priority rule.
-    MVP: FIFO; others can be implemented as simple stubs.
-    """
-    if queue.priority_rule is QueuePriorityRule.FIFO:
-        return list(waiting_ids)
-
-    return list(waiting_ids)
-
-
 def _clear_agent_queue_membership(
     agent: AgentState,
     tick: int,
@@ -215,6 +402,7 @@ def _clear_agent_queue_membership(
     """
     if agent.queue_join_tick is not None:
         wait = tick - agent.queue_join_tick
+        stats.wait_histogram.record(wait)
         if wait > stats.max_wait_ticks:
             stats.max_wait_ticks = wait
         if stats.total_processed > 0:
@@ -228,19 +416,15 @@ def _clear_agent_queue_membership(
     agent.queue_join_tick = None
 
 
-def _collect_queue_observers(
-    world: "WorldState",
-    queue: QueueState,
-    exclude: Sequence[AgentID] = (),
-) -> List[AgentState]:
+def _collect_queue_observers(world: "WorldState", queue: QueueState) -> List[AgentState]:
     """
-    MVP: observers are other agents still waiting in the same queue.
+    MVP: observers are the agents still waiting in the same queue.
+
+    Walks the heap in slot order (O(n), deterministic) rather than service
+    order, which would sort the whole queue on every serving step.
     """
-    exclude_set = set(exclude)
     observers: List[AgentState] = []
-    for agent_id in queue.agents_waiting:
-        if agent_id in exclude_set:
-            continue
+    for _, _, agent_id in queue.waiting.entries:
         agent = world.agents.get(agent_id)
         if agent is not None:
             observers.append(agent)
@@ -0,0 +1,391 @@
+"""SQLite sink and query helpers for evolve run outputs.
+
+``timeline.jsonl`` stays the canonical per-run artifact; this store is an
+optional, queryable mirror that makes cross-run analysis cheap. A single
+database can hold many runs (one per seed), with milestones, flattened KPIs,
+scorecards and a sample of world events normalized into indexed tables.
+
+Usage (from repository root):
+    python -m dosadi.runtime.run_analytics ingest runs/ --db analytics.sqlite
+    python -m dosadi.runtime.run_analytics query --db analytics.sqlite \\
+        --metric logistics.delivery_success_rate --agg median
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import statistics
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+ANALYTICS_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    scenario_id TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    config_json TEXT
+);
+CREATE TABLE IF NOT EXISTS milestones (
+    run_id TEXT NOT NULL,
+    milestone_idx INTEGER NOT NULL,
+    milestone_type TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    tick INTEGER NOT NULL,
+    snapshot_path TEXT,
+    snapshot_sha256 TEXT,
+    world_signature TEXT,
+    PRIMARY KEY (run_id, milestone_idx)
+);
+CREATE TABLE IF NOT EXISTS kpis (
+    run_id TEXT NOT NULL,
+    milestone_idx INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, milestone_idx, name)
+);
+CREATE TABLE IF NOT EXISTS scorecards (
+    run_id TEXT NOT NULL,
+    milestone_idx INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, milestone_idx, name)
+);
+CREATE TABLE IF NOT EXISTS events (
+    run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    subject_kind TEXT,
+    subject_id TEXT,
+    severity REAL,
+    payload_json TEXT,
+    PRIMARY KEY (run_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_scenario_seed ON runs (scenario_id, seed);
+CREATE INDEX IF NOT EXISTS idx_kpis_name_year ON kpis (name, year);
+CREATE INDEX IF NOT EXISTS idx_scorecards_name_year ON scorecards (name, year);
+CREATE INDEX IF NOT EXISTS idx_events_kind_day ON events (kind, day);
+"""
+
+_INSERTS = {
+    "runs": "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?)",
+    "milestones": "INSERT OR REPLACE INTO milestones VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "kpis": "INSERT OR REPLACE INTO kpis VALUES (?, ?, ?, ?, ?, ?)",
+    "scorecards": "INSERT OR REPLACE INTO scorecards VALUES (?, ?, ?, ?, ?, ?)",
+    "events": "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+}
+
+AGGREGATES = ("median", "mean", "min", "max", "count")
+GROUP_BY = ("year", "day", "seed")
+
+
+def _numeric_items(values: Mapping[str, Any], prefix: str = "") -> Iterable[tuple[str, float]]:
+    for key, value in sorted(values.items()):
+        name = f"{prefix}{key}"
+        if isinstance(value, bool):
+            yield name, float(value)
+        elif isinstance(value, (int, float)):
+            yield name, float(value)
+        elif isinstance(value, Mapping):
+            yield from _numeric_items(value, prefix=f"{name}.")
+
+
+class RunAnalyticsStore:
+    """Batched writer/reader over a WAL-mode SQLite database."""
+
+    def __init__(self, path: str | Path, *, batch_size: int = 500) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, int(batch_size))
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)", (str(ANALYTICS_SCHEMA_VERSION),)
+        )
+        self._conn.commit()
+        self._pending: Dict[str, List[tuple]] = {table: [] for table in _INSERTS}
+        self._pending_rows = 0
+        self._event_cursors: Dict[str, int] = {}
+
+    # -- lifecycle ------------------------------------------------------
+
+    def __enter__(self) -> "RunAnalyticsStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+    def flush(self) -> None:
+        """Write all buffered rows in a single transaction."""
+
+        if not self._pending_rows:
+            return
+        with self._conn:
+            for table, rows in self._pending.items():
+                if rows:
+                    self._conn.executemany(_INSERTS[table], rows)
+                    rows.clear()
+        self._pending_rows = 0
+
+    def _queue(self, table: str, rows: Sequence[tuple]) -> None:
+        self._pending[table].extend(rows)
+        self._pending_rows += len(rows)
+        if self._pending_rows >= self.batch_size:
+            self.flush()
+
+    # -- writes ---------------------------------------------------------
+
+    def record_run(self, run_id: str, *, scenario_id: str, seed: int, config: Any = None) -> None:
+        config_json = json.dumps(config, sort_keys=True, default=str) if config is not None else None
+        self._queue("runs", [(run_id, scenario_id, int(seed), config_json)])
+
+    def record_milestone(self, row: Mapping[str, Any], *, milestone_idx: int) -> None:
+        """Record one ``append_timeline_row`` row with its KPIs and scorecard."""
+
+        run_id = str(row["run_id"])
+        day = int(row.get("day", 0))
+        year = int(row.get("year", day // 365))
+        idx = int(milestone_idx)
+        self._queue(
+            "milestones",
+            [
+                (
+                    run_id,
+                    idx,
+                    str(row.get("milestone_type", "")),
+                    day,
+                    year,
+                    int(row.get("tick", 0)),
+                    row.get("snapshot_path"),
+                    row.get("snapshot_sha256"),
+                    row.get("world_signature"),
+                )
+            ],
+        )
+        kpis = row.get("kpis") or {}
+        self._queue("kpis", [(run_id, idx, year, day, name, value) for name, value in _numeric_items(kpis)])
+        scorecard = row.get("scorecard") or {}
+        self._queue(
+            "scorecards", [(run_id, idx, year, day, name, value) for name, value in _numeric_items(scorecard)]
+        )
+
+    def record_events(self, run_id: str, events: Iterable[Any], *, first_seq: int) -> int:
+        """Record world events (``world.events.WorldEvent``) starting at ``first_seq``."""
+
+        rows = []
+        for offset, event in enumerate(events):
+            kind = getattr(event, "kind", "")
+            rows.append(
+                (
+                    run_id,
+                    int(first_seq) + offset,
+                    int(getattr(event, "day", 0)),
+                    str(getattr(kind, "value", kind)),
+                    getattr(event, "subject_kind", None),
+                    getattr(event, "subject_id", None),
+                    float(getattr(event, "severity", 0.0)),
+                    json.dumps(getattr(event, "payload", {}), sort_keys=True, default=str),
+                )
+            )
+        self._queue("events", rows)
+        return len(rows)
+
+    def record_event_log(self, run_id: str, event_log: Any, *, max_events: int) -> int:
+        """Sample events appended to ``event_log`` since the last call for ``run_id``.
+
+        At most ``max_events`` are kept per call, spread evenly over the window.
+        """
+
+        if event_log is None or max_events <= 0:
+            return 0
+        cursor = max(self._event_cursors.get(run_id, 0), int(getattr(event_log, "base_seq", 0)))
+        end = int(getattr(event_log, "next_seq", cursor))
+        self._event_cursors[run_id] = end
+        window = event_log.since(cursor)
+        if not window:
+            return 0
+        stride = max(1, -(-len(window) // int(max_events)))
+        rows = 0
+        for offset in range(0, len(window), stride):
+            rows += self.record_events(run_id, [window[offset]], first_seq=cursor + offset)
+        return rows
+
+    def ingest_timeline(self, timeline_path: str | Path) -> int:
+        """Load an existing ``timeline.jsonl`` into the store; returns rows read."""
+
+        count = 0
+        with open(timeline_path, "r", encoding="utf-8") as fp:
+            for idx, line in enumerate(fp):
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if idx == 0:
+                    self.record_run(
+                        str(row["run_id"]), scenario_id=str(row.get("scenario_id", "")), seed=int(row.get("seed", 0))
+                    )
+                self.record_milestone(row, milestone_idx=idx)
+                count += 1
+        return count
+
+    # -- queries --------------------------------------------------------
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        self.flush()
+        return list(self._conn.execute(sql, params))
+
+    def runs(self, *, scenario_id: str | None = None) -> List[Dict[str, Any]]:
+        sql = "SELECT run_id, scenario_id, seed FROM runs"
+        params: tuple = ()
+        if scenario_id is not None:
+            sql += " WHERE scenario_id = ?"
+            params = (scenario_id,)
+        sql += " ORDER BY scenario_id, seed, run_id"
+        return [{"run_id": r, "scenario_id": s, "seed": seed} for r, s, seed in self.execute(sql, params)]
+
+    def metric_series(self, run_id: str, metric: str, *, table: str = "kpis") -> List[tuple[int, float]]:
+        if table not in ("kpis", "scorecards"):
+            raise ValueError(f"unknown metric table '{table}'")
+        return [
+            (int(day), float(value))
+            for day, value in self.execute(
+                f"SELECT day, value FROM {table} WHERE run_id = ? AND name = ? ORDER BY day, milestone_idx",
+                (run_id, metric),
+            )
+        ]
+
+    def aggregate(
+        self,
+        metric: str,
+        *,
+        agg: str = "median",
+        by: str = "year",
+        table: str = "kpis",
+        scenario_id: str | None = None,
+        milestone_type: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Aggregate ``metric`` across runs, grouped by ``year``, ``day`` or ``seed``.
+
+        When a run has several milestones in the same group, its latest value
+        is used so every run contributes one sample per group.
+        """
+
+        if agg not in AGGREGATES:
+            raise ValueError(f"unknown aggregate '{agg}'")
+        if by not in GROUP_BY:
+            raise ValueError(f"unknown grouping '{by}'")
+        if table not in ("kpis", "scorecards"):
+            raise ValueError(f"unknown metric table '{table}'")
+
+        group_col = "r.seed" if by == "seed" else f"k.{by}"
+        sql = (
+            f"SELECT {group_col}, k.run_id, k.value FROM {table} k "
+            "JOIN runs r ON r.run_id = k.run_id "
+            "JOIN milestones m ON m.run_id = k.run_id AND m.milestone_idx = k.milestone_idx "
+            "WHERE k.name = ?"
+        )
+        params: List[Any] = [metric]
+        if scenario_id is not None:
+            sql += " AND r.scenario_id = ?"
+            params.append(scenario_id)
+        if milestone_type is not None:
+            sql += " AND m.milestone_type = ?"
+            params.append(milestone_type)
+        sql += " ORDER BY 1, k.run_id, k.milestone_idx"
+
+        samples: Dict[Any, Dict[str, float]] = {}
+        for group, run_id, value in self.execute(sql, params):
+            samples.setdefault(group, {})[run_id] = float(value)
+
+        results: List[Dict[str, Any]] = []
+        for group, per_run in samples.items():
+            values = list(per_run.values())
+            if agg == "median":
+                stat = statistics.median(values)
+            elif agg == "mean":
+                stat = statistics.fmean(values)
+            elif agg == "min":
+                stat = min(values)
+            elif agg == "max":
+                stat = max(values)
+            else:
+                stat = float(len(values))
+            results.append({by: group, "value": stat, "runs": len(values)})
+        return results
+
+
+def _ingest(args: argparse.Namespace) -> None:
+    paths: List[Path] = []
+    for root in args.paths:
+        root = Path(root)
+        paths.extend([root] if root.is_file() else sorted(root.rglob("timeline.jsonl")))
+    with RunAnalyticsStore(args.db) as store:
+        rows = sum(store.ingest_timeline(path) for path in paths)
+    print(f"ingested {rows} milestones from {len(paths)} timelines into {args.db}")
+
+
+def _query(args: argparse.Namespace) -> None:
+    with RunAnalyticsStore(args.db) as store:
+        results = store.aggregate(
+            args.metric,
+            agg=args.agg,
+            by=args.by,
+            table=args.table,
+            scenario_id=args.scenario,
+            milestone_type=args.milestone_type,
+        )
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+    print(f"{args.by:>8}  {args.agg:>12}  runs")
+    for entry in results:
+        print(f"{entry[args.by]!s:>8}  {entry['value']:12.4f}  {entry['runs']}")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Query the evolve run-analytics database")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Load timeline.jsonl files into the database")
+    ingest.add_argument("paths", nargs="+", type=Path, help="Run directories or timeline files")
+    ingest.add_argument("--db", type=Path, required=True)
+    ingest.set_defaults(func=_ingest)
+
+    query = sub.add_parser("query", help="Aggregate a KPI or scorecard metric across runs")
+    query.add_argument("--db", type=Path, required=True)
+    query.add_argument("--metric", required=True, help="e.g. logistics.delivery_success_rate")
+    query.add_argument("--agg", choices=AGGREGATES, default="median")
+    query.add_argument("--by", choices=GROUP_BY, default="year")
+    query.add_argument("--table", choices=("kpis", "scorecards"), default="kpis")
+    query.add_argument("--scenario", help="Restrict to one scenario id")
+    query.add_argument("--milestone-type", help="Restrict to one milestone type (e.g. annual)")
+    query.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    query.set_defaults(func=_query)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+__all__ = ["ANALYTICS_SCHEMA_VERSION", "RunAnalyticsStore", "main"]
+
+
+if __name__ == "__main__":
+    main()
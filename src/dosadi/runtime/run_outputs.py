@@ -75,7 +75,7 @@ def _relative_snapshot_path(snapshot_path: Path, run_dir: Path) -> str:
         return str(snapshot_path)
 
 
-def append_timeline_row(
+def build_timeline_row(
     run_dir: Path,
     *,
     run_id: str,
@@ -85,18 +85,13 @@ def append_timeline_row(
     tick: int,
     milestone_type: str,
     snapshot_path: Path,
-    snapshot_sha256: str,
+    snapshot_sha256: str | None,
     kpis: Mapping[str, Any],
     world_signature: str | None = None,
     year: int | None = None,
-    write_csv: bool = True,
     scorecard: Mapping[str, Any] | None = None,
-) -> Mapping[str, Any]:
-    """Append a milestone entry to ``timeline.jsonl`` (and CSV).
-
-    Returns the row dict that was written, including the computed ``year``
-    and normalized snapshot path.
-    """
+) -> dict[str, Any]:
+    """Build a milestone row without writing it (see :func:`write_timeline_row`)."""
 
     computed_year = year if year is not None else int(day) // 365
     normalized_path = _relative_snapshot_path(snapshot_path, run_dir)
@@ -116,6 +111,11 @@ def append_timeline_row(
     }
     if scorecard is not None:
         row["scorecard"] = dict(scorecard)
+    return row
+
+
+def write_timeline_row(run_dir: Path, row: Mapping[str, Any], *, write_csv: bool = True) -> None:
+    """Append ``row`` to ``timeline.jsonl`` (and ``timeline.csv``)."""
 
     timeline_path = run_dir / "timeline.jsonl"
     with open(timeline_path, "a", encoding="utf-8") as fp:
@@ -150,7 +150,53 @@ def append_timeline_row(
                 }
             )
 
+
+def append_timeline_row(
+    run_dir: Path,
+    *,
+    run_id: str,
+    scenario_id: str,
+    seed: int,
+    day: int,
+    tick: int,
+    milestone_type: str,
+    snapshot_path: Path,
+    snapshot_sha256: str,
+    kpis: Mapping[str, Any],
+    world_signature: str | None = None,
+    year: int | None = None,
+    write_csv: bool = True,
+    scorecard: Mapping[str, Any] | None = None,
+) -> Mapping[str, Any]:
+    """Append a milestone entry to ``timeline.jsonl`` (and CSV).
+
+    Returns the row dict that was written, including the computed ``year``
+    and normalized snapshot path.
+    """
+
+    row = build_timeline_row(
+        run_dir,
+        run_id=run_id,
+        scenario_id=scenario_id,
+        seed=seed,
+        day=day,
+        tick=tick,
+        milestone_type=milestone_type,
+        snapshot_path=snapshot_path,
+        snapshot_sha256=snapshot_sha256,
+        kpis=kpis,
+        world_signature=world_signature,
+        year=year,
+        scorecard=scorecard,
+    )
+    write_timeline_row(run_dir, row, write_csv=write_csv)
     return row
 
 
-__all__ = ["append_timeline_row", "generate_run_id", "prepare_run_directory"]
+__all__ = [
+    "append_timeline_row",
+    "build_timeline_row",
+    "generate_run_id",
+    "prepare_run_directory",
+    "write_timeline_row",
+]
@@ -0,0 +1,216 @@
+"""Low-overhead sampling profiler for long scenario and evolve runs.
+
+A daemon thread wakes every ``interval_ms``, reads the target thread's current
+frame through ``sys._current_frames()`` and counts the collapsed stack
+(``module:function`` frames joined by ``;``, root first).  Samples are grouped
+into windows -- :meth:`SamplingProfiler.mark` closes the current one, which the
+evolve loop does at every milestone -- and each window is written as a
+flamegraph-ready ``.collapsed`` file.
+
+Every sample is also attributed to the innermost frame that is a registered
+subsystem entry point (see :mod:`dosadi.runtime.subsystems`), so the summary
+can say how much of a window went to ``health.run`` versus ``migration.run``
+without reading the flamegraph.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+from dosadi.runtime.subsystems import SUBSYSTEM_TARGETS
+
+PROFILE_DIRNAME = "profile"
+SUMMARY_FILENAME = "profile_summary.json"
+UNATTRIBUTED = "<other>"
+_MAX_DEPTH = 256
+
+
+def _subsystem_entry_points() -> Dict[tuple[str, str], str]:
+    entries: Dict[tuple[str, str], str] = {}
+    for name, target in SUBSYSTEM_TARGETS.items():
+        module_path, sep, attr = target.partition(":")
+        if sep:
+            entries.setdefault((module_path, attr), name)
+    return entries
+
+
+def _safe_label(text: str) -> str:
+    return "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in text)
+
+
+@dataclass(slots=True)
+class ProfileWindow:
+    label: str
+    started: float
+    stacks: Counter = field(default_factory=Counter)
+    subsystems: Counter = field(default_factory=Counter)
+    seconds: float = 0.0
+    path: Optional[str] = None
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+
+class SamplingProfiler:
+    """Sample one thread's stack at a fixed interval into labelled windows."""
+
+    def __init__(
+        self,
+        out_dir: Path,
+        *,
+        interval_ms: float = 5.0,
+        thread_id: Optional[int] = None,
+    ) -> None:
+        self.out_dir = Path(out_dir)
+        self.interval_s = max(0.0005, float(interval_ms) / 1000.0)
+        self.thread_id = thread_id
+        self.entry_points = _subsystem_entry_points()
+        self.windows: List[ProfileWindow] = []
+        self.self_samples: Counter = Counter()
+        self.sample_seconds = 0.0
+        self._current: Optional[ProfileWindow] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        self._current = ProfileWindow(label="start", started=self._started)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="dosadi-sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                started = time.perf_counter()
+                self.record(frame)
+                self.sample_seconds += time.perf_counter() - started
+
+    def record(self, frame: FrameType) -> None:
+        """Count one sample of the stack ending at ``frame``."""
+
+        labels: List[str] = []
+        subsystem_name = UNATTRIBUTED
+        cursor: Optional[FrameType] = frame
+        while cursor is not None and len(labels) < _MAX_DEPTH:
+            code = cursor.f_code
+            module = cursor.f_globals.get("__name__", "?")
+            if subsystem_name == UNATTRIBUTED:
+                subsystem_name = self.entry_points.get((module, code.co_name), UNATTRIBUTED)
+            labels.append(f"{module}:{code.co_name}")
+            cursor = cursor.f_back
+        stack = ";".join(reversed(labels))
+        with self._lock:
+            window = self._current
+            if window is None:
+                return
+            window.stacks[stack] += 1
+            window.subsystems[subsystem_name] += 1
+            if labels:
+                self.self_samples[labels[0]] += 1
+
+    def mark(self, label: str) -> ProfileWindow | None:
+        """Close the current window under ``label``, write it, and open the next one."""
+
+        now = time.perf_counter()
+        with self._lock:
+            window = self._current
+            if window is None:
+                return None
+            self._current = ProfileWindow(label="pending", started=now)
+        window.label = label
+        window.seconds = now - window.started
+        window.path = self._write_window(window, len(self.windows))
+        self.windows.append(window)
+        return window
+
+    def _write_window(self, window: ProfileWindow, index: int) -> str:
+        profile_dir = self.out_dir / PROFILE_DIRNAME
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        path = profile_dir / f"{index:04d}-{_safe_label(window.label)}.collapsed"
+        with open(path, "w", encoding="utf-8") as fp:
+            for stack, count in sorted(window.stacks.items()):
+                fp.write(f"{stack} {count}\n")
+        return str(path.relative_to(self.out_dir))
+
+    def stop(self, *, label: str = "end") -> Dict[str, Any]:
+        """Stop sampling, flush the open window and write the summary."""
+
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._current is not None and (self._current.samples or not self.windows):
+            self.mark(label)
+        self._current = None
+        summary = self.summary()
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        (self.out_dir / SUMMARY_FILENAME).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        return summary
+
+    def summary(self, *, top: int = 25) -> Dict[str, Any]:
+        totals: Counter = Counter()
+        for window in self.windows:
+            totals.update(window.subsystems)
+        samples = sum(totals.values())
+
+        def shares(counts: Counter) -> Dict[str, Dict[str, float]]:
+            total = max(1, sum(counts.values()))
+            return {
+                name: {"samples": count, "share": round(count / total, 4)}
+                for name, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+            }
+
+        return {
+            "interval_ms": round(self.interval_s * 1000.0, 3),
+            "samples": samples,
+            "wall_seconds": round(sum(window.seconds for window in self.windows), 6),
+            "sampler_seconds": round(self.sample_seconds, 6),
+            "subsystems": shares(totals),
+            "top_self": [
+                {"frame": frame, "samples": count}
+                for frame, count in sorted(self.self_samples.items(), key=lambda item: (-item[1], item[0]))[:top]
+            ],
+            "windows": [
+                {
+                    "label": window.label,
+                    "file": window.path,
+                    "samples": window.samples,
+                    "seconds": round(window.seconds, 6),
+                    "subsystems": shares(window.subsystems),
+                }
+                for window in self.windows
+            ],
+        }
+
+
+__all__ = [
+    "PROFILE_DIRNAME",
+    "ProfileWindow",
+    "SUMMARY_FILENAME",
+    "SamplingProfiler",
+    "UNATTRIBUTED",
+]
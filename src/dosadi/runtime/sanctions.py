@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import math
 from dataclasses import dataclass, field
 from typing import Any, Iterable
@@ -12,6 +13,12 @@ def _clamp01(value: float) -> float:
     return max(0.0, min(1.0, float(value)))
 
 
+# Stamps each compiled index so the process-wide route cache can tell two
+# indexes apart; staleness itself is decided by the world's rule revision.
+_INDEX_STAMPS = itertools.count(1)
+_OPEN_DAY = 1 << 62
+
+
 @dataclass(slots=True)
 class SanctionsConfig:
     enabled: bool = False
@@ -66,6 +73,14 @@ def ensure_sanction_rules(world: Any) -> dict[str, SanctionRule]:
     return rules
 
 
+def sanction_rules_revision(world: Any) -> int:
+    return int(getattr(world, "sanction_rules_revision", 0) or 0)
+
+
+def _bump_sanction_rules_revision(world: Any) -> None:
+    world.sanction_rules_revision = sanction_rules_revision(world) + 1
+
+
 def ensure_sanctions_compliance(world: Any) -> dict[str, SanctionsCompliance]:
     compliance = getattr(world, "sanctions_compliance", None)
     if not isinstance(compliance, dict):
@@ -95,6 +110,34 @@ def register_sanction_rule(world: Any, rule: SanctionRule) -> None:
     if len(rules) > max(1, int(cfg.max_rules_active)):
         for rule_id in sorted(rules.keys())[: len(rules) - cfg.max_rules_active]:
             rules.pop(rule_id, None)
+    _bump_sanction_rules_revision(world)
+
+
+def reschedule_sanction_rule(
+    world: Any, rule_id: str, *, start_day: int | None = None, end_day: int | None = None
+) -> SanctionRule | None:
+    """Move a rule's active window; use it to activate early or expire a rule."""
+
+    rule = ensure_sanction_rules(world).get(rule_id)
+    if rule is None:
+        return None
+    changed = False
+    if start_day is not None and int(start_day) != rule.start_day:
+        rule.start_day = int(start_day)
+        changed = True
+    if end_day is not None and int(end_day) != rule.end_day:
+        rule.end_day = int(end_day)
+        changed = True
+    if changed:
+        _bump_sanction_rules_revision(world)
+    return rule
+
+
+def lift_sanction_rule(world: Any, rule_id: str) -> SanctionRule | None:
+    rule = ensure_sanction_rules(world).pop(rule_id, None)
+    if rule is not None:
+        _bump_sanction_rules_revision(world)
+    return rule
 
 
 def _active_rules(world: Any, *, day: int, kinds: set[str] | None = None) -> list[SanctionRule]:
@@ -170,6 +213,122 @@ def _edge_ward(world: Any, edge_key: str) -> str | None:
     return ward_id if ward_id is not None else getattr(edge, "ward_id", None)
 
 
+@dataclass(slots=True)
+class SanctionIndex:
+    """Transit-denial targets compiled from the rules active over a day window.
+
+    The index is valid for every day in ``[valid_from, valid_until]``: no rule
+    starts or expires inside that window, so it only rebuilds when the rule
+    registry's revision moves (:func:`register_sanction_rule`,
+    :func:`reschedule_sanction_rule`, :func:`lift_sanction_rule`) or the day
+    crosses a start/end day.
+    """
+
+    version: int = 0
+    enabled: bool = False
+    valid_from: int = 0
+    valid_until: int = 0
+    key: tuple[int, int, int, bool] = (0, 0, 0, False)
+    denied_corridors: frozenset[str] = frozenset()
+    denied_factions: frozenset[str] = frozenset()
+    denied_wards: frozenset[str] = frozenset()
+    edge_wards: dict[str, str | None] = field(default_factory=dict)
+    edge_wards_key: tuple[int, ...] = (0, 0, 0)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.denied_corridors or self.denied_factions or self.denied_wards)
+
+    def covers(self, key: tuple[int, int, int, bool], day: int) -> bool:
+        return self.key == key and self.valid_from <= day <= self.valid_until
+
+    def edge_ward(self, world: Any, edge_key: str) -> str | None:
+        survey_map = getattr(world, "survey_map", None)
+        map_key = (
+            id(survey_map),
+            len(getattr(survey_map, "edges", {}) or {}),
+            int(getattr(survey_map, "ward_revision", 0)),
+        )
+        if map_key != self.edge_wards_key:
+            self.edge_wards = {}
+            self.edge_wards_key = map_key
+        try:
+            return self.edge_wards[edge_key]
+        except KeyError:
+            ward_id = _edge_ward(world, edge_key)
+            self.edge_wards[edge_key] = ward_id
+            return ward_id
+
+    def denies(
+        self,
+        world: Any,
+        edge_key: str,
+        *,
+        actor_faction_id: str | None,
+        actor_ward_id: str | None,
+    ) -> bool:
+        if edge_key in self.denied_corridors:
+            return True
+        if actor_faction_id and actor_faction_id in self.denied_factions:
+            return True
+        if self.denied_wards:
+            if actor_ward_id in self.denied_wards:
+                return True
+            return self.edge_ward(world, edge_key) in self.denied_wards
+        return False
+
+
+def _compile_sanction_index(world: Any, *, day: int, key: tuple[int, int, int, bool]) -> SanctionIndex:
+    corridors: set[str] = set()
+    factions: set[str] = set()
+    wards: set[str] = set()
+    valid_from = -_OPEN_DAY
+    valid_until = _OPEN_DAY
+    for rule in ensure_sanction_rules(world).values():
+        start, end = int(rule.start_day), int(rule.end_day)
+        if day < start:
+            valid_until = min(valid_until, start - 1)
+            continue
+        if day > end:
+            valid_from = max(valid_from, end + 1)
+            continue
+        valid_from = max(valid_from, start)
+        valid_until = min(valid_until, end)
+        if rule.kind != "TRANSIT_DENIAL":
+            continue
+        if rule.target_kind == "CORRIDOR":
+            corridors.add(rule.target_id)
+        elif rule.target_kind == "FACTION":
+            factions.add(rule.target_id)
+        elif rule.target_kind == "WARD":
+            wards.add(rule.target_id)
+    enabled = key[3]
+    return SanctionIndex(
+        version=next(_INDEX_STAMPS),
+        enabled=enabled,
+        valid_from=valid_from,
+        valid_until=valid_until,
+        key=key,
+        denied_corridors=frozenset(corridors) if enabled else frozenset(),
+        denied_factions=frozenset(factions) if enabled else frozenset(),
+        denied_wards=frozenset(wards) if enabled else frozenset(),
+    )
+
+
+def sanction_index(world: Any, *, day: int) -> SanctionIndex:
+    """Return the compiled transit-denial index for ``day``, rebuilding if stale."""
+
+    cfg = ensure_sanctions_config(world)
+    rules = ensure_sanction_rules(world)
+    key = (sanction_rules_revision(world), id(rules), len(rules), bool(cfg.enabled))
+    index = getattr(world, "sanction_index", None)
+    if isinstance(index, SanctionIndex) and index.covers(key, day):
+        return index
+    index = _compile_sanction_index(world, day=day, key=key)
+    world.sanction_index = index
+    return index
+
+
 def is_transit_denied(
     world: Any,
     edge_key: str,
@@ -178,18 +337,10 @@ def is_transit_denied(
     actor_ward_id: str | None,
     day: int,
 ) -> bool:
-    cfg = ensure_sanctions_config(world)
-    if not cfg.enabled:
+    index = sanction_index(world, day=day)
+    if index.empty:
         return False
-    for rule in _active_rules(world, day=day, kinds={"TRANSIT_DENIAL"}):
-        if rule.target_kind == "CORRIDOR" and rule.target_id == edge_key:
-            return True
-        if rule.target_kind == "FACTION" and actor_faction_id and rule.target_id == actor_faction_id:
-            return True
-        ward_match = actor_ward_id == rule.target_id or _edge_ward(world, edge_key) == rule.target_id
-        if rule.target_kind == "WARD" and ward_match:
-            return True
-    return False
+    return index.denies(world, edge_key, actor_faction_id=actor_faction_id, actor_ward_id=actor_ward_id)
 
 
 def evaluate_sanctioned_flow(
@@ -296,13 +447,18 @@ __all__ = [
     "SanctionsConfig",
     "SanctionRule",
     "SanctionsCompliance",
+    "SanctionIndex",
     "ensure_sanctions_config",
     "ensure_sanction_rules",
     "ensure_sanctions_compliance",
     "ensure_sanctions_events",
     "register_sanction_rule",
+    "reschedule_sanction_rule",
+    "lift_sanction_rule",
+    "sanction_rules_revision",
     "enforcement_capacity",
     "compute_leak_rate",
+    "sanction_index",
     "is_transit_denied",
     "evaluate_sanctioned_flow",
     "update_compliance",
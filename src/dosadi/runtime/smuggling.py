@@ -3,11 +3,12 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass, field
 import json
 from pathlib import Path
+import time
 from typing import Any, Iterable, Mapping
 
 from dosadi.runtime.telemetry import ensure_metrics
 from dosadi.runtime.customs import iter_border_crossings
-from dosadi.world.routing import compute_route
+from dosadi.world.routing import compute_routes_from
 from dosadi.world.factions import pseudo_rand01
 
 
@@ -96,16 +97,6 @@ def _ward_smuggle_risk(world: Any, ward_id: str) -> float:
     return float(getattr(ward, "smuggle_risk", 0.0))
 
 
-def _default_node_for_ward(world: Any, ward_id: str) -> str | None:
-    survey_map = getattr(world, "survey_map", None)
-    if survey_map is None:
-        return None
-    candidates = [node_id for node_id, node in survey_map.nodes.items() if getattr(node, "ward_id", None) == ward_id]
-    if not candidates:
-        return None
-    return sorted(candidates)[0]
-
-
 def _score_demand(world: Any, ward_id: str, commodity: str) -> float:
     tolerance = _ward_norm(world, ward_id, "norm:smuggling_tolerance")
     corruption = _ward_norm(world, ward_id, "norm:corruption")
@@ -161,49 +152,121 @@ def _shipment_signature(day: int, faction_id: str, commodity: str, source: str,
     return "|".join(parts)
 
 
+@dataclass(slots=True)
+class SmugglingPlanReport:
+    """What the last daily planning pass did and how long it took."""
+
+    day: int
+    factions: int = 0
+    commodities: int = 0
+    candidates: int = 0
+    route_origins: int = 0
+    routes_resolved: int = 0
+    shipments: int = 0
+    planning_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class _Candidate:
+    faction_id: str
+    commodity: str
+    pref_score: float
+    src_id: str
+    src_score: float
+    dest_id: str
+    dest_score: float
+    origin_node: str
+    dest_node: str
+
+
+def _default_nodes_by_ward(world: Any) -> dict[str, str]:
+    survey_map = getattr(world, "survey_map", None)
+    if survey_map is None:
+        return {}
+    nodes: dict[str, str] = {}
+    for node_id, node in survey_map.nodes.items():
+        ward_id = getattr(node, "ward_id", None)
+        if ward_id is not None and (ward_id not in nodes or node_id < nodes[ward_id]):
+            nodes[ward_id] = node_id
+    return nodes
+
+
+def _commodity_rankings(
+    world: Any, commodity: str, k: int
+) -> tuple[list[tuple[str, float]], list[tuple[str, float]]]:
+    ward_ids = getattr(world, "wards", {})
+    demand = _stable_topk(((ward_id, _score_demand(world, ward_id, commodity)) for ward_id in ward_ids), k)
+    source = _stable_topk(((ward_id, _score_source(world, ward_id, commodity)) for ward_id in ward_ids), k)
+    return demand, source
+
+
 def plan_smuggling_shipments(world: Any, *, day: int) -> list[Any]:
     cfg = ensure_smuggling_config(world)
     if not cfg.enabled:
         return []
+    started = time.perf_counter()
     state = ensure_smuggling_state(world)
     metrics = ensure_metrics(world)
     factions = sorted(getattr(world, "factions", {}).items())[: cfg.max_active_factions]
     shipments = []
     per_day_cap = max(0, int(cfg.max_shipments_per_day))
-
+    report = SmugglingPlanReport(day=day, factions=len(factions))
+
+    # Demand/source rankings depend on ward state and commodity only, so they
+    # are computed once per commodity and shared by every faction.
+    rankings: dict[str, tuple[list[tuple[str, float]], list[tuple[str, float]]]] = {}
+    default_nodes = _default_nodes_by_ward(world)
+    candidates_by_faction: dict[str, list[_Candidate]] = {}
+    dests_by_origin: dict[str, list[str]] = {}
     for faction_id, faction in factions:
         net = state.get(faction_id)
-        if net is None:
-            net = SmugglingNetworkState(faction_id=faction_id)
-            net.commodity_prefs = _commodity_preferences(faction)
-            state[faction_id] = net
-        commodity_prefs = _stable_topk(net.commodity_prefs.items(), cfg.commodity_topk)
-        for commodity, pref_score in commodity_prefs:
-            demand_scores = _stable_topk(
-                ((ward_id, _score_demand(world, ward_id, commodity)) for ward_id in getattr(world, "wards", {})),
-                cfg.route_topk,
-            )
-            source_scores = _stable_topk(
-                ((ward_id, _score_source(world, ward_id, commodity)) for ward_id in getattr(world, "wards", {})),
-                cfg.route_topk,
-            )
+        prefs = net.commodity_prefs if net is not None else _commodity_preferences(faction)
+        candidates: list[_Candidate] = []
+        for commodity, pref_score in _stable_topk(prefs.items(), cfg.commodity_topk):
+            if commodity not in rankings:
+                rankings[commodity] = _commodity_rankings(world, commodity, cfg.route_topk)
+            demand_scores, source_scores = rankings[commodity]
             if not demand_scores or not source_scores:
                 continue
             dest_id, dest_score = demand_scores[0]
             src_id, src_score = source_scores[0]
             if dest_id == src_id:
                 continue
-            origin_node = _default_node_for_ward(world, src_id)
-            dest_node = _default_node_for_ward(world, dest_id)
+            origin_node = default_nodes.get(src_id)
+            dest_node = default_nodes.get(dest_id)
             if not origin_node or not dest_node:
                 continue
-            route = compute_route(world, from_node=origin_node, to_node=dest_node)
+            candidates.append(
+                _Candidate(faction_id, commodity, pref_score, src_id, src_score, dest_id, dest_score, origin_node, dest_node)
+            )
+            dests_by_origin.setdefault(origin_node, []).append(dest_node)
+        candidates_by_faction[faction_id] = candidates
+        report.candidates += len(candidates)
+    report.commodities = len(rankings)
+
+    routes: dict[tuple[str, str], Any] = {}
+    for origin_node, dest_nodes in sorted(dests_by_origin.items()):
+        for dest_node, route in compute_routes_from(world, from_node=origin_node, to_nodes=dest_nodes).items():
+            routes[(origin_node, dest_node)] = route
+    report.route_origins = len(dests_by_origin)
+    report.routes_resolved = len(routes)
+
+    for faction_id, faction in factions:
+        net = state.get(faction_id)
+        if net is None:
+            net = SmugglingNetworkState(faction_id=faction_id)
+            net.commodity_prefs = _commodity_preferences(faction)
+            state[faction_id] = net
+        for candidate in candidates_by_faction[faction_id]:
+            route = routes.get((candidate.origin_node, candidate.dest_node))
             if route is None:
                 continue
             score = _route_score(net.edge_stats, route.edge_keys)
-            signature = _shipment_signature(day, faction_id, commodity, src_id, dest_id, cfg.deterministic_salt)
+            signature = _shipment_signature(
+                day, faction_id, candidate.commodity, candidate.src_id, candidate.dest_id, cfg.deterministic_salt
+            )
             weight_roll = pseudo_rand01(signature)
-            if weight_roll * (dest_score + src_score + pref_score) < score:
+            if weight_roll * (candidate.dest_score + candidate.src_score + candidate.pref_score) < score:
                 continue
             delivery_id = f"smuggle:{faction_id}:{day}:{len(shipments)}"
             crossings = iter_border_crossings(world, route.nodes, route.edge_keys)
@@ -212,7 +275,7 @@ def plan_smuggling_shipments(world: Any, *, day: int) -> list[Any]:
                 delivery_id=delivery_id,
                 faction=faction,
                 faction_id=faction_id,
-                commodity=commodity,
+                commodity=candidate.commodity,
                 route=route,
                 bribe_map=bribe_map,
             )
@@ -223,6 +286,10 @@ def plan_smuggling_shipments(world: Any, *, day: int) -> list[Any]:
                 break
         if len(shipments) >= per_day_cap:
             break
+
+    report.shipments = len(shipments)
+    report.planning_seconds = time.perf_counter() - started
+    world.smuggling_plan_report = report
     return shipments
 
 
@@ -338,6 +405,7 @@ __all__ = [
     "SmugglingConfig",
     "SmugglingEdgeStats",
     "SmugglingNetworkState",
+    "SmugglingPlanReport",
     "ensure_smuggling_config",
     "ensure_smuggling_state",
     "plan_smuggling_shipments",
@@ -11,8 +11,6 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any, Mapping, MutableMapping, Sequence
 
-from dosadi.agents.core import GoalStatus
-from dosadi.systems.protocols import ProtocolStatus
 from dosadi.admin_log import AdminEventLog
 from dosadi.memory.episodes import EpisodeBuffers
 from dosadi.runtime.events import EventBus
@@ -80,7 +78,7 @@ def to_snapshot_dict(obj: Any) -> Any:
             },
         }
 
-    if isinstance(obj, set):
+    if isinstance(obj, (set, frozenset)):
         return {"__set__": [to_snapshot_dict(item) for item in sorted(obj, key=lambda itm: str(itm))]}
 
     if isinstance(obj, deque):
@@ -194,7 +192,9 @@ def _canonical_dumps(data: Mapping[str, Any]) -> str:
     return json.dumps(data, sort_keys=True, separators=(",", ":"))
 
 
-def save_snapshot(snapshot: WorldSnapshotV1, path: Path, *, gzip_output: bool = True) -> str:
+def encode_snapshot(snapshot: WorldSnapshotV1) -> bytes:
+    """Serialize ``snapshot`` to its canonical JSON payload."""
+
     snapshot_dict = {
         "schema_version": snapshot.schema_version,
         "scenario_id": snapshot.scenario_id,
@@ -205,21 +205,31 @@ def save_snapshot(snapshot: WorldSnapshotV1, path: Path, *, gzip_output: bool =
         "world": snapshot.world,
         "event_queue": snapshot.event_queue,
     }
+    return _canonical_dumps(snapshot_dict).encode("utf-8")
+
+
+def write_snapshot_payload(payload: bytes, path: Path, *, gzip_output: bool = True) -> str:
+    """Write an encoded snapshot atomically and return its sha256."""
 
-    payload = _canonical_dumps(snapshot_dict).encode("utf-8")
     digest = sha256(payload).hexdigest()
 
     path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
     if gzip_output:
-        with gzip.open(path, "wb") as fp:
+        with gzip.open(tmp_path, "wb") as fp:
             fp.write(payload)
     else:
-        with open(path, "wb") as fp:
+        with open(tmp_path, "wb") as fp:
             fp.write(payload)
+    tmp_path.replace(path)
 
     return digest
 
 
+def save_snapshot(snapshot: WorldSnapshotV1, path: Path, *, gzip_output: bool = True) -> str:
+    return write_snapshot_payload(encode_snapshot(snapshot), path, gzip_output=gzip_output)
+
+
 def load_snapshot(path: Path) -> WorldSnapshotV1:
     if not path.exists():
         raise FileNotFoundError(path)
@@ -246,6 +256,9 @@ def load_snapshot(path: Path) -> WorldSnapshotV1:
 
 
 def world_signature(world: Any) -> str:
+    from dosadi.agents.core import GoalStatus
+    from dosadi.systems.protocols import ProtocolStatus
+
     agents_summary = []
     for agent_id, agent in sorted(getattr(world, "agents", {}).items()):
         goals = getattr(agent, "goals", [])
@@ -301,6 +314,7 @@ def world_signature(world: Any) -> str:
 __all__ = [
     "SNAPSHOT_SCHEMA_VERSION",
     "WorldSnapshotV1",
+    "encode_snapshot",
     "load_snapshot",
     "restore_world",
     "rng_state_from_jsonable",
@@ -308,4 +322,5 @@ __all__ = [
     "save_snapshot",
     "snapshot_world",
     "world_signature",
+    "write_snapshot_payload",
 ]
@@ -0,0 +1,210 @@
+"""Lazy registry for runtime subsystem entry points.
+
+Subsystems are registered as ``"module:attribute"`` strings and only imported
+the first time they are resolved. Importing a driver (timewarp, the seed vault,
+a CLI) therefore no longer pays for importing every subsystem module up front.
+
+While a :func:`timed_subsystems` block is active, resolved callables are wrapped
+so each call's wall time is charged to its registry name (inclusive of nested
+subsystem calls). Outside such a block resolution returns the bare callable.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import importlib
+import sys
+import time
+from typing import Any, Callable, Iterator, Mapping
+
+SUBSYSTEM_TARGETS: dict[str, str] = {
+    # Daily pipeline (timewarp.step_day)
+    "scouting.create_missions": "dosadi.runtime.scouting:maybe_create_scout_missions",
+    "scouting.step_missions": "dosadi.runtime.scouting:step_scout_missions_for_day",
+    "facilities.update": "dosadi.runtime.facility_updates:update_facilities_for_day",
+    "maintenance.wear": "dosadi.runtime.maintenance:update_facility_wear",
+    "suit_wear.run": "dosadi.runtime.suit_wear:run_suit_wear_for_day",
+    "suit_wear.ensure_config": "dosadi.runtime.suit_wear:ensure_suit_config",
+    "suit_wear.decay_multiplier": "dosadi.runtime.suit_wear:suit_decay_multiplier",
+    "corridor_infra.plan": "dosadi.world.corridor_infrastructure:run_corridor_improvement_planner",
+    "incidents.run": "dosadi.runtime.incident_engine:run_incident_engine_for_day",
+    "evidence.update": "dosadi.runtime.evidence_producers:run_evidence_update",
+    "governance_failures.run": "dosadi.runtime.governance_failures:run_governance_failure_for_day",
+    "mandates.run": "dosadi.runtime.mandates:run_mandate_system_for_day",
+    "finance.run_week": "dosadi.runtime.finance:run_finance_week",
+    "ledger.run": "dosadi.runtime.ledger:run_ledger_for_day",
+    "law_enforcement.run": "dosadi.runtime.law_enforcement:run_enforcement_for_day",
+    "factions.run": "dosadi.runtime.factions:run_real_factions_for_day",
+    "leadership.run": "dosadi.runtime.leadership:run_leadership_for_day",
+    "war.run": "dosadi.runtime.war:run_war_for_day",
+    "faction_interference.run": "dosadi.runtime.faction_interference:run_faction_interference_for_day",
+    "institutions.ensure_config": "dosadi.runtime.institutions:ensure_inst_config",
+    "institutions.run": "dosadi.runtime.institutions:run_institutions_for_day",
+    "class_system.update": "dosadi.runtime.class_system:update_class_system_for_day",
+    "local_interactions.run": "dosadi.runtime.local_interactions:run_interactions_for_day",
+    "memory_router.run": "dosadi.runtime.event_to_memory_router:run_router_for_day",
+    "belief_formation.run": "dosadi.runtime.belief_formation:run_belief_formation_for_day",
+    "health.run": "dosadi.runtime.health:run_health_for_day",
+    "migration.run": "dosadi.runtime.migration:run_migration_for_day",
+    "demographics.run": "dosadi.runtime.demographics:run_demographics_for_day",
+    "religion.run_week": "dosadi.runtime.religion:run_religion_for_week",
+    "ideology.update": "dosadi.runtime.ideology:run_ideology_update",
+    "education.update": "dosadi.runtime.education:run_education_update",
+    "urban.run": "dosadi.runtime.urban:run_urban_for_day",
+    "culture.run": "dosadi.runtime.culture_wars:run_culture_for_day",
+    "memory_budget.run": "dosadi.runtime.memory_budget:run_memory_budget_for_day",
+    "expansion_planner.config": "dosadi.world.expansion_planner:ExpansionPlannerConfig",
+    "expansion_planner.state": "dosadi.world.expansion_planner:ExpansionPlannerState",
+    "expansion_planner.maybe_plan": "dosadi.world.expansion_planner:maybe_plan",
+    "staffing.config": "dosadi.runtime.staffing:StaffingConfig",
+    "staffing.state": "dosadi.runtime.staffing:StaffingState",
+    "staffing.run": "dosadi.runtime.staffing:run_staffing_policy",
+    "construction.apply_work": "dosadi.world.construction:apply_project_work",
+    # Scenario drivers (evolve harness)
+    "scenario.founding_wakeup.config": "dosadi.playbook.scenario_runner:FoundingWakeupScenarioConfig",
+    "scenario.founding_wakeup.generate": "dosadi.world.scenarios.founding_wakeup:generate_founding_wakeup_mvp",
+    "scenario.wakeup_prime.config": "dosadi.scenarios.wakeup_prime:WakeupPrimeScenarioConfig",
+    "scenario.wakeup_prime.generate": "dosadi.scenarios.wakeup_prime:generate_wakeup_scenario_prime",
+    "step.founding_wakeup": "dosadi.runtime.founding_wakeup:step_world_once",
+    "step.wakeup_prime": "dosadi.runtime.wakeup_prime:step_wakeup_prime_once",
+    "timewarp.step_day": "dosadi.runtime.timewarp:step_day",
+    "snapshot.load": "dosadi.runtime.snapshot:load_snapshot",
+    "snapshot.restore_world": "dosadi.runtime.snapshot:restore_world",
+    "snapshot.world_signature": "dosadi.runtime.snapshot:world_signature",
+    "kpis.flatten_for_report": "dosadi.runtime.kpis:flatten_kpis_for_report",
+    "vault.save_seed": "dosadi.vault.seed_vault:save_seed",
+    # Seed vault writers
+    "seed.institutions": "dosadi.runtime.institutions:save_institutions_seed",
+    "seed.culture": "dosadi.runtime.culture_wars:save_culture_seed",
+    "seed.ledger": "dosadi.runtime.ledger:save_ledger_seed",
+    "seed.finance": "dosadi.runtime.finance:save_finance_seed",
+    "seed.treaties": "dosadi.runtime.treaties:save_treaties_seed",
+    "seed.smuggling": "dosadi.runtime.smuggling:save_smuggling_seed",
+    "seed.migration": "dosadi.runtime.migration:save_migration_seed",
+    "seed.policing": "dosadi.runtime.policing:save_policing_seed",
+    "seed.archives": "dosadi.runtime.archives:save_archives_seed",
+    "seed.scorecard": "dosadi.runtime.scorecards:compute_scorecard",
+    "seed.kpis": "dosadi.testing.kpis:collect_kpis",
+}
+
+_RESOLVED: dict[str, Any] = {}
+
+
+@dataclass(slots=True)
+class SubsystemTimings:
+    """Accumulated wall time and call counts per subsystem name."""
+
+    seconds: dict[str, float] = field(default_factory=dict)
+    calls: dict[str, int] = field(default_factory=dict)
+
+    def record(self, name: str, elapsed: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        ordered = sorted(self.seconds.items(), key=lambda item: (-item[1], item[0]))
+        return {name: {"seconds": round(seconds, 6), "calls": self.calls[name]} for name, seconds in ordered}
+
+
+_TIMINGS: SubsystemTimings | None = None
+
+
+def _timed_call(name: str, fn: Callable[..., Any], timings: SubsystemTimings) -> Callable[..., Any]:
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timings.record(name, time.perf_counter() - started)
+
+    return timed
+
+
+@contextmanager
+def timed_subsystems(timings: SubsystemTimings | None = None) -> Iterator[SubsystemTimings]:
+    """Charge every ``subsystem(name)`` call made inside the block to ``timings``."""
+
+    global _TIMINGS
+    previous = _TIMINGS
+    _TIMINGS = timings if timings is not None else SubsystemTimings()
+    try:
+        yield _TIMINGS
+    finally:
+        _TIMINGS = previous
+
+
+def resolve_target(target: str) -> Any:
+    """Import ``"package.module:attribute"`` and return the attribute."""
+
+    module_path, sep, attr = target.partition(":")
+    if not sep:
+        module_path, _, attr = target.rpartition(".")
+    module = importlib.import_module(module_path)
+    return getattr(module, attr)
+
+
+def register_subsystem(name: str, target: str) -> None:
+    SUBSYSTEM_TARGETS[name] = target
+    _RESOLVED.pop(name, None)
+
+
+def subsystem(name: str) -> Callable[..., Any]:
+    """Return the callable registered under ``name``, importing it on first use."""
+
+    fn = _RESOLVED.get(name)
+    if fn is None:
+        try:
+            target = SUBSYSTEM_TARGETS[name]
+        except KeyError:
+            raise KeyError(f"unknown subsystem '{name}'") from None
+        fn = resolve_target(target)
+        _RESOLVED[name] = fn
+    if _TIMINGS is not None:
+        return _timed_call(name, fn, _TIMINGS)
+    return fn
+
+
+def loaded_subsystems() -> Mapping[str, Any]:
+    return dict(_RESOLVED)
+
+
+def lazy_factory(target: str, **kwargs: Any) -> Callable[[], Any]:
+    """Build a dataclass ``default_factory`` that imports ``target`` on first call."""
+
+    cls: list[Any] = []
+
+    def factory() -> Any:
+        if not cls:
+            cls.append(resolve_target(target))
+        return cls[0](**kwargs)
+
+    factory.__qualname__ = f"lazy_factory[{target}]"
+    return factory
+
+
+def lazy_module_getattr(module_name: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """Build a PEP 562 ``__getattr__`` that resolves ``exports`` lazily."""
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = resolve_target(target)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
+__all__ = [
+    "SUBSYSTEM_TARGETS",
+    "SubsystemTimings",
+    "lazy_factory",
+    "lazy_module_getattr",
+    "loaded_subsystems",
+    "register_subsystem",
+    "resolve_target",
+    "subsystem",
+    "timed_subsystems",
+]
@@ -275,7 +275,7 @@ def run_tech_for_day(world, *, day: int) -> None:
         if ledger_cfg.enabled:
             if sponsor_budget <= 0.0 or sponsor_ward is None:
                 continue
-            prev_len = len(ledger_state.txs) if ledger_state is not None else 0
+            prev_total = ledger_state.tx_total if ledger_state is not None else 0
             posted = post_tx(
                 world,
                 day=day,
@@ -285,7 +285,7 @@ def run_tech_for_day(world, *, day: int) -> None:
                 reason="PAY_RESEARCH",
                 meta={"tech_id": spec.tech_id},
             )
-            if not posted or (ledger_state is not None and len(ledger_state.txs) <= prev_len):
+            if not posted or (ledger_state is not None and ledger_state.tx_total <= prev_total):
                 continue
         inventory.inv(_owner_for_research(world)).apply_bom(spec.cost_materials)
         duration_multiplier = tech_delay_multiplier(world, sponsor_ward)
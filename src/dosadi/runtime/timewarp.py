@@ -7,9 +7,8 @@ D-RUNTIME-0232_Timewarp_MacroStep_Implementation_Checklist.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from dosadi.agents.core import AgentState
 from dosadi.agents.physiology import (
     SLEEP_BASE_ACCUM_PER_TICK,
     SLEEP_HUNGER_MODIFIER,
@@ -17,52 +16,53 @@ from dosadi.agents.physiology import (
     compute_needs_pressure,
     update_stress_and_morale,
 )
-from dosadi.runtime.eating import (
+from dosadi.runtime.config import (
     HUNGER_MAX,
     HUNGER_RATE_PER_TICK,
     HYDRATION_DECAY_PER_TICK,
 )
-from dosadi.runtime.belief_formation import run_belief_formation_for_day
-from dosadi.runtime.class_system import update_class_system_for_day
-from dosadi.runtime.culture_wars import run_culture_for_day
-from dosadi.runtime.education import run_education_update
-from dosadi.runtime.ideology import run_ideology_update
-from dosadi.runtime.event_to_memory_router import run_router_for_day
-from dosadi.runtime.governance_failures import run_governance_failure_for_day
-from dosadi.runtime.religion import run_religion_for_week
-from dosadi.runtime.scouting import maybe_create_scout_missions, step_scout_missions_for_day
 from dosadi.runtime.scouting_config import ScoutConfig
-from dosadi.runtime.staffing import StaffingConfig, StaffingState, run_staffing_policy
-from dosadi.runtime.maintenance import update_facility_wear
-from dosadi.runtime.facility_updates import update_facilities_for_day
-from dosadi.runtime.incident_engine import run_incident_engine_for_day
-from dosadi.runtime.faction_interference import run_faction_interference_for_day
-from dosadi.runtime.factions import run_real_factions_for_day
-from dosadi.runtime.mandates import run_mandate_system_for_day
-from dosadi.runtime.war import run_war_for_day
-from dosadi.runtime.local_interactions import run_interactions_for_day
-from dosadi.runtime.evidence_producers import run_evidence_update
-from dosadi.runtime.law_enforcement import run_enforcement_for_day
-from dosadi.runtime.ledger import run_ledger_for_day
-from dosadi.runtime.finance import run_finance_week
-from dosadi.runtime.health import run_health_for_day
-from dosadi.runtime.demographics import run_demographics_for_day
-from dosadi.runtime.migration import run_migration_for_day
-from dosadi.runtime.institutions import ensure_inst_config, run_institutions_for_day
-from dosadi.runtime.leadership import run_leadership_for_day
-from dosadi.runtime.urban import run_urban_for_day
-from dosadi.runtime.suit_wear import ensure_suit_config, run_suit_wear_for_day, suit_decay_multiplier
-from dosadi.world.corridor_infrastructure import run_corridor_improvement_planner
-from dosadi.world.construction import apply_project_work
-from dosadi.world.expansion_planner import (
-    ExpansionPlannerConfig,
-    ExpansionPlannerState,
-    maybe_plan,
-)
-from dosadi.world.logistics import process_logistics_until
+from dosadi.runtime.subsystems import subsystem
+
+if TYPE_CHECKING:
+    from dosadi.agents.core import AgentState
 
 DEFAULT_TICKS_PER_DAY = 144_000
 
+# Daily subsystems called as ``fn(world, day=day)``, in pipeline order. Names are
+# resolved through ``dosadi.runtime.subsystems`` on first use.
+_DAILY_PIPELINE_HEAD: tuple[str, ...] = (
+    "maintenance.wear",
+    "suit_wear.run",
+    "corridor_infra.plan",
+    "incidents.run",
+    "evidence.update",
+    "governance_failures.run",
+    "mandates.run",
+    "finance.run_week",
+    "ledger.run",
+    "law_enforcement.run",
+    "factions.run",
+    "leadership.run",
+    "war.run",
+    "faction_interference.run",
+)
+_DAILY_PIPELINE_TAIL: tuple[str, ...] = (
+    "class_system.update",
+    "local_interactions.run",
+    "memory_router.run",
+    "belief_formation.run",
+    "health.run",
+    "migration.run",
+    "demographics.run",
+    "religion.run_week",
+    "ideology.update",
+    "education.update",
+    "urban.run",
+    "culture.run",
+    "memory_budget.run",
+)
+
 
 @dataclass(slots=True)
 class TimewarpConfig:
@@ -167,7 +167,7 @@ def step_day(world, *, days: int = 1, cfg: Optional[TimewarpConfig] = None) -> N
     elapsed_ticks = max(0, int(days)) * ticks_per_day
     total_days = max(1, int(days))
 
-    suit_cfg = ensure_suit_config(world)
+    suit_cfg = subsystem("suit_wear.ensure_config")(world)
     awake_ids = select_awake_set(world, cfg)
     awake_set = set(awake_ids)
     ambient_ids = [
@@ -178,7 +178,7 @@ def step_day(world, *, days: int = 1, cfg: Optional[TimewarpConfig] = None) -> N
         agent = world.agents[agent_id]
         multiplier = 1.0
         if getattr(suit_cfg, "enabled", False) and getattr(suit_cfg, "apply_physio_penalties", False):
-            multiplier = suit_decay_multiplier(agent, cfg=suit_cfg)
+            multiplier = subsystem("suit_wear.decay_multiplier")(agent, cfg=suit_cfg)
         if cfg.physiology_enabled:
             _integrate_agent_over_interval(
                 agent,
@@ -192,65 +192,46 @@ def step_day(world, *, days: int = 1, cfg: Optional[TimewarpConfig] = None) -> N
         agent = world.agents[agent_id]
         multiplier = 1.0
         if getattr(suit_cfg, "enabled", False) and getattr(suit_cfg, "apply_physio_penalties", False):
-            multiplier = suit_decay_multiplier(agent, cfg=suit_cfg)
+            multiplier = subsystem("suit_wear.decay_multiplier")(agent, cfg=suit_cfg)
         if cfg.physiology_enabled:
             _integrate_agent_over_interval(
                 agent, elapsed_ticks=elapsed_ticks, substeps=1, suit_multiplier=multiplier
             )
         agent.physical.last_physical_update_tick = getattr(world, "tick", 0) + elapsed_ticks
 
-    apply_project_work(
+    subsystem("construction.apply_work")(
         world,
         elapsed_hours=(elapsed_ticks / ticks_per_day) * 24.0,
         tick=getattr(world, "tick", 0) + elapsed_ticks,
     )
 
     current_day = getattr(world, "day", 0)
-    planner_cfg = getattr(world, "expansion_planner_cfg", ExpansionPlannerConfig())
-    planner_state = getattr(world, "expansion_planner_state", ExpansionPlannerState(next_plan_day=0))
+    planner_cfg = getattr(world, "expansion_planner_cfg", None) or subsystem("expansion_planner.config")()
+    planner_state = getattr(world, "expansion_planner_state", None) or subsystem("expansion_planner.state")(
+        next_plan_day=0
+    )
     world.expansion_planner_cfg = planner_cfg
     world.expansion_planner_state = planner_state
-    staffing_cfg = getattr(world, "staffing_cfg", StaffingConfig())
-    staffing_state = getattr(world, "staffing_state", StaffingState())
+    staffing_cfg = getattr(world, "staffing_cfg", None) or subsystem("staffing.config")()
+    staffing_state = getattr(world, "staffing_state", None) or subsystem("staffing.state")()
     world.staffing_cfg = staffing_cfg
     world.staffing_state = staffing_state
     scout_cfg = getattr(world, "scout_cfg", None) or ScoutConfig()
     for offset in range(total_days):
         world.day = current_day + offset
-        maybe_create_scout_missions(world, cfg=scout_cfg)
-        step_scout_missions_for_day(world, day=world.day, cfg=scout_cfg)
-        update_facilities_for_day(world, day=world.day, days=1)
-        update_facility_wear(world, day=world.day)
-        run_suit_wear_for_day(world, day=world.day)
-        run_corridor_improvement_planner(world, day=world.day)
-        run_incident_engine_for_day(world, day=world.day)
-        run_evidence_update(world, day=world.day)
-        run_governance_failure_for_day(world, day=world.day)
-        run_mandate_system_for_day(world, day=world.day)
-        run_finance_week(world, day=world.day)
-        run_ledger_for_day(world, day=world.day)
-        run_enforcement_for_day(world, day=world.day)
-        run_real_factions_for_day(world, day=world.day)
-        run_leadership_for_day(world, day=world.day)
-        run_war_for_day(world, day=world.day)
-        run_faction_interference_for_day(world, day=world.day)
-        inst_cfg = ensure_inst_config(world)
+        day = world.day
+        subsystem("scouting.create_missions")(world, cfg=scout_cfg)
+        subsystem("scouting.step_missions")(world, day=day, cfg=scout_cfg)
+        subsystem("facilities.update")(world, day=day, days=1)
+        for name in _DAILY_PIPELINE_HEAD:
+            subsystem(name)(world, day=day)
+        inst_cfg = subsystem("institutions.ensure_config")(world)
         if getattr(inst_cfg, "enabled", False):
-            run_institutions_for_day(world, day=world.day)
-        update_class_system_for_day(world, day=world.day)
-        run_interactions_for_day(world, day=world.day)
-        run_router_for_day(world, day=world.day)
-        run_belief_formation_for_day(world, day=world.day)
-        run_health_for_day(world, day=world.day)
-        run_migration_for_day(world, day=world.day)
-        run_demographics_for_day(world, day=world.day)
-        run_religion_for_week(world, day=world.day)
-        run_ideology_update(world, day=world.day)
-        run_education_update(world, day=world.day)
-        run_urban_for_day(world, day=world.day)
-        run_culture_for_day(world, day=world.day)
-        maybe_plan(world, cfg=planner_cfg, state=planner_state)
-        run_staffing_policy(world, day=world.day, cfg=staffing_cfg, state=staffing_state)
+            subsystem("institutions.run")(world, day=day)
+        for name in _DAILY_PIPELINE_TAIL:
+            subsystem(name)(world, day=day)
+        subsystem("expansion_planner.maybe_plan")(world, cfg=planner_cfg, state=planner_state)
+        subsystem("staffing.run")(world, day=day, cfg=staffing_cfg, state=staffing_state)
 
     _advance_clock(world, elapsed_ticks=elapsed_ticks, ticks_per_day=ticks_per_day)
 
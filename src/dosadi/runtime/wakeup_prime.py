@@ -6,19 +6,21 @@ from dataclasses import dataclass
 
 from dosadi.memory.config import MemoryConfig
 from dosadi.runtime.memory_runtime import step_agent_memory_maintenance, step_agent_sleep_wake
+from dosadi.memory.episode_factory import EpisodeFactory
 from dosadi.runtime.queue_episodes import QueueEpisodeEmitter
 from dosadi.runtime.queues import process_all_queues
 from dosadi.agents.groups import (
-    GroupType,
     _find_dangerous_corridors_from_metrics,
     maybe_form_proto_council,
     maybe_run_council_meeting,
-    maybe_run_pod_meeting,
+    ensure_group_schedule,
+    run_due_pod_meetings,
 )
 from dosadi.scenarios.wakeup_prime import (
     WakeupPrimeReport,
     WakeupPrimeScenarioConfig,
     generate_wakeup_scenario_prime,
+    wakeup_prime_template,
 )
 from dosadi.state import WorldState
 from dosadi.runtime.proto_council import run_proto_council_tuning
@@ -83,19 +85,17 @@ def _step_governance(world: WorldState, tick: int, cfg: WakeupPrimeRuntimeConfig
             risk_threshold_for_protocol=cfg.risk_threshold_for_protocol,
         )
 
-    for group in groups:
-        if group.group_type != GroupType.POD:
-            continue
-        maybe_run_pod_meeting(
-            pod_group=group,
-            agents_by_id=world.agents,
-            tick=tick,
-            rng=rng,
-            meeting_interval_ticks=cfg.pod_meeting_interval_ticks,
-            rep_vote_fraction_threshold=cfg.rep_vote_fraction_threshold,
-            min_leadership_threshold=cfg.min_leadership_threshold,
-            max_representatives=cfg.max_pod_representatives,
-        )
+    run_due_pod_meetings(
+        world,
+        groups,
+        world.agents,
+        tick,
+        rng,
+        meeting_interval_ticks=cfg.pod_meeting_interval_ticks,
+        rep_vote_fraction_threshold=cfg.rep_vote_fraction_threshold,
+        min_leadership_threshold=cfg.min_leadership_threshold,
+        max_representatives=cfg.max_pod_representatives,
+    )
 
     council = maybe_form_proto_council(
         groups=groups,
@@ -103,6 +103,7 @@ def _step_governance(world: WorldState, tick: int, cfg: WakeupPrimeRuntimeConfig
         tick=tick,
         hub_location_id="corr:main-core",
         max_council_size=cfg.max_council_size,
+        pod_rep_ids=ensure_group_schedule(world).rep_ids(groups),
     )
 
     if council is not None:
@@ -135,7 +136,9 @@ def step_wakeup_prime_once(world: WorldState) -> None:
     cfg: WakeupPrimeRuntimeConfig = getattr(world, "runtime_config", None) or WakeupPrimeRuntimeConfig()
     world.runtime_config = cfg
 
-    queue_emitter = getattr(world, "queue_episode_emitter", None) or QueueEpisodeEmitter()
+    queue_emitter = getattr(world, "queue_episode_emitter", None) or QueueEpisodeEmitter(
+        EpisodeFactory(world=world)
+    )
     world.queue_episode_emitter = queue_emitter
 
     memory_config: MemoryConfig = getattr(world, "memory_config", None) or MemoryConfig()
@@ -181,7 +184,7 @@ def run_wakeup_prime(
         max_ticks=max_ticks,
         basic_suit_stock=basic_suit_stock,
     )
-    report = generate_wakeup_scenario_prime(scenario_config)
+    report = generate_wakeup_scenario_prime(scenario_config, template=wakeup_prime_template(scenario_config))
     world = report.world
 
     runtime_cfg = WakeupPrimeRuntimeConfig(max_ticks=max_ticks)
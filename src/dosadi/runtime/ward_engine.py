@@ -0,0 +1,118 @@
+"""Array-backed ward adjacency shared by the ward-level daily updates.
+
+Health spread and migration both walk the corridor graph between wards. The
+original loops rescanned ``world.edges`` for every ward (and, for migration,
+for every neighbour of every ward), which is quadratic in the number of
+corridors. :class:`WardGraph` indexes the edges once per update into a CSR
+adjacency (``indptr``/``indices`` arrays over sorted node ids) plus a lookup of
+the first edge joining each ordered pair, so neighbour queries become slices.
+
+:class:`WardColumns` gathers a per-ward value from the existing ward state
+dataclasses into an aligned ``array('d')`` (one slot per ward id), which lets
+coupled updates run over flat arrays and write back only the entries they
+touched. The dataclasses stay the source of truth for snapshots.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+
+def _endpoints(edge: object) -> tuple[object, object]:
+    origin = getattr(edge, "origin", None) or getattr(edge, "a", None)
+    destination = getattr(edge, "destination", None) or getattr(edge, "b", None)
+    return origin, destination
+
+
+def _edge_field(edge: object, name: str) -> object:
+    if isinstance(edge, Mapping):
+        return edge.get(name)
+    return getattr(edge, name, None)
+
+
+@dataclass(slots=True)
+class WardGraph:
+    """Undirected corridor adjacency in compressed sparse row form."""
+
+    node_ids: tuple[str, ...] = ()
+    index: dict[str, int] = field(default_factory=dict)
+    indptr: array = field(default_factory=lambda: array("l", [0]))
+    indices: array = field(default_factory=lambda: array("l"))
+    pair_edges: dict[tuple[object, object], object] = field(default_factory=dict)
+
+    @property
+    def has_edges(self) -> bool:
+        return len(self.indices) > 0
+
+    def neighbor_slots(self, node_id: str) -> array:
+        slot = self.index.get(node_id)
+        if slot is None:
+            return array("l")
+        return self.indices[self.indptr[slot] : self.indptr[slot + 1]]
+
+    def neighbors(self, node_id: str) -> list[str]:
+        node_ids = self.node_ids
+        return [node_ids[idx] for idx in self.neighbor_slots(node_id)]
+
+    def edge_between(self, origin: object, destination: object) -> object | None:
+        """Return the first edge (in ``world.edges`` order) joining the pair.
+
+        Matches ``origin -> destination`` and either orientation of an
+        ``a``/``b`` edge, for attribute-style and mapping-style edges alike.
+        """
+
+        return self.pair_edges.get((origin, destination))
+
+
+def build_ward_graph(edges: Mapping[str, object] | Iterable[object]) -> WardGraph:
+    values = edges.values() if isinstance(edges, Mapping) else edges
+    adjacency: dict[str, set[str]] = {}
+    pair_edges: dict[tuple[object, object], object] = {}
+    for edge in values:
+        origin, destination = _endpoints(edge)
+        if origin and destination:
+            adjacency.setdefault(str(origin), set()).add(str(destination))
+            adjacency.setdefault(str(destination), set()).add(str(origin))
+        a = _edge_field(edge, "a")
+        b = _edge_field(edge, "b")
+        for key in ((_edge_field(edge, "origin"), _edge_field(edge, "destination")), (a, b), (b, a)):
+            pair_edges.setdefault(key, edge)
+
+    node_ids = tuple(sorted(adjacency))
+    index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+    indptr = array("l", [0])
+    indices = array("l")
+    for node_id in node_ids:
+        indices.extend(sorted(index[other] for other in adjacency[node_id]))
+        indptr.append(len(indices))
+    return WardGraph(node_ids=node_ids, index=index, indptr=indptr, indices=indices, pair_edges=pair_edges)
+
+
+def ward_graph(world: Any) -> WardGraph:
+    return build_ward_graph(getattr(world, "edges", {}) or {})
+
+
+@dataclass(slots=True)
+class WardColumns:
+    """Aligned per-ward float columns gathered from ward state objects."""
+
+    ward_ids: tuple[str, ...]
+    index: dict[str, int] = field(default_factory=dict)
+    columns: dict[str, array] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.index:
+            self.index = {ward_id: idx for idx, ward_id in enumerate(self.ward_ids)}
+
+    def gather(self, name: str, states: Sequence[object], getter: Callable[[object], float]) -> array:
+        column = array("d", (float(getter(state)) for state in states))
+        self.columns[name] = column
+        return column
+
+    def column(self, name: str) -> array:
+        return self.columns[name]
+
+
+__all__ = ["WardColumns", "WardGraph", "build_ward_graph", "ward_graph"]
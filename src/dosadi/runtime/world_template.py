@@ -0,0 +1,143 @@
+"""Reusable seed-independent world templates for multi-seed runs.
+
+A template is a world built once without any seed-dependent state (topology,
+facilities, queues, configs).  :meth:`WorldTemplate.instantiate` returns a
+fresh ``WorldState`` for a seed by copying only the attributes the template
+build replaced or mutated; frozen objects registered as shared (layout nodes
+and edges) are referenced rather than copied.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+import io
+import pickle
+from typing import Any, Callable, Iterable
+
+from dosadi.state import WorldState
+
+# Seed-owned fields: always taken from the fresh world, never from the template.
+_SEED_FIELDS = frozenset({"seed", "rng"})
+
+
+def _fingerprint(value: Any) -> bytes | None:
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+
+
+def _fingerprints(world: WorldState) -> dict[str, bytes | None]:
+    return {name: _fingerprint(value) for name, value in vars(world).items() if name not in _SEED_FIELDS}
+
+
+def _changed_attributes(before: dict[str, bytes | None], world: WorldState) -> tuple[str, ...]:
+    """Attributes the build replaced or mutated; unpicklable ones count as changed."""
+
+    changed: list[str] = []
+    for name, value in vars(world).items():
+        if name in _SEED_FIELDS:
+            continue
+        previous = before.get(name)
+        if previous is None or previous != _fingerprint(value):
+            changed.append(name)
+    return tuple(changed)
+
+
+class _SharingPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, shared: dict[int, int]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared = shared
+
+    def persistent_id(self, obj: Any) -> int | None:
+        return self._shared.get(id(obj))
+
+
+class _SharingUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, shared: tuple[Any, ...]) -> None:
+        super().__init__(file)
+        self._shared = shared
+
+    def persistent_load(self, pid: int) -> Any:
+        return self._shared[pid]
+
+
+@dataclass(slots=True)
+class WorldTemplate:
+    """A seed-independent base world plus the attributes its build set.
+
+    Changed attributes are kept as one pickle blob in which shared objects
+    are stored by reference; attributes that cannot be pickled are deep-copied
+    from ``base`` on every instantiation instead.
+    """
+
+    scenario_id: str
+    base: WorldState
+    changed_fields: tuple[str, ...]
+    shared: tuple[Any, ...] = ()
+    extras: dict[str, Any] = field(default_factory=dict)
+    blob: bytes = b""
+    copied_fields: tuple[str, ...] = ()
+
+    def freeze(self) -> None:
+        shared_ids = {id(obj): idx for idx, obj in enumerate(self.shared)}
+        payload: dict[str, Any] = {}
+        copied: list[str] = []
+        for name in self.changed_fields:
+            value = getattr(self.base, name)
+            try:
+                _SharingPickler(io.BytesIO(), shared_ids).dump(value)
+            except Exception:
+                copied.append(name)
+                continue
+            payload[name] = value
+        buffer = io.BytesIO()
+        _SharingPickler(buffer, shared_ids).dump(payload)
+        self.blob = buffer.getvalue()
+        self.copied_fields = tuple(copied)
+
+    def instantiate(self, *, seed: int) -> WorldState:
+        world = WorldState(seed=seed)
+        payload = _SharingUnpickler(io.BytesIO(self.blob), self.shared).load() if self.blob else {}
+        memo: dict[int, Any] = {id(obj): obj for obj in self.shared}
+        for name in self.changed_fields:
+            if name in payload:
+                setattr(world, name, payload[name])
+            else:
+                setattr(world, name, copy.deepcopy(getattr(self.base, name), memo))
+        return world
+
+
+def build_world_template(
+    scenario_id: str,
+    build: Callable[[WorldState], Any],
+    *,
+    shared: Iterable[Any] | Callable[[WorldState], Iterable[Any]] = (),
+) -> WorldTemplate:
+    """Run ``build`` on a blank world and capture the result as a template.
+
+    ``build`` must not depend on the seed; whatever it returns is kept in
+    ``extras["build"]`` for the scenario's own populate step.  ``shared`` lists
+    immutable objects (or a callable picking them from the built world) that
+    every instance references instead of copying.
+    """
+
+    base = WorldState()
+    before = _fingerprints(base)
+    result = build(base)
+    template = WorldTemplate(
+        scenario_id=scenario_id,
+        base=base,
+        changed_fields=_changed_attributes(before, base),
+        shared=tuple(shared(base) if callable(shared) else shared),
+    )
+    template.extras["build"] = result
+    template.freeze()
+    return template
+
+
+__all__ = [
+    "WorldTemplate",
+    "build_world_template",
+]
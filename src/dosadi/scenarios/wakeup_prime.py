@@ -20,6 +20,7 @@ from dosadi.agents.groups import Group, GroupRole, create_pod_group, maybe_form_
 from dosadi.law import FacilityProtocolTuning
 from dosadi.memory.config import MemoryConfig
 from dosadi.runtime.queues import QueueLifecycleState, QueuePriorityRule, QueueState
+from dosadi.runtime.world_template import WorldTemplate, build_world_template
 from dosadi.state import WorldState
 from dosadi.world.construction import ProjectLedger
 from dosadi.world.facilities import Facility, FacilityLedger
@@ -180,20 +181,16 @@ def _seed_risk_metrics(world: WorldState) -> None:
     world.metrics = metrics
 
 
-def generate_wakeup_scenario_prime(config: WakeupPrimeScenarioConfig) -> WakeupPrimeReport:
-    """Build the initial world + agents for Wakeup Scenario Prime."""
+def _build_wakeup_prime_layout(
+    world: WorldState, *, include_canteen: bool, include_hazard_spurs: bool
+) -> List[str]:
+    """Seed-independent part of the scenario; returns the pod location ids."""
 
-    layout = build_habitat_layout_prime(
-        include_canteen=config.include_canteen, include_hazard_spurs=config.include_hazard_spurs
-    )
-    world = WorldState(seed=config.seed)
-    world.rng.seed(config.seed)
+    layout = build_habitat_layout_prime(include_canteen=include_canteen, include_hazard_spurs=include_hazard_spurs)
 
     # Initialize construction ledger for expansion tasks
     world.projects = ProjectLedger()
-
-    memory_config = MemoryConfig()
-    world.memory_config = memory_config
+    world.memory_config = MemoryConfig()
 
     world.policy["topology"] = layout.to_topology()
     world.nodes = layout.nodes
@@ -226,20 +223,63 @@ def generate_wakeup_scenario_prime(config: WakeupPrimeScenarioConfig) -> WakeupP
             fac_id, FacilityProtocolTuning(facility_id=fac_id)
         )
 
-    pods = [pid for pid in layout.nodes.keys() if pid.startswith("pod:")]
+    _register_wakeup_queues(world)
+    _seed_risk_metrics(world)
+    return [pid for pid in layout.nodes.keys() if pid.startswith("pod:")]
+
+
+_TEMPLATES: dict[tuple[bool, bool], WorldTemplate] = {}
+
+
+def wakeup_prime_template(config: WakeupPrimeScenarioConfig) -> WorldTemplate:
+    """Return the cached seed-independent template for ``config``'s layout options."""
+
+    key = (bool(config.include_canteen), bool(config.include_hazard_spurs))
+    template = _TEMPLATES.get(key)
+    if template is None:
+        template = build_world_template(
+            "wakeup_prime",
+            lambda world: _build_wakeup_prime_layout(
+                world, include_canteen=key[0], include_hazard_spurs=key[1]
+            ),
+            shared=lambda world: (*world.nodes.values(), *world.edges.values()),
+        )
+        _TEMPLATES[key] = template
+    return template
+
+
+def generate_wakeup_scenario_prime(
+    config: WakeupPrimeScenarioConfig, *, template: WorldTemplate | None = None
+) -> WakeupPrimeReport:
+    """Build the initial world + agents for Wakeup Scenario Prime.
+
+    Pass ``template=wakeup_prime_template(config)`` when generating many seeds
+    to build the layout once and only generate the population per seed.
+    """
+
+    if template is None:
+        world = WorldState(seed=config.seed)
+        pods = _build_wakeup_prime_layout(
+            world, include_canteen=config.include_canteen, include_hazard_spurs=config.include_hazard_spurs
+        )
+    else:
+        world = template.instantiate(seed=config.seed)
+        pods = list(template.extras["build"])
+    world.rng.seed(config.seed)
+
+    memory_config = world.memory_config
     agents = _create_agents(config.num_agents, pods, config.seed)
     for agent in agents:
         world.register_agent(agent)
         _initialize_agent_sleep_schedule(agent, world, memory_config)
 
-    queues = _register_wakeup_queues(world)
+    queues = list(world.queues.values())
 
     num_agents = len(agents)
     default_suits = getattr(config, "basic_suit_stock", None)
     world.basic_suit_stock = num_agents if default_suits is None else default_suits
 
     _initialize_pod_groups(world, pods)
-    _seed_risk_metrics(world)
 
     metadata = {
         "scenario_id": "wakeup_prime",
@@ -287,4 +327,5 @@ __all__ = [
     "WakeupPrimeScenarioConfig",
     "WakeupPrimeReport",
     "generate_wakeup_scenario_prime",
+    "wakeup_prime_template",
 ]
@@ -20,86 +20,111 @@ from .admin_log import AdminEventLog
 from .law import FacilityProtocolTuning
 from .memory.facility_summary import FacilityBeliefSummary
 from .world.events import WorldEventLog
-from .world.facilities import FacilityLedger
-from .world.logistics import LogisticsConfig, LogisticsLedger
-from .world.scout_missions import ScoutMissionLedger
 from .simulation.snapshots import serialize_state
 from .runtime.admin_log import AdminLogEntry
-from .runtime.council_metrics import CouncilMetrics, CouncilStaffingConfig
-from .runtime.escort_protocols import EscortConfig, EscortState
-from .runtime.staffing import StaffingConfig, StaffingState
-from .runtime.workforce import FacilityStaffing, WardWorkforcePools, WorkforceConfig
-from .runtime.stockpile_policy import DepotPolicyLedger, StockpilePolicyConfig, StockpilePolicyState
 from .runtime.work_details import WorkDetailType
-from .runtime.war import RaidOutcome, RaidPlan, WarConfig
-from .runtime.incident_engine import IncidentConfig, IncidentState
 from .runtime.scouting_config import ScoutConfig
 from .runtime.telemetry import DebugConfig, EventRing, Metrics
 from .runtime.rng_service import RNGConfig, RNGService
 from .runtime.events import EventBus, EventBusConfig
-from .runtime.kpis import KPIStore
-from .runtime.evidence import EvidenceBuffer, EvidenceConfig
-from .runtime.mobility import MobilityConfig, MobilityEvent, PolityMobilityState
-from .runtime.institutions import InstitutionConfig, WardInstitutionPolicy, WardInstitutionState
-from .runtime.class_system import ClassConfig, WardClassState
-from .runtime.corridor_risk import CorridorRiskConfig, CorridorRiskLedger
-from .runtime.corridor_cascade import CorridorCascadeConfig, CorridorCascadeLedger
-from .runtime.constitution import ConstitutionConfig, ConstitutionalEvent, ConstitutionState, Settlement
-from .runtime.media import MediaConfig, MediaMessage
-from .runtime.comms import CommsConfig, CommsModifiers, CommsNodeState
-from .runtime.espionage import EspionageConfig, IntelOpOutcome, IntelOpPlan
-from .runtime.culture_wars import CultureConfig, WardCultureState
-from .runtime.education import EducationConfig, WardEducationState
-from .runtime.urban import UrbanConfig, WardUrbanState
-from .world.corridor_infrastructure import CorridorInfraConfig, CorridorInfraEdge
-from .runtime.escort_policy_v2 import EscortPolicyV2Config, EscortPolicyV2State
-from .runtime.migration import MigrationConfig, MigrationFlow, WardMigrationState
-from .runtime.demographics import DemographicEvent, DemographicsConfig, PolityDemographics
-from .runtime.defense import DefenseConfig, WardDefenseState
-from .runtime.market_signals import MarketSignalsConfig, MarketSignalsState
-from .runtime.production_runtime import FacilityProductionState, ProductionConfig, ProductionState
-from .runtime.smuggling import SmugglingConfig, SmugglingNetworkState
-from .runtime.policing import PolicingConfig, WardPolicingState
-from .runtime.archives import ArchivesConfig, ArchiveState, CanonEvent, CounterNarrative, NarrativeState
-from .runtime.mandates import MandateSystemConfig, MandateSystemState
 from .agent.memory_crumbs import CrumbStore
 from .agent.memory_episodes import EpisodeBuffer
 from .agent.memory_stm import STMBoringWinner
 from .world.environment import PlaceEnvironmentState
-from .world.factions import FactionSystemConfig, FactionSystemState, FactionTerritory, Faction
 from .world.phases import PhaseConfig, PhaseState
-from .world.discovery import DiscoveryConfig
-from .world.extraction import ExtractionLedger
 from .world.survey_map import SurveyMap
-from .world.construction import ProjectLedger
-from .world.expansion_planner import ExpansionPlannerConfig, ExpansionPlannerState
-from .world.materials import InventoryRegistry
 from .world.water import WellState
-from .world.water_access import WaterAccessConfig, WaterAccessLedger
-from .world.workforce import WorkforceLedger
-from .world.incidents import IncidentLedger
-from .runtime.focus_mode import FocusConfig, FocusState
-from .runtime.extraction_runtime import ExtractionConfig, ExtractionState
-from .runtime.maintenance import MaintenanceConfig, MaintenanceLedger, MaintenanceState
-from .runtime.faction_interference import InterferenceConfig, InterferenceState
-from .runtime.suit_wear import SuitRepairLedger, SuitWearConfig, SuitWearState
-from .runtime.ledger import LedgerConfig, LedgerState
-from .runtime.shadow_state import CorruptionIndex, InfluenceEdge, ShadowAccount, ShadowStateConfig
-from .runtime.finance import FinanceConfig, Loan, Patronage
-from .runtime.trade_federations import (
-    CartelAgreement,
-    CartelCompliance,
-    Federation,
-    FederationConfig,
-)
-from .runtime.truth_regimes import IntegrityState, TruthConfig, TruthEvent
-from .runtime.careers import CareerConfig
-from .runtime.success_contracts import ContractConfig, ContractRuntimeState, SuccessContract
-from .runtime.labor import BargainingEvent, LaborConfig, LaborOrgState
 from .agent.suits import SuitState
+from .runtime.subsystems import lazy_factory, lazy_module_getattr
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .world.facilities import FacilityLedger
+    from .world.logistics import LogisticsConfig, LogisticsLedger
+    from .world.scout_missions import ScoutMissionLedger
+    from .runtime.council_metrics import CouncilMetrics, CouncilStaffingConfig
+    from .runtime.escort_protocols import EscortConfig, EscortState
+    from .runtime.staffing import StaffingConfig, StaffingState
+    from .runtime.workforce import FacilityStaffing, WardWorkforcePools, WorkforceConfig
+    from .runtime.stockpile_policy import (
+        DepotPolicyLedger,
+        StockpilePolicyConfig,
+        StockpilePolicyState,
+    )
+    from .runtime.war import RaidOutcome, RaidPlan, WarConfig
+    from .runtime.incident_engine import IncidentConfig, IncidentState
+    from .runtime.kpis import KPIStore
+    from .runtime.evidence import EvidenceBuffer, EvidenceConfig
+    from .runtime.mobility import MobilityConfig, MobilityEvent, PolityMobilityState
+    from .runtime.institutions import InstitutionConfig, WardInstitutionPolicy, WardInstitutionState
+    from .runtime.class_system import ClassConfig, WardClassState
+    from .runtime.corridor_risk import CorridorRiskConfig, CorridorRiskLedger
+    from .runtime.corridor_cascade import CorridorCascadeConfig, CorridorCascadeLedger
+    from .runtime.constitution import (
+        ConstitutionConfig,
+        ConstitutionalEvent,
+        ConstitutionState,
+        Settlement,
+    )
+    from .runtime.media import MediaConfig, MediaMessage
+    from .runtime.comms import CommsConfig, CommsModifiers, CommsNodeState
+    from .runtime.espionage import EspionageConfig, IntelOpOutcome, IntelOpPlan
+    from .runtime.culture_wars import CultureConfig, WardCultureState
+    from .runtime.education import EducationConfig, WardEducationState
+    from .runtime.urban import UrbanConfig, WardUrbanState
+    from .world.corridor_infrastructure import CorridorInfraConfig, CorridorInfraEdge
+    from .runtime.escort_policy_v2 import EscortPolicyV2Config, EscortPolicyV2State
+    from .runtime.migration import MigrationConfig, MigrationFlow, WardMigrationState
+    from .runtime.demographics import DemographicEvent, DemographicsConfig, PolityDemographics
+    from .runtime.defense import DefenseConfig, WardDefenseState
+    from .runtime.market_signals import MarketSignalsConfig, MarketSignalsState
+    from .runtime.production_runtime import (
+        FacilityProductionState,
+        ProductionConfig,
+        ProductionState,
+    )
+    from .runtime.smuggling import SmugglingConfig, SmugglingNetworkState
+    from .runtime.policing import PolicingConfig, WardPolicingState
+    from .runtime.archives import (
+        ArchivesConfig,
+        ArchiveState,
+        CanonEvent,
+        CounterNarrative,
+        NarrativeState,
+    )
+    from .runtime.mandates import MandateSystemConfig, MandateSystemState
+    from .world.factions import FactionSystemConfig, FactionSystemState, FactionTerritory, Faction
+    from .world.discovery import DiscoveryConfig
+    from .world.extraction import ExtractionLedger
+    from .world.construction import ProjectLedger
+    from .world.expansion_planner import ExpansionPlannerConfig, ExpansionPlannerState
+    from .world.materials import InventoryRegistry
+    from .world.water_access import WaterAccessConfig, WaterAccessLedger
+    from .world.workforce import WorkforceLedger
+    from .world.incidents import IncidentLedger
+    from .runtime.focus_mode import FocusConfig, FocusState
+    from .runtime.extraction_runtime import ExtractionConfig, ExtractionState
+    from .runtime.maintenance import MaintenanceConfig, MaintenanceLedger, MaintenanceState
+    from .runtime.faction_interference import InterferenceConfig, InterferenceState
+    from .runtime.suit_wear import SuitRepairLedger, SuitWearConfig, SuitWearState
+    from .runtime.ledger import LedgerConfig, LedgerState
+    from .runtime.shadow_state import (
+        CorruptionIndex,
+        InfluenceEdge,
+        ShadowAccount,
+        ShadowStateConfig,
+    )
+    from .runtime.finance import FinanceConfig, Loan, Patronage
+    from .runtime.trade_federations import (
+        CartelAgreement,
+        CartelCompliance,
+        Federation,
+        FederationConfig,
+    )
+    from .runtime.truth_regimes import IntegrityState, TruthConfig, TruthEvent
+    from .runtime.careers import CareerConfig
+    from .runtime.success_contracts import ContractConfig, ContractRuntimeState, SuccessContract
+    from .runtime.labor import BargainingEvent, LaborConfig, LaborOrgState
     from .systems.protocols import ProtocolRegistry
     from .runtime.queues import FacilityQueueState, QueueState
     from .runtime.work_details import WorkDetailType
@@ -887,12 +912,12 @@ class WorldState:
     events: List[Dict[str, object]] = field(default_factory=list)
     event_log: WorldEventLog = field(default_factory=lambda: WorldEventLog(max_len=5000))
     routes: MutableMapping[str, RouteState] = field(default_factory=dict)
-    facilities: MutableMapping[str, Any] = field(default_factory=FacilityLedger)
+    facilities: MutableMapping[str, Any] = field(default_factory=lazy_factory("dosadi.world.facilities:FacilityLedger"))
     places: MutableMapping[str, Any] = field(default_factory=dict)
     survey_map: SurveyMap = field(default_factory=SurveyMap)
-    infra_cfg: CorridorInfraConfig = field(default_factory=CorridorInfraConfig)
+    infra_cfg: CorridorInfraConfig = field(default_factory=lazy_factory("dosadi.world.corridor_infrastructure:CorridorInfraConfig"))
     infra_edges: MutableMapping[str, CorridorInfraEdge] = field(default_factory=dict)
-    discovery_cfg: DiscoveryConfig = field(default_factory=DiscoveryConfig)
+    discovery_cfg: DiscoveryConfig = field(default_factory=lazy_factory("dosadi.world.discovery:DiscoveryConfig"))
     crews: Dict[str, CrewState] = field(default_factory=dict)
     water_tap_sources: Dict[str, str] = field(default_factory=dict)
     facility_queues: MutableMapping[str, "FacilityQueueState"] = field(default_factory=dict)
@@ -905,7 +930,7 @@ class WorldState:
     trades: List[Dict[str, object]] = field(default_factory=list)
     labor_postings: List[Dict[str, object]] = field(default_factory=list)
     labor_assignments: List[Dict[str, object]] = field(default_factory=list)
-    career_cfg: CareerConfig = field(default_factory=CareerConfig)
+    career_cfg: CareerConfig = field(default_factory=lazy_factory("dosadi.runtime.careers:CareerConfig"))
     career_roles: Dict[str, object] = field(default_factory=dict)
     career_events: List[Dict[str, object]] = field(default_factory=list)
     career_last_run_day: int = -1
@@ -914,6 +939,7 @@ class WorldState:
     goals: Dict[str, "Goal"] = field(default_factory=dict)
     goals_by_owner: Dict[str, List[str]] = field(default_factory=dict)
     next_goal_seq: int = 0
+    next_episode_seq: int = 0
     maintenance_tasks: List[Dict[str, object]] = field(default_factory=list)
     clinic_records: List[Dict[str, object]] = field(default_factory=list)
     law_cases: List[Dict[str, object]] = field(default_factory=list)
@@ -925,25 +951,25 @@ class WorldState:
     metrics: Metrics = field(default_factory=Metrics)
     event_bus_cfg: EventBusConfig = field(default_factory=EventBusConfig)
     event_bus: EventBus = field(default_factory=EventBus)
-    evidence_cfg: EvidenceConfig = field(default_factory=EvidenceConfig)
+    evidence_cfg: EvidenceConfig = field(default_factory=lazy_factory("dosadi.runtime.evidence:EvidenceConfig"))
     evidence_by_polity: dict[str, EvidenceBuffer] = field(default_factory=dict)
-    mandate_cfg: MandateSystemConfig = field(default_factory=MandateSystemConfig)
-    mandate_state: MandateSystemState = field(default_factory=MandateSystemState)
-    kpis: KPIStore = field(default_factory=KPIStore)
+    mandate_cfg: MandateSystemConfig = field(default_factory=lazy_factory("dosadi.runtime.mandates:MandateSystemConfig"))
+    mandate_state: MandateSystemState = field(default_factory=lazy_factory("dosadi.runtime.mandates:MandateSystemState"))
+    kpis: KPIStore = field(default_factory=lazy_factory("dosadi.runtime.kpis:KPIStore"))
     kpi_event_subscription_id: int | None = None
     event_ring: EventRing = field(default_factory=EventRing)
     treaty_cfg: Any = None
     treaties: Dict[str, Any] = field(default_factory=dict)
     treaty_penalties: Dict[str, float] = field(default_factory=dict)
     debug_cfg: DebugConfig = field(default_factory=DebugConfig)
-    council_metrics: CouncilMetrics = field(default_factory=CouncilMetrics)
-    council_staffing_config: CouncilStaffingConfig = field(default_factory=CouncilStaffingConfig)
-    ledger_cfg: LedgerConfig = field(default_factory=LedgerConfig)
-    ledger_state: LedgerState = field(default_factory=LedgerState)
-    contract_cfg: ContractConfig = field(default_factory=ContractConfig)
+    council_metrics: CouncilMetrics = field(default_factory=lazy_factory("dosadi.runtime.council_metrics:CouncilMetrics"))
+    council_staffing_config: CouncilStaffingConfig = field(default_factory=lazy_factory("dosadi.runtime.council_metrics:CouncilStaffingConfig"))
+    ledger_cfg: LedgerConfig = field(default_factory=lazy_factory("dosadi.runtime.ledger:LedgerConfig"))
+    ledger_state: LedgerState = field(default_factory=lazy_factory("dosadi.runtime.ledger:LedgerState"))
+    contract_cfg: ContractConfig = field(default_factory=lazy_factory("dosadi.runtime.success_contracts:ContractConfig"))
     active_contract: SuccessContract | None = None
-    contract_state: ContractRuntimeState = field(default_factory=ContractRuntimeState)
-    finance_cfg: FinanceConfig = field(default_factory=FinanceConfig)
+    contract_state: ContractRuntimeState = field(default_factory=lazy_factory("dosadi.runtime.success_contracts:ContractRuntimeState"))
+    finance_cfg: FinanceConfig = field(default_factory=lazy_factory("dosadi.runtime.finance:FinanceConfig"))
     loans: dict[str, Loan] = field(default_factory=dict)
     patronage: list[Patronage] = field(default_factory=list)
     finance_events: list[dict[str, object]] = field(default_factory=list)
@@ -953,21 +979,22 @@ class WorldState:
     premiums_by_corridor: dict[str, Any] = field(default_factory=dict)
     insured_flows: dict[str, Any] = field(default_factory=dict)
     insurance_events: list[dict[str, object]] = field(default_factory=list)
-    inst_cfg: InstitutionConfig = field(default_factory=InstitutionConfig)
+    inst_cfg: InstitutionConfig = field(default_factory=lazy_factory("dosadi.runtime.institutions:InstitutionConfig"))
     inst_policy_by_ward: Dict[str, WardInstitutionPolicy] = field(default_factory=dict)
+    inst_customs_revision: int = 0
     inst_state_by_ward: Dict[str, WardInstitutionState] = field(default_factory=dict)
-    class_cfg: ClassConfig = field(default_factory=ClassConfig)
+    class_cfg: ClassConfig = field(default_factory=lazy_factory("dosadi.runtime.class_system:ClassConfig"))
     class_by_ward: Dict[str, WardClassState] = field(default_factory=dict)
-    urban_cfg: UrbanConfig = field(default_factory=UrbanConfig)
+    urban_cfg: UrbanConfig = field(default_factory=lazy_factory("dosadi.runtime.urban:UrbanConfig"))
     urban_by_ward: Dict[str, WardUrbanState] = field(default_factory=dict)
-    culture_cfg: CultureConfig = field(default_factory=CultureConfig)
+    culture_cfg: CultureConfig = field(default_factory=lazy_factory("dosadi.runtime.culture_wars:CultureConfig"))
     culture_by_ward: Dict[str, WardCultureState] = field(default_factory=dict)
-    education_cfg: EducationConfig = field(default_factory=EducationConfig)
+    education_cfg: EducationConfig = field(default_factory=lazy_factory("dosadi.runtime.education:EducationConfig"))
     education_by_ward: Dict[str, WardEducationState] = field(default_factory=dict)
-    migration_cfg: MigrationConfig = field(default_factory=MigrationConfig)
+    migration_cfg: MigrationConfig = field(default_factory=lazy_factory("dosadi.runtime.migration:MigrationConfig"))
     migration_by_ward: Dict[str, WardMigrationState] = field(default_factory=dict)
     migration_flows: List[MigrationFlow] = field(default_factory=list)
-    demographics_cfg: DemographicsConfig = field(default_factory=DemographicsConfig)
+    demographics_cfg: DemographicsConfig = field(default_factory=lazy_factory("dosadi.runtime.demographics:DemographicsConfig"))
     demographics_by_polity: dict[str, PolityDemographics] = field(default_factory=dict)
     demographic_events: list[DemographicEvent] = field(default_factory=list)
     health_cfg: "HealthConfig" = field(default_factory=_health_config_factory)
@@ -976,9 +1003,9 @@ class WorldState:
     admin_logs: Dict[str, AdminLogEntry] = field(default_factory=dict)
     next_admin_log_seq: int = 0
     well: WellState = field(default_factory=WellState)
-    water_access_cfg: WaterAccessConfig = field(default_factory=WaterAccessConfig)
-    water_access: WaterAccessLedger = field(default_factory=WaterAccessLedger)
-    inventories: InventoryRegistry = field(default_factory=InventoryRegistry)
+    water_access_cfg: WaterAccessConfig = field(default_factory=lazy_factory("dosadi.world.water_access:WaterAccessConfig"))
+    water_access: WaterAccessLedger = field(default_factory=lazy_factory("dosadi.world.water_access:WaterAccessLedger"))
+    inventories: InventoryRegistry = field(default_factory=lazy_factory("dosadi.world.materials:InventoryRegistry"))
     place_environment: Dict[str, PlaceEnvironmentState] = field(default_factory=dict)
     enf_cfg: Any = None
     enf_policy_by_ward: Dict[str, Any] = field(default_factory=dict)
@@ -989,27 +1016,27 @@ class WorldState:
     agents_with_new_signals: Set[str] = field(default_factory=set)
     basic_suit_stock: int = 0
     service_facilities: Dict[str, List[str]] = field(default_factory=dict)
-    logistics: LogisticsLedger = field(default_factory=LogisticsLedger)
-    logistics_cfg: LogisticsConfig = field(default_factory=LogisticsConfig)
-    stock_cfg: StockpilePolicyConfig = field(default_factory=StockpilePolicyConfig)
-    stock_state: StockpilePolicyState = field(default_factory=StockpilePolicyState)
-    stock_policies: DepotPolicyLedger = field(default_factory=DepotPolicyLedger)
-    market_cfg: MarketSignalsConfig = field(default_factory=MarketSignalsConfig)
-    market_state: MarketSignalsState = field(default_factory=MarketSignalsState)
-    escort_cfg: EscortConfig = field(default_factory=EscortConfig)
-    escort_state: EscortState = field(default_factory=EscortState)
+    logistics: LogisticsLedger = field(default_factory=lazy_factory("dosadi.world.logistics:LogisticsLedger"))
+    logistics_cfg: LogisticsConfig = field(default_factory=lazy_factory("dosadi.world.logistics:LogisticsConfig"))
+    stock_cfg: StockpilePolicyConfig = field(default_factory=lazy_factory("dosadi.runtime.stockpile_policy:StockpilePolicyConfig"))
+    stock_state: StockpilePolicyState = field(default_factory=lazy_factory("dosadi.runtime.stockpile_policy:StockpilePolicyState"))
+    stock_policies: DepotPolicyLedger = field(default_factory=lazy_factory("dosadi.runtime.stockpile_policy:DepotPolicyLedger"))
+    market_cfg: MarketSignalsConfig = field(default_factory=lazy_factory("dosadi.runtime.market_signals:MarketSignalsConfig"))
+    market_state: MarketSignalsState = field(default_factory=lazy_factory("dosadi.runtime.market_signals:MarketSignalsState"))
+    escort_cfg: EscortConfig = field(default_factory=lazy_factory("dosadi.runtime.escort_protocols:EscortConfig"))
+    escort_state: EscortState = field(default_factory=lazy_factory("dosadi.runtime.escort_protocols:EscortState"))
     ideology_cfg: Any = None
     ideology_by_ward: Dict[str, Any] = field(default_factory=dict)
     religion_cfg: Any = None
     sects: Dict[str, Any] = field(default_factory=dict)
     religion_by_ward: Dict[str, Any] = field(default_factory=dict)
-    media_cfg: MediaConfig = field(default_factory=MediaConfig)
+    media_cfg: MediaConfig = field(default_factory=lazy_factory("dosadi.runtime.media:MediaConfig"))
     media_in_flight: Dict[str, MediaMessage] = field(default_factory=dict)
     media_inbox_by_ward: Dict[str, deque[str]] = field(default_factory=dict)
     media_inbox_by_faction: Dict[str, deque[str]] = field(default_factory=dict)
     media_stats: Dict[str, float] = field(default_factory=dict)
     next_media_seq: int = 0
-    comms_cfg: CommsConfig = field(default_factory=CommsConfig)
+    comms_cfg: CommsConfig = field(default_factory=lazy_factory("dosadi.runtime.comms:CommsConfig"))
     comms_nodes: Dict[str, CommsNodeState] = field(default_factory=dict)
     comms_mod_by_ward: Dict[str, CommsModifiers] = field(default_factory=dict)
     comms_events: List[Dict[str, object]] = field(default_factory=list)
@@ -1019,82 +1046,85 @@ class WorldState:
     central_depot_node_id: str = "loc:depot-water-1"
     last_proto_council_tuning_day: int = -1
     last_promotion_check_tick: int = 0
-    projects: ProjectLedger = field(default_factory=ProjectLedger)
+    projects: ProjectLedger = field(default_factory=lazy_factory("dosadi.world.construction:ProjectLedger"))
     stockpiles: Dict[str, float] = field(default_factory=dict)
     phase_cfg: PhaseConfig = field(default_factory=PhaseConfig)
     phase_state: PhaseState = field(default_factory=PhaseState)
     logistics_loss_rate: float = 0.0
-    expansion_planner_cfg: ExpansionPlannerConfig = field(default_factory=ExpansionPlannerConfig)
+    expansion_planner_cfg: ExpansionPlannerConfig = field(default_factory=lazy_factory("dosadi.world.expansion_planner:ExpansionPlannerConfig"))
     expansion_planner_state: ExpansionPlannerState = field(
-        default_factory=lambda: ExpansionPlannerState(next_plan_day=0)
+        default_factory=lazy_factory("dosadi.world.expansion_planner:ExpansionPlannerState", next_plan_day=0)
     )
-    scout_missions: ScoutMissionLedger = field(default_factory=ScoutMissionLedger)
+    scout_missions: ScoutMissionLedger = field(default_factory=lazy_factory("dosadi.world.scout_missions:ScoutMissionLedger"))
     scout_cfg: ScoutConfig = field(default_factory=ScoutConfig)
     next_mission_seq: int = 0
-    workforce: WorkforceLedger = field(default_factory=WorkforceLedger)
-    workforce_cfg: WorkforceConfig = field(default_factory=WorkforceConfig)
+    workforce: WorkforceLedger = field(default_factory=lazy_factory("dosadi.world.workforce:WorkforceLedger"))
+    workforce_cfg: WorkforceConfig = field(default_factory=lazy_factory("dosadi.runtime.workforce:WorkforceConfig"))
     workforce_by_ward: dict[str, WardWorkforcePools] = field(default_factory=dict)
     staffing_by_facility: dict[str, FacilityStaffing] = field(default_factory=dict)
-    staffing_cfg: StaffingConfig = field(default_factory=StaffingConfig)
-    staffing_state: StaffingState = field(default_factory=StaffingState)
-    suit_cfg: SuitWearConfig = field(default_factory=SuitWearConfig)
-    suit_state: SuitWearState = field(default_factory=SuitWearState)
-    suit_repairs: SuitRepairLedger = field(default_factory=SuitRepairLedger)
-    incidents: IncidentLedger = field(default_factory=IncidentLedger)
-    incident_cfg: IncidentConfig = field(default_factory=IncidentConfig)
-    incident_state: IncidentState = field(default_factory=IncidentState)
-    policing_cfg: PolicingConfig = field(default_factory=PolicingConfig)
+    staffing_cfg: StaffingConfig = field(default_factory=lazy_factory("dosadi.runtime.staffing:StaffingConfig"))
+    staffing_state: StaffingState = field(default_factory=lazy_factory("dosadi.runtime.staffing:StaffingState"))
+    suit_cfg: SuitWearConfig = field(default_factory=lazy_factory("dosadi.runtime.suit_wear:SuitWearConfig"))
+    suit_state: SuitWearState = field(default_factory=lazy_factory("dosadi.runtime.suit_wear:SuitWearState"))
+    suit_repairs: SuitRepairLedger = field(default_factory=lazy_factory("dosadi.runtime.suit_wear:SuitRepairLedger"))
+    incidents: IncidentLedger = field(default_factory=lazy_factory("dosadi.world.incidents:IncidentLedger"))
+    incident_cfg: IncidentConfig = field(default_factory=lazy_factory("dosadi.runtime.incident_engine:IncidentConfig"))
+    incident_state: IncidentState = field(default_factory=lazy_factory("dosadi.runtime.incident_engine:IncidentState"))
+    policing_cfg: PolicingConfig = field(default_factory=lazy_factory("dosadi.runtime.policing:PolicingConfig"))
     policing_by_ward: dict[str, WardPolicingState] = field(default_factory=dict)
-    intf_cfg: InterferenceConfig = field(default_factory=InterferenceConfig)
-    intf_state: InterferenceState = field(default_factory=InterferenceState)
-    focus_cfg: FocusConfig = field(default_factory=FocusConfig)
-    focus_state: FocusState = field(default_factory=FocusState)
-    maint_cfg: MaintenanceConfig = field(default_factory=MaintenanceConfig)
-    maint_state: MaintenanceState = field(default_factory=MaintenanceState)
-    maintenance: MaintenanceLedger = field(default_factory=MaintenanceLedger)
-    labor_cfg: LaborConfig = field(default_factory=LaborConfig)
+    intf_cfg: InterferenceConfig = field(default_factory=lazy_factory("dosadi.runtime.faction_interference:InterferenceConfig"))
+    intf_state: InterferenceState = field(default_factory=lazy_factory("dosadi.runtime.faction_interference:InterferenceState"))
+    focus_cfg: FocusConfig = field(default_factory=lazy_factory("dosadi.runtime.focus_mode:FocusConfig"))
+    focus_state: FocusState = field(default_factory=lazy_factory("dosadi.runtime.focus_mode:FocusState"))
+    maint_cfg: MaintenanceConfig = field(default_factory=lazy_factory("dosadi.runtime.maintenance:MaintenanceConfig"))
+    maint_state: MaintenanceState = field(default_factory=lazy_factory("dosadi.runtime.maintenance:MaintenanceState"))
+    maintenance: MaintenanceLedger = field(default_factory=lazy_factory("dosadi.runtime.maintenance:MaintenanceLedger"))
+    labor_cfg: LaborConfig = field(default_factory=lazy_factory("dosadi.runtime.labor:LaborConfig"))
     labor_orgs_by_ward: dict[str, list[LaborOrgState]] = field(default_factory=dict)
     labor_events: list[BargainingEvent] = field(default_factory=list)
-    prod_cfg: ProductionConfig = field(default_factory=ProductionConfig)
-    prod_state: ProductionState = field(default_factory=ProductionState)
+    prod_cfg: ProductionConfig = field(default_factory=lazy_factory("dosadi.runtime.production_runtime:ProductionConfig"))
+    prod_state: ProductionState = field(default_factory=lazy_factory("dosadi.runtime.production_runtime:ProductionState"))
     fac_prod: dict[str, FacilityProductionState] = field(default_factory=dict)
     mat_cfg: object | None = None
     mat_state: object | None = None
     construction_cfg: object | None = None
-    extraction: ExtractionLedger = field(default_factory=ExtractionLedger)
-    risk_cfg: CorridorRiskConfig = field(default_factory=CorridorRiskConfig)
-    risk_ledger: CorridorRiskLedger = field(default_factory=CorridorRiskLedger)
-    corridor_cascade_cfg: CorridorCascadeConfig = field(default_factory=CorridorCascadeConfig)
-    corridor_cascade: CorridorCascadeLedger = field(default_factory=CorridorCascadeLedger)
-    escort2_cfg: EscortPolicyV2Config = field(default_factory=EscortPolicyV2Config)
-    escort2_state: EscortPolicyV2State = field(default_factory=EscortPolicyV2State)
-    extract_cfg: ExtractionConfig = field(default_factory=ExtractionConfig)
-    faction_cfg: FactionSystemConfig = field(default_factory=FactionSystemConfig)
-    faction_state: FactionSystemState = field(default_factory=FactionSystemState)
+    extraction: ExtractionLedger = field(default_factory=lazy_factory("dosadi.world.extraction:ExtractionLedger"))
+    risk_cfg: CorridorRiskConfig = field(default_factory=lazy_factory("dosadi.runtime.corridor_risk:CorridorRiskConfig"))
+    risk_ledger: CorridorRiskLedger = field(default_factory=lazy_factory("dosadi.runtime.corridor_risk:CorridorRiskLedger"))
+    corridor_cascade_cfg: CorridorCascadeConfig = field(default_factory=lazy_factory("dosadi.runtime.corridor_cascade:CorridorCascadeConfig"))
+    corridor_cascade: CorridorCascadeLedger = field(default_factory=lazy_factory("dosadi.runtime.corridor_cascade:CorridorCascadeLedger"))
+    escort2_cfg: EscortPolicyV2Config = field(default_factory=lazy_factory("dosadi.runtime.escort_policy_v2:EscortPolicyV2Config"))
+    escort2_state: EscortPolicyV2State = field(default_factory=lazy_factory("dosadi.runtime.escort_policy_v2:EscortPolicyV2State"))
+    extract_cfg: ExtractionConfig = field(default_factory=lazy_factory("dosadi.runtime.extraction_runtime:ExtractionConfig"))
+    faction_cfg: FactionSystemConfig = field(default_factory=lazy_factory("dosadi.world.factions:FactionSystemConfig"))
+    faction_state: FactionSystemState = field(default_factory=lazy_factory("dosadi.world.factions:FactionSystemState"))
     faction_territory: dict[str, FactionTerritory] = field(default_factory=dict)
-    extract_state: ExtractionState = field(default_factory=ExtractionState)
+    extract_state: ExtractionState = field(default_factory=lazy_factory("dosadi.runtime.extraction_runtime:ExtractionState"))
     tech_cfg: object | None = None
     tech_state: object | None = None
-    smuggling_cfg: SmugglingConfig = field(default_factory=SmugglingConfig)
+    smuggling_cfg: SmugglingConfig = field(default_factory=lazy_factory("dosadi.runtime.smuggling:SmugglingConfig"))
     smuggling_by_faction: dict[str, SmugglingNetworkState] = field(default_factory=dict)
-    war_cfg: WarConfig = field(default_factory=WarConfig)
+    war_cfg: WarConfig = field(default_factory=lazy_factory("dosadi.runtime.war:WarConfig"))
     raid_active: dict[str, RaidPlan] = field(default_factory=dict)
     raid_history: list[RaidOutcome] = field(default_factory=list)
     corridor_stress: dict[str, float] = field(default_factory=dict)
     collapsed_corridors: set[str] = field(default_factory=set)
-    espionage_cfg: EspionageConfig = field(default_factory=EspionageConfig)
+    espionage_cfg: EspionageConfig = field(default_factory=lazy_factory("dosadi.runtime.espionage:EspionageConfig"))
     intel_ops_active: dict[str, IntelOpPlan] = field(default_factory=dict)
     intel_ops_history: list[IntelOpOutcome] = field(default_factory=list)
     counterintel_by_ward: dict[str, float] = field(default_factory=dict)
-    defense_cfg: DefenseConfig = field(default_factory=DefenseConfig)
+    defense_cfg: DefenseConfig = field(default_factory=lazy_factory("dosadi.runtime.defense:DefenseConfig"))
     ward_defense: dict[str, WardDefenseState] = field(default_factory=dict)
     deterrence_cfg: object | None = None
     relationships: dict[str, object] = field(default_factory=dict)
     sanctions_cfg: Any = None
     sanction_rules: dict[str, Any] = field(default_factory=dict)
+    sanction_rules_revision: int = 0
     sanctions_compliance: dict[str, Any] = field(default_factory=dict)
     sanctions_events: list[dict[str, object]] = field(default_factory=list)
-    fed_cfg: FederationConfig = field(default_factory=FederationConfig)
+    memory_budget_cfg: Any = None
+    memory_budget_state: Any = None
+    fed_cfg: FederationConfig = field(default_factory=lazy_factory("dosadi.runtime.trade_federations:FederationConfig"))
     federations: dict[str, Federation] = field(default_factory=dict)
     cartels: dict[str, CartelAgreement] = field(default_factory=dict)
     cartel_compliance: dict[tuple[str, str], CartelCompliance] = field(default_factory=dict)
@@ -1107,25 +1137,25 @@ class WorldState:
     leadership_cfg: Any = None
     leadership_by_polity: dict[str, Any] = field(default_factory=dict)
     succession_events: list[object] = field(default_factory=list)
-    constitution_cfg: ConstitutionConfig = field(default_factory=ConstitutionConfig)
+    constitution_cfg: ConstitutionConfig = field(default_factory=lazy_factory("dosadi.runtime.constitution:ConstitutionConfig"))
     settlements: dict[str, Settlement] = field(default_factory=dict)
     constitution_by_polity: dict[str, ConstitutionState] = field(default_factory=dict)
     constitution_events: list[ConstitutionalEvent] = field(default_factory=list)
-    truth_cfg: TruthConfig = field(default_factory=TruthConfig)
+    truth_cfg: TruthConfig = field(default_factory=lazy_factory("dosadi.runtime.truth_regimes:TruthConfig"))
     integrity_by_polity: dict[str, IntegrityState] = field(default_factory=dict)
     integrity_by_ward: dict[str, IntegrityState] = field(default_factory=dict)
     truth_events: list[TruthEvent] = field(default_factory=list)
-    archives_cfg: ArchivesConfig = field(default_factory=ArchivesConfig)
+    archives_cfg: ArchivesConfig = field(default_factory=lazy_factory("dosadi.runtime.archives:ArchivesConfig"))
     archive_by_polity: dict[str, ArchiveState] = field(default_factory=dict)
     narrative_by_polity: dict[str, NarrativeState] = field(default_factory=dict)
     canon_events: dict[str, list[CanonEvent]] = field(default_factory=dict)
     counter_narratives: dict[str, list[CounterNarrative]] = field(default_factory=dict)
-    shadow_cfg: ShadowStateConfig = field(default_factory=ShadowStateConfig)
+    shadow_cfg: ShadowStateConfig = field(default_factory=lazy_factory("dosadi.runtime.shadow_state:ShadowStateConfig"))
     influence_edges_by_ward: dict[str, list[InfluenceEdge]] = field(default_factory=dict)
     shadow_accounts: dict[str, ShadowAccount] = field(default_factory=dict)
     corruption_by_ward: dict[str, CorruptionIndex] = field(default_factory=dict)
     shadow_events: list[dict[str, object]] = field(default_factory=list)
-    mobility_cfg: MobilityConfig = field(default_factory=MobilityConfig)
+    mobility_cfg: MobilityConfig = field(default_factory=lazy_factory("dosadi.runtime.mobility:MobilityConfig"))
     mobility_by_polity: dict[str, PolityMobilityState] = field(default_factory=dict)
     mobility_events: list[MobilityEvent] = field(default_factory=list)
 
@@ -1142,6 +1172,10 @@ class WorldState:
         self.next_goal_seq += 1
         return f"{prefix}:{self.next_goal_seq}"
 
+    def next_episode_id(self, prefix: str = "ep") -> str:
+        self.next_episode_seq += 1
+        return f"{prefix}:{self.next_episode_seq}"
+
     def register_goal(self, goal: "Goal") -> None:
         self.goals[goal.goal_id] = goal
         owner_list = self.goals_by_owner.setdefault(goal.owner_id, [])
@@ -1235,6 +1269,145 @@ def _clamp01(value: float) -> float:
     return _clamp(0.0, 1.0, value)
 
 
+# Names that used to be imported eagerly from subsystem modules remain available
+# as ``dosadi.state.<Name>``; they are resolved on first access.
+_LAZY_EXPORTS = {
+    "FacilityLedger": "dosadi.world.facilities:FacilityLedger",
+    "LogisticsConfig": "dosadi.world.logistics:LogisticsConfig",
+    "LogisticsLedger": "dosadi.world.logistics:LogisticsLedger",
+    "ScoutMissionLedger": "dosadi.world.scout_missions:ScoutMissionLedger",
+    "CouncilMetrics": "dosadi.runtime.council_metrics:CouncilMetrics",
+    "CouncilStaffingConfig": "dosadi.runtime.council_metrics:CouncilStaffingConfig",
+    "EscortConfig": "dosadi.runtime.escort_protocols:EscortConfig",
+    "EscortState": "dosadi.runtime.escort_protocols:EscortState",
+    "StaffingConfig": "dosadi.runtime.staffing:StaffingConfig",
+    "StaffingState": "dosadi.runtime.staffing:StaffingState",
+    "FacilityStaffing": "dosadi.runtime.workforce:FacilityStaffing",
+    "WardWorkforcePools": "dosadi.runtime.workforce:WardWorkforcePools",
+    "WorkforceConfig": "dosadi.runtime.workforce:WorkforceConfig",
+    "DepotPolicyLedger": "dosadi.runtime.stockpile_policy:DepotPolicyLedger",
+    "StockpilePolicyConfig": "dosadi.runtime.stockpile_policy:StockpilePolicyConfig",
+    "StockpilePolicyState": "dosadi.runtime.stockpile_policy:StockpilePolicyState",
+    "RaidOutcome": "dosadi.runtime.war:RaidOutcome",
+    "RaidPlan": "dosadi.runtime.war:RaidPlan",
+    "WarConfig": "dosadi.runtime.war:WarConfig",
+    "IncidentConfig": "dosadi.runtime.incident_engine:IncidentConfig",
+    "IncidentState": "dosadi.runtime.incident_engine:IncidentState",
+    "KPIStore": "dosadi.runtime.kpis:KPIStore",
+    "EvidenceBuffer": "dosadi.runtime.evidence:EvidenceBuffer",
+    "EvidenceConfig": "dosadi.runtime.evidence:EvidenceConfig",
+    "MobilityConfig": "dosadi.runtime.mobility:MobilityConfig",
+    "MobilityEvent": "dosadi.runtime.mobility:MobilityEvent",
+    "PolityMobilityState": "dosadi.runtime.mobility:PolityMobilityState",
+    "InstitutionConfig": "dosadi.runtime.institutions:InstitutionConfig",
+    "WardInstitutionPolicy": "dosadi.runtime.institutions:WardInstitutionPolicy",
+    "WardInstitutionState": "dosadi.runtime.institutions:WardInstitutionState",
+    "ClassConfig": "dosadi.runtime.class_system:ClassConfig",
+    "WardClassState": "dosadi.runtime.class_system:WardClassState",
+    "CorridorRiskConfig": "dosadi.runtime.corridor_risk:CorridorRiskConfig",
+    "CorridorRiskLedger": "dosadi.runtime.corridor_risk:CorridorRiskLedger",
+    "CorridorCascadeConfig": "dosadi.runtime.corridor_cascade:CorridorCascadeConfig",
+    "CorridorCascadeLedger": "dosadi.runtime.corridor_cascade:CorridorCascadeLedger",
+    "ConstitutionConfig": "dosadi.runtime.constitution:ConstitutionConfig",
+    "ConstitutionalEvent": "dosadi.runtime.constitution:ConstitutionalEvent",
+    "ConstitutionState": "dosadi.runtime.constitution:ConstitutionState",
+    "Settlement": "dosadi.runtime.constitution:Settlement",
+    "MediaConfig": "dosadi.runtime.media:MediaConfig",
+    "MediaMessage": "dosadi.runtime.media:MediaMessage",
+    "CommsConfig": "dosadi.runtime.comms:CommsConfig",
+    "CommsModifiers": "dosadi.runtime.comms:CommsModifiers",
+    "CommsNodeState": "dosadi.runtime.comms:CommsNodeState",
+    "EspionageConfig": "dosadi.runtime.espionage:EspionageConfig",
+    "IntelOpOutcome": "dosadi.runtime.espionage:IntelOpOutcome",
+    "IntelOpPlan": "dosadi.runtime.espionage:IntelOpPlan",
+    "CultureConfig": "dosadi.runtime.culture_wars:CultureConfig",
+    "WardCultureState": "dosadi.runtime.culture_wars:WardCultureState",
+    "EducationConfig": "dosadi.runtime.education:EducationConfig",
+    "WardEducationState": "dosadi.runtime.education:WardEducationState",
+    "UrbanConfig": "dosadi.runtime.urban:UrbanConfig",
+    "WardUrbanState": "dosadi.runtime.urban:WardUrbanState",
+    "CorridorInfraConfig": "dosadi.world.corridor_infrastructure:CorridorInfraConfig",
+    "CorridorInfraEdge": "dosadi.world.corridor_infrastructure:CorridorInfraEdge",
+    "EscortPolicyV2Config": "dosadi.runtime.escort_policy_v2:EscortPolicyV2Config",
+    "EscortPolicyV2State": "dosadi.runtime.escort_policy_v2:EscortPolicyV2State",
+    "MigrationConfig": "dosadi.runtime.migration:MigrationConfig",
+    "MigrationFlow": "dosadi.runtime.migration:MigrationFlow",
+    "WardMigrationState": "dosadi.runtime.migration:WardMigrationState",
+    "DemographicEvent": "dosadi.runtime.demographics:DemographicEvent",
+    "DemographicsConfig": "dosadi.runtime.demographics:DemographicsConfig",
+    "PolityDemographics": "dosadi.runtime.demographics:PolityDemographics",
+    "DefenseConfig": "dosadi.runtime.defense:DefenseConfig",
+    "WardDefenseState": "dosadi.runtime.defense:WardDefenseState",
+    "MarketSignalsConfig": "dosadi.runtime.market_signals:MarketSignalsConfig",
+    "MarketSignalsState": "dosadi.runtime.market_signals:MarketSignalsState",
+    "FacilityProductionState": "dosadi.runtime.production_runtime:FacilityProductionState",
+    "ProductionConfig": "dosadi.runtime.production_runtime:ProductionConfig",
+    "ProductionState": "dosadi.runtime.production_runtime:ProductionState",
+    "SmugglingConfig": "dosadi.runtime.smuggling:SmugglingConfig",
+    "SmugglingNetworkState": "dosadi.runtime.smuggling:SmugglingNetworkState",
+    "PolicingConfig": "dosadi.runtime.policing:PolicingConfig",
+    "WardPolicingState": "dosadi.runtime.policing:WardPolicingState",
+    "ArchivesConfig": "dosadi.runtime.archives:ArchivesConfig",
+    "ArchiveState": "dosadi.runtime.archives:ArchiveState",
+    "CanonEvent": "dosadi.runtime.archives:CanonEvent",
+    "CounterNarrative": "dosadi.runtime.archives:CounterNarrative",
+    "NarrativeState": "dosadi.runtime.archives:NarrativeState",
+    "MandateSystemConfig": "dosadi.runtime.mandates:MandateSystemConfig",
+    "MandateSystemState": "dosadi.runtime.mandates:MandateSystemState",
+    "FactionSystemConfig": "dosadi.world.factions:FactionSystemConfig",
+    "FactionSystemState": "dosadi.world.factions:FactionSystemState",
+    "FactionTerritory": "dosadi.world.factions:FactionTerritory",
+    "Faction": "dosadi.world.factions:Faction",
+    "DiscoveryConfig": "dosadi.world.discovery:DiscoveryConfig",
+    "ExtractionLedger": "dosadi.world.extraction:ExtractionLedger",
+    "ProjectLedger": "dosadi.world.construction:ProjectLedger",
+    "ExpansionPlannerConfig": "dosadi.world.expansion_planner:ExpansionPlannerConfig",
+    "ExpansionPlannerState": "dosadi.world.expansion_planner:ExpansionPlannerState",
+    "InventoryRegistry": "dosadi.world.materials:InventoryRegistry",
+    "WaterAccessConfig": "dosadi.world.water_access:WaterAccessConfig",
+    "WaterAccessLedger": "dosadi.world.water_access:WaterAccessLedger",
+    "WorkforceLedger": "dosadi.world.workforce:WorkforceLedger",
+    "IncidentLedger": "dosadi.world.incidents:IncidentLedger",
+    "FocusConfig": "dosadi.runtime.focus_mode:FocusConfig",
+    "FocusState": "dosadi.runtime.focus_mode:FocusState",
+    "ExtractionConfig": "dosadi.runtime.extraction_runtime:ExtractionConfig",
+    "ExtractionState": "dosadi.runtime.extraction_runtime:ExtractionState",
+    "MaintenanceConfig": "dosadi.runtime.maintenance:MaintenanceConfig",
+    "MaintenanceLedger": "dosadi.runtime.maintenance:MaintenanceLedger",
+    "MaintenanceState": "dosadi.runtime.maintenance:MaintenanceState",
+    "InterferenceConfig": "dosadi.runtime.faction_interference:InterferenceConfig",
+    "InterferenceState": "dosadi.runtime.faction_interference:InterferenceState",
+    "SuitRepairLedger": "dosadi.runtime.suit_wear:SuitRepairLedger",
+    "SuitWearConfig": "dosadi.runtime.suit_wear:SuitWearConfig",
+    "SuitWearState": "dosadi.runtime.suit_wear:SuitWearState",
+    "LedgerConfig": "dosadi.runtime.ledger:LedgerConfig",
+    "LedgerState": "dosadi.runtime.ledger:LedgerState",
+    "CorruptionIndex": "dosadi.runtime.shadow_state:CorruptionIndex",
+    "InfluenceEdge": "dosadi.runtime.shadow_state:InfluenceEdge",
+    "ShadowAccount": "dosadi.runtime.shadow_state:ShadowAccount",
+    "ShadowStateConfig": "dosadi.runtime.shadow_state:ShadowStateConfig",
+    "FinanceConfig": "dosadi.runtime.finance:FinanceConfig",
+    "Loan": "dosadi.runtime.finance:Loan",
+    "Patronage": "dosadi.runtime.finance:Patronage",
+    "CartelAgreement": "dosadi.runtime.trade_federations:CartelAgreement",
+    "CartelCompliance": "dosadi.runtime.trade_federations:CartelCompliance",
+    "Federation": "dosadi.runtime.trade_federations:Federation",
+    "FederationConfig": "dosadi.runtime.trade_federations:FederationConfig",
+    "IntegrityState": "dosadi.runtime.truth_regimes:IntegrityState",
+    "TruthConfig": "dosadi.runtime.truth_regimes:TruthConfig",
+    "TruthEvent": "dosadi.runtime.truth_regimes:TruthEvent",
+    "CareerConfig": "dosadi.runtime.careers:CareerConfig",
+    "ContractConfig": "dosadi.runtime.success_contracts:ContractConfig",
+    "ContractRuntimeState": "dosadi.runtime.success_contracts:ContractRuntimeState",
+    "SuccessContract": "dosadi.runtime.success_contracts:SuccessContract",
+    "BargainingEvent": "dosadi.runtime.labor:BargainingEvent",
+    "LaborConfig": "dosadi.runtime.labor:LaborConfig",
+    "LaborOrgState": "dosadi.runtime.labor:LaborOrgState",
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_EXPORTS)
+
+
 __all__ = [
     "AgentState",
     "CaseState",
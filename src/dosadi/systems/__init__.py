@@ -1,6 +1,7 @@
 """Protocol subsystem utilities for the Founding Wakeup MVP."""
 
 from .protocols import (
+    HazardEnvelope,
     Protocol,
     ProtocolAdoptionMetrics,
     ProtocolRegistry,
@@ -14,6 +15,7 @@ from .protocols import (
 )
 
 __all__ = [
+    "HazardEnvelope",
     "Protocol",
     "ProtocolAdoptionMetrics",
     "ProtocolRegistry",
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from dosadi.agents.core import AgentState, Episode, Goal
@@ -83,6 +84,61 @@ class Protocol:
 
     adoption: Optional[ProtocolAdoptionMetrics] = None
 
+    def complies(self, group_size: int) -> bool:
+        size_ok = group_size >= self.min_group_size
+        if self.max_group_size is not None:
+            size_ok = size_ok and group_size <= self.max_group_size
+        return size_ok
+
+
+def _protocol_multiplier(protocols: List[Protocol], group_size: int) -> float:
+    """MVP rule: the strongest compliant reduction wins, else the worst violation."""
+
+    compliant_multipliers: List[float] = []
+    violated_multipliers: List[float] = []
+
+    for p in protocols:
+        if p.complies(group_size):
+            compliant_multipliers.append(p.compliant_hazard_multiplier)
+        else:
+            violated_multipliers.append(p.violation_hazard_multiplier)
+
+    if compliant_multipliers:
+        return min(compliant_multipliers)
+    if violated_multipliers:
+        return max(violated_multipliers)
+    return 1.0
+
+
+@dataclass(frozen=True)
+class HazardEnvelope:
+    """Protocol hazard multiplier for one location as a step function of group size.
+
+    ``multipliers[i]`` applies to group sizes in ``[breakpoints[i - 1],
+    breakpoints[i])``; ``multipliers[0]`` covers sizes below the first
+    breakpoint.
+    """
+
+    breakpoints: Tuple[int, ...]
+    multipliers: Tuple[float, ...]
+
+    @classmethod
+    def build(cls, protocols: List[Protocol]) -> "HazardEnvelope":
+        points = set()
+        for p in protocols:
+            points.add(p.min_group_size)
+            if p.max_group_size is not None:
+                points.add(p.max_group_size + 1)
+        breakpoints = tuple(sorted(points))
+        samples = [breakpoints[0] - 1, *breakpoints]
+        return cls(
+            breakpoints=breakpoints,
+            multipliers=tuple(_protocol_multiplier(protocols, size) for size in samples),
+        )
+
+    def multiplier(self, group_size: int) -> float:
+        return self.multipliers[bisect_right(self.breakpoints, group_size)]
+
 
 def make_protocol_id(prefix: str = "protocol") -> str:
     return f"{prefix}:{uuid.uuid4().hex}"
@@ -94,8 +150,48 @@ class ProtocolRegistry:
 
     protocols_by_id: Dict[str, Protocol] = field(default_factory=dict)
 
+    # The location index is derived state: it is kept off the dataclass fields
+    # (so snapshots stay unchanged) together with the registry revision that
+    # add_protocol() and set_status() bump, and rebuilt when that moves.
+
+    def _bump_revision(self) -> None:
+        self._revision = getattr(self, "_revision", 0) + 1
+
     def add_protocol(self, protocol: Protocol) -> None:
         self.protocols_by_id[protocol.protocol_id] = protocol
+        self._bump_revision()
+
+    def set_status(self, protocol: Protocol, status: ProtocolStatus) -> None:
+        """Transition ``protocol`` to ``status`` and refresh the location index."""
+
+        if protocol.status != status:
+            protocol.status = status
+            self._bump_revision()
+
+    def reindex(self) -> None:
+        """Rebuild the location index.
+
+        Needed only after editing a registered protocol's status, coverage,
+        group sizes or multipliers directly instead of through the registry.
+        """
+
+        active: Dict[str, List[Protocol]] = {}
+        for p in self.protocols_by_id.values():
+            if p.status != ProtocolStatus.ACTIVE:
+                continue
+            for location_id in dict.fromkeys(p.covered_location_ids):
+                active.setdefault(location_id, []).append(p)
+        self._active_by_location = active
+        self._envelopes = {location_id: HazardEnvelope.build(protos) for location_id, protos in active.items()}
+        self._index_key = (getattr(self, "_revision", 0), len(self.protocols_by_id))
+
+    def _ensure_index(self) -> None:
+        if getattr(self, "_index_key", None) != (getattr(self, "_revision", 0), len(self.protocols_by_id)):
+            self.reindex()
+
+    def hazard_envelope(self, location_id: str) -> Optional[HazardEnvelope]:
+        self._ensure_index()
+        return self._envelopes.get(location_id)
 
     def get(self, protocol_id: str) -> Optional[Protocol]:
         return self.protocols_by_id.get(protocol_id)
@@ -104,12 +200,8 @@ class ProtocolRegistry:
         return self.protocols_by_id.values()
 
     def active_protocols_for_location(self, location_id: str) -> List[Protocol]:
-        return [
-            p
-            for p in self.protocols_by_id.values()
-            if p.status == ProtocolStatus.ACTIVE
-            and location_id in p.covered_location_ids
-        ]
+        self._ensure_index()
+        return list(self._active_by_location.get(location_id, ()))
 
 
 # ---------------------------------------------------------------------------
@@ -166,10 +258,13 @@ def create_movement_protocol_from_goal(
     return protocol
 
 
-def activate_protocol(protocol: Protocol, tick: int) -> None:
+def activate_protocol(protocol: Protocol, tick: int, registry: Optional[ProtocolRegistry] = None) -> None:
     """Mark a protocol as ACTIVE and stamp activated_at_tick."""
 
-    protocol.status = ProtocolStatus.ACTIVE
+    if registry is not None:
+        registry.set_status(protocol, ProtocolStatus.ACTIVE)
+    else:
+        protocol.status = ProtocolStatus.ACTIVE
     protocol.activated_at_tick = tick
 
 
@@ -238,42 +333,23 @@ def compute_effective_hazard_prob(
 ) -> float:
     """Return the effective per-traversal hazard probability for movement.
 
-    - Looks up ACTIVE protocols covering location_id.
-    - Computes a protocol multiplier according to MVP rules.
-    - Returns base_hazard_prob * multiplier.
+    - Looks up the precomputed multiplier envelope of the ACTIVE protocols
+      covering location_id (see HazardEnvelope).
+    - Returns base_hazard_prob * multiplier for the group size.
     """
 
     if registry is None:
         return base_hazard_prob
 
-    applicable = registry.active_protocols_for_location(location_id)
-    if not applicable:
+    envelope = registry.hazard_envelope(location_id)
+    if envelope is None:
         return base_hazard_prob
 
-    compliant_multipliers: List[float] = []
-    violated_multipliers: List[float] = []
-
-    for p in applicable:
-        size_ok = group_size >= p.min_group_size
-        if p.max_group_size is not None:
-            size_ok = size_ok and group_size <= p.max_group_size
-
-        if size_ok:
-            compliant_multipliers.append(p.compliant_hazard_multiplier)
-        else:
-            violated_multipliers.append(p.violation_hazard_multiplier)
-
-    if compliant_multipliers:
-        multiplier = min(compliant_multipliers)
-    elif violated_multipliers:
-        multiplier = max(violated_multipliers)
-    else:
-        multiplier = 1.0
-
-    return base_hazard_prob * multiplier
+    return base_hazard_prob * envelope.multiplier(group_size)
 
 
 __all__ = [
+    "HazardEnvelope",
     "Protocol",
     "ProtocolAdoptionMetrics",
     "ProtocolRegistry",
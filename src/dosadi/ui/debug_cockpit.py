@@ -9,7 +9,7 @@ from dosadi.runtime.evidence import ensure_evidence_buffer, get_top_evidence
 from dosadi.runtime.success_contracts import MilestoneStatus, ensure_contract_state
 from dosadi.world.construction import ProjectStatus
 from dosadi.world.facilities import FacilityKind, ensure_facility_ledger
-from dosadi.world.logistics import DeliveryStatus, ensure_logistics
+from dosadi.world.logistics import OPEN_DELIVERY_STATUSES, ensure_logistics
 from dosadi.world.scout_missions import ScoutMissionLedger
 
 
@@ -102,16 +102,7 @@ def _recent_events(ring: EventRing, *, limit: int = 10) -> list[str]:
 
 def _logistics_health(world, telemetry: Metrics) -> list[str]:
     logistics = ensure_logistics(world)
-    active_deliveries = [
-        logistics.deliveries[delivery_id]
-        for delivery_id in sorted(logistics.active_ids)
-        if delivery_id in logistics.deliveries
-    ]
-    active = [
-        d
-        for d in active_deliveries
-        if d.status not in {DeliveryStatus.DELIVERED, DeliveryStatus.CANCELED, DeliveryStatus.FAILED}
-    ]
+    active = logistics.with_status(*OPEN_DELIVERY_STATUSES)
     requested = int(telemetry.counters.get("stockpile.deliveries_requested", 0))
     completed = int(telemetry.counters.get("stockpile.deliveries_completed", 0))
     lines = [
@@ -273,11 +264,7 @@ class DebugCockpitCLI:
                 if project.status not in {ProjectStatus.COMPLETE, ProjectStatus.CANCELED}
             )
         logistics = ensure_logistics(world)
-        active_deliveries = [
-            d
-            for d in logistics.deliveries.values()
-            if d.status not in {DeliveryStatus.DELIVERED, DeliveryStatus.CANCELED, DeliveryStatus.FAILED}
-        ]
+        active_deliveries = logistics.with_status(*OPEN_DELIVERY_STATUSES)
         scouts = getattr(world, "scout_missions", ScoutMissionLedger())
         active_scouts = len(getattr(scouts, "missions", {})) if hasattr(scouts, "missions") else 0
         shortages = telemetry.gauges.get("stockpile.shortages_count", 0)
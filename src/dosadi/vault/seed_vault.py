@@ -4,26 +4,33 @@ import json
 from dataclasses import asdict
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Dict, List, Mapping
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping
 
 from dosadi.runtime.snapshot import (
     WorldSnapshotV1,
+    encode_snapshot,
     load_snapshot,
     restore_world,
-    save_snapshot,
     snapshot_world,
+    write_snapshot_payload,
+)
+from dosadi.runtime.subsystems import subsystem
+
+if TYPE_CHECKING:
+    from dosadi.runtime.background_writer import BackgroundWriter
+
+# (manifest key, file name, subsystem writer). Writers are imported on first save.
+SEED_SIDECARS: tuple[tuple[str, str, str], ...] = (
+    ("institutions", "institutions.json", "seed.institutions"),
+    ("culture", "culture.json", "seed.culture"),
+    ("ledger", "ledger_accounts.json", "seed.ledger"),
+    ("finance", "finance.json", "seed.finance"),
+    ("treaties", "treaties.json", "seed.treaties"),
+    ("smuggling", "smuggling.json", "seed.smuggling"),
+    ("migration", "migration.json", "seed.migration"),
+    ("policing", "policing.json", "seed.policing"),
+    ("archives", "archives.json", "seed.archives"),
 )
-from dosadi.runtime.institutions import save_institutions_seed
-from dosadi.runtime.culture_wars import save_culture_seed
-from dosadi.runtime.ledger import save_ledger_seed
-from dosadi.runtime.treaties import save_treaties_seed
-from dosadi.runtime.smuggling import save_smuggling_seed
-from dosadi.runtime.policing import save_policing_seed
-from dosadi.runtime.migration import save_migration_seed
-from dosadi.runtime.finance import save_finance_seed
-from dosadi.runtime.archives import save_archives_seed
-from dosadi.runtime.scorecards import compute_scorecard
-from dosadi.testing.kpis import collect_kpis
 
 
 def _manifest_path(vault_dir: Path) -> Path:
@@ -45,8 +52,10 @@ def load_manifest(vault_dir: Path) -> Dict[str, Any]:
 def write_manifest(vault_dir: Path, manifest: Mapping[str, Any]) -> None:
     path = _manifest_path(vault_dir)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fp:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as fp:
         json.dump(manifest, fp, indent=2, sort_keys=True)
+    tmp_path.replace(path)
 
 
 def list_seeds(vault_dir: Path) -> List[Dict[str, Any]]:
@@ -55,7 +64,7 @@ def list_seeds(vault_dir: Path) -> List[Dict[str, Any]]:
 
 
 def _compute_kpis(world) -> Dict[str, Any]:
-    return collect_kpis(world)
+    return subsystem("seed.kpis")(world)
 
 
 def save_seed(
@@ -65,33 +74,27 @@ def save_seed(
     seed_id: str,
     scenario_id: str,
     meta: Dict[str, Any] | None = None,
+    writer: "BackgroundWriter | None" = None,
 ) -> Dict[str, Any]:
-    manifest = load_manifest(vault_dir)
-    manifest.setdefault("seeds", [])
+    """Snapshot ``world`` into the vault and record it in the manifest.
+
+    With a ``writer``, only the world capture, sidecars, scorecard and KPIs
+    run on the calling thread; encoding, hashing, compression and the
+    manifest update happen on the writer thread. The manifest only ever
+    references fully written snapshots, and the returned entry's
+    ``snapshot_sha256`` is filled in once the write completes (call
+    ``writer.flush()`` to wait for it).
+    """
 
     snapshot = snapshot_world(world, scenario_id=scenario_id)
     snapshot_path = _snapshots_dir(vault_dir) / f"{seed_id}.json.gz"
-    snapshot_sha = save_snapshot(snapshot, snapshot_path, gzip_output=True)
-    inst_path = vault_dir / "seeds" / seed_id / "institutions.json"
-    save_institutions_seed(world, inst_path)
-    culture_path = vault_dir / "seeds" / seed_id / "culture.json"
-    save_culture_seed(world, culture_path)
-    ledger_path = vault_dir / "seeds" / seed_id / "ledger_accounts.json"
-    save_ledger_seed(world, ledger_path)
-    finance_path = vault_dir / "seeds" / seed_id / "finance.json"
-    save_finance_seed(world, finance_path)
-    treaties_path = vault_dir / "seeds" / seed_id / "treaties.json"
-    save_treaties_seed(world, treaties_path)
-    smuggling_path = vault_dir / "seeds" / seed_id / "smuggling.json"
-    save_smuggling_seed(world, smuggling_path)
-    migration_path = vault_dir / "seeds" / seed_id / "migration.json"
-    save_migration_seed(world, migration_path)
-    policing_path = vault_dir / "seeds" / seed_id / "policing.json"
-    save_policing_seed(world, policing_path)
-    archives_path = vault_dir / "seeds" / seed_id / "archives.json"
-    save_archives_seed(world, archives_path)
-
-    scorecard = compute_scorecard(world)
+    sidecar_paths: List[tuple[str, Path]] = []
+    for key, filename, sidecar_writer in SEED_SIDECARS:
+        path = vault_dir / "seeds" / seed_id / filename
+        subsystem(sidecar_writer)(world, path)
+        sidecar_paths.append((key, path))
+
+    scorecard = subsystem("seed.scorecard")(world)
     entry = {
         "seed_id": seed_id,
         "scenario_id": scenario_id,
@@ -99,42 +102,38 @@ def save_seed(
         "created_tick": snapshot.tick,
         "elapsed_ticks": snapshot.tick,
         "snapshot_path": str(snapshot_path.relative_to(vault_dir)),
-        "snapshot_sha256": snapshot_sha,
-        "kpis": collect_kpis(world),
+        "snapshot_sha256": None,
+        "kpis": _compute_kpis(world),
         "scorecard": asdict(scorecard),
     }
-    if inst_path.exists():
-        entry["institutions_path"] = str(inst_path.relative_to(vault_dir))
-        entry["institutions_sha256"] = sha256(inst_path.read_bytes()).hexdigest()
-    if culture_path.exists():
-        entry["culture_path"] = str(culture_path.relative_to(vault_dir))
-        entry["culture_sha256"] = sha256(culture_path.read_bytes()).hexdigest()
-    if ledger_path.exists():
-        entry["ledger_path"] = str(ledger_path.relative_to(vault_dir))
-        entry["ledger_sha256"] = sha256(ledger_path.read_bytes()).hexdigest()
-    if finance_path.exists():
-        entry["finance_path"] = str(finance_path.relative_to(vault_dir))
-        entry["finance_sha256"] = sha256(finance_path.read_bytes()).hexdigest()
-    if treaties_path.exists():
-        entry["treaties_path"] = str(treaties_path.relative_to(vault_dir))
-        entry["treaties_sha256"] = sha256(treaties_path.read_bytes()).hexdigest()
-    if smuggling_path.exists():
-        entry["smuggling_path"] = str(smuggling_path.relative_to(vault_dir))
-        entry["smuggling_sha256"] = sha256(smuggling_path.read_bytes()).hexdigest()
-    if policing_path.exists():
-        entry["policing_path"] = str(policing_path.relative_to(vault_dir))
-        entry["policing_sha256"] = sha256(policing_path.read_bytes()).hexdigest()
-    if archives_path.exists():
-        entry["archives_path"] = str(archives_path.relative_to(vault_dir))
-        entry["archives_sha256"] = sha256(archives_path.read_bytes()).hexdigest()
     if meta:
         entry.update({k: v for k, v in meta.items() if k not in entry})
 
+    if writer is None:
+        _write_seed(vault_dir, snapshot, snapshot_path, entry, sidecar_paths)
+    else:
+        writer.submit(_write_seed, vault_dir, snapshot, snapshot_path, entry, sidecar_paths)
+    return entry
+
+
+def _write_seed(
+    vault_dir: Path,
+    snapshot: WorldSnapshotV1,
+    snapshot_path: Path,
+    entry: Dict[str, Any],
+    sidecar_paths: List[tuple[str, Path]],
+) -> None:
+    entry["snapshot_sha256"] = write_snapshot_payload(encode_snapshot(snapshot), snapshot_path, gzip_output=True)
+    for key, path in sidecar_paths:
+        if path.exists():
+            entry[f"{key}_path"] = str(path.relative_to(vault_dir))
+            entry[f"{key}_sha256"] = sha256(path.read_bytes()).hexdigest()
+
+    manifest = load_manifest(vault_dir)
     manifest["schema"] = manifest.get("schema", "seed_vault_v1")
-    manifest["seeds"] = [s for s in manifest["seeds"] if s.get("seed_id") != seed_id]
-    manifest["seeds"].append(entry)
+    manifest["seeds"] = [s for s in manifest.get("seeds", []) if s.get("seed_id") != entry["seed_id"]]
+    manifest["seeds"].append(dict(entry))
     write_manifest(vault_dir, manifest)
-    return entry
 
 
 def load_seed(vault_dir: Path, *, seed_id: str):
@@ -151,6 +150,7 @@ def load_seed(vault_dir: Path, *, seed_id: str):
 
 
 __all__ = [
+    "SEED_SIDECARS",
     "list_seeds",
     "load_manifest",
     "load_seed",
@@ -0,0 +1,382 @@
+"""Append-only, columnar on-disk archive for evicted world events.
+
+``WorldEventLog`` keeps a bounded in-memory ring. When an archive is attached,
+events that fall out of the ring are buffered here and written as immutable
+segment files once ``segment_size`` events have accumulated (or on
+``flush()``). Segments are memory-mapped for reads and indexed by sequence
+number and day, so ``WorldEventLog.since`` can backfill older history without
+holding it in memory.
+
+Segment layout (little-endian)::
+
+    magic   b"DOSEVT01"
+    header  u64 first_seq, u32 count
+    chunks  u32 byte_length + bytes, in this order:
+            vocab (JSON: kinds, subject_kinds), day[i64], kind[u16],
+            subject_kind[u16], subject_id offsets[u32] + blob, severity[f64],
+            event_id offsets[u32] + blob, payload offsets[u32] + JSON blob
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+import json
+import mmap
+from pathlib import Path
+import struct
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+from .events import EventKind, WorldEvent
+
+SEGMENT_MAGIC = b"DOSEVT01"
+_HEADER = struct.Struct("<QI")
+_CHUNK_LEN = struct.Struct("<I")
+INDEX_FILE = "index.json"
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _segment_name(first_seq: int) -> str:
+    return f"seg-{first_seq:012d}.evt"
+
+
+def _pack_array(typecode: str, values: Iterable[Any]) -> bytes:
+    arr = array(typecode, values)
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _unpack_array(typecode: str, raw: memoryview) -> array:
+    arr = array(typecode)
+    arr.frombytes(raw)
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    return arr
+
+
+def _pack_strings(values: Sequence[str]) -> tuple[bytes, bytes]:
+    offsets = [0]
+    blob = bytearray()
+    for value in values:
+        blob.extend(value.encode("utf-8"))
+        offsets.append(len(blob))
+    return _pack_array("I", offsets), bytes(blob)
+
+
+def encode_segment(first_seq: int, events: Sequence[WorldEvent]) -> bytes:
+    kinds: Dict[str, int] = {}
+    subject_kinds: Dict[str, int] = {}
+    kind_codes: List[int] = []
+    subject_kind_codes: List[int] = []
+    for event in events:
+        kind_value = event.kind.value if isinstance(event.kind, EventKind) else str(event.kind)
+        kind_codes.append(kinds.setdefault(kind_value, len(kinds)))
+        subject_kind_codes.append(subject_kinds.setdefault(str(event.subject_kind), len(subject_kinds)))
+
+    vocab = json.dumps({"kinds": list(kinds), "subject_kinds": list(subject_kinds)}).encode("utf-8")
+    subject_offsets, subject_blob = _pack_strings([str(e.subject_id) for e in events])
+    id_offsets, id_blob = _pack_strings([str(e.event_id) for e in events])
+    payload_offsets, payload_blob = _pack_strings(
+        [json.dumps(e.payload, sort_keys=True, separators=(",", ":"), default=str) for e in events]
+    )
+    chunks = (
+        vocab,
+        _pack_array("q", (int(e.day) for e in events)),
+        _pack_array("H", kind_codes),
+        _pack_array("H", subject_kind_codes),
+        subject_offsets,
+        subject_blob,
+        _pack_array("d", (float(e.severity) for e in events)),
+        id_offsets,
+        id_blob,
+        payload_offsets,
+        payload_blob,
+    )
+    out = bytearray(SEGMENT_MAGIC)
+    out.extend(_HEADER.pack(int(first_seq), len(events)))
+    for chunk in chunks:
+        out.extend(_CHUNK_LEN.pack(len(chunk)))
+        out.extend(chunk)
+    return bytes(out)
+
+
+class SegmentReader:
+    """Memory-mapped, column-at-a-time reader for one segment file."""
+
+    __slots__ = ("path", "first_seq", "count", "_file", "_map", "_chunks", "_vocab", "_columns")
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        if bytes(view[: len(SEGMENT_MAGIC)]) != SEGMENT_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an event archive segment")
+        pos = len(SEGMENT_MAGIC)
+        self.first_seq, self.count = _HEADER.unpack_from(view, pos)
+        pos += _HEADER.size
+        chunks: List[memoryview] = []
+        while pos < len(view):
+            (length,) = _CHUNK_LEN.unpack_from(view, pos)
+            pos += _CHUNK_LEN.size
+            chunks.append(view[pos : pos + length])
+            pos += length
+        self._chunks = chunks
+        self._vocab: Dict[str, List[str]] | None = None
+        self._columns: Dict[str, array] = {}
+
+    def close(self) -> None:
+        self._chunks = []
+        self._columns = {}
+        try:
+            self._map.close()
+        except (BufferError, ValueError):
+            pass
+        self._file.close()
+
+    def _column(self, name: str, index: int, typecode: str) -> array:
+        column = self._columns.get(name)
+        if column is None:
+            column = _unpack_array(typecode, self._chunks[index])
+            self._columns[name] = column
+        return column
+
+    def vocab(self) -> Dict[str, List[str]]:
+        if self._vocab is None:
+            self._vocab = json.loads(bytes(self._chunks[0]).decode("utf-8"))
+        return self._vocab
+
+    def days(self) -> array:
+        return self._column("day", 1, "q")
+
+    def severities(self) -> array:
+        return self._column("severity", 6, "d")
+
+    def _string(self, offsets_name: str, offsets_index: int, blob_index: int, row: int) -> str:
+        offsets = self._column(offsets_name, offsets_index, "I")
+        return bytes(self._chunks[blob_index][offsets[row] : offsets[row + 1]]).decode("utf-8")
+
+    def event(self, row: int) -> WorldEvent:
+        vocab = self.vocab()
+        kind_value = vocab["kinds"][self._column("kind", 2, "H")[row]]
+        try:
+            kind: Any = EventKind(kind_value)
+        except ValueError:
+            kind = kind_value
+        return WorldEvent(
+            event_id=self._string("event_id_offsets", 7, 8, row),
+            day=int(self.days()[row]),
+            kind=kind,
+            subject_kind=vocab["subject_kinds"][self._column("subject_kind", 3, "H")[row]],
+            subject_id=self._string("subject_offsets", 4, 5, row),
+            severity=float(self.severities()[row]),
+            payload=json.loads(self._string("payload_offsets", 9, 10, row)),
+        )
+
+    def events(self, start: int = 0, stop: int | None = None) -> Iterator[WorldEvent]:
+        stop = self.count if stop is None else min(stop, self.count)
+        for row in range(max(0, start), stop):
+            yield self.event(row)
+
+
+@dataclass
+class SegmentMeta:
+    file: str
+    first_seq: int
+    count: int
+    min_day: int
+    max_day: int
+
+    @property
+    def end_seq(self) -> int:
+        return self.first_seq + self.count
+
+
+@dataclass
+class EventArchive:
+    """Disk-backed store for events evicted from a ``WorldEventLog`` ring."""
+
+    root: str
+    segment_size: int = 4096
+    segments: List[SegmentMeta] = field(default_factory=list)
+    pending: List[WorldEvent] = field(default_factory=list)
+    pending_first_seq: int = 0
+
+    @classmethod
+    def open(cls, root: str | Path, *, segment_size: int = 4096) -> "EventArchive":
+        """Open (or create) an archive directory, loading its segment index."""
+
+        root_path = Path(root)
+        root_path.mkdir(parents=True, exist_ok=True)
+        archive = cls(root=str(root_path), segment_size=segment_size)
+        index_path = root_path / INDEX_FILE
+        if index_path.exists():
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            archive.segments = [SegmentMeta(**meta) for meta in data.get("segments", [])]
+        else:
+            for path in sorted(root_path.glob("seg-*.evt")):
+                reader = SegmentReader(path)
+                days = reader.days()
+                archive.segments.append(
+                    SegmentMeta(path.name, reader.first_seq, reader.count, min(days), max(days))
+                )
+                reader.close()
+        if archive.segments:
+            archive.pending_first_seq = archive.segments[-1].end_seq
+        return archive
+
+    # -- writes ---------------------------------------------------------
+
+    @property
+    def end_seq(self) -> int:
+        return self.pending_first_seq + len(self.pending)
+
+    @property
+    def start_seq(self) -> int:
+        if self.segments:
+            return self.segments[0].first_seq
+        return self.pending_first_seq
+
+    def extend(self, events: Sequence[WorldEvent], *, first_seq: int) -> None:
+        """Accept events evicted from the ring, starting at sequence ``first_seq``."""
+
+        if not events:
+            return
+        if not self.pending and not self.segments:
+            self.pending_first_seq = int(first_seq)
+        elif first_seq != self.end_seq:
+            raise ValueError(f"archive expected seq {self.end_seq}, got {first_seq}")
+        self.pending.extend(events)
+        size = max(1, int(self.segment_size))
+        while len(self.pending) >= size:
+            self._write_segment(self.pending[:size])
+            del self.pending[:size]
+
+    def flush(self) -> None:
+        """Write any buffered events as a (possibly short) segment."""
+
+        if self.pending:
+            self._write_segment(self.pending)
+            self.pending = []
+
+    def _write_segment(self, events: Sequence[WorldEvent]) -> None:
+        first_seq = self.pending_first_seq
+        root = Path(self.root)
+        root.mkdir(parents=True, exist_ok=True)
+        name = _segment_name(first_seq)
+        tmp_path = root / f"{name}.tmp"
+        tmp_path.write_bytes(encode_segment(first_seq, events))
+        tmp_path.replace(root / name)
+        days = [int(e.day) for e in events]
+        self.segments.append(SegmentMeta(name, first_seq, len(events), min(days), max(days)))
+        self.pending_first_seq = first_seq + len(events)
+        self._write_index()
+
+    def _write_index(self) -> None:
+        root = Path(self.root)
+        payload = {
+            "schema": "event_archive_v1",
+            "segments": [
+                {
+                    "file": meta.file,
+                    "first_seq": meta.first_seq,
+                    "count": meta.count,
+                    "min_day": meta.min_day,
+                    "max_day": meta.max_day,
+                }
+                for meta in self.segments
+            ],
+        }
+        tmp_path = root / f"{INDEX_FILE}.tmp"
+        tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(root / INDEX_FILE)
+
+    # -- reads ----------------------------------------------------------
+
+    def _reader(self, meta: SegmentMeta) -> SegmentReader:
+        readers: Dict[str, SegmentReader] | None = getattr(self, "_readers", None)
+        if readers is None:
+            readers = {}
+            object.__setattr__(self, "_readers", readers)
+        reader = readers.get(meta.file)
+        if reader is None:
+            reader = SegmentReader(Path(self.root) / meta.file)
+            readers[meta.file] = reader
+        return reader
+
+    def close(self) -> None:
+        for reader in (getattr(self, "_readers", None) or {}).values():
+            reader.close()
+        object.__setattr__(self, "_readers", {})
+
+    def iter_range(self, start_seq: int, stop_seq: int | None = None) -> Iterator[WorldEvent]:
+        """Yield archived events with ``start_seq <= seq < stop_seq`` in order."""
+
+        stop = self.end_seq if stop_seq is None else min(int(stop_seq), self.end_seq)
+        start = max(int(start_seq), self.start_seq)
+        if start >= stop:
+            return
+        for meta in self._segments_for_seq(start, stop):
+            reader = self._reader(meta)
+            yield from reader.events(start - meta.first_seq, stop - meta.first_seq)
+        if stop > self.pending_first_seq:
+            lo = max(0, start - self.pending_first_seq)
+            yield from self.pending[lo : stop - self.pending_first_seq]
+
+    def _segments_for_seq(self, start: int, stop: int) -> Iterator[SegmentMeta]:
+        lo, hi = 0, len(self.segments)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.segments[mid].end_seq <= start:
+                lo = mid + 1
+            else:
+                hi = mid
+        for meta in self.segments[lo:]:
+            if meta.first_seq >= stop:
+                break
+            yield meta
+
+    def iter_days(self, start_day: int, end_day: int) -> Iterator[WorldEvent]:
+        """Yield archived events whose day falls in ``[start_day, end_day]``."""
+
+        for meta in self.segments:
+            if meta.max_day < start_day or meta.min_day > end_day:
+                continue
+            reader = self._reader(meta)
+            days = reader.days()
+            for row in range(meta.count):
+                if start_day <= days[row] <= end_day:
+                    yield reader.event(row)
+        for event in self.pending:
+            if start_day <= event.day <= end_day:
+                yield event
+
+
+def attach_event_archive(world: Any, root: str | Path, *, segment_size: int = 4096) -> EventArchive:
+    """Attach a disk archive to ``world.event_log`` so evicted events are kept."""
+
+    from .events import WorldEventLog
+
+    log = getattr(world, "event_log", None)
+    if not isinstance(log, WorldEventLog):
+        log = WorldEventLog(max_len=5000)
+        world.event_log = log
+    archive = EventArchive.open(root, segment_size=segment_size)
+    if not archive.segments and not archive.pending:
+        archive.pending_first_seq = log.base_seq
+    log.archive = archive
+    return archive
+
+
+__all__ = [
+    "EventArchive",
+    "SEGMENT_MAGIC",
+    "SegmentMeta",
+    "SegmentReader",
+    "attach_event_archive",
+    "encode_segment",
+]
@@ -4,7 +4,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 import json
 from hashlib import sha256
-from typing import Dict, List
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterator, List
+
+if TYPE_CHECKING:
+    from .event_archive import EventArchive
 
 
 class EventKind(Enum):
@@ -48,6 +52,8 @@ class WorldEventLog:
     events: List[WorldEvent] = field(default_factory=list)
     next_seq: int = 0
     base_seq: int = 0
+    # Optional disk archive; events evicted from the ring are appended to it.
+    archive: "EventArchive | None" = None
 
     def append(self, event: WorldEvent) -> None:
         if not event.event_id:
@@ -57,16 +63,42 @@ class WorldEventLog:
 
         if self.max_len > 0 and len(self.events) > self.max_len:
             overflow = len(self.events) - self.max_len
+            if self.archive is not None:
+                self.archive.extend(self.events[:overflow], first_seq=self.base_seq)
             del self.events[:overflow]
             self.base_seq += overflow
 
-    def since(self, cursor_seq: int) -> List[WorldEvent]:
-        if cursor_seq < self.base_seq:
+    def iter_since(self, cursor_seq: int) -> Iterator[WorldEvent]:
+        """Yield events from ``cursor_seq`` onward without copying the ring.
+
+        When an archive is attached, sequence numbers older than ``base_seq``
+        are read back from disk before the in-memory tail.
+        """
+
+        if self.archive is not None and cursor_seq < self.base_seq:
+            yield from self.archive.iter_range(cursor_seq, self.base_seq)
+        offset = max(0, cursor_seq - self.base_seq)
+        events = self.events
+        for idx in range(offset, len(events)):
+            yield events[idx]
+
+    def since(self, cursor_seq: int, limit: int | None = None) -> List[WorldEvent]:
+        if self.archive is None and cursor_seq < self.base_seq:
             cursor_seq = self.base_seq
-        offset = cursor_seq - self.base_seq
-        if offset < 0:
-            offset = 0
-        return list(self.events[offset:])
+        if limit is None:
+            if self.archive is None or cursor_seq >= self.base_seq:
+                return self.events[cursor_seq - self.base_seq :]
+            return list(self.iter_since(cursor_seq))
+        return list(islice(self.iter_since(cursor_seq), max(0, int(limit))))
+
+    def events_for_days(self, start_day: int, end_day: int) -> List[WorldEvent]:
+        """Return archived and in-memory events with ``start_day <= day <= end_day``."""
+
+        selected: List[WorldEvent] = []
+        if self.archive is not None:
+            selected.extend(self.archive.iter_days(start_day, end_day))
+        selected.extend(e for e in self.events if start_day <= e.day <= end_day)
+        return selected
 
     def signature(self) -> str:
         canonical = {
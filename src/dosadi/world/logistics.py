@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from enum import Enum
 import heapq
@@ -108,16 +109,94 @@ class DeliveryRequest:
             self.flags = set(self.flags or set())
 
 
+# Deliveries that still need carrier, route or incident processing.
+OPEN_DELIVERY_STATUSES = (
+    DeliveryStatus.REQUESTED,
+    DeliveryStatus.ASSIGNED,
+    DeliveryStatus.PICKED_UP,
+    DeliveryStatus.IN_TRANSIT,
+)
+
+
+def _sorted_remove(ids: list[str], delivery_id: str) -> None:
+    idx = bisect_left(ids, delivery_id)
+    if idx < len(ids) and ids[idx] == delivery_id:
+        del ids[idx]
+
+
+def _sorted_add(ids: list[str], delivery_id: str) -> None:
+    idx = bisect_left(ids, delivery_id)
+    if idx == len(ids) or ids[idx] != delivery_id:
+        ids.insert(idx, delivery_id)
+
+
 @dataclass(slots=True)
 class LogisticsLedger:
     deliveries: Dict[str, DeliveryRequest] = field(default_factory=dict)
     active_ids: list[str] = field(default_factory=list)
+    # Status value -> sorted delivery ids, plus the status each id is filed
+    # under. Maintained by add()/set_status(); rebuilt from deliveries when
+    # it is missing (older snapshots, ledgers built from a deliveries dict).
+    status_index: Dict[str, list[str]] = field(default_factory=dict)
+    indexed_status: Dict[str, str] = field(default_factory=dict)
 
     def add(self, delivery: DeliveryRequest) -> None:
         self.deliveries[delivery.delivery_id] = delivery
-        if delivery.delivery_id not in self.active_ids:
-            self.active_ids.append(delivery.delivery_id)
-            self.active_ids.sort()
+        _sorted_add(self.active_ids, delivery.delivery_id)
+        self._file(delivery.delivery_id, delivery.status.value)
+
+    def _file(self, delivery_id: str, status_value: str) -> None:
+        previous = self.indexed_status.get(delivery_id)
+        if previous == status_value:
+            return
+        if previous is not None:
+            _sorted_remove(self.status_index.get(previous, []), delivery_id)
+        insort(self.status_index.setdefault(status_value, []), delivery_id)
+        self.indexed_status[delivery_id] = status_value
+
+    def reindex(self) -> None:
+        """Rebuild the status index from the deliveries themselves."""
+
+        self.status_index = {}
+        self.indexed_status = {}
+        for delivery_id in sorted(self.deliveries):
+            status_value = self.deliveries[delivery_id].status.value
+            self.status_index.setdefault(status_value, []).append(delivery_id)
+            self.indexed_status[delivery_id] = status_value
+
+    def _ensure_index(self) -> None:
+        if len(self.indexed_status) != len(self.deliveries):
+            self.reindex()
+
+    def set_status(self, delivery: DeliveryRequest, status: DeliveryStatus) -> None:
+        """Transition ``delivery`` to ``status`` and refile it in the index."""
+
+        delivery.status = status
+        if self.deliveries.get(delivery.delivery_id) is delivery:
+            self._ensure_index()
+            self._file(delivery.delivery_id, status.value)
+
+    def ids_with_status(self, *statuses: DeliveryStatus) -> list[str]:
+        """Sorted ids of deliveries currently in any of ``statuses``."""
+
+        self._ensure_index()
+        for _ in range(2):
+            buckets = [self.status_index.get(status.value, ()) for status in statuses]
+            ids = list(heapq.merge(*buckets)) if len(buckets) > 1 else list(buckets[0] if buckets else ())
+            wanted = {status.value for status in statuses}
+            deliveries = self.deliveries
+            if all(deliveries[delivery_id].status.value in wanted for delivery_id in ids):
+                return ids
+            # A status was assigned directly instead of through set_status().
+            self.reindex()
+        return ids
+
+    def with_status(self, *statuses: DeliveryStatus) -> list[DeliveryRequest]:
+        return [self.deliveries[delivery_id] for delivery_id in self.ids_with_status(*statuses)]
+
+    def status_counts(self) -> Dict[str, int]:
+        self._ensure_index()
+        return {status.value: len(self.status_index.get(status.value, ())) for status in DeliveryStatus}
 
     def signature(self) -> str:
         canonical = {
@@ -140,6 +219,16 @@ class LogisticsLedger:
         return sha256(payload.encode("utf-8")).hexdigest()
 
 
+def set_delivery_status(world, delivery: DeliveryRequest, status: DeliveryStatus) -> None:
+    """Route a delivery status change through the world's LogisticsLedger."""
+
+    ledger = getattr(world, "logistics", None)
+    if isinstance(ledger, LogisticsLedger):
+        ledger.set_status(delivery, status)
+    else:
+        delivery.status = status
+
+
 def ensure_logistics(world) -> LogisticsLedger:
     ledger: LogisticsLedger = getattr(world, "logistics", None) or LogisticsLedger()
     world.logistics = ledger
@@ -267,7 +356,6 @@ def _schedule_next_edge(world, delivery: DeliveryRequest, start_tick: int) -> No
     delivery.remaining_edge_ticks = remaining
     delivery.next_edge_complete_tick = start_tick + delivery.remaining_edge_ticks
     queue: list[tuple[int, str]] = getattr(world, "delivery_due_queue", [])
-    heapq.heapify(queue)
     heapq.heappush(queue, (delivery.next_edge_complete_tick, delivery.delivery_id))
     world.delivery_due_queue = queue
 
@@ -325,7 +413,7 @@ def _reroute_delivery(world, delivery: DeliveryRequest) -> None:
     dest = delivery.route_nodes[-1]
     new_route = compute_route(world, from_node=current_node, to_node=dest, perspective_agent_id=delivery.assigned_carrier_id)
     if new_route is None:
-        delivery.status = DeliveryStatus.FAILED
+        set_delivery_status(world, delivery, DeliveryStatus.FAILED)
         delivery.notes["failure"] = "reroute_failed"
         release_courier(world, delivery.assigned_carrier_id)
         release_escorts(world, delivery.delivery_id)
@@ -506,7 +594,7 @@ def _assign_carrier(world, delivery: DeliveryRequest, tick: int) -> None:
 
     if not mat_enabled or origin_owner_id is None:
         if not _has_stock(stockpiles, delivery.items):
-            delivery.status = DeliveryStatus.FAILED
+            set_delivery_status(world, delivery, DeliveryStatus.FAILED)
             delivery.notes["failure"] = "insufficient_stock"
             return
 
@@ -542,7 +630,7 @@ def _assign_carrier(world, delivery: DeliveryRequest, tick: int) -> None:
     if assigned_carrier is None:
         available = getattr(world, "carriers_available", 0)
         if available <= 0:
-            delivery.status = DeliveryStatus.REQUESTED
+            set_delivery_status(world, delivery, DeliveryStatus.REQUESTED)
             return
 
         world.next_carrier_seq = getattr(world, "next_carrier_seq", 0) + 1
@@ -554,7 +642,7 @@ def _assign_carrier(world, delivery: DeliveryRequest, tick: int) -> None:
         metrics["assigned_agent_couriers"] = metrics.get("assigned_agent_couriers", 0.0) + 1
 
     delivery.assigned_carrier_id = assigned_carrier
-    delivery.status = DeliveryStatus.PICKED_UP
+    set_delivery_status(world, delivery, DeliveryStatus.PICKED_UP)
     delivery.pickup_tick = tick
 
     if mat_enabled and origin_owner_id:
@@ -565,10 +653,10 @@ def _assign_carrier(world, delivery: DeliveryRequest, tick: int) -> None:
         return
     assign_escorts_for_delivery(world, delivery.delivery_id, day=day)
     if not delivery.route_edge_keys:
-        delivery.status = DeliveryStatus.IN_TRANSIT
+        set_delivery_status(world, delivery, DeliveryStatus.IN_TRANSIT)
         _deliver(world, delivery, tick)
         return
-    delivery.status = DeliveryStatus.IN_TRANSIT
+    set_delivery_status(world, delivery, DeliveryStatus.IN_TRANSIT)
     logistics.add(delivery)
     _schedule_next_edge(world, delivery, tick)
 
@@ -582,7 +670,7 @@ def assign_pending_deliveries(world, *, tick: int) -> None:
     if available <= 0 and not has_agents:
         return
 
-    for delivery_id in sorted(logistics.active_ids):
+    for delivery_id in logistics.ids_with_status(DeliveryStatus.REQUESTED):
         delivery = logistics.deliveries[delivery_id]
         if delivery.status != DeliveryStatus.REQUESTED:
             continue
@@ -592,7 +680,7 @@ def assign_pending_deliveries(world, *, tick: int) -> None:
 
 
 def _deliver(world, delivery: DeliveryRequest, tick: int) -> None:
-    delivery.status = DeliveryStatus.DELIVERED
+    set_delivery_status(world, delivery, DeliveryStatus.DELIVERED)
     delivery.deliver_tick = tick
     release_courier(world, delivery.assigned_carrier_id)
     release_escorts(world, delivery.delivery_id)
@@ -639,8 +727,9 @@ def _deliver(world, delivery: DeliveryRequest, tick: int) -> None:
 
 def process_due_deliveries(world, *, tick: int) -> None:
     logistics = ensure_logistics(world)
+    # delivery_due_queue is kept heap-ordered by every writer, so it is not
+    # re-heapified here.
     queue = getattr(world, "delivery_due_queue", [])
-    heapq.heapify(queue)
 
     while queue and queue[0][0] <= tick:
         _, delivery_id = heapq.heappop(queue)
@@ -650,7 +739,7 @@ def process_due_deliveries(world, *, tick: int) -> None:
         if delivery.status != DeliveryStatus.IN_TRANSIT:
             continue
         if _delivery_should_fail(world, delivery_id, getattr(world, "day", 0)):
-            delivery.status = DeliveryStatus.FAILED
+            set_delivery_status(world, delivery, DeliveryStatus.FAILED)
             delivery.deliver_tick = tick
             delivery.notes["failure"] = "phase_loss"
             release_courier(world, delivery.assigned_carrier_id)
@@ -676,5 +765,6 @@ def process_logistics_until(world, *, target_tick: int, current_tick: Optional[i
         world.delivery_due_queue = []
     assign_pending_deliveries(world, tick=start_tick)
     process_due_deliveries(world, tick=target_tick)
+    _logistics_metrics(world)["deliveries_by_status"] = logistics.status_counts()
     world.logistics = logistics
 
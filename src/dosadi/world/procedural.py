@@ -0,0 +1,333 @@
+"""Deterministic procedural worlds for scaling benchmarks and profiling.
+
+The shipped scenarios are small hand-authored habitats.  This generator builds
+arbitrarily large worlds from the same primitives (``SurveyMap``,
+``FacilityLedger``, ``WardState``, ``FactionState`` and ``create_agent``) so the
+daily subsystems can be exercised at thousands of nodes and tens of thousands
+of agents.
+
+Every stage draws from its own ``random.Random`` stream derived from the seed,
+so changing one count (say, agents) leaves the topology, wards and facilities
+of the same seed untouched.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import math
+import random
+from typing import Dict, List, Tuple
+
+from dosadi.agents.core import create_agent
+from dosadi.state import FactionState, RouteState, StockState, WardState, WorldState
+from dosadi.world.facilities import Facility, FacilityKind, FacilityLedger
+from dosadi.world.survey_map import SurveyEdge, SurveyMap, SurveyNode
+
+TOPOLOGIES: Tuple[str, ...] = ("grid", "tree", "small_world")
+
+FACILITY_KINDS: Tuple[FacilityKind, ...] = (
+    FacilityKind.DEPOT,
+    FacilityKind.WORKSHOP,
+    FacilityKind.RECYCLER,
+    FacilityKind.WATER_WORKS,
+    FacilityKind.OUTPOST,
+)
+
+FACTION_ARCHETYPES: Tuple[str, ...] = ("CIVIC", "GUILD", "MILITARY", "RAIDER")
+
+SMUGGLED_COMMODITIES: Tuple[str, ...] = ("NARCOTICS", "WEAPON_PARTS", "STOLEN_GOODS", "RAIDER_SUPPLIES")
+
+
+@dataclass(slots=True)
+class ProceduralWorldConfig:
+    seed: int = 0
+    topology: str = "grid"
+    nodes: int = 400
+    wards: int = 16
+    factions: int = 6
+    facilities: int = 40
+    agents: int = 400
+    pods_per_ward: int = 2
+    tree_branching: int = 3
+    small_world_degree: int = 4
+    small_world_rewire: float = 0.1
+    max_hazard: float = 0.3
+
+
+def _validate(config: ProceduralWorldConfig) -> None:
+    if config.topology not in TOPOLOGIES:
+        raise ValueError(f"unknown topology {config.topology!r}; expected one of {TOPOLOGIES}")
+    if config.nodes < 1 or config.wards < 1:
+        raise ValueError("procedural worlds need at least one node and one ward")
+    if config.wards > config.nodes:
+        raise ValueError("cannot assign more wards than survey nodes")
+    if config.factions < 0 or config.facilities < 0 or config.agents < 0:
+        raise ValueError("faction, facility and agent counts must be non-negative")
+    if config.agents and config.factions == 0:
+        raise ValueError("agents need at least one faction to join")
+
+
+def _stream(config: ProceduralWorldConfig, stage: str) -> random.Random:
+    return random.Random(f"{config.seed}:{stage}")
+
+
+def _grid_pairs(n: int) -> List[Tuple[int, int]]:
+    width = max(1, math.isqrt(n - 1) + 1) if n > 1 else 1
+    pairs: List[Tuple[int, int]] = []
+    for idx in range(n):
+        if (idx + 1) % width and idx + 1 < n:
+            pairs.append((idx, idx + 1))
+        if idx + width < n:
+            pairs.append((idx, idx + width))
+    return pairs
+
+
+def _tree_pairs(n: int, branching: int) -> List[Tuple[int, int]]:
+    branching = max(1, int(branching))
+    return [((idx - 1) // branching, idx) for idx in range(1, n)]
+
+
+def _small_world_pairs(n: int, degree: int, rewire: float, rng: random.Random) -> List[Tuple[int, int]]:
+    """Watts-Strogatz ring lattice; the ring itself is never rewired, so it stays connected."""
+
+    half = max(1, int(degree) // 2)
+    seen: set[Tuple[int, int]] = set()
+    pairs: List[Tuple[int, int]] = []
+
+    def add(a: int, b: int) -> bool:
+        pair = (min(a, b), max(a, b))
+        if a == b or pair in seen:
+            return False
+        seen.add(pair)
+        pairs.append(pair)
+        return True
+
+    for idx in range(n):
+        for offset in range(1, half + 1):
+            other = (idx + offset) % n
+            if offset > 1 and rng.random() < rewire:
+                for _ in range(8):
+                    if add(idx, rng.randrange(n)):
+                        break
+                else:
+                    add(idx, other)
+            else:
+                add(idx, other)
+    return pairs
+
+
+def _topology_pairs(config: ProceduralWorldConfig) -> List[Tuple[int, int]]:
+    if config.topology == "grid":
+        return _grid_pairs(config.nodes)
+    if config.topology == "tree":
+        return _tree_pairs(config.nodes, config.tree_branching)
+    return _small_world_pairs(
+        config.nodes, config.small_world_degree, config.small_world_rewire, _stream(config, "rewire")
+    )
+
+
+def _ward_slices(config: ProceduralWorldConfig) -> List[range]:
+    """Split node indices into contiguous, near-equal runs (rows, subtrees or arcs)."""
+
+    return [
+        range(k * config.nodes // config.wards, (k + 1) * config.nodes // config.wards)
+        for k in range(config.wards)
+    ]
+
+
+def _build_survey_map(
+    config: ProceduralWorldConfig, node_ids: List[str], ward_of: List[str], pods: set[int]
+) -> SurveyMap:
+    rng = _stream(config, "survey")
+    survey_map = SurveyMap()
+    hubs = {idx for idx in range(config.nodes) if idx == 0 or ward_of[idx] != ward_of[idx - 1]}
+    for idx, node_id in enumerate(node_ids):
+        kind = "hub" if idx in hubs else "pod" if idx in pods else "corridor"
+        survey_map.nodes[node_id] = SurveyNode(
+            node_id=node_id,
+            kind=kind,
+            ward_id=ward_of[idx],
+            hazard=round(rng.random() * config.max_hazard, 3),
+            water=round(rng.random() * 5.0, 2),
+            confidence=1.0,
+        )
+    for a, b in sorted(_topology_pairs(config)):
+        distance = round(rng.uniform(20.0, 120.0), 1)
+        hazard = round(rng.random() * config.max_hazard, 3)
+        edge = SurveyEdge(
+            a=node_ids[a],
+            b=node_ids[b],
+            distance_m=distance,
+            travel_cost=round(distance * (1.0 + hazard), 1),
+            hazard=hazard,
+            confidence=1.0,
+        )
+        survey_map.edges[edge.key] = edge
+    survey_map.known_nodes = set(survey_map.nodes)
+    survey_map.known_edges = set(survey_map.edges)
+    survey_map.frontier_nodes = set(survey_map.nodes)
+    survey_map.rebuild_adjacency()
+    return survey_map
+
+
+def _ward_routes(survey_map: SurveyMap) -> Dict[str, RouteState]:
+    """One ward-level corridor per pair of wards joined by a survey edge."""
+
+    routes: Dict[str, RouteState] = {}
+    for edge in survey_map.edges.values():
+        ward_a = survey_map.nodes[edge.a].ward_id
+        ward_b = survey_map.nodes[edge.b].ward_id
+        if not ward_a or not ward_b or ward_a == ward_b:
+            continue
+        origin, destination = sorted((ward_a, ward_b))
+        route_id = f"route:{origin}|{destination}"
+        if route_id in routes:
+            continue
+        routes[route_id] = RouteState(
+            id=route_id,
+            origin=origin,
+            destination=destination,
+            distance_minutes=round(edge.distance_m / 60.0, 2),
+            checkpoint_level=0.0,
+            escort_risk=edge.hazard,
+            capacity_liters=1_000.0,
+            distance_km=round(edge.distance_m / 1_000.0, 3),
+            risk=edge.hazard,
+        )
+    return routes
+
+
+def _navigation_topology(survey_map: SurveyMap, well_core_id: str) -> Dict[str, object]:
+    """Node-level topology in the ``policy["topology"]`` shape agent navigation reads."""
+
+    nodes = [
+        {
+            "id": node.node_id,
+            "name": node.node_id,
+            "type": node.kind,
+            "ward_id": node.ward_id,
+            "is_well_core": node.node_id == well_core_id,
+        }
+        for node in survey_map.nodes.values()
+    ]
+    edges = [
+        {"id": f"edge:{key}", "a": edge.a, "b": edge.b, "base_hazard_prob": edge.hazard}
+        for key, edge in survey_map.edges.items()
+    ]
+    return {"id": "procedural", "nodes": nodes, "edges": edges}
+
+
+def generate_procedural_world(config: ProceduralWorldConfig | None = None) -> WorldState:
+    """Build a deterministic world of the requested size and topology.
+
+    Wards own contiguous runs of survey nodes; each ward's first node is a
+    ``hub`` and ``pods_per_ward`` further nodes are residential ``pod`` nodes
+    that agents start in.  Ward-level corridors (``world.edges``) are derived
+    from the survey edges that cross ward boundaries, and the survey graph is
+    also published as ``policy["topology"]`` (first hub as the well core) so
+    the per-tick agent loop can navigate it.
+    """
+
+    config = config or ProceduralWorldConfig()
+    _validate(config)
+
+    world = WorldState(seed=config.seed)
+    world.rng.seed(config.seed)
+
+    width = len(str(max(0, config.nodes - 1)))
+    node_ids = [f"node:{idx:0{width}d}" for idx in range(config.nodes)]
+    ward_width = len(str(max(0, config.wards - 1)))
+    ward_ids = [f"ward:{k:0{ward_width}d}" for k in range(config.wards)]
+    ward_slices = _ward_slices(config)
+    ward_of = [""] * config.nodes
+    for ward_id, members in zip(ward_ids, ward_slices):
+        for idx in members:
+            ward_of[idx] = ward_id
+
+    pod_rng = _stream(config, "pods")
+    pods_by_ward: Dict[str, List[str]] = {}
+    pod_indices: set[int] = set()
+    for ward_id, members in zip(ward_ids, ward_slices):
+        candidates = list(members)[1:]
+        chosen = sorted(pod_rng.sample(candidates, min(len(candidates), max(0, config.pods_per_ward))))
+        pod_indices.update(chosen)
+        pods_by_ward[ward_id] = [node_ids[idx] for idx in chosen] or [node_ids[members[0]]]
+
+    world.survey_map = _build_survey_map(config, node_ids, ward_of, pod_indices)
+    world.edges = _ward_routes(world.survey_map)
+    world.policy["topology"] = _navigation_topology(world.survey_map, node_ids[0])
+
+    for k, ward_id in enumerate(ward_ids):
+        world.register_ward(
+            WardState(id=ward_id, name=f"Ward {k}", ring=1 + (3 * k) // config.wards, sealed_mode="OPEN")
+        )
+
+    faction_rng = _stream(config, "factions")
+    faction_width = len(str(max(0, config.factions - 1)))
+    faction_ids: List[str] = []
+    for k in range(config.factions):
+        faction_id = f"faction:{k:0{faction_width}d}"
+        archetype = FACTION_ARCHETYPES[k % len(FACTION_ARCHETYPES)]
+        home_ward = ward_ids[k * config.wards // config.factions]
+        profile = {}
+        if archetype == "RAIDER":
+            profile = {
+                commodity: round(faction_rng.random(), 3)
+                for commodity in faction_rng.sample(SMUGGLED_COMMODITIES, 3)
+            }
+        world.register_faction(
+            FactionState(
+                id=faction_id,
+                name=f"Faction {k}",
+                archetype=archetype,
+                home_ward=home_ward,
+                assets=StockState(credits={"credits": round(faction_rng.uniform(50.0, 500.0), 1)}),
+                smuggling_profile=profile,
+            )
+        )
+        world.wards[home_ward].governor_faction = world.wards[home_ward].governor_faction or faction_id
+        faction_ids.append(faction_id)
+
+    facility_rng = _stream(config, "facilities")
+    world.facilities = FacilityLedger()
+    facility_width = len(str(max(0, config.facilities - 1)))
+    for k in range(config.facilities):
+        site = node_ids[facility_rng.randrange(config.nodes)]
+        ward_id = world.survey_map.nodes[site].ward_id or ""
+        kind = FACILITY_KINDS[k % len(FACILITY_KINDS)]
+        world.facilities.add(
+            Facility(
+                facility_id=f"facility:{k:0{facility_width}d}",
+                kind=kind,
+                site_node_id=site,
+                ward_id=ward_id,
+                created_tick=world.tick,
+            )
+        )
+        ward_facilities = world.wards[ward_id].facilities
+        ward_facilities[kind.value] = ward_facilities.get(kind.value, 0) + 1
+
+    agent_rng = _stream(config, "agents")
+    agent_width = len(str(max(0, config.agents - 1)))
+    for idx in range(config.agents):
+        ward_id = ward_ids[idx % config.wards]
+        pods = pods_by_ward[ward_id]
+        pod_id = pods[(idx // config.wards) % len(pods)]
+        agent = create_agent(
+            agent_id=f"agent:{idx:0{agent_width}d}", name=f"Resident {idx}", pod_location_id=pod_id, rng=agent_rng
+        )
+        agent.ward = ward_id
+        world.register_agent(agent)
+        world.factions[faction_ids[idx % len(faction_ids)]].members.append(agent.id)
+
+    world.policy["procedural"] = asdict(config)
+    return world
+
+
+__all__ = [
+    "FACILITY_KINDS",
+    "FACTION_ARCHETYPES",
+    "ProceduralWorldConfig",
+    "TOPOLOGIES",
+    "generate_procedural_world",
+]
@@ -3,13 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 import heapq
 import math
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Iterable, Mapping
 
+from dosadi.agent.beliefs import BeliefStore
 from dosadi.runtime.belief_queries import belief_score, planner_perspective_agent
-from dosadi.runtime.corridor_cascade import corridor_status
-from dosadi.runtime.sanctions import is_transit_denied
+from dosadi.runtime.corridor_cascade import corridor_status, ensure_cascade_ledger
+from dosadi.runtime.sanctions import SanctionIndex, sanction_index
 
-from .corridor_infrastructure import travel_time_multiplier_for_edge
+from .corridor_infrastructure import ensure_infra_config, travel_time_multiplier_for_edge
+from .routing_graph import CompiledRoutingGraph, invalidate_routing_graph, routing_graph
 from .survey_map import SurveyMap, edge_key
 
 
@@ -29,13 +31,28 @@ class RoutingConfig:
     belief_weight: float = 0.50
     tie_break: str = "lex"
     cache_size: int = 2000
+    # Search the compiled integer graph; the string search remains the fallback.
+    compiled: bool = True
+
+
+@dataclass(slots=True)
+class _CachedRoute:
+    """A cached route plus the sanction-denied edges its search skipped.
+
+    When the sanction index changes, the entry stays valid as long as none of
+    its route edges became denied and none of its skipped edges were lifted.
+    """
+
+    route: Route | None
+    denied_edges: frozenset[str]
+    sanction_version: int
 
 
 class _LRU:
     def __init__(self, capacity: int):
         self.capacity = max(1, capacity)
         self.order: list[str] = []
-        self.data: Dict[str, Route | None] = {}
+        self.data: Dict[str, _CachedRoute | None] = {}
 
     def _touch(self, key: str) -> None:
         if key in self.order:
@@ -45,16 +62,20 @@ class _LRU:
             oldest = self.order.pop(0)
             self.data.pop(oldest, None)
 
-    def get(self, key: str) -> Route | None | None:
+    def get(self, key: str) -> _CachedRoute | None:
         if key not in self.data:
             return None
         self._touch(key)
         return self.data[key]
 
-    def set(self, key: str, value: Route | None) -> None:
+    def set(self, key: str, value: _CachedRoute | None) -> None:
         self.data[key] = value
         self._touch(key)
 
+    def discard(self, key: str) -> None:
+        if self.data.pop(key, None) is not None:
+            self.order.remove(key)
+
 
 _ROUTE_CACHE = _LRU(capacity=2000)
 
@@ -79,59 +100,126 @@ def _build_neighbors(survey_map: SurveyMap) -> Dict[str, list[tuple[str, str]]]:
     return survey_map.adj
 
 
+def _resolve_perspective(world: Any, perspective_agent_id: str | None) -> Any:
+    perspective = None
+    if perspective_agent_id:
+        perspective = getattr(world, "agents", {}).get(perspective_agent_id)
+    if perspective is None:
+        perspective = planner_perspective_agent(world)
+    return perspective
+
+
+def _cached_route_valid(
+    world: Any,
+    entry: _CachedRoute,
+    index: SanctionIndex,
+    *,
+    actor_faction_id: str | None,
+    actor_ward_id: str | None,
+) -> bool:
+    if entry.sanction_version == index.version:
+        return True
+    route = entry.route
+    if route is not None:
+        for ekey in route.edge_keys:
+            if index.denies(world, ekey, actor_faction_id=actor_faction_id, actor_ward_id=actor_ward_id):
+                return False
+    for ekey in entry.denied_edges:
+        if not index.denies(world, ekey, actor_faction_id=actor_faction_id, actor_ward_id=actor_ward_id):
+            return False
+    entry.sanction_version = index.version
+    return True
+
+
 def _stable_push(frontier: list[tuple[float, str, str]], cost: float, node: str, tie_key: str) -> None:
     heapq.heappush(frontier, (cost, tie_key, node))
 
 
-def compute_route(
+def _cache_key(from_node: str, to_node: str, perspective_agent_id: str | None, day: int) -> str:
+    return f"{from_node}->{to_node}:{perspective_agent_id}:{day}"
+
+
+def _cached_lookup(
     world: Any,
-    *,
-    from_node: str,
-    to_node: str,
-    perspective_agent_id: str | None = None,
+    cache_key: str,
+    sanctions: SanctionIndex,
+    perspective_agent_id: str | None,
 ) -> Route | None:
-    cfg: RoutingConfig = getattr(world, "routing_cfg", RoutingConfig())
-    if not cfg.enabled:
+    cached = _ROUTE_CACHE.get(cache_key)
+    if cached is None or cached.route is None:
         return None
+    if cached.sanction_version == sanctions.version:
+        return cached.route
+    perspective = _resolve_perspective(world, perspective_agent_id)
+    if _cached_route_valid(
+        world,
+        cached,
+        sanctions,
+        actor_faction_id=getattr(perspective, "faction_id", None),
+        actor_ward_id=getattr(perspective, "home_ward_id", None),
+    ):
+        return cached.route
+    _ROUTE_CACHE.discard(cache_key)
+    return None
+
+
+def _trace_route(from_node: str, to_node: str, costs, parents, parent_edge) -> Route:
+    path_nodes: list[str] = []
+    path_edges: list[str] = []
+    cursor = to_node
+    while cursor != from_node:
+        path_nodes.append(cursor)
+        ekey = parent_edge[cursor]
+        path_edges.append(ekey)
+        cursor = parents[cursor]
+    path_nodes.append(from_node)
+    path_nodes.reverse()
+    path_edges.reverse()
+    return Route(nodes=path_nodes, edge_keys=path_edges, total_cost=costs[to_node])
 
-    sanction_stamp = ""
-    sanction_rules = getattr(world, "sanction_rules", None)
-    if isinstance(sanction_rules, dict) and sanction_rules:
-        sanction_stamp = ":" + ";".join(sorted(sanction_rules.keys()))
-    cache_key = f"{from_node}->{to_node}:{perspective_agent_id}:{getattr(world, 'day', 0)}{sanction_stamp}"
-    cached = _ROUTE_CACHE.get(cache_key)
-    if cached is not None:
-        return cached
 
-    survey_map: SurveyMap = getattr(world, "survey_map", SurveyMap())
-    if from_node == to_node:
-        route = Route(nodes=[from_node], edge_keys=[], total_cost=0.0)
-        _ROUTE_CACHE.set(cache_key, route)
-        return route
+def _search(
+    world: Any,
+    cfg: RoutingConfig,
+    survey_map: SurveyMap,
+    neighbors: Dict[str, list[tuple[str, str]]],
+    *,
+    from_node: str,
+    targets: set[str],
+    perspective_agent_id: str | None,
+    sanctions: SanctionIndex,
+) -> Dict[str, tuple[Route | None, frozenset[str]]]:
+    """Dijkstra from ``from_node`` that settles every node in ``targets``.
 
-    neighbors = _build_neighbors(survey_map)
-    if from_node not in neighbors or to_node not in neighbors:
-        _ROUTE_CACHE.set(cache_key, None)
-        return None
+    Each target's route is traced at the moment it is first popped, which is
+    exactly where a single-target search for it would stop, so the result per
+    target is identical to routing it on its own.
+    """
 
-    perspective = None
-    if perspective_agent_id:
-        perspective = getattr(world, "agents", {}).get(perspective_agent_id)
-    if perspective is None:
-        perspective = planner_perspective_agent(world)
+    perspective = _resolve_perspective(world, perspective_agent_id)
+    perspective_faction = getattr(perspective, "faction_id", None)
+    perspective_ward = getattr(perspective, "home_ward_id", None)
 
     frontier: list[tuple[float, str, str]] = []
     _stable_push(frontier, 0.0, from_node, from_node)
     costs: Dict[str, float] = {from_node: 0.0}
     parents: Dict[str, str] = {}
     parent_edge: Dict[str, str] = {}
+    denied_edges: set[str] = set()
+    check_sanctions = not sanctions.empty
+    pending = set(targets)
+    results: Dict[str, tuple[Route | None, frozenset[str]]] = {}
     expansions = 0
 
     while frontier and expansions < cfg.max_expansions:
         cost, _, node = heapq.heappop(frontier)
         expansions += 1
-        if node == to_node:
-            break
+        if node in pending:
+            pending.discard(node)
+            route = _trace_route(from_node, node, costs, parents, parent_edge)
+            results[node] = (route, frozenset(denied_edges))
+            if not pending:
+                break
         for nbr, ekey in sorted(neighbors.get(node, [])):
             edge_obj = survey_map.edges.get(ekey)
             if edge_obj and edge_obj.closed_until_day is not None:
@@ -148,15 +236,13 @@ def compute_route(
                 "hazard": getattr(edge_obj, "hazard", 0.0),
                 "edge_obj": edge_obj,
             }
-            perspective_faction = getattr(perspective, "faction_id", None)
-            perspective_ward = getattr(perspective, "home_ward_id", None)
-            if is_transit_denied(
+            if check_sanctions and sanctions.denies(
                 world,
-                edge_key=ekey,
+                ekey,
                 actor_faction_id=perspective_faction,
                 actor_ward_id=perspective_ward,
-                day=getattr(world, "day", 0),
             ):
+                denied_edges.add(ekey)
                 continue
             step_cost = _edge_cost(world, edge_payload, cfg, perspective)
             next_cost = cost + step_cost
@@ -168,29 +254,234 @@ def compute_route(
                 parent_edge[nbr] = ekey
                 _stable_push(frontier, next_cost, nbr, tie_key)
 
-    if to_node not in costs:
-        _ROUTE_CACHE.set(cache_key, None)
-        return None
+    denied = frozenset(denied_edges)
+    for target in sorted(pending):
+        if target in costs:
+            results[target] = (_trace_route(from_node, target, costs, parents, parent_edge), denied)
+        else:
+            results[target] = (None, denied)
+    return results
 
-    path_nodes: list[str] = []
-    path_edges: list[str] = []
-    cursor = to_node
-    while cursor != from_node:
-        path_nodes.append(cursor)
-        ekey = parent_edge[cursor]
-        path_edges.append(ekey)
-        cursor = parents[cursor]
-    path_nodes.append(from_node)
-    path_nodes.reverse()
-    path_edges.reverse()
 
-    route = Route(nodes=path_nodes, edge_keys=path_edges, total_cost=costs[to_node])
-    _ROUTE_CACHE.set(cache_key, route)
-    return route
+def _search_compiled(
+    world: Any,
+    cfg: RoutingConfig,
+    graph: CompiledRoutingGraph,
+    survey_map: SurveyMap,
+    *,
+    from_node: str,
+    targets: set[str],
+    perspective_agent_id: str | None,
+    sanctions: SanctionIndex,
+) -> Dict[str, tuple[Route | None, frozenset[str]]] | None:
+    """:func:`_search` over the compiled arrays, with identical results.
+
+    An arc whose edge object was replaced under the same key (a re-observed
+    edge) is refreshed in place.  Returns ``None`` when an arc's edge was
+    removed behind the adjacency's back, i.e. the compiled graph is stale.
+    """
+
+    perspective = _resolve_perspective(world, perspective_agent_id)
+    perspective_faction = getattr(perspective, "faction_id", None)
+    perspective_ward = getattr(perspective, "home_ward_id", None)
+
+    # Resolved once per query rather than per relaxation.
+    day = getattr(world, "day", 0)
+    edges = survey_map.edges
+    corridors = ensure_cascade_ledger(world).corridors
+    infra_enabled = bool(getattr(ensure_infra_config(world), "enabled", False))
+    beliefs = None
+    if perspective is not None:
+        store = getattr(perspective, "beliefs", None)
+        beliefs = getattr(store, "items", None) if isinstance(store, BeliefStore) else None
+    risk_weight, hazard_weight, belief_weight = cfg.risk_weight, cfg.hazard_weight, cfg.belief_weight
+
+    index = graph.index
+    node_ids = graph.node_ids
+    offsets = graph.offsets
+    arc_target = graph.arc_target
+    arc_edge_key = graph.arc_edge_key
+    arc_cost_key = graph.arc_cost_key
+    arc_belief_key = graph.arc_belief_key
+    arc_edge = graph.arc_edge
+    arc_base_cost = graph.arc_base_cost
+    arc_hazard = graph.arc_hazard
+
+    source = index[from_node]
+    frontier: list[tuple[float, int, int]] = [(0.0, source, source)]
+    costs: Dict[int, float] = {source: 0.0}
+    parents: Dict[int, int] = {}
+    parent_arc: Dict[int, int] = {}
+    denied_edges: set[str] = set()
+    check_sanctions = not sanctions.empty
+    pending = {index[target] for target in targets}
+    results: Dict[str, tuple[Route | None, frozenset[str]]] = {}
+    expansions = 0
+
+    def trace(target: int) -> Route:
+        path_nodes: list[str] = []
+        path_edges: list[str] = []
+        cursor = target
+        while cursor != source:
+            path_nodes.append(node_ids[cursor])
+            path_edges.append(arc_edge_key[parent_arc[cursor]])
+            cursor = parents[cursor]
+        path_nodes.append(from_node)
+        path_nodes.reverse()
+        path_edges.reverse()
+        return Route(nodes=path_nodes, edge_keys=path_edges, total_cost=costs[target])
+
+    while frontier and expansions < cfg.max_expansions:
+        cost, _, node = heapq.heappop(frontier)
+        expansions += 1
+        if node in pending:
+            pending.discard(node)
+            results[node_ids[node]] = (trace(node), frozenset(denied_edges))
+            if not pending:
+                break
+        for arc in range(offsets[node], offsets[node + 1]):
+            ekey = arc_edge_key[arc]
+            edge_obj = edges.get(ekey)
+            if edge_obj is not arc_edge[arc]:
+                if edge_obj is None:
+                    return None
+                graph.refresh_arc(arc, edge_obj)
+            if edge_obj and edge_obj.closed_until_day is not None and day < edge_obj.closed_until_day:
+                continue
+            state = corridors.get(ekey)
+            if state is not None and state.collapse_status in {"CLOSED", "COLLAPSED"}:
+                continue
+            if check_sanctions and sanctions.denies(
+                world,
+                ekey,
+                actor_faction_id=perspective_faction,
+                actor_ward_id=perspective_ward,
+            ):
+                denied_edges.add(ekey)
+                continue
+            base_cost = arc_base_cost[arc]
+            if infra_enabled:
+                base_cost *= travel_time_multiplier_for_edge(world, arc_cost_key[arc])
+            belief = 0.0
+            if perspective is not None:
+                belief = hazard_weight
+                if beliefs and arc_belief_key[arc] in beliefs:
+                    belief = belief_score(perspective, arc_belief_key[arc], hazard_weight)
+            risk_component = hazard_weight * arc_hazard[arc] + belief_weight * belief
+            next_cost = cost + base_cost * (1.0 + risk_weight * risk_component)
+            nbr = arc_target[arc]
+            prev = costs.get(nbr)
+            if prev is None or next_cost < prev or (math.isclose(next_cost, prev) and nbr < parents.get(nbr, nbr)):
+                costs[nbr] = next_cost
+                parents[nbr] = node
+                parent_arc[nbr] = arc
+                heapq.heappush(frontier, (next_cost, nbr, nbr))
+
+    denied = frozenset(denied_edges)
+    for target in sorted(pending, key=node_ids.__getitem__):
+        results[node_ids[target]] = (trace(target) if target in costs else None, denied)
+    return results
+
+
+def compute_routes_from(
+    world: Any,
+    *,
+    from_node: str,
+    to_nodes: Iterable[str],
+    perspective_agent_id: str | None = None,
+) -> Dict[str, Route | None]:
+    """Route one origin to many destinations with a single shared search.
+
+    Each result equals ``compute_route(world, from_node=..., to_node=target)``
+    and is stored in (and served from) the same route cache.
+    """
+
+    cfg: RoutingConfig = getattr(world, "routing_cfg", RoutingConfig())
+    targets = list(dict.fromkeys(to_nodes))
+    if not cfg.enabled:
+        return {target: None for target in targets}
+
+    day = getattr(world, "day", 0)
+    sanctions = sanction_index(world, day=day)
+    results: Dict[str, Route | None] = {}
+    missing: set[str] = set()
+    for target in targets:
+        route = _cached_lookup(world, _cache_key(from_node, target, perspective_agent_id, day), sanctions, perspective_agent_id)
+        if route is not None:
+            results[target] = route
+        else:
+            missing.add(target)
+    if not missing:
+        return results
+
+    survey_map: SurveyMap = getattr(world, "survey_map", SurveyMap())
+    if from_node in missing:
+        route = Route(nodes=[from_node], edge_keys=[], total_cost=0.0)
+        _ROUTE_CACHE.set(
+            _cache_key(from_node, from_node, perspective_agent_id, day), _CachedRoute(route, frozenset(), sanctions.version)
+        )
+        results[from_node] = route
+        missing.discard(from_node)
+
+    neighbors = _build_neighbors(survey_map) if missing else {}
+    reachable = {target for target in missing if target in neighbors} if from_node in neighbors else set()
+    for target in missing - reachable:
+        _ROUTE_CACHE.set(_cache_key(from_node, target, perspective_agent_id, day), None)
+        results[target] = None
+    if reachable:
+        found = None
+        if cfg.compiled and cfg.tie_break == "lex":
+            found = _search_compiled(
+                world,
+                cfg,
+                routing_graph(world, survey_map),
+                survey_map,
+                from_node=from_node,
+                targets=reachable,
+                perspective_agent_id=perspective_agent_id,
+                sanctions=sanctions,
+            )
+            if found is None:
+                invalidate_routing_graph(world)
+        if found is None:
+            found = _search(
+                world,
+                cfg,
+                survey_map,
+                neighbors,
+                from_node=from_node,
+                targets=reachable,
+                perspective_agent_id=perspective_agent_id,
+                sanctions=sanctions,
+            )
+        for target, (route, denied) in found.items():
+            cache_key = _cache_key(from_node, target, perspective_agent_id, day)
+            if route is None:
+                _ROUTE_CACHE.set(cache_key, None)
+            else:
+                _ROUTE_CACHE.set(cache_key, _CachedRoute(route, denied, sanctions.version))
+            results[target] = route
+    return {target: results[target] for target in targets}
+
+
+def compute_route(
+    world: Any,
+    *,
+    from_node: str,
+    to_node: str,
+    perspective_agent_id: str | None = None,
+) -> Route | None:
+    cfg: RoutingConfig = getattr(world, "routing_cfg", RoutingConfig())
+    if not cfg.enabled:
+        return None
+    return compute_routes_from(
+        world, from_node=from_node, to_nodes=(to_node,), perspective_agent_id=perspective_agent_id
+    )[to_node]
 
 
 __all__ = [
     "Route",
     "RoutingConfig",
     "compute_route",
+    "compute_routes_from",
 ]
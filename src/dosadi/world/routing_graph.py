@@ -0,0 +1,111 @@
+"""Survey map adjacency compiled to integer ids and per-arc arrays for routing.
+
+Node ids are numbered in sorted order, so comparing two indices gives the same
+answer as comparing the ids themselves and the router's lexicographic tie-break
+carries over unchanged.  Arcs are stored CSR-style: the arcs leaving node ``i``
+are ``offsets[i]:offsets[i + 1]``, in the same ``(neighbor, edge key)`` order
+the string router sorts them into.
+
+Per-arc data that only changes when an edge object is replaced (base cost,
+hazard, the edge and belief keys) is materialized at compile time; re-observing
+a known edge replaces its object, and the search refreshes that arc in place
+with :meth:`CompiledRoutingGraph.refresh_arc`.  Data that changes in place --
+corridor status, closures, infrastructure levels, sanctions and beliefs -- is
+still read live during the search.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from .survey_map import SurveyMap, edge_key
+
+
+@dataclass(slots=True)
+class CompiledRoutingGraph:
+    key: tuple[int, ...]
+    node_ids: List[str] = field(default_factory=list)
+    index: Dict[str, int] = field(default_factory=dict)
+    offsets: List[int] = field(default_factory=list)
+    arc_target: List[int] = field(default_factory=list)
+    # Key from the adjacency list; closures, status and sanctions use it.
+    arc_edge_key: List[str] = field(default_factory=list)
+    # Key of the (node, neighbor) pair; infrastructure and beliefs use it.
+    arc_cost_key: List[str] = field(default_factory=list)
+    arc_belief_key: List[str] = field(default_factory=list)
+    arc_edge: List[Any] = field(default_factory=list)
+    arc_base_cost: List[float] = field(default_factory=list)
+    arc_hazard: List[float] = field(default_factory=list)
+
+    def refresh_arc(self, arc: int, edge: Any) -> None:
+        """Point ``arc`` at a replacement edge object stored under the same key."""
+
+        self.arc_edge[arc] = edge
+        self.arc_base_cost[arc] = _base_cost(edge)
+        self.arc_hazard[arc] = float(getattr(edge, "hazard", 0.0))
+
+
+def _base_cost(edge: Any) -> float:
+    return max(float(getattr(edge, "distance_m", 0.0)), float(getattr(edge, "travel_cost", 0.0)))
+
+
+def _graph_key(survey_map: SurveyMap) -> tuple[int, ...]:
+    return (
+        survey_map.adjacency_revision,
+        id(survey_map),
+        id(survey_map.adj),
+        id(survey_map.edges),
+        len(survey_map.edges),
+    )
+
+
+def compile_routing_graph(survey_map: SurveyMap) -> CompiledRoutingGraph:
+    adj = survey_map.adj
+    node_set = set(adj)
+    for arcs in adj.values():
+        node_set.update(nbr for nbr, _ in arcs)
+    node_ids = sorted(node_set)
+    graph = CompiledRoutingGraph(key=_graph_key(survey_map), node_ids=node_ids)
+    graph.index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+    edges = survey_map.edges
+
+    graph.offsets.append(0)
+    for node_id in node_ids:
+        for nbr, ekey in sorted(adj.get(node_id, [])):
+            edge = edges.get(ekey)
+            cost_key = edge_key(node_id, nbr)
+            graph.arc_target.append(graph.index[nbr])
+            graph.arc_edge_key.append(ekey)
+            graph.arc_cost_key.append(cost_key)
+            graph.arc_belief_key.append(f"route-risk:{cost_key}")
+            graph.arc_edge.append(edge)
+            graph.arc_base_cost.append(_base_cost(edge))
+            graph.arc_hazard.append(float(getattr(edge, "hazard", 0.0)))
+        graph.offsets.append(len(graph.arc_target))
+    return graph
+
+
+def routing_graph(world: Any, survey_map: SurveyMap) -> CompiledRoutingGraph:
+    """Return the world's compiled graph, recompiling when the adjacency changed."""
+
+    key = _graph_key(survey_map)
+    graph = getattr(world, "routing_graph", None)
+    if isinstance(graph, CompiledRoutingGraph) and graph.key == key:
+        return graph
+    graph = compile_routing_graph(survey_map)
+    world.routing_graph = graph
+    return graph
+
+
+def invalidate_routing_graph(world: Any) -> None:
+    if getattr(world, "routing_graph", None) is not None:
+        world.routing_graph = None
+
+
+__all__ = [
+    "CompiledRoutingGraph",
+    "compile_routing_graph",
+    "invalidate_routing_graph",
+    "routing_graph",
+]
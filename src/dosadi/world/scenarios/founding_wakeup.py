@@ -16,6 +16,7 @@ from dosadi.agents.groups import create_pod_group
 from dosadi.law import FacilityProtocolTuning
 from dosadi.memory.config import MemoryConfig
 from dosadi.runtime.work_details import WorkDetailType
+from dosadi.runtime.world_template import WorldTemplate, build_world_template
 from dosadi.runtime.queues import QueueLifecycleState, QueuePriorityRule, QueueState
 from ...state import FactionState, WorldState
 from ..phases import PhaseState, WorldPhase
@@ -255,18 +256,12 @@ def _initialize_pod_groups(world: WorldState, pod_ids: Iterable[str]) -> None:
         world.groups.append(group)
 
 
-def generate_founding_wakeup_mvp(num_agents: int, seed: int) -> WorldState:
-    """Construct the Founding Wakeup MVP topology and initial population."""
+def _build_founding_wakeup_layout(world: WorldState) -> None:
+    """Seed-independent part of the scenario: topology, facilities, queues, configs."""
 
-    world = WorldState(seed=seed)
-    world.rng.seed(seed)
     world.phase_state = PhaseState(phase=WorldPhase.PHASE0, phase_day=world.day)
     world.logistics_loss_rate = 0.0
-    planner_cfg = world.expansion_planner_cfg
-    planner_state = world.expansion_planner_state
-    planner_state.next_plan_day = seed % max(1, planner_cfg.planning_interval_days)
-    memory_config = MemoryConfig()
-    world.memory_config = memory_config
+    world.memory_config = MemoryConfig()
     world.well.daily_capacity = WATER_DAILY_CAPACITY
     world.well.well_id = "loc:well-head-core"
     world.desired_work_details[WorkDetailType.SCOUT_INTERIOR] = 8
@@ -313,27 +308,15 @@ def generate_founding_wakeup_mvp(num_agents: int, seed: int) -> WorldState:
     world.places = world.nodes
     world.water_tap_sources["loc:tap-1"] = "loc:depot-water-1"
 
-    colonist_faction = FactionState(
-        id="faction:colonists",
-        name="Founding Colonists",
-        archetype="CIVIC",
-        home_ward=WELL_CORE_ID,
+    world.register_faction(
+        FactionState(
+            id="faction:colonists",
+            name="Founding Colonists",
+            archetype="CIVIC",
+            home_ward=WELL_CORE_ID,
+        )
     )
-    world.register_faction(colonist_faction)
-
-    pod_ids = ["loc:pod-1", "loc:pod-2", "loc:pod-3", "loc:pod-4"]
-    agents = initialize_agents_for_founding_wakeup(num_agents=num_agents, seed=seed, pod_ids=pod_ids)
-
-    for agent in agents:
-        colonist_faction.members.append(agent.id)
-        world.register_agent(agent)
-        _initialize_agent_sleep_schedule(agent, world, memory_config)
-        agent.goals.extend(_initial_wakeup_goals(agent.agent_id))
-
     _register_wakeup_queues(world)
-    world.basic_suit_stock = len(agents)
-
-    _initialize_pod_groups(world, pod_ids)
     _seed_risk_metrics(world)
     world.scenario_metadata = {
         "scenario_id": "founding_wakeup_mvp",
@@ -360,6 +343,58 @@ def generate_founding_wakeup_mvp(num_agents: int, seed: int) -> WorldState:
 
     initialize_environment_for_founding_wakeup(world)
 
+
+def _populate_founding_wakeup(world: WorldState, num_agents: int, seed: int) -> None:
+    """Seed-dependent part of the scenario: colonists, their goals and pods."""
+
+    world.rng.seed(seed)
+    planner_cfg = world.expansion_planner_cfg
+    world.expansion_planner_state.next_plan_day = seed % max(1, planner_cfg.planning_interval_days)
+
+    colonist_faction = world.factions["faction:colonists"]
+    pod_ids = list(POD_IDS)
+    agents = initialize_agents_for_founding_wakeup(num_agents=num_agents, seed=seed, pod_ids=pod_ids)
+    for agent in agents:
+        colonist_faction.members.append(agent.id)
+        world.register_agent(agent)
+        _initialize_agent_sleep_schedule(agent, world, world.memory_config)
+        agent.goals.extend(_initial_wakeup_goals(agent.agent_id))
+
+    world.basic_suit_stock = len(agents)
+    _initialize_pod_groups(world, pod_ids)
+
+
+_TEMPLATE: Optional[WorldTemplate] = None
+
+
+def founding_wakeup_template() -> WorldTemplate:
+    """Return the cached seed-independent Founding Wakeup template."""
+
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        _TEMPLATE = build_world_template(
+            "founding_wakeup_mvp",
+            _build_founding_wakeup_layout,
+            shared=BASE_NODES + BASE_EDGES,
+        )
+    return _TEMPLATE
+
+
+def generate_founding_wakeup_mvp(
+    num_agents: int, seed: int, *, template: Optional[WorldTemplate] = None
+) -> WorldState:
+    """Construct the Founding Wakeup MVP topology and initial population.
+
+    Pass ``template=founding_wakeup_template()`` when generating many seeds to
+    build the topology once and only generate the population per seed.
+    """
+
+    if template is None:
+        world = WorldState(seed=seed)
+        _build_founding_wakeup_layout(world)
+    else:
+        world = template.instantiate(seed=seed)
+    _populate_founding_wakeup(world, num_agents, seed)
     return world
 
 
@@ -397,6 +432,7 @@ def _initialize_agent_sleep_schedule(agent: AgentState, world: WorldState, memor
 
 
 __all__ = [
+    "founding_wakeup_template",
     "generate_founding_wakeup_mvp",
     "LocationNode",
     "LocationEdge",
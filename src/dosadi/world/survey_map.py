@@ -101,6 +101,11 @@ class SurveyMap:
     known_nodes: set[str] = field(default_factory=set)
     known_edges: set[str] = field(default_factory=set)
     frontier_nodes: set[str] = field(default_factory=set)
+    # Bumped when a node's ward assignment changes; node->ward tables key on it.
+    ward_revision: int = 0
+    # Bumped when an edge key first enters the adjacency or it is rebuilt;
+    # compiled routing graphs key on it.
+    adjacency_revision: int = 0
 
     def __post_init__(self) -> None:
         if not self.known_nodes and self.nodes:
@@ -124,11 +129,19 @@ class SurveyMap:
             candidate.last_seen_tick = max(existing.last_seen_tick, node.last_seen_tick)
         else:
             candidate.confidence = min(1.0, max(node.confidence, confidence_delta))
+        if candidate.ward_id != (existing.ward_id if existing else None):
+            self.ward_revision += 1
         self.nodes[node.node_id] = candidate
         if candidate.discovered:
             self.known_nodes.add(candidate.node_id)
             self.frontier_nodes.add(candidate.node_id)
 
+    def assign_ward(self, node_id: str, ward_id: str | None) -> None:
+        node = self.nodes[node_id]
+        if node.ward_id != ward_id:
+            node.ward_id = ward_id
+            self.ward_revision += 1
+
     def upsert_edge(self, edge: SurveyEdge, *, confidence_delta: float = 0.1) -> None:
         key = edge.key
         existing = self.edges.get(key)
@@ -224,10 +237,16 @@ class SurveyMap:
         return sha256(_canonical_json(canonical).encode("utf-8")).hexdigest()
 
     def _update_adjacency_for_edge(self, edge: SurveyEdge) -> None:
-        self.adj.setdefault(edge.a, []).append((edge.b, edge.key))
-        self.adj.setdefault(edge.b, []).append((edge.a, edge.key))
+        key = edge.key
+        arcs = self.adj.setdefault(edge.a, [])
+        if (edge.b, key) in arcs:
+            return
+        arcs.append((edge.b, key))
+        self.adj.setdefault(edge.b, []).append((edge.a, key))
+        self.adjacency_revision += 1
 
     def rebuild_adjacency(self) -> None:
+        self.adjacency_revision += 1
         self.adj = {}
         for edge in self.edges.values():
             self._update_adjacency_for_edge(edge)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict
+from typing import Dict, List
 
 
 class AssignmentKind(Enum):
@@ -25,13 +25,24 @@ class Assignment:
     notes: Dict[str, str] = field(default_factory=dict)
 
 
+def _staff_role(assignment: Assignment) -> str:
+    return assignment.notes.get("role", "staff") if assignment.notes else "staff"
+
+
 @dataclass(slots=True)
 class WorkforceLedger:
     assignments: Dict[str, Assignment] = field(default_factory=dict)
+    # facility_id -> {agent_id: role} for FACILITY_STAFF assignments, kept in
+    # step by assign()/unassign(). roster_size records len(assignments) at the
+    # last sync so entries written straight into ``assignments`` trigger a
+    # rebuild (as do snapshots that predate the roster).
+    facility_roster: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    roster_size: int = -1
 
     def get(self, agent_id: str) -> Assignment:
         assignment = self.assignments.get(agent_id)
         if assignment is None:
+            self._ensure_roster()
             assignment = Assignment(
                 agent_id=agent_id,
                 kind=AssignmentKind.IDLE,
@@ -39,6 +50,7 @@ class WorkforceLedger:
                 start_day=0,
             )
             self.assignments[agent_id] = assignment
+            self.roster_size = len(self.assignments)
         return assignment
 
     def is_idle(self, agent_id: str) -> bool:
@@ -48,9 +60,13 @@ class WorkforceLedger:
         current = self.assignments.get(assignment.agent_id)
         if current is not None and current.kind is not AssignmentKind.IDLE:
             raise ValueError(f"Agent {assignment.agent_id} already assigned to {current.kind.name}")
+        self._ensure_roster()
         self.assignments[assignment.agent_id] = assignment
+        self._roster_add(assignment)
+        self.roster_size = len(self.assignments)
 
     def unassign(self, agent_id: str) -> None:
+        self._ensure_roster()
         prior = self.assignments.get(
             agent_id,
             Assignment(
@@ -66,6 +82,53 @@ class WorkforceLedger:
             target_id=None,
             start_day=prior.start_day,
         )
+        self._roster_remove(prior)
+        self.roster_size = len(self.assignments)
+
+    def _roster_add(self, assignment: Assignment) -> None:
+        if assignment.kind is AssignmentKind.FACILITY_STAFF and assignment.target_id is not None:
+            self.facility_roster.setdefault(assignment.target_id, {})[assignment.agent_id] = _staff_role(assignment)
+
+    def _roster_remove(self, assignment: Assignment) -> None:
+        if assignment.kind is not AssignmentKind.FACILITY_STAFF or assignment.target_id is None:
+            return
+        roster = self.facility_roster.get(assignment.target_id)
+        if roster is not None:
+            roster.pop(assignment.agent_id, None)
+            if not roster:
+                del self.facility_roster[assignment.target_id]
+
+    def _ensure_roster(self) -> None:
+        if self.roster_size != len(self.assignments):
+            self.rebuild_roster()
+
+    def rebuild_roster(self) -> None:
+        """Recompute the facility roster from ``assignments``."""
+
+        self.facility_roster = {}
+        for agent_id in sorted(self.assignments):
+            self._roster_add(self.assignments[agent_id])
+        self.roster_size = len(self.assignments)
+
+    def facility_staff_ids(self, facility_id: str) -> List[str]:
+        self._ensure_roster()
+        return sorted(self.facility_roster.get(facility_id, ()))
+
+    def facility_staff_count(self, facility_id: str, role: str | None = None) -> int:
+        self._ensure_roster()
+        roster = self.facility_roster.get(facility_id)
+        if not roster:
+            return 0
+        if role is None:
+            return len(roster)
+        return sum(1 for staff_role in roster.values() if staff_role == role)
+
+    def facility_role_counts(self, facility_id: str) -> Dict[str, int]:
+        self._ensure_roster()
+        counts: Dict[str, int] = {}
+        for role in (self.facility_roster.get(facility_id) or {}).values():
+            counts[role] = counts.get(role, 0) + 1
+        return dict(sorted(counts.items()))
 
     def signature(self) -> str:
         """Return a deterministic signature of current assignments."""
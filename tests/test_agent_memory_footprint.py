@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import random
+
+from dosadi.agents.core import AgentState, Goal, GoalType, PlaceBelief, create_agent
+from dosadi.memory.episodes import Episode, EpisodeBuffers
+from dosadi.playbook.scenario_runner import run_scenario
+from dosadi.runtime.memory_report import MEMORY_CATEGORIES, deep_sizeof, memory_report
+from dosadi.runtime.snapshot import from_snapshot_dict, to_snapshot_dict
+
+
+def test_hot_agent_dataclasses_are_slotted() -> None:
+    agent = create_agent("agent:1", "A", "loc:pod-1", random.Random(1))
+    for obj in (
+        agent,
+        agent.physical,
+        agent.personality,
+        agent.attributes,
+        agent.episodes,
+        agent.get_or_create_place_belief("loc:well"),
+        Goal(goal_id="g:1", owner_id=agent.agent_id, goal_type=GoalType.REST_TONIGHT),
+        Episode(episode_id="ep:1", owner_agent_id=agent.agent_id, tick=0),
+    ):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+
+def test_slotted_agent_snapshot_roundtrip() -> None:
+    agent = create_agent("agent:1", "A", "loc:pod-1", random.Random(3))
+    goal = Goal(goal_id="g:1", owner_id=agent.agent_id, goal_type=GoalType.ACQUIRE_RESOURCE)
+    goal.kind = "get_suit"
+    agent.goals.append(goal)
+    agent.place_beliefs["loc:well"] = PlaceBelief(owner_id=agent.agent_id, place_id="loc:well", safety_score=0.4)
+    agent.episodes.push_short_term(Episode(episode_id="ep:1", owner_agent_id=agent.agent_id, tick=5, tags={"queue_served"}))
+
+    restored = from_snapshot_dict(to_snapshot_dict(agent))
+
+    assert isinstance(restored, AgentState)
+    assert isinstance(restored.episodes, EpisodeBuffers)
+    restored_goal = next(g for g in restored.goals if g.goal_id == "g:1")
+    assert restored_goal.kind == "get_suit"
+    assert restored.place_beliefs["loc:well"].safety_score == 0.4
+    assert to_snapshot_dict(restored) == to_snapshot_dict(agent)
+
+
+def test_memory_report_attributes_bytes_to_categories() -> None:
+    world = run_scenario("founding_wakeup_mvp", overrides={"num_agents": 12, "max_ticks": 60, "seed": 5}).world
+
+    report = memory_report(world)
+
+    assert report.agent_count == 12
+    assert set(report.bytes_by_category) == set(MEMORY_CATEGORIES)
+    assert report.bytes_by_category["agents"] > 0
+    assert report.bytes_by_category["episodes"] > 0
+    assert report.total_bytes == sum(report.bytes_by_category.values())
+    assert report.total_bytes >= deep_sizeof(world.agents)
+    assert report.bytes_per_agent > 0
+    assert report.to_dict()["agent_count"] == 12
+
+
+def test_deep_sizeof_counts_shared_objects_once() -> None:
+    shared = ["x" * 100]
+    seen: set[int] = set()
+    first = deep_sizeof({"a": shared}, seen)
+    second = deep_sizeof({"b": shared}, seen)
+    assert second < first
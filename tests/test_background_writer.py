@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from dataclasses import replace
+from datetime import datetime, timezone
+from hashlib import sha256
+from pathlib import Path
+
+import pytest
+
+from dosadi.runtime.background_writer import BackgroundWriter
+from dosadi.runtime.evolve import EvolveConfig, evolve_seed
+from dosadi.runtime.timewarp import TimewarpConfig
+from dosadi.vault.seed_vault import load_manifest
+
+
+def test_writer_runs_jobs_in_order_with_back_pressure() -> None:
+    gate = threading.Event()
+    seen: list[int] = []
+    writer = BackgroundWriter(max_pending=1)
+    writer.submit(gate.wait)
+    writer.submit(seen.append, 0)
+
+    blocked = threading.Thread(target=writer.submit, args=(seen.append, 1))
+    blocked.start()
+    blocked.join(timeout=0.1)
+    assert blocked.is_alive()  # queue is full until the first job finishes
+
+    gate.set()
+    blocked.join()
+    writer.close()
+    assert seen == [0, 1]
+    assert writer.stats.completed == 3
+
+
+def test_writer_surfaces_failures_on_flush() -> None:
+    writer = BackgroundWriter()
+    writer.submit(lambda: 1 / 0)
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit(print)
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def test_background_writes_match_synchronous_outputs(tmp_path: Path) -> None:
+    base = EvolveConfig(
+        target_years=1,
+        cruise_days=120,
+        microsim_days=0,
+        save_every_days=120,
+        timewarp_cfg=TimewarpConfig(max_awake_agents=6),
+    )
+    timestamp = datetime(2024, 3, 3, tzinfo=timezone.utc)
+    results = {}
+    for depth in (0, 2):
+        cfg = replace(base, vault_dir=tmp_path / f"vault{depth}", runs_dir=tmp_path / f"runs{depth}", writer_queue_depth=depth)
+        summary = evolve_seed(scenario_id="founding_wakeup_mvp", seed=11, cfg=cfg, timestamp=timestamp)
+        manifest = load_manifest(cfg.vault_dir)
+        timeline = _read_jsonl(Path(summary["run_dir"]) / "timeline.jsonl")
+        shas = {}
+        for seed in manifest["seeds"]:
+            payload = gzip.decompress((cfg.vault_dir / seed["snapshot_path"]).read_bytes())
+            assert sha256(payload).hexdigest() == seed["snapshot_sha256"]
+            shas[str(cfg.vault_dir / seed["snapshot_path"])] = seed["snapshot_sha256"]
+        for row, written in zip(summary["milestones"], timeline):
+            assert row["snapshot_sha256"] == written["snapshot_sha256"] == shas[written["snapshot_path"]]
+        results[depth] = (
+            [seed["seed_id"] for seed in manifest["seeds"]],
+            [(r["milestone_type"], r["day"], r["world_signature"]) for r in timeline],
+        )
+
+    assert results[0] == results[2]
+    assert len(results[2][0]) == len(results[2][1]) >= 3
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+
+from dosadi.runtime.corridor_cascade import (
+    corridor_state,
+    record_delivery_outcome,
+    update_corridor_cascades,
+)
+from dosadi.runtime.events import ensure_event_bus
+from dosadi.runtime.snapshot import from_snapshot_dict, to_snapshot_dict
+from dosadi.state import WorldState
+from dosadi.world.survey_map import SurveyEdge, SurveyMap
+
+
+def _world(*, incremental: bool) -> WorldState:
+    world = WorldState(seed=11)
+    edges = {}
+    for idx in range(40):
+        edge = SurveyEdge(a=f"loc:{idx}", b=f"loc:{idx + 1}", distance_m=1.0, travel_cost=1.0)
+        edges[edge.key] = edge
+    world.survey_map = SurveyMap(edges=edges)
+    cfg = world.corridor_cascade_cfg
+    cfg.incremental = incremental
+    cfg.health_decay_base = 0.03
+    cfg.collapse_days = 4
+    ensure_event_bus(world)
+    return world
+
+
+def _drive(world: WorldState, days: int = 60) -> list[tuple]:
+    rng = random.Random(5)
+    corridor_ids = sorted(world.survey_map.edges)
+    events: list[tuple] = []
+    bus = ensure_event_bus(world)
+    bus.subscribe(lambda evt: events.append((evt.day, evt.kind, evt.subject_id, tuple(evt.payload))))
+    world.corridor_stress = {}
+    world.corridor_maintenance_investment = {}
+    world.corridor_escort_level = {}
+    for day in range(days):
+        if day % 7 == 0:
+            world.corridor_stress = {cid: rng.random() for cid in rng.sample(corridor_ids, 5)}
+        if day % 11 == 3:
+            world.corridor_maintenance_investment = {rng.choice(corridor_ids): 1.0}
+        if day % 13 == 5:
+            world.corridor_escort_level = {rng.choice(corridor_ids): rng.random()}
+        for _ in range(3):
+            record_delivery_outcome(world, rng.choice(corridor_ids), day=day, success=rng.random() < 0.5)
+        if day == 30:
+            world.corridor_cascade_cfg.degraded_threshold = 0.6
+        update_corridor_cascades(world, day)
+        bus.drain()
+    return events
+
+
+def test_incremental_matches_full_sweep() -> None:
+    full = _world(incremental=False)
+    incremental = _world(incremental=True)
+    full_events = _drive(full)
+    incremental_events = _drive(incremental)
+
+    assert incremental_events == full_events
+    assert any(kind.endswith("COLLAPSED") for _, kind, _, _ in full_events)
+    assert incremental.corridor_cascade.signature() == full.corridor_cascade.signature()
+    for corridor_id, state in full.corridor_cascade.corridors.items():
+        other = corridor_state(incremental, corridor_id)
+        assert (other.health, other.risk, other.recent_failures_7d) == (
+            state.health,
+            state.risk,
+            state.recent_failures_7d,
+        )
+    assert incremental.collapsed_corridors == full.collapsed_corridors
+    assert [i.incident_id for i in incremental.incidents.incidents.values()] == [
+        i.incident_id for i in full.incidents.incidents.values()
+    ]
+
+
+def test_incremental_skips_quiet_corridors_and_survives_snapshot() -> None:
+    world = _world(incremental=True)
+    update_corridor_cascades(world, 0)
+    ledger = world.corridor_cascade
+    assert not ledger.hot
+    assert len(ledger.wake_at) == 40
+
+    for day in range(1, 5):
+        update_corridor_cascades(world, day)
+    lagging = [state for state in ledger.corridors.values() if state.synced_seq < ledger.update_seq]
+    assert lagging
+
+    restored = from_snapshot_dict(to_snapshot_dict(ledger))
+    assert restored.signature() == ledger.signature()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from dosadi.runtime.customs import (
+    CustomsConfig,
+    border_table,
+    iter_border_crossings,
+    process_delivery_edge,
+)
+from dosadi.runtime.institutions import WardInstitutionPolicy, set_customs_biases
+from dosadi.world.survey_map import SurveyEdge, SurveyMap, SurveyNode
+
+
+def _world(max_checks: int = 100) -> SimpleNamespace:
+    nodes = {
+        "A": SurveyNode(node_id="A", kind="hub", ward_id="wardA"),
+        "B": SurveyNode(node_id="B", kind="hub", ward_id="wardA"),
+        "C": SurveyNode(node_id="C", kind="hub", ward_id="wardB"),
+    }
+    edges = [
+        SurveyEdge(a="A", b="B", distance_m=1, travel_cost=1),
+        SurveyEdge(a="B", b="C", distance_m=1, travel_cost=1),
+    ]
+    world = SimpleNamespace(day=0, phase_state=SimpleNamespace(phase=0))
+    world.survey_map = SurveyMap(nodes=nodes, edges={edge.key: edge for edge in edges})
+    world.customs_cfg = CustomsConfig(enabled=True, base_tariff_rate=0.0, max_checks_per_day=max_checks)
+    world.inst_policy_by_ward = {"wardA": WardInstitutionPolicy(ward_id="wardA")}
+    return world
+
+
+def _delivery(idx: int) -> SimpleNamespace:
+    return SimpleNamespace(delivery_id=f"d:{idx}", flags=set(), declared_value=10.0, owner_party="wardA")
+
+
+def test_table_tracks_ward_reassignment_and_policy_edits() -> None:
+    world = _world()
+    table = border_table(world)
+    assert not table.edges["A|B"].crossing
+    assert table.edges["B|C"].crossing and not table.edges["B|C"].policy_boundary
+
+    crossings = iter_border_crossings(world, ["C", "B", "A"], ["B|C", "A|B"])
+    assert [(c.border_at, c.from_control, c.to_control) for c in crossings] == [("B|C", "wardB", "wardA")]
+    assert border_table(world) is table
+
+    set_customs_biases(world, "wardA", tariff_bias=0.5)
+    assert border_table(world).edges["B|C"].policy_boundary
+
+    world.survey_map.assign_ward("B", "wardB")
+    crossings = iter_border_crossings(world, ["A", "B", "C"], ["A|B", "B|C"])
+    assert [(c.border_at, c.from_control, c.to_control) for c in crossings] == [("A|B", "wardA", "wardB")]
+
+
+def test_unchanged_writes_keep_the_table() -> None:
+    world = _world()
+    table = border_table(world)
+
+    SurveyNode(node_id="elsewhere", kind="hub", ward_id="wardC")
+    SurveyMap().upsert_node(SurveyNode(node_id="A", kind="hub", ward_id="wardC"))
+    world.survey_map.upsert_node(SurveyNode(node_id="A", kind="hub", ward_id="wardA"))
+    world.survey_map.assign_ward("B", "wardA")
+    set_customs_biases(world, "wardA", tariff_bias=0.0, inspection_bias=0.0)
+    WardInstitutionPolicy(ward_id="wardZ", customs_tariff_bias=0.9)
+
+    assert border_table(world) is table
+
+
+def test_per_hop_processing_respects_daily_budget() -> None:
+    world = _world(max_checks=3)
+    for idx in range(4):
+        for edge, frm, to in (("A|B", "A", "B"), ("B|C", "B", "C")):
+            process_delivery_edge(world, day=2, delivery=_delivery(idx), edge_key=edge, from_node=frm, to_node=to)
+
+    assert [event.shipment_id for event in world.customs_events] == ["d:0", "d:1", "d:2"]
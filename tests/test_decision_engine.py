@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pytest
+
+from dosadi.agents.core import GoalStatus, GoalType
+from dosadi.runtime import decision_engine
+from dosadi.runtime.decision_engine import (
+    WORLD_WRITING_GOAL_TYPES,
+    decision_seeds,
+    effective_workers,
+    fork_available,
+    run_decision_phase,
+)
+from dosadi.runtime.founding_wakeup import RuntimeConfig, step_world_once
+from dosadi.runtime.snapshot import world_signature
+from dosadi.world.scenarios.founding_wakeup import generate_founding_wakeup_mvp
+
+
+def _world(workers: int):
+    world = generate_founding_wakeup_mvp(num_agents=16, seed=5)
+    world.runtime_config = RuntimeConfig(decision_workers=workers, decision_min_parallel_agents=0)
+    return world
+
+
+@pytest.fixture
+def many_cores(monkeypatch):
+    monkeypatch.setattr(decision_engine.os, "cpu_count", lambda: 4)
+
+
+def _queue_world(workers: int):
+    """Every agent focused on its get_suit (even) or get_assignment (odd) goal."""
+
+    world = _world(workers)
+    for idx, agent_id in enumerate(sorted(world.agents)):
+        wanted = "get_suit" if idx % 2 == 0 else "get_assignment"
+        for goal in world.agents[agent_id].goals:
+            if getattr(goal, "kind", None) != wanted:
+                goal.status = GoalStatus.COMPLETED
+    return world
+
+
+def _action_rows(actions):
+    return [
+        (agent_id, action.verb, action.target_location_id, action.metadata)
+        for agent_id, action in actions.items()
+    ]
+
+
+def test_seeds_are_per_agent_and_order_independent() -> None:
+    first = decision_seeds(_world(1), 4, ["agent:b", "agent:a"])
+    second = decision_seeds(_world(1), 4, ["agent:a"])
+    assert first["agent:a"] == second["agent:a"]
+    assert first["agent:a"] != first["agent:b"]
+    assert decision_seeds(_world(1), 5, ["agent:a"]) != second
+
+
+def test_handler_goals_are_committed_serially() -> None:
+    assert GoalType.GET_MEAL_TODAY in WORLD_WRITING_GOAL_TYPES
+    assert GoalType.SECURE_SHELTER not in WORLD_WRITING_GOAL_TYPES
+
+
+def test_pool_is_gated_on_agent_count_and_cores(monkeypatch) -> None:
+    monkeypatch.setattr(decision_engine.os, "cpu_count", lambda: 1)
+    assert effective_workers(8, 100_000, min_parallel_agents=0) == 1
+    monkeypatch.setattr(decision_engine.os, "cpu_count", lambda: 4)
+    assert effective_workers(8, 100, min_parallel_agents=1_000) == 1
+    assert effective_workers(1, 100_000) == 1
+    expected = 4 if fork_available() else 1
+    assert effective_workers(8, 100_000, min_parallel_agents=1_000) == expected
+
+
+@pytest.mark.skipif(not fork_available(), reason="process pool needs the fork start method")
+def test_parallel_queue_choices_match_in_process(many_cores) -> None:
+    serial, parallel = _queue_world(1), _queue_world(3)
+    for tick in range(2):
+        expected = run_decision_phase(serial, tick, workers=1, min_parallel_agents=0)
+        actual = run_decision_phase(parallel, tick, workers=3, min_parallel_agents=0)
+        assert _action_rows(actual) == _action_rows(expected)
+        # Walk everyone onto their queue's front so the next commit joins it.
+        for world in (serial, parallel):
+            for agent in world.agents.values():
+                agent.location_id = agent.navigation_target_id or agent.location_id
+
+    def queue_state(world):
+        return [
+            (
+                agent_id,
+                agent.navigation_target_id,
+                dict(agent.last_facility_by_service),
+                agent.current_queue_id,
+            )
+            for agent_id, agent in sorted(world.agents.items())
+        ]
+
+    assert queue_state(parallel) == queue_state(serial)
+    services = {service for _, _, memory, _ in queue_state(serial) for service in memory}
+    assert services == {"suit_issue", "assignment_hall"}
+    assert all(queue_id is not None for *_, queue_id in queue_state(serial))
+
+
+@pytest.mark.skipif(not fork_available(), reason="process pool needs the fork start method")
+def test_parallel_decisions_match_in_process_decisions(many_cores) -> None:
+    serial, parallel = _world(1), _world(3)
+    for tick in range(3):
+        expected = run_decision_phase(serial, tick, workers=1, min_parallel_agents=0)
+        actual = run_decision_phase(parallel, tick, workers=3, min_parallel_agents=0)
+        assert list(actual) == sorted(actual)
+        assert _action_rows(actual) == _action_rows(expected)
+
+    for _ in range(40):
+        step_world_once(serial)
+        step_world_once(parallel)
+    assert world_signature(parallel) == world_signature(serial)
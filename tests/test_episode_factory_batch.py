@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dosadi.agents.core import AgentState, Goal, GoalStatus, GoalType
+from dosadi.memory.episode_factory import EpisodeFactory
+from dosadi.memory.episodes import EpisodeChannel, EpisodeTargetType
+from dosadi.runtime.queue_episodes import QueueEpisodeEmitter
+from dosadi.state import WorldState
+
+
+def _agents(count: int) -> list[AgentState]:
+    return [AgentState(agent_id=f"a-{idx}", name=f"A{idx}") for idx in range(count)]
+
+
+def _emit(world: WorldState) -> list[str]:
+    agents = _agents(3)
+    emitter = QueueEpisodeEmitter(EpisodeFactory(world=world))
+    emitter.queue_served(tick=5, queue_location_id="loc:mess", served_agents=agents[:1], observers=agents[1:])
+    emitter.queue_denied(tick=6, queue_location_id="loc:mess", denied_agents=agents[1:2], observers=agents)
+    return [ep.episode_id for agent in agents for ep in agent.episodes.short_term]
+
+
+def test_episode_ids_are_per_world_and_deterministic() -> None:
+    first = _emit(WorldState(seed=1))
+    second = _emit(WorldState(seed=1))
+    assert first == second
+    assert len(set(first)) == len(first)
+    assert all(episode_id.startswith("ep:") for episode_id in first)
+
+
+def test_build_many_matches_build_episode() -> None:
+    factory = EpisodeFactory(world=WorldState(seed=2))
+    owners = _agents(2)
+    owners[0].goals.append(
+        Goal(goal_id="g:eat", owner_id="a-0", goal_type=GoalType.GET_MEAL_TODAY, status=GoalStatus.PENDING)
+    )
+    kwargs = dict(
+        summary_tag="queue_served",
+        channel=EpisodeChannel.DIRECT,
+        location_id="loc:mess",
+        target_type=EpisodeTargetType.PLACE,
+        target_id="loc:mess",
+    )
+    batch = factory.build_many(owners, 9, details={"a-1": {"wait_ticks": 4}}, **kwargs)
+    singles = [factory.build_episode(owner=owner, tick=9, **kwargs) for owner in owners]
+
+    for built, single in zip(batch, singles):
+        for name in ("owner_agent_id", "verb", "outcome", "emotion", "importance", "reliability",
+                     "goal_id", "goal_relevance", "goal_relation"):
+            assert getattr(built, name) == getattr(single, name), name
+        assert built.tags == {"queue_served"}
+    assert batch[0].goal_id == "g:eat"
+    assert batch[1].details == {"wait_ticks": 4}
+
+
+def test_focus_goal_is_chosen_once_per_tick(monkeypatch) -> None:
+    owner = AgentState(agent_id="a", name="A")
+    owner.goals.append(Goal(goal_id="g:1", owner_id="a", goal_type=GoalType.GET_MEAL_TODAY))
+    calls = []
+    original = AgentState.choose_focus_goal
+
+    def counting(self):
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(AgentState, "choose_focus_goal", counting)
+    factory = EpisodeFactory()
+    for _ in range(5):
+        factory.build_episode(owner=owner, tick=3, summary_tag="queue_denied", channel=EpisodeChannel.OBSERVED)
+    assert len(calls) == 1
+
+    owner.goals[0].status = GoalStatus.COMPLETED
+    factory.build_episode(owner=owner, tick=3, summary_tag="queue_denied", channel=EpisodeChannel.OBSERVED)
+    factory.build_episode(owner=owner, tick=4, summary_tag="queue_denied", channel=EpisodeChannel.OBSERVED)
+    assert len(calls) == 3
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from dosadi.runtime.snapshot import from_snapshot_dict, to_snapshot_dict
+from dosadi.world.event_archive import EventArchive, SegmentReader, attach_event_archive
+from dosadi.world.events import EventKind, WorldEvent, WorldEventLog
+
+
+def _event(idx: int) -> WorldEvent:
+    return WorldEvent(
+        event_id="",
+        day=idx // 10,
+        kind=EventKind.DELIVERY_DELIVERED if idx % 2 else EventKind.INCIDENT,
+        subject_kind="delivery",
+        subject_id=f"d:{idx}",
+        severity=idx / 100,
+        payload={"idx": idx, "node": f"node:{idx % 3}"},
+    )
+
+
+def _fill(log: WorldEventLog, count: int) -> None:
+    for idx in range(count):
+        log.append(_event(idx))
+
+
+def test_ring_without_archive_keeps_existing_behavior() -> None:
+    log = WorldEventLog(max_len=5)
+    _fill(log, 12)
+
+    assert log.base_seq == 7
+    assert [e.payload["idx"] for e in log.since(0)] == [7, 8, 9, 10, 11]
+    assert [e.payload["idx"] for e in log.since(9, limit=1)] == [9]
+
+
+def test_since_reads_evicted_events_from_archive(tmp_path) -> None:
+    world = SimpleNamespace(event_log=WorldEventLog(max_len=8))
+    archive = attach_event_archive(world, tmp_path / "events", segment_size=16)
+    _fill(world.event_log, 100)
+
+    log = world.event_log
+    assert len(log.events) == 8
+    assert len(archive.segments) == 5
+    assert archive.end_seq == log.base_seq
+
+    replay = log.since(0)
+    assert [e.payload["idx"] for e in replay] == list(range(100))
+    assert replay[3].event_id == "evt:0:3"
+    assert replay[3].kind is EventKind.DELIVERY_DELIVERED
+    assert replay[3].severity == 0.03
+    assert [e.payload["idx"] for e in log.since(30, limit=4)] == [30, 31, 32, 33]
+    assert [e.payload["idx"] for e in log.events_for_days(4, 4)] == list(range(40, 50))
+    archive.close()
+
+
+def test_archive_reopens_from_index(tmp_path) -> None:
+    root = tmp_path / "events"
+    world = SimpleNamespace(event_log=WorldEventLog(max_len=4))
+    archive = attach_event_archive(world, root, segment_size=10)
+    _fill(world.event_log, 40)
+    archive.flush()
+    archive.close()
+
+    reopened = EventArchive.open(root)
+    assert reopened.end_seq == 36
+    assert [e.payload["idx"] for e in reopened.iter_range(12, 15)] == [12, 13, 14]
+    reader = SegmentReader(root / reopened.segments[1].file)
+    assert list(reader.days()) == [1] * 10
+    reader.close()
+    reopened.close()
+
+
+def test_event_log_with_archive_snapshot_roundtrip(tmp_path) -> None:
+    world = SimpleNamespace(event_log=WorldEventLog(max_len=4))
+    attach_event_archive(world, tmp_path / "events", segment_size=8)
+    _fill(world.event_log, 14)
+
+    restored = from_snapshot_dict(to_snapshot_dict(world.event_log))
+
+    assert isinstance(restored.archive, EventArchive)
+    assert [e.payload["idx"] for e in restored.since(0)] == list(range(14))
+    assert restored.signature() == world.event_log.signature()
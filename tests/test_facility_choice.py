@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import random
+
+from dosadi.agents.core import AgentState
+from dosadi.runtime.agent_navigation import choose_queue_for_goal
+from dosadi.world.scenarios.founding_wakeup import generate_founding_wakeup_mvp
+
+
+def test_queue_choice_records_facility_on_real_agent() -> None:
+    world = generate_founding_wakeup_mvp(num_agents=4, seed=3)
+    agent = world.agents[sorted(world.agents)[0]]
+    assert isinstance(agent, AgentState)
+    suit_goal = next(goal for goal in agent.goals if getattr(goal, "kind", None) == "get_suit")
+    assignment_goal = next(goal for goal in agent.goals if getattr(goal, "kind", None) == "get_assignment")
+
+    queue_id, queue_location_id = choose_queue_for_goal(agent, world, suit_goal, rng=random.Random(0))
+    assert queue_id is not None and queue_location_id is not None
+    assert agent.last_facility_by_service == {"suit_issue": "loc:suit-issue-1"}
+
+    choose_queue_for_goal(agent, world, assignment_goal, rng=random.Random(0))
+    assert agent.last_facility_by_service["assignment_hall"] == "loc:assign-hall-1"
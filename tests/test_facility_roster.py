@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dosadi.runtime.snapshot import from_snapshot_dict, to_snapshot_dict
+from dosadi.world.workforce import Assignment, AssignmentKind, WorkforceLedger
+
+
+def _staff(agent_id: str, facility_id: str, role: str | None = None) -> Assignment:
+    return Assignment(
+        agent_id=agent_id,
+        kind=AssignmentKind.FACILITY_STAFF,
+        target_id=facility_id,
+        start_day=0,
+        notes={"role": role} if role else {},
+    )
+
+
+def test_roster_tracks_assign_and_unassign() -> None:
+    ledger = WorkforceLedger()
+    ledger.assign(_staff("a2", "fac:1", "foreman"))
+    ledger.assign(_staff("a1", "fac:1"))
+    ledger.assign(_staff("a3", "fac:2"))
+    ledger.assign(Assignment(agent_id="a4", kind=AssignmentKind.PROJECT_WORK, target_id="fac:1", start_day=0))
+
+    assert ledger.facility_staff_ids("fac:1") == ["a1", "a2"]
+    assert ledger.facility_role_counts("fac:1") == {"foreman": 1, "staff": 1}
+    assert ledger.facility_staff_count("fac:1", role="foreman") == 1
+
+    ledger.unassign("a2")
+    ledger.get("a9")
+    assert ledger.facility_staff_ids("fac:1") == ["a1"]
+    assert ledger.facility_staff_count("fac:2") == 1
+    assert ledger.facility_staff_count("fac:missing") == 0
+
+
+def test_roster_rebuilds_after_direct_writes_and_snapshot() -> None:
+    ledger = WorkforceLedger()
+    ledger.assignments["b1"] = _staff("b1", "fac:9")
+    ledger.assignments["b2"] = _staff("b2", "fac:9")
+    assert ledger.facility_staff_count("fac:9") == 2
+
+    restored = from_snapshot_dict(to_snapshot_dict(ledger))
+    restored.unassign("b1")
+    assert restored.facility_staff_ids("fac:9") == ["b2"]
+
+    legacy = WorkforceLedger(assignments={"c1": _staff("c1", "fac:3")})
+    assert legacy.facility_staff_ids("fac:3") == ["c1"]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dosadi.runtime.subsystems import (
+    SUBSYSTEM_TARGETS,
+    lazy_factory,
+    register_subsystem,
+    subsystem,
+    timed_subsystems,
+)
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+
+
+def _modules_after_import(statement: str) -> set[str]:
+    code = f"{statement}\nimport sys\nprint('\\n'.join(m for m in sys.modules if m.startswith('dosadi')))"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env={"PYTHONPATH": str(SRC_PATH)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(out.stdout.split())
+
+
+def test_all_registered_subsystems_resolve() -> None:
+    for name in SUBSYSTEM_TARGETS:
+        assert callable(subsystem(name)), name
+
+
+def test_unknown_subsystem_raises() -> None:
+    with pytest.raises(KeyError):
+        subsystem("does.not.exist")
+
+
+def test_register_subsystem_overrides_target() -> None:
+    register_subsystem("test.lazy_factory", "dosadi.runtime.subsystems:lazy_factory")
+    assert subsystem("test.lazy_factory") is lazy_factory
+    SUBSYSTEM_TARGETS.pop("test.lazy_factory")
+
+
+def test_timed_subsystems_charges_calls_by_name() -> None:
+    from dosadi.runtime.timewarp import step_day
+    from dosadi.state import WorldState
+
+    world = WorldState(seed=3)
+    with timed_subsystems() as timings:
+        step_day(world, days=2)
+    report = timings.as_dict()
+    assert report["health.run"]["calls"] == 2
+    assert report["facilities.update"]["seconds"] >= 0.0
+    assert subsystem("health.run") is subsystem("health.run")
+
+
+def test_drivers_do_not_import_daily_subsystems() -> None:
+    for statement in (
+        "import dosadi.runtime.timewarp",
+        "import dosadi.vault.seed_vault",
+        "import dosadi.runtime.evolve_cli",
+    ):
+        loaded = _modules_after_import(statement)
+        assert "dosadi.runtime.war" not in loaded, statement
+        assert "dosadi.runtime.health" not in loaded, statement
+
+
+def test_state_builds_subsystem_fields_lazily() -> None:
+    loaded = _modules_after_import("import dosadi.state")
+    assert "dosadi.runtime.war" not in loaded
+    assert "dosadi.world.logistics" not in loaded
+
+    from dosadi.state import WardMigrationState, WorldState
+    from dosadi.runtime.migration import WardMigrationState as MigrationWardState
+    from dosadi.world.logistics import LogisticsLedger
+
+    assert WardMigrationState is MigrationWardState
+    world = WorldState()
+    assert isinstance(world.logistics, LogisticsLedger)
+    assert world.expansion_planner_state.next_plan_day == 0
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+
+from dosadi.runtime.ledger import LedgerAccount, LedgerConfig, flush_ledger_spill, post_tx
+from dosadi.runtime.snapshot import restore_world, snapshot_world
+from dosadi.state import WorldState
+
+
+def _world(**cfg) -> WorldState:
+    world = WorldState(seed=3)
+    world.ledger_cfg = LedgerConfig(enabled=True, **cfg)
+    world.ledger_state.accounts["acct:a"] = LedgerAccount(acct_id="acct:a", balance=1_000.0)
+    return world
+
+
+def _post(world: WorldState, day: int, amount: float, reason: str = "TEST", **meta) -> None:
+    assert post_tx(world, day=day, from_acct="acct:a", to_acct="acct:b", amount=amount, reason=reason, meta=meta)
+
+
+def test_ring_keeps_newest_rows_with_interned_columns() -> None:
+    world = _world(max_tx_retained=4)
+    for idx in range(10):
+        _post(world, day=idx // 5, amount=1.0 + idx, reason=f"R{idx % 2}", idx=idx)
+
+    state = world.ledger_state
+    txs = list(state.txs)
+    assert [tx.tx_id for tx in txs] == ["1:000001", "1:000002", "1:000003", "1:000004"]
+    assert [tx.meta["idx"] for tx in txs] == [6, 7, 8, 9]
+    assert state.txs[-1].amount == 10.0
+    assert state.tx_total == 10
+    assert state.journal.account_names == ["acct:a", "acct:b"]
+    assert state.journal.reason_names == ["R0", "R1"]
+
+
+def test_daily_rollups_and_incremental_signature() -> None:
+    world = _world(max_tx_retained=2)
+    twin = _world(max_tx_retained=50)
+    for world_ in (world, twin):
+        _post(world_, day=0, amount=5.0)
+        _post(world_, day=0, amount=2.5)
+        _post(world_, day=1, amount=1.0)
+
+    assert world.ledger_state.account_day_rollup(0) == {"acct:a": [0.0, 7.5, 2], "acct:b": [7.5, 0.0, 2]}
+    assert world.ledger_state.account_day_rollup(1)["acct:b"] == [1.0, 0.0, 1]
+    # Retention does not change the signature: it chains every posted row.
+    assert world.ledger_state.signature() == twin.ledger_state.signature()
+
+    restored = restore_world(snapshot_world(world, scenario_id="ledger-journal"))
+    assert restored.ledger_state.signature() == world.ledger_state.signature()
+    _post(restored, day=1, amount=1.0)
+    _post(world, day=1, amount=1.0)
+    assert restored.ledger_state.signature() == world.ledger_state.signature()
+    assert [tx.tx_id for tx in restored.ledger_state.txs] == ["1:000000", "1:000001"]
+
+
+def test_evicted_rows_spill_to_disk(tmp_path) -> None:
+    spill = tmp_path / "ledger" / "audit.jsonl"
+    world = _world(max_tx_retained=3, spill_path=str(spill), spill_batch_size=100)
+    for idx in range(8):
+        _post(world, day=0, amount=1.0, note=str(idx))
+
+    assert not spill.exists()
+    assert flush_ledger_spill(world) == 5
+    rows = [json.loads(line) for line in spill.read_text(encoding="utf-8").splitlines()]
+    retained = [tx.tx_id for tx in world.ledger_state.txs]
+    assert [row[1] for row in rows] + retained == [f"0:{idx:06d}" for idx in range(8)]
+    assert rows[0][6] == {"note": "0"}
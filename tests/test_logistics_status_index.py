@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dosadi.runtime.snapshot import restore_world, snapshot_world
+from dosadi.state import WorldState
+from dosadi.world.logistics import (
+    OPEN_DELIVERY_STATUSES,
+    DeliveryRequest,
+    DeliveryStatus,
+    LogisticsLedger,
+    ensure_logistics,
+    process_logistics_until,
+)
+from dosadi.world.survey_map import SurveyEdge
+
+
+def _delivery(delivery_id: str, status: DeliveryStatus = DeliveryStatus.REQUESTED) -> DeliveryRequest:
+    return DeliveryRequest(
+        delivery_id=delivery_id,
+        project_id="proj",
+        origin_node_id="loc:depot",
+        dest_node_id="loc:site",
+        items={"polymer": 1.0},
+        status=status,
+        created_tick=0,
+    )
+
+
+def test_set_status_moves_between_buckets() -> None:
+    ledger = LogisticsLedger()
+    for delivery_id in ("d3", "d1", "d2"):
+        ledger.add(_delivery(delivery_id))
+    assert ledger.ids_with_status(DeliveryStatus.REQUESTED) == ["d1", "d2", "d3"]
+
+    ledger.set_status(ledger.deliveries["d2"], DeliveryStatus.IN_TRANSIT)
+    ledger.set_status(ledger.deliveries["d3"], DeliveryStatus.DELIVERED)
+    assert ledger.ids_with_status(DeliveryStatus.REQUESTED) == ["d1"]
+    assert ledger.ids_with_status(*OPEN_DELIVERY_STATUSES) == ["d1", "d2"]
+    counts = ledger.status_counts()
+    assert counts["REQUESTED"] == counts["IN_TRANSIT"] == counts["DELIVERED"] == 1
+    assert ledger.active_ids == ["d1", "d2", "d3"]
+
+
+def test_index_rebuilds_for_direct_construction_and_direct_assignment() -> None:
+    deliveries = {"a": _delivery("a"), "b": _delivery("b", DeliveryStatus.FAILED)}
+    ledger = LogisticsLedger(deliveries=deliveries, active_ids=["a", "b"])
+    assert ledger.ids_with_status(DeliveryStatus.REQUESTED) == ["a"]
+
+    deliveries["a"].status = DeliveryStatus.CANCELED
+    assert ledger.ids_with_status(DeliveryStatus.REQUESTED) == []
+    assert ledger.ids_with_status(DeliveryStatus.CANCELED) == ["a"]
+
+
+def test_due_queue_stays_a_heap_and_counts_reach_telemetry() -> None:
+    world = WorldState(seed=3)
+    world.stockpiles = {"polymer": 50.0}
+    world.carriers_available = 5
+    world.survey_map.upsert_edge(SurveyEdge(a="loc:depot", b="loc:site", distance_m=1.0, travel_cost=1.0))
+    logistics = ensure_logistics(world)
+    for idx in range(4):
+        logistics.add(_delivery(f"d{idx}"))
+
+    process_logistics_until(world, target_tick=0, current_tick=0)
+    assert logistics.ids_with_status(DeliveryStatus.REQUESTED) == []
+    queue = world.delivery_due_queue
+    assert len(queue) == 4
+    assert all(queue[(idx - 1) // 2] <= queue[idx] for idx in range(1, len(queue)))
+    assert world.metrics.gauges["logistics"]["deliveries_by_status"]["IN_TRANSIT"] == 4
+
+    restored = restore_world(snapshot_world(world, scenario_id="logistics"))
+    process_logistics_until(world, target_tick=10_000, current_tick=0)
+    process_logistics_until(restored, target_tick=10_000, current_tick=0)
+    assert world.logistics.ids_with_status(DeliveryStatus.DELIVERED) == ["d0", "d1", "d2", "d3"]
+    assert restored.logistics.status_counts() == world.logistics.status_counts()
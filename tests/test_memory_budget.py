@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+
+from dosadi.runtime.demographics import DemographicEvent
+from dosadi.runtime.memory_budget import (
+    DROP_OLDEST,
+    SPILL,
+    SUMMARIZE,
+    ensure_memory_budget_config,
+    ensure_memory_budget_state,
+    measure_collections,
+    run_memory_budget_for_day,
+)
+from dosadi.runtime.snapshot import restore_world, snapshot_world
+from dosadi.runtime.telemetry import ensure_metrics
+from dosadi.runtime.timewarp import step_day
+from dosadi.state import WorldState
+
+
+def _world() -> WorldState:
+    world = WorldState(seed=1)
+    world.market_quotes = [{"day": day, "price": float(day), "note": "x" * 40} for day in range(400)]
+    world.finance_events = [{"day": day, "event": "LOAN_ISSUED" if day % 2 else "PAYMENT_MISSED"} for day in range(300)]
+    world.demographic_events = [DemographicEvent(day=day, polity_id="p", kind="BIRTHS", magnitude=1.0) for day in range(100)]
+    return world
+
+
+def test_measurement_reports_gauges_without_trimming_under_budget() -> None:
+    world = _world()
+    cfg = ensure_memory_budget_config(world)
+    cfg.enabled = True
+    cfg.budget_bytes = 10**9
+    run_memory_budget_for_day(world, day=0)
+
+    metrics = ensure_metrics(world)
+    assert metrics.gauges["memory.market_quotes.items"] == 400
+    assert metrics.gauges["memory.market_quotes.bytes"] > 0
+    usage = measure_collections(world, cfg.policies)
+    assert metrics.gauges["memory.total_bytes"] == sum(item.bytes for item in usage.values())
+    assert len(world.market_quotes) == 400
+
+
+def test_policies_trim_oldest_entries_until_under_budget(tmp_path) -> None:
+    world = _world()
+    cfg = ensure_memory_budget_config(world)
+    cfg.enabled = True
+    cfg.min_keep = 20
+    cfg.spill_dir = str(tmp_path)
+    cfg.policies.update({"market_quotes": DROP_OLDEST, "finance_events": SUMMARIZE, "demographic_events": SPILL})
+    full = sum(item.bytes for item in measure_collections(world, cfg.policies).values())
+    cfg.budget_bytes = full // 10
+
+    run_memory_budget_for_day(world, day=5)
+    state = ensure_memory_budget_state(world)
+
+    assert state.total_bytes <= cfg.budget_bytes
+    assert world.market_quotes[-1]["day"] == 399 and len(world.market_quotes) >= 20
+    assert world.market_quotes[0]["day"] == 400 - len(world.market_quotes)
+
+    trimmed_finance = state.trimmed.get("finance_events", 0)
+    if trimmed_finance:
+        summary = state.summaries["finance_events"]
+        assert summary["count"] == trimmed_finance
+        assert summary["first_day"] == 0
+        assert sum(summary["by_kind"].values()) == trimmed_finance
+
+    trimmed_demo = state.trimmed.get("demographic_events", 0)
+    if trimmed_demo:
+        lines = (tmp_path / "demographic_events.jsonl").read_text().splitlines()
+        assert len(lines) == trimmed_demo
+        assert json.loads(lines[0])["data"]["day"] == 0
+    assert sum(state.trimmed.values()) > 0
+
+
+def test_daily_pipeline_runs_on_cadence() -> None:
+    world = _world()
+    cfg = ensure_memory_budget_config(world)
+    cfg.enabled = True
+    cfg.cadence_days = 10
+    cfg.budget_bytes = 0
+    cfg.min_keep = 10
+    step_day(world, days=3)
+
+    state = ensure_memory_budget_state(world)
+    assert state.last_run_day == 0
+    assert len(world.market_quotes) == 10
+    assert state.summaries["finance_events"]["count"] == 290
+
+
+def test_budget_config_and_rollups_survive_snapshot_round_trip() -> None:
+    world = _world()
+    cfg = ensure_memory_budget_config(world)
+    cfg.enabled = True
+    cfg.cadence_days = 7
+    cfg.min_keep = 10
+    cfg.budget_bytes = 0
+    run_memory_budget_for_day(world, day=3)
+    state = ensure_memory_budget_state(world)
+    rollup = dict(state.summaries["finance_events"])
+    assert rollup["count"] == 290
+
+    restored = restore_world(snapshot_world(world, scenario_id="memory-budget"))
+
+    restored_cfg = ensure_memory_budget_config(restored)
+    assert restored_cfg.enabled and restored_cfg.cadence_days == 7 and restored_cfg.min_keep == 10
+    restored_state = ensure_memory_budget_state(restored)
+    assert restored_state.last_run_day == 3
+    assert restored_state.summaries["finance_events"] == rollup
+    assert restored_state.trimmed == state.trimmed
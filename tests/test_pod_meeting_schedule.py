@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+
+from dosadi.agents.core import AgentState
+from dosadi.agents.groups import (
+    GroupRole,
+    create_pod_group,
+    ensure_group_schedule,
+    maybe_form_proto_council,
+    maybe_run_pod_meeting,
+    run_due_pod_meetings,
+)
+from dosadi.state import WorldState
+
+
+def _pod_world(members: int, *, leader_weight: float = 0.95) -> WorldState:
+    world = WorldState(seed=2)
+    ids = []
+    for idx in range(members):
+        agent = AgentState(agent_id=f"agent:{idx}", name=f"A{idx}", location_id="loc:pod-1")
+        agent.personality.leadership_weight = 0.2 + 0.001 * idx
+        world.agents[agent.agent_id] = agent
+        ids.append(agent.agent_id)
+    world.agents["agent:7"].personality.leadership_weight = leader_weight
+    world.groups.append(create_pod_group("loc:pod-1", ids, tick=0))
+    return world
+
+
+class _CountingRng(random.Random):
+    draws = 0
+
+    def uniform(self, a: float, b: float) -> float:
+        self.draws += 1
+        return super().uniform(a, b)
+
+
+def test_clear_leader_wins_without_scoring_every_candidate() -> None:
+    world = _pod_world(200)
+    rng = _CountingRng(4)
+    pod = world.groups[0]
+
+    maybe_run_pod_meeting(pod, world.agents, tick=10, rng=rng, meeting_interval_ticks=5)
+
+    assert GroupRole.POD_REPRESENTATIVE in pod.roles_by_agent["agent:7"]
+    assert rng.draws == 200  # one contender per voter, not 200 x 200
+
+
+def test_pod_meetings_run_only_when_due() -> None:
+    world = _pod_world(8)
+    pod = world.groups[0]
+    rng = random.Random(1)
+
+    assert run_due_pod_meetings(world, world.groups, world.agents, 10, rng, meeting_interval_ticks=10)
+    assert pod.last_meeting_tick == 10
+    assert ensure_group_schedule(world).next_pod_meeting_tick == 20
+    assert not run_due_pod_meetings(world, world.groups, world.agents, 19, rng, meeting_interval_ticks=10)
+    assert run_due_pod_meetings(world, world.groups, world.agents, 20, rng, meeting_interval_ticks=10)
+
+
+def test_cached_reps_form_council_at_hub() -> None:
+    world = _pod_world(8)
+    second = _pod_world(8)
+    for agent in second.agents.values():
+        agent.agent_id = agent.agent_id.replace("agent", "other")
+        agent.location_id = "loc:pod-2"
+        world.agents[agent.agent_id] = agent
+    world.groups.append(create_pod_group("loc:pod-2", sorted(a for a in world.agents if a.startswith("other")), tick=0))
+    run_due_pod_meetings(world, world.groups, world.agents, 10, random.Random(1), meeting_interval_ticks=10)
+
+    schedule = ensure_group_schedule(world)
+    assert schedule.rep_ids(world.groups) == ["agent:7", "other:7"]
+    world.agents["agent:7"].location_id = "loc:well-core"
+    world.agents["other:7"].location_id = "loc:well-core"
+
+    council = maybe_form_proto_council(world.groups, world.agents, 11, pod_rep_ids=schedule.rep_ids(world.groups))
+    assert council is not None
+    assert council.member_ids == ["agent:7", "other:7"]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections import deque
+
+import pytest
+
+from dosadi.runtime.snapshot import world_signature
+from dosadi.runtime.ward_engine import ward_graph
+from dosadi.world.procedural import TOPOLOGIES, ProceduralWorldConfig, generate_procedural_world
+
+
+def _reachable(world, start: str) -> set[str]:
+    seen = {start}
+    frontier = deque([start])
+    while frontier:
+        node_id = frontier.popleft()
+        for neighbor, _ in world.survey_map.adj.get(node_id, []):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                frontier.append(neighbor)
+    return seen
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+def test_generator_honours_counts_and_stays_connected(topology: str) -> None:
+    config = ProceduralWorldConfig(seed=4, topology=topology, nodes=150, wards=10, factions=4, facilities=25, agents=60)
+    world = generate_procedural_world(config)
+
+    assert len(world.survey_map.nodes) == 150
+    assert len(world.wards) == 10
+    assert len(world.factions) == 4
+    assert len(world.facilities) == 25
+    assert len(world.agents) == 60
+    assert _reachable(world, "node:000") == set(world.survey_map.nodes)
+    assert set(ward_graph(world).node_ids) == set(world.wards)
+    assert sum(len(f.members) for f in world.factions.values()) == 60
+    for agent in world.agents.values():
+        assert world.survey_map.nodes[agent.location_id].ward_id == agent.ward
+    for facility in world.facilities.values():
+        assert world.survey_map.nodes[facility.site_node_id].ward_id == facility.ward_id
+
+
+def test_generation_is_deterministic_and_stages_are_independent() -> None:
+    config = ProceduralWorldConfig(seed=9, topology="small_world", nodes=120, wards=8, agents=30)
+    first = generate_procedural_world(config)
+    second = generate_procedural_world(config)
+    assert world_signature(first) == world_signature(second)
+    assert first.survey_map.edges == second.survey_map.edges
+    assert first.survey_map.nodes == second.survey_map.nodes
+
+    more_agents = generate_procedural_world(ProceduralWorldConfig(seed=9, topology="small_world", nodes=120, wards=8, agents=90))
+    assert more_agents.survey_map.edges == first.survey_map.edges
+    assert list(more_agents.facilities.keys()) == list(first.facilities.keys())
+
+    other_seed = generate_procedural_world(ProceduralWorldConfig(seed=10, topology="small_world", nodes=120, wards=8, agents=30))
+    assert other_seed.survey_map.edges != first.survey_map.edges
+
+
+def test_invalid_configs_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        generate_procedural_world(ProceduralWorldConfig(topology="torus"))
+    with pytest.raises(ValueError):
+        generate_procedural_world(ProceduralWorldConfig(nodes=4, wards=5))
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import random
+
+from dosadi.agents.core import AgentState
+from dosadi.systems.protocols import (
+    Protocol,
+    ProtocolRegistry,
+    ProtocolStatus,
+    ProtocolType,
+    activate_protocol,
+    compute_effective_hazard_prob,
+)
+
+
+def _protocol(idx: int, locations: list[str], **kwargs) -> Protocol:
+    return Protocol(
+        protocol_id=f"protocol:{idx}",
+        protocol_type=ProtocolType.TRAFFIC_AND_SAFETY,
+        name=f"P{idx}",
+        description="",
+        covered_location_ids=locations,
+        **kwargs,
+    )
+
+
+def _scan_multiplier(registry: ProtocolRegistry, location_id: str, group_size: int) -> float:
+    applicable = [
+        p
+        for p in registry.protocols_by_id.values()
+        if p.status == ProtocolStatus.ACTIVE and location_id in p.covered_location_ids
+    ]
+    if not applicable:
+        return 1.0
+    compliant = [p.compliant_hazard_multiplier for p in applicable if p.complies(group_size)]
+    if compliant:
+        return min(compliant)
+    return max(p.violation_hazard_multiplier for p in applicable)
+
+
+def test_index_tracks_add_activate_and_status_changes() -> None:
+    registry = ProtocolRegistry()
+    first = _protocol(1, ["loc:a", "loc:b"])
+    registry.add_protocol(first)
+    assert registry.active_protocols_for_location("loc:a") == []
+
+    activate_protocol(first, tick=5, registry=registry)
+    assert registry.active_protocols_for_location("loc:a") == [first]
+    assert first.activated_at_tick == 5
+
+    second = _protocol(2, ["loc:a", "loc:a"], status=ProtocolStatus.ACTIVE)
+    registry.add_protocol(second)
+    assert registry.active_protocols_for_location("loc:a") == [first, second]
+
+    registry.set_status(first, ProtocolStatus.RETIRED)
+    assert registry.active_protocols_for_location("loc:a") == [second]
+    assert registry.active_protocols_for_location("loc:b") == []
+
+
+def test_index_is_owned_by_each_registry() -> None:
+    registry, other = ProtocolRegistry(), ProtocolRegistry()
+    protocol = _protocol(1, ["loc:a"], status=ProtocolStatus.ACTIVE)
+    registry.add_protocol(protocol)
+    assert registry.active_protocols_for_location("loc:a") == [protocol]
+    assert other.active_protocols_for_location("loc:a") == []
+    index = registry._active_by_location
+
+    # Unregistered protocols and no-op transitions leave the index alone.
+    _protocol(2, ["loc:a"], status=ProtocolStatus.ACTIVE).status = ProtocolStatus.RETIRED
+    other.add_protocol(_protocol(3, ["loc:a"]))
+    registry.set_status(protocol, ProtocolStatus.ACTIVE)
+    registry.active_protocols_for_location("loc:a")
+    assert registry._active_by_location is index
+
+    # Direct edits to a registered protocol need an explicit reindex.
+    protocol.covered_location_ids = ["loc:b"]
+    registry.reindex()
+    assert registry.active_protocols_for_location("loc:b") == [protocol]
+
+
+def test_envelope_matches_protocol_scan() -> None:
+    rng = random.Random(3)
+    registry = ProtocolRegistry()
+    locations = [f"loc:{idx}" for idx in range(6)]
+    for idx in range(40):
+        min_size = rng.randint(1, 5)
+        registry.add_protocol(
+            _protocol(
+                idx,
+                rng.sample(locations, 2),
+                status=rng.choice([ProtocolStatus.ACTIVE, ProtocolStatus.DRAFT]),
+                min_group_size=min_size,
+                max_group_size=rng.choice([None, min_size + rng.randint(0, 3)]),
+                compliant_hazard_multiplier=round(rng.uniform(0.2, 1.0), 3),
+                violation_hazard_multiplier=round(rng.uniform(1.0, 2.0), 3),
+            )
+        )
+    agent = AgentState(agent_id="a", name="A")
+    for location_id in locations + ["loc:none"]:
+        for group_size in range(0, 11):
+            expected = 0.2 * _scan_multiplier(registry, location_id, group_size)
+            assert compute_effective_hazard_prob(agent, location_id, 0.2, group_size, registry) == expected
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import random
+
+from dosadi.agents.core import AgentState
+from dosadi.runtime.queue_episodes import QueueEpisodeEmitter
+from dosadi.runtime.queues import (
+    QueuePriorityRule,
+    QueueState,
+    WaitHistogram,
+    WaitingHeap,
+    dequeue_agent,
+    enqueue_agent,
+    process_queue,
+)
+from dosadi.runtime.snapshot import from_snapshot_dict, to_snapshot_dict
+from dosadi.state import WorldState
+
+
+def _world_with_agents(count: int) -> WorldState:
+    world = WorldState(seed=1)
+    for idx in range(count):
+        agent = AgentState(agent_id=f"agent:{idx}", name=f"A{idx}")
+        world.agents[agent.agent_id] = agent
+    return world
+
+
+def _join(world: WorldState, queue: QueueState, agent_id: str, tick: int) -> None:
+    enqueue_agent(world, queue, agent_id)
+    agent = world.agents[agent_id]
+    agent.current_queue_id = queue.queue_id
+    agent.queue_join_tick = tick
+
+
+def test_heap_matches_sorted_reference_under_random_ops() -> None:
+    rng = random.Random(5)
+    heap = WaitingHeap()
+    reference: dict[str, tuple[float, int]] = {}
+    seq = 0
+    for step in range(3000):
+        op = rng.random()
+        if op < 0.5:
+            agent_id = f"a{rng.randrange(400)}"
+            priority = float(rng.randrange(4))
+            if heap.push(agent_id, priority):
+                reference[agent_id] = (priority, seq)
+                seq += 1
+        elif op < 0.7 and reference:
+            agent_id = rng.choice(sorted(reference))
+            assert heap.remove(agent_id)
+            del reference[agent_id]
+        elif reference:
+            expected = min(reference, key=lambda key: reference[key])
+            assert heap.pop() == expected
+            del reference[expected]
+    assert heap.ordered_ids() == sorted(reference, key=lambda key: reference[key])
+
+
+def test_severity_queue_serves_worst_first_with_fifo_ties() -> None:
+    world = _world_with_agents(5)
+    world.agents["agent:3"].physical.hydration_level = 0.1
+    world.agents["agent:1"].physical.hunger_level = 0.5
+    world.agents["agent:4"].physical.hunger_level = 0.5
+    queue = QueueState(queue_id="queue:water", location_id="loc:well", priority_rule=QueuePriorityRule.SEVERITY)
+    for idx in range(5):
+        _join(world, queue, f"agent:{idx}", tick=idx)
+
+    assert queue.agents_waiting == ["agent:3", "agent:1", "agent:4", "agent:0", "agent:2"]
+    assert dequeue_agent(queue, "agent:1")
+    assert queue.agents_waiting == ["agent:3", "agent:4", "agent:0", "agent:2"]
+
+
+def test_role_biased_queue_uses_role_weights() -> None:
+    world = _world_with_agents(3)
+    world.agents["agent:2"].assignment_role = "medic"
+    queue = QueueState(
+        queue_id="queue:ration",
+        location_id="loc:mess",
+        priority_rule=QueuePriorityRule.ROLE_BIASED,
+        role_weights={"medic": 1.0},
+    )
+    for idx in range(3):
+        _join(world, queue, f"agent:{idx}", tick=0)
+    assert queue.agents_waiting == ["agent:2", "agent:0", "agent:1"]
+
+
+def test_batch_service_records_wait_histogram_and_snapshots() -> None:
+    world = _world_with_agents(6)
+    queue = QueueState(queue_id="queue:ration", location_id="loc:mess", processing_rate=4)
+    world.register_queue(queue)
+    for idx in range(6):
+        _join(world, queue, f"agent:{idx}", tick=idx * 20)
+
+    process_queue(world, queue, tick=200, episode_emitter=QueueEpisodeEmitter())
+
+    assert queue.agents_waiting == ["agent:4", "agent:5"]
+    assert queue.stats.total_processed == 4
+    assert queue.stats.wait_histogram.total == 4
+    assert queue.stats.wait_histogram.percentile(0.5) == 250
+    assert all(world.agents[f"agent:{idx}"].current_queue_id is None for idx in range(4))
+
+    restored = from_snapshot_dict(to_snapshot_dict(queue))
+    assert restored.agents_waiting == ["agent:4", "agent:5"]
+    assert "agent:5" in restored.waiting
+    restored.waiting.push("agent:9")
+    assert restored.waiting.pop_many(3) == ["agent:4", "agent:5", "agent:9"]
+
+
+def test_serving_step_does_not_sort_the_queue(monkeypatch) -> None:
+    world = _world_with_agents(50)
+    queue = QueueState(queue_id="queue:ration", location_id="loc:mess", processing_rate=3)
+    world.register_queue(queue)
+    for idx in range(50):
+        _join(world, queue, f"agent:{idx}", tick=idx)
+
+    def no_sort(self):
+        raise AssertionError("ordered_ids() is for reporting only")
+
+    monkeypatch.setattr(WaitingHeap, "ordered_ids", no_sort)
+    process_queue(world, queue, tick=100, episode_emitter=QueueEpisodeEmitter())
+
+    waiting = {entry[2] for entry in queue.waiting.entries}
+    assert len(waiting) == 47 and "agent:0" not in waiting
+    observed = {agent_id for agent_id, agent in world.agents.items() if agent.episodes}
+    assert waiting <= observed
+
+
+def test_wait_histogram_buckets() -> None:
+    histogram = WaitHistogram()
+    for wait in (0, 5, 10, 11, 20_000):
+        histogram.record(wait)
+    assert histogram.counts[:3] == [1, 2, 1]
+    assert histogram.counts[-1] == 1
+    assert histogram.percentile(1.0) is None
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import random
+
+from dosadi.agent.beliefs import Belief, BeliefStore
+from dosadi.runtime.corridor_cascade import CorridorCascadeState, ensure_cascade_ledger
+from dosadi.world.corridor_infrastructure import edge_record, ensure_infra_config
+from dosadi.world.procedural import ProceduralWorldConfig, generate_procedural_world
+from dosadi.world import routing
+from dosadi.world.routing import RoutingConfig, compute_route
+from dosadi.world.routing_graph import compile_routing_graph, routing_graph
+from dosadi.world.survey_map import SurveyEdge, SurveyMap
+
+
+def _world():
+    world = generate_procedural_world(
+        ProceduralWorldConfig(seed=11, topology="small_world", nodes=120, wards=6, factions=2, facilities=0, agents=3)
+    )
+    edge_keys = sorted(world.survey_map.edges)
+    rng = random.Random(3)
+    perspective = world.agents[sorted(world.agents)[0]]
+    perspective.beliefs = BeliefStore(max_items=500)
+    for ekey in rng.sample(edge_keys, 40):
+        perspective.beliefs.upsert(Belief(key=f"route-risk:{ekey}", value=rng.random(), weight=rng.random(), last_day=0))
+    for ekey in rng.sample(edge_keys, 5):
+        world.survey_map.edges[ekey].closed_until_day = 10
+    ledger = ensure_cascade_ledger(world)
+    for ekey in rng.sample(edge_keys, 5):
+        ledger.corridors[ekey] = CorridorCascadeState(collapse_status="COLLAPSED")
+    ensure_infra_config(world).enabled = True
+    for ekey in rng.sample(edge_keys, 20):
+        edge_record(world, ekey).level = rng.choice([1, 2])
+    return world, perspective.agent_id
+
+
+def _routes(world, pairs, perspective_id, *, compiled: bool, day: int):
+    world.routing_cfg = RoutingConfig(compiled=compiled)
+    world.day = day
+    return [compute_route(world, from_node=a, to_node=b, perspective_agent_id=perspective_id) for a, b in pairs]
+
+
+def test_compiled_search_matches_string_search() -> None:
+    world, perspective_id = _world()
+    nodes = sorted(world.survey_map.nodes)
+    rng = random.Random(5)
+    pairs = [tuple(rng.sample(nodes, 2)) for _ in range(60)]
+
+    for perspective in (perspective_id, None):
+        expected = _routes(world, pairs, perspective, compiled=False, day=1)
+        actual = _routes(world, pairs, perspective, compiled=True, day=2)
+        assert actual == expected
+        assert any(route is not None and len(route.edge_keys) > 2 for route in actual)
+
+
+def test_arcs_follow_sorted_adjacency() -> None:
+    world, _ = _world()
+    graph = compile_routing_graph(world.survey_map)
+    for idx, node_id in enumerate(graph.node_ids):
+        arcs = range(graph.offsets[idx], graph.offsets[idx + 1])
+        expected = sorted(world.survey_map.adj.get(node_id, []))
+        assert [(graph.node_ids[graph.arc_target[a]], graph.arc_edge_key[a]) for a in arcs] == expected
+
+
+def test_graph_recompiles_only_for_new_adjacency() -> None:
+    world, _ = _world()
+    smap = world.survey_map
+    graph = routing_graph(world, smap)
+    assert routing_graph(world, smap) is graph
+
+    # Re-observing a known edge, in either orientation, keeps the graph.
+    ekey = sorted(smap.edges)[0]
+    known = smap.edges[ekey]
+    arcs = sum(len(v) for v in smap.adj.values())
+    smap.upsert_edge(SurveyEdge(a=known.b, b=known.a, distance_m=known.distance_m, travel_cost=known.travel_cost))
+    assert sum(len(v) for v in smap.adj.values()) == arcs
+    assert routing_graph(world, smap) is graph
+
+    # A second map's edges never touch this map's revision.
+    SurveyMap().upsert_edge(SurveyEdge(a="node:y1", b="node:y2", distance_m=1.0, travel_cost=1.0))
+    assert routing_graph(world, smap) is graph
+
+    smap.upsert_edge(SurveyEdge(a="node:x1", b="node:x2", distance_m=1.0, travel_cost=1.0))
+    graph = routing_graph(world, smap)
+    assert graph.index.keys() >= {"node:x1", "node:x2"}
+
+
+
+def _counting_search(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    string_search = routing._search
+
+    def counted(*args, **kwargs):
+        calls.append(1)
+        return string_search(*args, **kwargs)
+
+    monkeypatch.setattr(routing, "_search", counted)
+    return calls
+
+
+def test_reobserved_edges_are_refreshed_in_the_compiled_graph(monkeypatch) -> None:
+    world, _ = _world()
+    smap = world.survey_map
+    pair = (sorted(smap.nodes)[0], sorted(smap.nodes)[-1])
+    route = _routes(world, [pair], None, compiled=True, day=3)[0]
+    graph = world.routing_graph
+
+    # Scouting re-observes edges through merge_observation, replacing their objects.
+    smap.merge_observation(
+        {"discovered_edges": [{"a": smap.edges[k].a, "b": smap.edges[k].b, "distance_m": 1e9} for k in route.edge_keys]},
+        tick=9,
+    )
+    ekey = route.edge_keys[0]
+    old = smap.edges[ekey]
+    smap.edges[ekey] = SurveyEdge(a=old.a, b=old.b, distance_m=old.distance_m * 100, travel_cost=old.travel_cost * 100)
+
+    calls = _counting_search(monkeypatch)
+    actual = _routes(world, [pair], None, compiled=True, day=4)
+    assert calls == [] and world.routing_graph is graph
+    assert actual == _routes(world, [pair], None, compiled=False, day=5)
+    assert actual[0].edge_keys != route.edge_keys
+
+
+def test_removed_edge_recompiles_the_graph(monkeypatch) -> None:
+    world, _ = _world()
+    smap = world.survey_map
+    pair = (sorted(smap.nodes)[0], sorted(smap.nodes)[-1])
+    route = _routes(world, [pair], None, compiled=True, day=13)[0]
+    graph = world.routing_graph
+    del smap.edges[route.edge_keys[0]]
+
+    calls = _counting_search(monkeypatch)
+    actual = _routes(world, [pair], None, compiled=True, day=14)
+    assert calls == [] and world.routing_graph is not graph
+    assert actual == _routes(world, [pair], None, compiled=False, day=15)
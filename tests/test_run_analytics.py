@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dosadi.runtime.evolve import EvolveConfig, evolve_seed
+from dosadi.runtime.run_analytics import RunAnalyticsStore, main
+from dosadi.runtime.timewarp import TimewarpConfig
+from dosadi.world.events import EventKind, WorldEvent, WorldEventLog
+
+
+def _row(run_id: str, seed: int, day: int, success: float) -> dict:
+    return {
+        "run_id": run_id,
+        "scenario_id": "founding_wakeup_mvp",
+        "seed": seed,
+        "day": day,
+        "year": day // 365,
+        "tick": day * 10,
+        "milestone_type": "annual",
+        "kpis": {"logistics.delivery_success_rate": success, "schema_version": "1.0"},
+        "scorecard": {"score_total": success / 2, "grades": {"logistics": success}, "badges": []},
+    }
+
+
+def test_aggregate_median_by_year_across_seeds(tmp_path: Path) -> None:
+    with RunAnalyticsStore(tmp_path / "a.sqlite", batch_size=3) as store:
+        for seed, values in enumerate(([0.2, 0.5], [0.4, 0.9], [0.6, 0.7])):
+            run_id = f"run-{seed}"
+            store.record_run(run_id, scenario_id="founding_wakeup_mvp", seed=seed)
+            for idx, value in enumerate(values):
+                store.record_milestone(_row(run_id, seed, 365 * (idx + 1), value), milestone_idx=idx)
+
+        by_year = store.aggregate("logistics.delivery_success_rate", agg="median", by="year")
+        assert by_year == [
+            {"year": 1, "value": 0.4, "runs": 3},
+            {"year": 2, "value": 0.7, "runs": 3},
+        ]
+        grades = store.aggregate("grades.logistics", agg="max", table="scorecards")
+        assert [entry["value"] for entry in grades] == [0.6, 0.9]
+        assert store.metric_series("run-1", "logistics.delivery_success_rate") == [(365, 0.4), (730, 0.9)]
+        assert [run["seed"] for run in store.runs()] == [0, 1, 2]
+
+    conn = sqlite3.connect(tmp_path / "a.sqlite")
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+
+
+def test_record_event_log_samples_new_window(tmp_path: Path) -> None:
+    log = WorldEventLog(max_len=1000)
+    for idx in range(50):
+        log.append(WorldEvent("", idx, EventKind.INCIDENT, "node", f"n:{idx}", payload={"idx": idx}))
+
+    with RunAnalyticsStore(tmp_path / "e.sqlite") as store:
+        assert store.record_event_log("run", log, max_events=10) == 10
+        assert store.record_event_log("run", log, max_events=10) == 0
+        log.append(WorldEvent("", 51, EventKind.INCIDENT, "node", "n:51"))
+        assert store.record_event_log("run", log, max_events=10) == 1
+        seqs = [seq for (seq,) in store.execute("SELECT seq FROM events ORDER BY seq")]
+    assert seqs == [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50]
+
+
+def test_evolve_writes_analytics_db_and_cli_queries(tmp_path: Path, capsys) -> None:
+    db_path = tmp_path / "analytics.sqlite"
+    cfg = EvolveConfig(
+        target_years=1,
+        cruise_days=120,
+        microsim_days=0,
+        save_every_days=365,
+        timewarp_cfg=TimewarpConfig(max_awake_agents=6),
+        vault_dir=tmp_path / "vault",
+        runs_dir=tmp_path / "runs",
+        analytics_db=db_path,
+    )
+    summary = evolve_seed(
+        scenario_id="founding_wakeup_mvp",
+        seed=7,
+        cfg=cfg,
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+    with RunAnalyticsStore(db_path) as store:
+        milestones = store.execute("SELECT milestone_type FROM milestones ORDER BY milestone_idx")
+        assert [m for (m,) in milestones] == [row["milestone_type"] for row in summary["milestones"]]
+        assert store.runs()[0]["run_id"] == summary["run_id"]
+
+    main(["query", "--db", str(db_path), "--metric", "progress.day", "--agg", "max", "--by", "seed", "--json"])
+    result = json.loads(capsys.readouterr().out)
+    assert result == [{"seed": 7, "value": float(summary["final_day"]), "runs": 1}]
+
+    other = tmp_path / "ingested.sqlite"
+    main(["ingest", str(tmp_path / "runs"), "--db", str(other)])
+    with RunAnalyticsStore(other) as store:
+        assert store.execute("SELECT COUNT(*) FROM milestones")[0][0] == len(summary["milestones"])
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import sys
+
+from dosadi.playbook.scenario_runner import run_scenario
+from dosadi.runtime.evolve import EvolveConfig, evolve_seed
+from dosadi.runtime.sampling_profiler import SUMMARY_FILENAME, UNATTRIBUTED, SamplingProfiler
+from dosadi.runtime.subsystems import SUBSYSTEM_TARGETS, register_subsystem
+from dosadi.runtime.timewarp import TimewarpConfig
+
+
+def _profiled_entry(profiler: SamplingProfiler) -> None:
+    _nested_helper(profiler)
+
+
+def _nested_helper(profiler: SamplingProfiler) -> None:
+    profiler.record(sys._getframe())
+
+
+def test_samples_are_windowed_and_attributed_to_subsystems(tmp_path) -> None:
+    register_subsystem("test.profiled", f"{__name__}:_profiled_entry")
+    try:
+        profiler = SamplingProfiler(tmp_path, interval_ms=1000)
+        profiler.start()
+        _profiled_entry(profiler)
+        _profiled_entry(profiler)
+        profiler.mark("first")
+        profiler.record(sys._getframe())
+        summary = profiler.stop()
+    finally:
+        SUBSYSTEM_TARGETS.pop("test.profiled")
+
+    assert [w["label"] for w in summary["windows"]] == ["first", "end"]
+    assert summary["windows"][0]["subsystems"] == {"test.profiled": {"samples": 2, "share": 1.0}}
+    assert UNATTRIBUTED in summary["windows"][1]["subsystems"]
+    assert summary["top_self"][0] == {"frame": f"{__name__}:_nested_helper", "samples": 2}
+
+    lines = (tmp_path / summary["windows"][0]["file"]).read_text().splitlines()
+    assert len(lines) == 1
+    stack, count = lines[0].rsplit(" ", 1)
+    assert count == "2"
+    assert stack.endswith(f"{__name__}:_profiled_entry;{__name__}:_nested_helper")
+    assert json.loads((tmp_path / SUMMARY_FILENAME).read_text())["samples"] == 3
+
+
+def test_evolve_writes_one_window_per_milestone(tmp_path) -> None:
+    cfg = EvolveConfig(
+        target_years=1,
+        cruise_days=180,
+        microsim_days=0,
+        save_every_days=180,
+        timewarp_cfg=TimewarpConfig(max_awake_agents=5),
+        vault_dir=tmp_path / "vault",
+        runs_dir=tmp_path / "runs",
+        profile_interval_ms=1.0,
+    )
+    summary = evolve_seed(scenario_id="founding_wakeup_mvp", seed=2, cfg=cfg)
+
+    profile = json.loads(summary["profile_summary"].read_text())
+    labels = [window["label"] for window in profile["windows"]]
+    assert labels[: len(summary["milestones"])] == [
+        f"{row['milestone_type']}-day{row['day']}" for row in summary["milestones"]
+    ]
+    for window in profile["windows"]:
+        assert (summary["run_dir"] / window["file"]).exists()
+    assert summary["profile_summary"].parent == summary["run_dir"]
+    assert (summary["run_dir"] / "timeline.jsonl").exists()
+
+
+def test_run_scenario_profile_option(tmp_path) -> None:
+    run_scenario("founding_wakeup_mvp", overrides={"num_agents": 4, "max_ticks": 50}, profile=tmp_path)
+    summary = json.loads((tmp_path / SUMMARY_FILENAME).read_text())
+    assert summary["windows"][-1]["label"] == "founding_wakeup_mvp"
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dosadi.runtime.sanctions import (
+    SanctionRule,
+    ensure_sanctions_config,
+    is_transit_denied,
+    lift_sanction_rule,
+    register_sanction_rule,
+    reschedule_sanction_rule,
+    sanction_index,
+    sanction_rules_revision,
+)
+from dosadi.runtime.snapshot import restore_world, snapshot_world
+from dosadi.state import WorldState
+from dosadi.world.routing import compute_route
+from dosadi.world.survey_map import SurveyEdge, SurveyMap, SurveyNode
+
+
+def _rule(rule_id: str, target_kind: str, target_id: str, *, start: int = 0, end: int = 10) -> SanctionRule:
+    return SanctionRule(
+        rule_id=rule_id,
+        issuer_id="issuer:1",
+        treaty_id=None,
+        kind="TRANSIT_DENIAL",
+        target_kind=target_kind,
+        target_id=target_id,
+        goods=[],
+        severity=0.5,
+        start_day=start,
+        end_day=end,
+        enforcement_required=0.5,
+    )
+
+
+def _world() -> WorldState:
+    nodes = {
+        "A": SurveyNode(node_id="A", ward_id="ward:1", kind="WAYPOINT"),
+        "B": SurveyNode(node_id="B", ward_id="ward:1", kind="WAYPOINT"),
+        "C": SurveyNode(node_id="C", ward_id="ward:2", kind="WAYPOINT"),
+    }
+    edges = [
+        SurveyEdge(a="A", b="B", distance_m=1.0, hazard=0.0, travel_cost=1.0),
+        SurveyEdge(a="A", b="C", distance_m=1.0, hazard=0.0, travel_cost=1.0),
+        SurveyEdge(a="C", b="B", distance_m=1.0, hazard=0.0, travel_cost=1.0),
+    ]
+    world = WorldState(survey_map=SurveyMap(nodes=nodes, edges={edge.key: edge for edge in edges}))
+    ensure_sanctions_config(world).enabled = True
+    return world
+
+
+def test_index_rebuilds_only_on_rule_changes_and_window_edges() -> None:
+    world = _world()
+    register_sanction_rule(world, _rule("r:corridor", "CORRIDOR", "A|B", start=2, end=5))
+    register_sanction_rule(world, _rule("r:faction", "FACTION", "faction:x", start=0, end=8))
+
+    day0 = sanction_index(world, day=0)
+    assert day0.denied_corridors == frozenset()
+    assert (day0.valid_from, day0.valid_until) == (0, 1)
+    day2 = sanction_index(world, day=2)
+    assert day2 is not day0 and day2.denied_corridors == {"A|B"}
+    assert sanction_index(world, day=5) is day2
+
+    revision = sanction_rules_revision(world)
+    reschedule_sanction_rule(world, "r:corridor", end_day=5)
+    _rule("r:unregistered", "CORRIDOR", "A|C")
+    assert sanction_rules_revision(world) == revision
+    assert sanction_index(world, day=5) is day2
+
+    reschedule_sanction_rule(world, "r:corridor", end_day=3)
+    assert sanction_index(world, day=3) is not day2
+    assert sanction_index(world, day=4).denied_corridors == frozenset()
+
+    assert is_transit_denied(world, "A|C", actor_faction_id="faction:x", actor_ward_id=None, day=4)
+    assert not is_transit_denied(world, "A|C", actor_faction_id="faction:y", actor_ward_id=None, day=4)
+    ensure_sanctions_config(world).enabled = False
+    assert not is_transit_denied(world, "A|C", actor_faction_id="faction:x", actor_ward_id=None, day=4)
+
+
+def test_ward_denial_matches_edge_ward_and_actor_ward() -> None:
+    world = _world()
+    register_sanction_rule(world, _rule("r:ward", "WARD", "ward:2"))
+    assert is_transit_denied(world, "B|C", actor_faction_id=None, actor_ward_id=None, day=1)
+    assert not is_transit_denied(world, "A|B", actor_faction_id=None, actor_ward_id=None, day=1)
+    assert is_transit_denied(world, "A|B", actor_faction_id=None, actor_ward_id="ward:2", day=1)
+
+
+def test_route_cache_survives_unrelated_rules_and_tracks_affected_edges() -> None:
+    world = _world()
+    world.day = 501
+    direct = compute_route(world, from_node="A", to_node="B")
+    assert direct is not None and direct.edge_keys == ["A|B"]
+
+    register_sanction_rule(world, _rule("r:elsewhere", "CORRIDOR", "X|Y", start=0, end=1000))
+    assert compute_route(world, from_node="A", to_node="B") is direct
+
+    register_sanction_rule(world, _rule("r:direct", "CORRIDOR", "A|B", start=0, end=1000))
+    detour = compute_route(world, from_node="A", to_node="B")
+    assert detour is not None and detour.edge_keys == ["A|C", "B|C"]
+
+    lift_sanction_rule(world, "r:direct")
+    lifted = compute_route(world, from_node="A", to_node="B")
+    assert lifted is not None and lifted.edge_keys == ["A|B"]
+
+
+def test_rule_revision_is_per_world_and_survives_snapshots() -> None:
+    world, other = _world(), _world()
+    register_sanction_rule(world, _rule("r:corridor", "CORRIDOR", "A|B"))
+    assert (sanction_rules_revision(world), sanction_rules_revision(other)) == (1, 0)
+
+    restored = restore_world(snapshot_world(world, scenario_id="sanctions"))
+    assert sanction_rules_revision(restored) == 1
+    assert is_transit_denied(restored, "A|B", actor_faction_id=None, actor_ward_id=None, day=1)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dosadi.agents.core import AgentState, PlaceBelief
+from dosadi.memory.episode_factory import EpisodeFactory
+from dosadi.memory.episodes import EpisodeBuffers, EpisodeChannel, EpisodeTargetType, SharedEpisode
+from dosadi.memory.place_belief_updates import apply_episode_to_place_belief
+from dosadi.runtime.memory_report import deep_sizeof
+from dosadi.runtime.queue_episodes import QueueEpisodeEmitter
+from dosadi.runtime.snapshot import from_snapshot_dict, to_snapshot_dict
+
+
+def _agents(prefix: str, count: int) -> list[AgentState]:
+    return [AgentState(agent_id=f"{prefix}-{idx}", name=f"{prefix}{idx}") for idx in range(count)]
+
+
+def test_observers_reference_one_shared_event() -> None:
+    served = _agents("served", 2)
+    observers = _agents("obs", 30)
+
+    QueueEpisodeEmitter().queue_served(
+        tick=12,
+        queue_location_id="loc:mess",
+        served_agents=served,
+        wait_ticks={"served-0": 40},
+        observers=observers,
+    )
+
+    assert served[0].episodes.short_term[0].details["wait_ticks"] == 40
+    observed = [agent.episodes.short_term[-1] for agent in observers]
+    assert all(isinstance(ep, SharedEpisode) for ep in observed)
+    assert len({id(ep.shared) for ep in observed}) == 1
+    assert len({ep.episode_id for ep in observed}) == len(observers)
+    assert {ep.owner_agent_id for ep in observed} == {agent.agent_id for agent in observers}
+    assert observed[0].channel is EpisodeChannel.OBSERVED
+    assert "queue_served" in observed[0].tags
+
+
+def test_shared_episode_matches_full_episode_semantics() -> None:
+    factory = EpisodeFactory()
+    owner = AgentState(agent_id="a", name="A")
+    full = factory.build_episode(
+        owner=owner,
+        tick=3,
+        summary_tag="queue_denied",
+        channel=EpisodeChannel.OBSERVED,
+        location_id="loc:well",
+        target_type=EpisodeTargetType.PLACE,
+        target_id="loc:well",
+    )
+    full.tags.add("queue_denied")
+    shared_event = factory.build_shared_event(
+        3,
+        summary_tag="queue_denied",
+        channel=EpisodeChannel.OBSERVED,
+        location_id="loc:well",
+        target_type=EpisodeTargetType.PLACE,
+        target_id="loc:well",
+    )
+    overlay = factory.build_shared_episode(owner, shared_event)
+
+    materialized = overlay.materialize()
+    for name in ("tick", "location_id", "verb", "summary_tag", "outcome", "emotion", "tags", "details",
+                 "importance", "reliability", "goal_relevance", "goal_relation"):
+        assert getattr(materialized, name) == getattr(full, name), name
+
+    pb_full = PlaceBelief(owner_id="a", place_id="loc:well")
+    pb_shared = PlaceBelief(owner_id="a", place_id="loc:well")
+    apply_episode_to_place_belief(pb_full, full)
+    apply_episode_to_place_belief(pb_shared, overlay)
+    assert to_snapshot_dict(pb_full) == to_snapshot_dict(pb_shared)
+
+
+def test_shared_episodes_keep_eviction_and_snapshot_behavior() -> None:
+    factory = EpisodeFactory()
+    owner = AgentState(agent_id="a", name="A")
+    buffers = EpisodeBuffers(short_term_capacity=2)
+    low = factory.build_shared_episode(
+        owner, factory.build_shared_event(1, summary_tag="queue_served", channel=EpisodeChannel.OBSERVED)
+    )
+    high = factory.build_shared_episode(
+        owner, factory.build_shared_event(2, summary_tag="queue_fight", channel=EpisodeChannel.OBSERVED)
+    )
+    mid = factory.build_shared_episode(
+        owner, factory.build_shared_event(3, summary_tag="queue_denied", channel=EpisodeChannel.OBSERVED)
+    )
+    for ep in (low, high, mid):
+        buffers.push_short_term(ep)
+    assert list(buffers.short_term) == [high, mid]
+
+    restored = from_snapshot_dict(to_snapshot_dict(buffers))
+    assert [ep.episode_id for ep in restored.short_term] == [high.episode_id, mid.episode_id]
+    assert restored.short_term[0].verb == "QUEUE_FIGHT"
+    assert "queue_fight" in restored.short_term[0].tags
+
+
+def test_shared_observer_records_are_smaller_than_copies() -> None:
+    observers = _agents("obs", 50)
+    QueueEpisodeEmitter().queue_denied(
+        tick=1, queue_location_id="loc:suits", denied_agents=[], observers=observers
+    )
+    shared_bytes = deep_sizeof([agent.episodes.short_term[0] for agent in observers])
+    copies = [agent.episodes.short_term[0].materialize() for agent in observers]
+    assert shared_bytes < deep_sizeof(copies)
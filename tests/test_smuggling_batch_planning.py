@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import random
+
+from dosadi.runtime.culture_wars import WardCultureState
+from dosadi.runtime.customs import iter_border_crossings
+from dosadi.runtime.smuggling import (
+    SmugglingNetworkState,
+    _allocate_bribes,
+    _commodity_preferences,
+    _route_score,
+    _score_demand,
+    _score_source,
+    _shipment_signature,
+    _stable_topk,
+    plan_smuggling_shipments,
+)
+from dosadi.state import FactionState, StockState, WardState, WorldState
+from dosadi.world.factions import pseudo_rand01
+from dosadi.world.routing import compute_route, compute_routes_from
+from dosadi.world.survey_map import SurveyEdge, SurveyMap, SurveyNode
+
+
+def _world(seed: int, *, wards: int = 12, factions: int = 6) -> WorldState:
+    rng = random.Random(seed)
+    world = WorldState(seed=seed)
+    world.smuggling_cfg.enabled = True
+    world.smuggling_cfg.max_shipments_per_day = 40
+    survey_map = SurveyMap()
+    for idx in range(wards):
+        ward_id = f"ward:{idx:02d}"
+        world.wards[ward_id] = WardState(id=ward_id, name=ward_id, ring=1, sealed_mode="OPEN")
+        world.culture_by_ward[ward_id] = WardCultureState(
+            ward_id=ward_id,
+            norms={
+                "norm:smuggling_tolerance": round(rng.random(), 3),
+                "norm:raider_alignment": round(rng.random(), 3),
+                "norm:corruption": round(rng.random(), 3),
+            },
+        )
+        for node_idx in range(2):
+            node_id = f"node:{idx:02d}:{node_idx}"
+            survey_map.nodes[node_id] = SurveyNode(node_id=node_id, kind="ward", ward_id=ward_id)
+    node_ids = sorted(survey_map.nodes)
+    for idx, node_id in enumerate(node_ids):
+        for other in rng.sample(node_ids, 3):
+            if other != node_id:
+                edge = SurveyEdge(a=node_id, b=other, distance_m=rng.uniform(1, 5), travel_cost=1.0, hazard=rng.random())
+                survey_map.edges[edge.key] = edge
+    survey_map.rebuild_adjacency()
+    world.survey_map = survey_map
+    commodities = ["NARCOTICS", "WEAPON_PARTS", "STOLEN_GOODS", "RAIDER_SUPPLIES"]
+    for idx in range(factions):
+        faction_id = f"fac:{idx}"
+        world.factions[faction_id] = FactionState(
+            id=faction_id,
+            name=faction_id,
+            archetype="raider",
+            home_ward="ward:00",
+            assets=StockState(credits={"credits": 50.0 + idx}),
+            smuggling_profile={commodity: rng.random() for commodity in rng.sample(commodities, 3)},
+        )
+    return world
+
+
+def _legacy_plan(world: WorldState, day: int) -> list[tuple]:
+    cfg = world.smuggling_cfg
+    planned = []
+    for faction_id, faction in sorted(world.factions.items())[: cfg.max_active_factions]:
+        net = SmugglingNetworkState(faction_id=faction_id, commodity_prefs=_commodity_preferences(faction))
+        for commodity, pref_score in _stable_topk(net.commodity_prefs.items(), cfg.commodity_topk):
+            demand = _stable_topk(((w, _score_demand(world, w, commodity)) for w in world.wards), cfg.route_topk)
+            source = _stable_topk(((w, _score_source(world, w, commodity)) for w in world.wards), cfg.route_topk)
+            (dest_id, dest_score), (src_id, src_score) = demand[0], source[0]
+            if dest_id == src_id:
+                continue
+            origin = sorted(n for n, node in world.survey_map.nodes.items() if node.ward_id == src_id)[0]
+            dest = sorted(n for n, node in world.survey_map.nodes.items() if node.ward_id == dest_id)[0]
+            route = compute_route(world, from_node=origin, to_node=dest)
+            if route is None:
+                continue
+            score = _route_score(net.edge_stats, route.edge_keys)
+            roll = pseudo_rand01(_shipment_signature(day, faction_id, commodity, src_id, dest_id, cfg.deterministic_salt))
+            if roll * (dest_score + src_score + pref_score) < score:
+                continue
+            crossings = iter_border_crossings(world, route.nodes, route.edge_keys)
+            bribes = _allocate_bribes(cfg, net, faction=faction, route=route, crossings=crossings, day=day)
+            planned.append((faction_id, commodity, tuple(route.nodes), tuple(sorted(bribes.items()))))
+    return planned
+
+
+def test_batched_planner_matches_per_pair_planning() -> None:
+    for seed in (0, 1, 3, 5):
+        world = _world(seed)
+        world.day = 7000 + seed
+        expected = _legacy_plan(world, day=3)
+        world.day = 7100 + seed
+        shipments = plan_smuggling_shipments(world, day=3)
+        got = [
+            (
+                sh.owner_party.removeprefix("party:fac:"),
+                next(iter(sh.items)),
+                tuple(sh.route_nodes),
+                tuple(sorted(sh.smuggling_bribe_map.items())),
+            )
+            for sh in shipments
+        ]
+        assert expected and got == expected
+        report = world.smuggling_plan_report
+        assert report.shipments == len(shipments)
+        assert report.route_origins <= report.commodities
+        assert report.planning_seconds >= 0.0
+
+
+def test_one_to_many_routes_match_single_routes() -> None:
+    world = _world(11, wards=20)
+    world.day = 8000
+    origin = "node:03:1"
+    targets = sorted(world.survey_map.nodes)
+    single = {target: compute_route(world, from_node=origin, to_node=target) for target in targets}
+    world.day = 8001
+    batched = compute_routes_from(world, from_node=origin, to_nodes=targets)
+    assert list(batched) == targets
+    for target in targets:
+        if single[target] is None:
+            assert batched[target] is None
+        else:
+            assert batched[target].nodes == single[target].nodes
+            assert batched[target].total_cost == single[target].total_cost
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from dosadi.runtime.health import DISEASES, HealthConfig, WardHealthState, _clamp, _spread_outbreaks
+from dosadi.runtime.migration import _neighbor_ids
+from dosadi.runtime.ward_engine import build_ward_graph
+from dosadi.state import WardState, WorldState
+
+
+@dataclass
+class _Edge:
+    a: str
+    b: str
+    status: str = "open"
+
+
+def _reference_spread(world: WorldState, cfg: HealthConfig, by_ward: dict[str, WardHealthState]) -> None:
+    pairs: set[tuple[str, str]] = set()
+    for edge in world.edges.values():
+        origin = getattr(edge, "origin", None) or getattr(edge, "a", None)
+        destination = getattr(edge, "destination", None) or getattr(edge, "b", None)
+        if origin and destination:
+            pairs.add((str(origin), str(destination)))
+            pairs.add((str(destination), str(origin)))
+    if not pairs:
+        ward_ids = sorted(world.wards)
+        for idx, ward_id in enumerate(ward_ids):
+            for other in ward_ids[idx + 1 :]:
+                pairs.add((ward_id, other))
+                pairs.add((other, ward_id))
+    deltas: dict[tuple[str, str], dict[str, float]] = {}
+    for a, b in sorted(pairs):
+        ward_a = by_ward.get(a)
+        ward_b = by_ward.get(b)
+        if ward_a is None or ward_b is None:
+            continue
+        for disease in DISEASES:
+            ia = ward_a.outbreaks.get(disease, 0.0)
+            ib = ward_b.outbreaks.get(disease, 0.0)
+            if ia > ib:
+                deltas.setdefault((a, b), {})[disease] = (ia - ib) * cfg.spread_strength
+    for (a, b), transfers in deltas.items():
+        for disease, spill in transfers.items():
+            by_ward[a].outbreaks[disease] = _clamp(by_ward[a].outbreaks.get(disease, 0.0) - spill)
+            by_ward[b].outbreaks[disease] = _clamp(by_ward[b].outbreaks.get(disease, 0.0) + spill)
+
+
+def _world(seed: int, wards: int, *, edges: bool) -> tuple[WorldState, dict[str, WardHealthState]]:
+    rng = random.Random(seed)
+    world = WorldState(seed=seed)
+    ids = [f"ward:{idx:03d}" for idx in range(wards)]
+    for ward_id in ids:
+        world.wards[ward_id] = WardState(id=ward_id, name=ward_id, ring=1, sealed_mode="open")
+    if edges:
+        for idx in range(wards * 2):
+            a, b = rng.sample(ids, 2)
+            world.edges[f"edge:{idx}"] = _Edge(a=a, b=b)
+        world.edges["edge:dangling"] = _Edge(a=ids[0], b="loc:outside")
+    by_ward: dict[str, WardHealthState] = {}
+    for ward_id in ids[:-1]:
+        state = WardHealthState(ward_id=ward_id)
+        for disease in DISEASES:
+            if rng.random() < 0.3:
+                state.outbreaks[disease] = rng.choice([rng.random(), 1.0])
+        by_ward[ward_id] = state
+    return world, by_ward
+
+
+def test_spread_matches_pairwise_loop() -> None:
+    cfg = HealthConfig(spread_strength=0.35)
+    for seed in range(6):
+        for edges in (True, False):
+            world, by_ward = _world(seed, 40, edges=edges)
+            _, expected = _world(seed, 40, edges=edges)
+            _spread_outbreaks(world, cfg, by_ward)
+            _reference_spread(world, cfg, expected)
+            for ward_id, state in expected.items():
+                assert list(by_ward[ward_id].outbreaks.items()) == list(state.outbreaks.items())
+
+
+def test_ward_graph_neighbors_and_edge_lookup() -> None:
+    world = WorldState(seed=1)
+    for ward_id in ("ward:a", "ward:b", "ward:c", "ward:d"):
+        world.wards[ward_id] = WardState(id=ward_id, name=ward_id, ring=1, sealed_mode="open")
+    first = _Edge(a="ward:b", b="ward:a")
+    world.edges = {
+        "e1": first,
+        "e2": _Edge(a="ward:a", b="ward:b", status="collapsed"),
+        "e3": _Edge(a="ward:c", b="ward:a"),
+        "e4": {"origin": "ward:d", "destination": "ward:c"},
+    }
+    graph = build_ward_graph(world.edges)
+
+    assert graph.neighbors("ward:a") == ["ward:b", "ward:c"]
+    assert graph.edge_between("ward:a", "ward:b") is first
+    assert graph.edge_between("ward:d", "ward:c") is world.edges["e4"]
+    assert graph.edge_between("ward:c", "ward:d") is None
+    # Mapping edges carry no endpoint attributes, so ward:d falls back to every other ward.
+    assert _neighbor_ids(world, "ward:d", graph) == ["ward:a", "ward:b", "ward:c"]
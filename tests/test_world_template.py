@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from dosadi.runtime.snapshot import world_signature
+from dosadi.scenarios.wakeup_prime import (
+    WakeupPrimeScenarioConfig,
+    generate_wakeup_scenario_prime,
+    wakeup_prime_template,
+)
+from dosadi.world.scenarios.founding_wakeup import founding_wakeup_template, generate_founding_wakeup_mvp
+
+
+def test_founding_template_worlds_match_fresh_generation() -> None:
+    template = founding_wakeup_template()
+    for seed in (0, 7, 123):
+        fresh = generate_founding_wakeup_mvp(num_agents=24, seed=seed)
+        cloned = generate_founding_wakeup_mvp(num_agents=24, seed=seed, template=template)
+        assert world_signature(cloned) == world_signature(fresh)
+        assert cloned.expansion_planner_state.next_plan_day == fresh.expansion_planner_state.next_plan_day
+        assert cloned.factions["faction:colonists"].members == fresh.factions["faction:colonists"].members
+        assert list(cloned.facilities.keys()) == list(fresh.facilities.keys())
+        assert cloned.places is cloned.nodes
+
+
+def test_prime_template_worlds_match_fresh_generation() -> None:
+    for seed in (1, 1337):
+        config = WakeupPrimeScenarioConfig(num_agents=40, seed=seed, include_canteen=False)
+        fresh = generate_wakeup_scenario_prime(config)
+        cloned = generate_wakeup_scenario_prime(config, template=wakeup_prime_template(config))
+        assert world_signature(cloned.world) == world_signature(fresh.world)
+        assert [q.queue_id for q in cloned.queues] == [q.queue_id for q in fresh.queues]
+        assert cloned.world.policy["topology"] == fresh.world.policy["topology"]
+        assert [g.member_ids for g in cloned.world.groups] == [g.member_ids for g in fresh.world.groups]
+
+
+def test_instances_share_frozen_layout_but_not_mutable_state() -> None:
+    config = WakeupPrimeScenarioConfig(num_agents=8, seed=3)
+    template = wakeup_prime_template(config)
+    first = generate_wakeup_scenario_prime(config, template=template).world
+    second = generate_wakeup_scenario_prime(config, template=template).world
+
+    node_id = next(iter(first.nodes))
+    assert first.nodes[node_id] is second.nodes[node_id] is template.base.nodes[node_id]
+    assert first.nodes is not second.nodes
+
+    first.queues["queue:suit-issue"].processing_rate = 99
+    first.facilities.facilities.clear()
+    assert second.queues["queue:suit-issue"].processing_rate == 2
+    assert len(second.facilities) == len(template.base.facilities)